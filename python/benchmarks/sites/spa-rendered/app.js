@@ -0,0 +1,19 @@
+// Simulates a client-rendered event site: markup only exists after scripts run.
+(function () {
+    const data = {
+        name: "Hybrid Horizons 2026",
+        tagline: "Where in-person meets online, seamlessly.",
+        links: ["Programme", "Speakers", "Virtual Hub", "Tickets"]
+    };
+
+    setTimeout(function () {
+        document.title = data.name;
+        const app = document.getElementById("app");
+        app.innerHTML =
+            '<header><img class="logo" src="logo.svg" alt="Hybrid Horizons logo">' +
+            "<nav>" + data.links.map(function (l) { return '<a href="#">' + l + "</a>"; }).join(" ") + "</nav>" +
+            "</header>" +
+            "<main><h1>" + data.name + "</h1><p>" + data.tagline + "</p>" +
+            "<button>Join the waitlist</button></main>";
+    }, 150);
+})();
@@ -13,6 +13,35 @@ Usage:
         --property backgroundColor \\
         --expected "#160822"
 
+Batch mode checks many configs and fields in one run. Each site is
+opened once (one browser context per site, in one shared browser) and
+all of its selectors are read in a single in-page call, with sites
+checked concurrently, so runtime grows with the number of sites rather
+than the number of checks:
+
+    python scripts/validate_scraped_colors.py --manifest validation.json \\
+        --json-report results.json --junit-report results.xml
+
+The manifest lists configs and selector -> field mappings. Top-level
+checks apply to every site; a site's url defaults to the config's
+source_url, and paths are relative to the manifest:
+
+    {
+      "checks": [
+        {"field": "colors.background", "selector": "body", "property": "backgroundColor"},
+        {"field": "colors.text", "selector": "body", "property": "color"}
+      ],
+      "sites": [
+        {
+          "config": "style-configs/eventtechlive-com.json",
+          "checks": [
+            {"field": "colors.primary", "selector": "header",
+             "property": "backgroundColor", "expected": "#160822"}
+          ]
+        }
+      ]
+    }
+
 Exit codes:
     0: Colors match within tolerance
     1: Colors differ beyond tolerance
@@ -20,33 +49,34 @@ Exit codes:
 """
 
 import argparse
+import asyncio
 import json
 import sys
+import time
+import xml.etree.ElementTree as ET
+from dataclasses import asdict, dataclass, field
 from pathlib import Path
+from typing import Optional
+
 from playwright.sync_api import sync_playwright
 
+from event_style_scraper.colors import delta_e_2000, parse_color, rgb_to_lab
+
 
 def hex_to_rgb(hex_color: str) -> tuple:
-    """Convert hex color to RGB tuple."""
-    hex_color = hex_color.lstrip('#')
-    if len(hex_color) != 6:
-        raise ValueError(f"Invalid hex color: {hex_color}")
-    return tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
+    """Convert a CSS color (hex, rgb, hsl or named) to an RGB tuple."""
+    color = parse_color(hex_color)
+    if color is None:
+        raise ValueError(f"Invalid color: {hex_color}")
+    return color.rgb
 
 
 def rgb_string_to_tuple(rgb_string: str) -> tuple:
-    """Convert 'rgb(R, G, B)' string to (R, G, B) tuple."""
-    # Handle both "rgb(22, 8, 34)" and "rgba(22, 8, 34, 1)" formats
-    rgb_string = rgb_string.replace("rgba(", "rgb(")
-    if not rgb_string.startswith("rgb("):
+    """Convert a computed 'rgb(R, G, B)' or 'rgba(R, G, B, A)' string to an (R, G, B) tuple."""
+    color = parse_color(rgb_string)
+    if color is None:
         raise ValueError(f"Invalid RGB string: {rgb_string}")
-
-    # Extract numbers
-    nums_str = rgb_string.replace("rgb(", "").replace(")", "").split(",")
-    # Take only first 3 values (R, G, B), ignore alpha if present
-    nums = [int(n.strip()) for n in nums_str[:3]]
-
-    return tuple(nums)
+    return color.rgb
 
 
 def extract_color_with_playwright(url: str, selector: str, property: str, timeout: int = 30000) -> str:
@@ -111,6 +141,316 @@ def compare_colors(scraped_rgb: tuple, actual_rgb: tuple, tolerance: int = 2) ->
     return matches, max_diff
 
 
+def perceptual_distance(rgb_a: tuple, rgb_b: tuple) -> float:
+    """CIEDE2000 Delta-E between two RGB tuples (below ~2.3 reads as the same color)."""
+    return round(float(delta_e_2000(rgb_to_lab(rgb_a), rgb_to_lab(rgb_b))), 2)
+
+
+# Reads every check's computed style in one round trip; selectors and
+# properties are passed as data, not spliced into the script
+EVALUATE_CHECKS_JS = """(checks) => checks.map(({selector, property}) => {
+    const el = document.querySelector(selector);
+    if (!el) {
+        return {error: `Element not found: ${selector}`};
+    }
+    const value = window.getComputedStyle(el)[property];
+    return value ? {value} : {error: `Property not available: ${property}`};
+})"""
+
+
+@dataclass
+class ColorCheck:
+    """One selector/property compared against one config field."""
+
+    field: str
+    selector: str
+    property: str
+    expected: Optional[str] = None
+    tolerance: Optional[int] = None
+
+
+@dataclass
+class SiteSpec:
+    """A config to validate and the page it was scraped from."""
+
+    url: str
+    config_path: str
+    config: dict
+    checks: list
+
+
+@dataclass
+class CheckResult:
+    """Outcome of one check: pass, fail (beyond tolerance) or error."""
+
+    field: str
+    selector: str
+    property: str
+    status: str
+    scraped: Optional[str] = None
+    actual: Optional[str] = None
+    expected: Optional[str] = None
+    diff: Optional[int] = None
+    expected_diff: Optional[int] = None
+    delta_e: Optional[float] = None
+    message: Optional[str] = None
+
+
+@dataclass
+class SiteResult:
+    """All check results for one site."""
+
+    url: str
+    config: str
+    seconds: float
+    checks: list = field(default_factory=list)
+    error: Optional[str] = None
+
+
+def config_field(config: dict, path: str):
+    """Value at a dotted path such as colors.primary."""
+    value = config
+    for part in path.split('.'):
+        value = value[part]
+    return value
+
+
+def load_manifest(manifest_path: Path) -> list:
+    """
+    Load a batch manifest into site specs.
+
+    Raises:
+        ValueError: If the manifest is malformed or a site has no checks or URL
+        FileNotFoundError: If a config file does not exist
+    """
+    manifest = json.loads(manifest_path.read_text())
+    base_dir = manifest_path.parent
+    shared = [ColorCheck(**check) for check in manifest.get("checks", [])]
+    sites = []
+    for entry in manifest.get("sites", []):
+        config_path = Path(entry["config"])
+        if not config_path.is_absolute():
+            config_path = base_dir / config_path
+        config = load_scraped_config(config_path)
+        url = entry.get("url") or config.get("source_url")
+        if not url:
+            raise ValueError(f"No url for {config_path} and the config has no source_url")
+        checks = shared + [ColorCheck(**check) for check in entry.get("checks", [])]
+        if not checks:
+            raise ValueError(f"No checks for {config_path}")
+        sites.append(SiteSpec(url=url, config_path=str(config_path), config=config, checks=checks))
+    if not sites:
+        raise ValueError(f"No sites in manifest {manifest_path}")
+    return sites
+
+
+def evaluate_check(
+    check: ColorCheck,
+    config: dict,
+    computed: dict,
+    tolerance: int,
+    max_delta_e: Optional[float] = None,
+) -> CheckResult:
+    """
+    Compare one computed style value against the config (and expected) color.
+
+    Colors match within ``tolerance`` RGB units per channel, or within
+    ``max_delta_e`` CIEDE2000 units when that is given.
+    """
+    result = CheckResult(
+        field=check.field, selector=check.selector, property=check.property, status="error",
+        expected=check.expected, actual=computed.get("value"),
+    )
+    tolerance = check.tolerance if check.tolerance is not None else tolerance
+    try:
+        result.scraped = config_field(config, check.field)
+    except (KeyError, TypeError):
+        result.message = f"Field not found in config: {check.field}"
+        return result
+    if "error" in computed:
+        result.message = computed["error"]
+        return result
+    try:
+        actual_rgb = rgb_string_to_tuple(result.actual)
+        scraped_rgb = hex_to_rgb(result.scraped)
+        matches, result.diff = compare_colors(scraped_rgb, actual_rgb, tolerance)
+        result.delta_e = perceptual_distance(scraped_rgb, actual_rgb)
+        if max_delta_e is not None:
+            matches = result.delta_e <= max_delta_e
+        if check.expected:
+            expected_rgb = hex_to_rgb(check.expected)
+            expected_matches, result.expected_diff = compare_colors(
+                expected_rgb, actual_rgb, tolerance
+            )
+            if max_delta_e is not None:
+                expected_matches = perceptual_distance(expected_rgb, actual_rgb) <= max_delta_e
+            matches = matches and expected_matches
+    except (ValueError, AttributeError, TypeError) as e:
+        result.message = str(e)
+        return result
+    result.status = "pass" if matches else "fail"
+    if not matches:
+        if max_delta_e is not None:
+            result.message = f"ΔE={result.delta_e} (max {max_delta_e} allowed)"
+        else:
+            result.message = (
+                f"Δ={result.diff} RGB units (max {tolerance} allowed), ΔE={result.delta_e}"
+            )
+    return result
+
+
+async def validate_site(
+    browser, site: SiteSpec, tolerance: int, timeout: int, max_delta_e: Optional[float] = None
+) -> SiteResult:
+    """Open one site in its own browser context and run all of its checks at once."""
+    start = time.perf_counter()
+    context = await browser.new_context()
+    try:
+        page = await context.new_page()
+        await page.goto(site.url, wait_until="networkidle", timeout=timeout * 1000)
+        computed = await page.evaluate(
+            EVALUATE_CHECKS_JS,
+            [{"selector": c.selector, "property": c.property} for c in site.checks],
+        )
+    except Exception as e:
+        error = f"{type(e).__name__}: {e}"
+        checks = [
+            CheckResult(
+                field=c.field,
+                selector=c.selector,
+                property=c.property,
+                status="error",
+                message=error,
+            )
+            for c in site.checks
+        ]
+        return SiteResult(site.url, site.config_path, time.perf_counter() - start, checks, error)
+    finally:
+        await context.close()
+    checks = [
+        evaluate_check(c, site.config, v, tolerance, max_delta_e)
+        for c, v in zip(site.checks, computed)
+    ]
+    return SiteResult(site.url, site.config_path, time.perf_counter() - start, checks)
+
+
+async def validate_sites(
+    sites: list, concurrency: int, tolerance: int, timeout: int, max_delta_e: Optional[float] = None
+) -> list:
+    """Validate sites concurrently in one shared browser."""
+    from playwright.async_api import async_playwright
+
+    semaphore = asyncio.Semaphore(concurrency)
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=True)
+
+        async def run(site):
+            async with semaphore:
+                result = await validate_site(browser, site, tolerance, timeout, max_delta_e)
+            print(f"{'✅' if all(c.status == 'pass' for c in result.checks) else '❌'} {site.url} "
+                  f"({len(site.checks)} checks, {result.seconds:.1f}s)")
+            return result
+
+        try:
+            return await asyncio.gather(*(run(site) for site in sites))
+        finally:
+            await browser.close()
+
+
+def summarize_results(results: list) -> dict:
+    """Site and check counts by status."""
+    checks = [c for site in results for c in site.checks]
+    return {
+        "sites": len(results),
+        "checks": len(checks),
+        "passed": sum(1 for c in checks if c.status == "pass"),
+        "failed": sum(1 for c in checks if c.status == "fail"),
+        "errors": sum(1 for c in checks if c.status == "error"),
+    }
+
+
+def write_json_report(results: list, path: Path, duration: float) -> None:
+    """Write results and a summary as JSON."""
+    report = {
+        "duration_seconds": round(duration, 3),
+        "summary": summarize_results(results),
+        "sites": [asdict(site) for site in results],
+    }
+    path.write_text(json.dumps(report, indent=2))
+
+
+def write_junit_report(results: list, path: Path, duration: float) -> None:
+    """Write results as JUnit XML: one testsuite per site, one testcase per check."""
+    summary = summarize_results(results)
+    root = ET.Element(
+        "testsuites", name="validate_scraped_colors", tests=str(summary["checks"]),
+        failures=str(summary["failed"]), errors=str(summary["errors"]), time=f"{duration:.3f}",
+    )
+    for site in results:
+        suite = ET.SubElement(
+            root, "testsuite", name=site.url, tests=str(len(site.checks)),
+            failures=str(sum(1 for c in site.checks if c.status == "fail")),
+            errors=str(sum(1 for c in site.checks if c.status == "error")),
+            time=f"{site.seconds:.3f}",
+        )
+        for check in site.checks:
+            case = ET.SubElement(
+                suite, "testcase", classname=Path(site.config).stem,
+                name=f"{check.field} {check.selector}.{check.property}",
+            )
+            if check.status != "pass":
+                detail = (
+                    f"scraped {check.scraped}, actual {check.actual}, expected {check.expected}"
+                )
+                ET.SubElement(case, "failure" if check.status == "fail" else "error",
+                              message=check.message or "").text = detail
+    ET.ElementTree(root).write(path, encoding="utf-8", xml_declaration=True)
+
+
+def run_batch(args) -> int:
+    """Validate every site in the manifest and write the requested reports."""
+    try:
+        sites = load_manifest(Path(args.manifest))
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        print(f"❌ Error: Invalid manifest {args.manifest}: {e}")
+        return 2
+
+    checks = sum(len(site.checks) for site in sites)
+    print(f"🔍 Validating {checks} checks on {len(sites)} sites ({args.concurrency} at a time)")
+    start = time.perf_counter()
+    try:
+        results = asyncio.run(
+            validate_sites(sites, args.concurrency, args.tolerance, args.timeout, args.max_delta_e)
+        )
+    except Exception as e:
+        print(f"❌ Error: {type(e).__name__}: {e}")
+        return 2
+    duration = time.perf_counter() - start
+
+    for site in results:
+        for check in site.checks:
+            if check.status != "pass":
+                icon = "❌" if check.status == "fail" else "⚠️ "
+                print(
+                    f"  {icon} {site.url} {check.field} ({check.selector}.{check.property}): "
+                    f"{check.message}"
+                )
+    if args.json_report:
+        write_json_report(results, Path(args.json_report), duration)
+        print(f"💾 JSON report: {args.json_report}")
+    if args.junit_report:
+        write_junit_report(results, Path(args.junit_report), duration)
+        print(f"💾 JUnit report: {args.junit_report}")
+
+    summary = summarize_results(results)
+    print()
+    print(f"📊 {summary['passed']}/{summary['checks']} checks passed, {summary['failed']} failed, "
+          f"{summary['errors']} errors across {summary['sites']} sites in {duration:.1f}s")
+    if summary["errors"]:
+        return 2
+    return 1 if summary["failed"] else 0
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Validate scraped colors against DevTools inspection",
@@ -125,6 +465,13 @@ Examples:
       --property backgroundColor \\
       --expected "#160822"
 
+  # Validate many configs and fields, one page load per site
+  python scripts/validate_scraped_colors.py \\
+      --manifest validation.json \\
+      --concurrency 4 \\
+      --json-report results.json \\
+      --junit-report results.xml
+
   # Validate with custom tolerance
   python scripts/validate_scraped_colors.py \\
       --url https://example.com \\
@@ -136,17 +483,45 @@ Examples:
         """
     )
 
-    parser.add_argument("--url", required=True, help="Website URL to validate against")
-    parser.add_argument("--config", required=True, help="Path to scraped style config JSON")
-    parser.add_argument("--selector", required=True, help="CSS selector for element to inspect")
-    parser.add_argument("--property", required=True, help="CSS property to check (e.g., backgroundColor, color)")
-    parser.add_argument("--expected", required=True, help="Expected hex color (e.g., #160822)")
+    parser.add_argument("--url", help="Website URL to validate against")
+    parser.add_argument("--config", help="Path to scraped style config JSON")
+    parser.add_argument("--selector", help="CSS selector for element to inspect")
+    parser.add_argument("--property", help="CSS property to check (e.g., backgroundColor, color)")
+    parser.add_argument("--expected", help="Expected hex color (e.g., #160822)")
     parser.add_argument("--tolerance", type=int, default=2, help="Max RGB difference allowed per channel (default: 2)")
+    parser.add_argument(
+        "--max-delta-e",
+        type=float,
+        help="Match on perceptual CIEDE2000 distance instead of --tolerance (e.g. 2.3)",
+    )
     parser.add_argument("--timeout", type=int, default=30, help="Page load timeout in seconds (default: 30)")
     parser.add_argument("--scraped-field", default="colors.primary", help="JSON path to scraped color in config (default: colors.primary)")
+    parser.add_argument(
+        "--manifest", help="Batch mode: JSON manifest of configs and selector -> field checks"
+    )
+    parser.add_argument(
+        "--concurrency", type=int, default=4, help="Batch mode: sites checked at once (default: 4)"
+    )
+    parser.add_argument("--json-report", help="Batch mode: write results as JSON to this path")
+    parser.add_argument(
+        "--junit-report", help="Batch mode: write results as JUnit XML to this path"
+    )
 
     args = parser.parse_args()
 
+    if args.manifest:
+        if args.concurrency < 1:
+            parser.error("--concurrency must be at least 1")
+        return run_batch(args)
+    missing = [
+        name
+        for name in ("url", "config", "selector", "property", "expected")
+        if not getattr(args, name)
+    ]
+    if missing:
+        parser.error(f"the following arguments are required without --manifest: "
+                     f"{', '.join('--' + name for name in missing)}")
+
     print(f"🔍 Validating scraped color for {args.url}")
     print(f"📁 Config: {args.config}")
     print(f"🎯 Element: {args.selector}")
@@ -183,9 +558,20 @@ Examples:
 
         # Compare scraped vs actual
         scraped_matches, scraped_diff = compare_colors(scraped_rgb, actual_rgb, args.tolerance)
+        scraped_delta_e = perceptual_distance(scraped_rgb, actual_rgb)
 
         # Compare expected vs actual
         expected_matches, expected_diff = compare_colors(expected_rgb, actual_rgb, args.tolerance)
+        expected_delta_e = perceptual_distance(expected_rgb, actual_rgb)
+
+        if args.max_delta_e is not None:
+            scraped_matches = scraped_delta_e <= args.max_delta_e
+            expected_matches = expected_delta_e <= args.max_delta_e
+        limit = (
+            f"max ΔE {args.max_delta_e}"
+            if args.max_delta_e is not None
+            else f"max {args.tolerance} RGB units"
+        )
 
         # Display comparison
         print("📊 Comparison Results:")
@@ -194,18 +580,24 @@ Examples:
         print(f"  Actual:   {actual_color} → RGB{actual_rgb}")
         print()
 
-        print(f"  Scraped vs Actual:  Δ={scraped_diff} RGB units  {'✅ MATCH' if scraped_matches else '❌ MISMATCH'}")
-        print(f"  Expected vs Actual: Δ={expected_diff} RGB units  {'✅ MATCH' if expected_matches else '❌ MISMATCH'}")
+        print(
+            f"  Scraped vs Actual:  Δ={scraped_diff} RGB units, ΔE={scraped_delta_e}  "
+            f"{'✅ MATCH' if scraped_matches else '❌ MISMATCH'}"
+        )
+        print(
+            f"  Expected vs Actual: Δ={expected_diff} RGB units, ΔE={expected_delta_e}  "
+            f"{'✅ MATCH' if expected_matches else '❌ MISMATCH'}"
+        )
         print()
 
         # Determine final result
         if scraped_matches:
             print("✅ SUCCESS: Scraped color matches DevTools within tolerance")
-            print(f"   Difference: {scraped_diff} RGB units (max {args.tolerance} allowed)")
+            print(f"   Difference: {scraped_diff} RGB units, ΔE={scraped_delta_e} ({limit})")
             return 0
         else:
             print("❌ FAILURE: Scraped color differs from DevTools beyond tolerance")
-            print(f"   Difference: {scraped_diff} RGB units (max {args.tolerance} allowed)")
+            print(f"   Difference: {scraped_diff} RGB units, ΔE={scraped_delta_e} ({limit})")
             print()
             print("Possible causes:")
             print("  - Agent hallucinated colors instead of using Playwright tool")
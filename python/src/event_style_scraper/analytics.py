@@ -0,0 +1,261 @@
+"""Deterministic attendee analytics computed for a whole event at once.
+
+Replaces the LLM ``analyze_attendee`` stage for the facts that can be
+computed exactly from an attendee's ``sessions`` and ``connections``:
+counts, minutes, top tracks, topic diversity, speakers heard and which
+of them the attendee connected with. Attendees are flattened into NumPy
+arrays so the event is processed in a handful of vectorized passes
+rather than attendee by attendee. Every field depends only on the
+attendee's own record, so a profile (and the content hash built from
+it) stays the same when other attendees are added or change.
+"""
+
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+from pydantic import BaseModel, Field
+
+# How many top tracks, featured sessions and connection companies to keep
+TOP_N = 3
+
+
+class AttendeeProfile(BaseModel):
+    """Compact, exact summary of one attendee's event experience."""
+
+    attendee_id: str = Field(..., description="Attendee identifier")
+    name: str = Field(..., description="Full name")
+    title: Optional[str] = Field(default=None, description="Job title")
+    company: Optional[str] = Field(default=None, description="Company")
+    session_count: int = Field(default=0, description="Sessions attended")
+    total_minutes: int = Field(default=0, description="Minutes spent in sessions")
+    track_count: int = Field(default=0, description="Distinct tracks attended")
+    top_tracks: List[str] = Field(
+        default_factory=list, description="Most attended tracks, most first"
+    )
+    topic_diversity: float = Field(
+        default=0.0,
+        description="Normalized entropy of sessions across tracks (0 = one track, 1 = even spread)",
+    )
+    featured_sessions: List[str] = Field(
+        default_factory=list, description="Titles of sessions in the top tracks, in time order"
+    )
+    speakers_heard: int = Field(default=0, description="Distinct speakers across attended sessions")
+    repeat_speakers: List[str] = Field(
+        default_factory=list, description="Speakers heard in two or more sessions"
+    )
+    connection_count: int = Field(default=0, description="Connections made")
+    top_connection_companies: List[str] = Field(
+        default_factory=list, description="Companies the attendee connected with most"
+    )
+    connected_speakers: List[str] = Field(
+        default_factory=list, description="Connections who spoke at a session the attendee attended"
+    )
+    top_achievement: Optional[str] = Field(
+        default=None, description="Achievement from the attendee's stats"
+    )
+
+    def to_context(self) -> str:
+        """Compact JSON used as the attendee analysis in content prompts."""
+        return self.model_dump_json(exclude_none=True)
+
+
+def speaker_name(speaker: str) -> str:
+    """Name part of a "Name, Title, Company" speaker string."""
+    return speaker.split(",", 1)[0].strip()
+
+
+class _Interner:
+    """Map strings to dense integer codes."""
+
+    def __init__(self) -> None:
+        self.codes: Dict[str, int] = {}
+        self.values: List[str] = []
+
+    def __call__(self, value: str) -> int:
+        code = self.codes.get(value)
+        if code is None:
+            code = self.codes[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def ranks(self) -> np.ndarray:
+        """Alphabetical rank of each code, for order-independent tie-breaks."""
+        return np.argsort(np.argsort(np.asarray(self.values or [""])))
+
+
+def _ranked_pairs(
+    owners: np.ndarray, codes: np.ndarray, n_codes: int, ranks: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Count distinct (owner, code) pairs and order them per owner.
+
+    Returns owner, code and count arrays sorted by owner, then count
+    descending, then code rank ascending.
+    """
+    if owners.size == 0:
+        empty = np.zeros(0, dtype=np.int64)
+        return empty, empty, empty
+    keys, counts = np.unique(owners * n_codes + codes, return_counts=True)
+    pair_owners, pair_codes = np.divmod(keys, n_codes)
+    order = np.lexsort((ranks[pair_codes], -counts, pair_owners))
+    return pair_owners[order], pair_codes[order], counts[order]
+
+
+def _group(owners: np.ndarray, n_owners: int) -> List[slice]:
+    """Slices of a sorted owner array, one per owner."""
+    bounds = np.searchsorted(owners, np.arange(n_owners + 1))
+    return [slice(bounds[i], bounds[i + 1]) for i in range(n_owners)]
+
+
+def compute_profiles(attendees: Iterable[Dict[str, Any]]) -> List[AttendeeProfile]:
+    """
+    Compute profiles for all attendees of an event.
+
+    Attendees are read in a single pass, so a generator of lazily
+    materialized attendees (AttendeeRepository.iter_attendees) works
+    without holding them all in memory.
+
+    Args:
+        attendees: Attendee dicts (``sessions`` and ``connections`` arrays
+            as in data/attendees/*.json)
+
+    Returns:
+        One AttendeeProfile per attendee, in input order
+    """
+    # Flatten sessions, speakers and connections into parallel arrays
+    identities: List[Dict[str, Any]] = []
+    tracks, speakers, companies, people = _Interner(), _Interner(), _Interner(), _Interner()
+    session_owner: List[int] = []
+    session_track: List[int] = []
+    session_minutes: List[float] = []
+    session_meta: List[Tuple[str, str]] = []  # (dateTime, title)
+    speaker_owner: List[int] = []
+    speaker_code: List[int] = []
+    connection_owner: List[int] = []
+    connection_company: List[int] = []
+    connection_person: List[int] = []
+
+    for index, attendee in enumerate(attendees):
+        identities.append({
+            "attendee_id": str(attendee.get("id", "")),
+            "name": f"{attendee.get('firstName', '')} {attendee.get('lastName', '')}".strip(),
+            "title": attendee.get("title"),
+            "company": attendee.get("company"),
+            "top_achievement": (attendee.get("stats") or {}).get("topAchievement"),
+        })
+        for session in attendee.get("sessions") or []:
+            session_owner.append(index)
+            session_track.append(tracks(session.get("track") or "General"))
+            session_minutes.append(float(session.get("durationMinutes") or 0))
+            session_meta.append((session.get("dateTime") or "", session.get("title") or ""))
+            for speaker in session.get("speakers") or []:
+                speaker_owner.append(index)
+                speaker_code.append(speakers(speaker_name(speaker)))
+        for connection in attendee.get("connections") or []:
+            connection_owner.append(index)
+            connection_company.append(companies(connection.get("company") or ""))
+            connection_person.append(people(connection.get("name") or ""))
+
+    n = len(identities)
+    if n == 0:
+        return []
+    s_owner = np.asarray(session_owner, dtype=np.int64)
+    s_track = np.asarray(session_track, dtype=np.int64)
+    sp_owner = np.asarray(speaker_owner, dtype=np.int64)
+    sp_code = np.asarray(speaker_code, dtype=np.int64)
+    c_owner = np.asarray(connection_owner, dtype=np.int64)
+    c_company = np.asarray(connection_company, dtype=np.int64)
+
+    session_counts = np.bincount(s_owner, minlength=n)
+    minutes = np.bincount(s_owner, weights=np.asarray(session_minutes), minlength=n)
+    connection_counts = np.bincount(c_owner, minlength=n)
+
+    # Tracks: attendee x track counts; few tracks per event, so dense is fine
+    n_tracks = max(len(tracks), 1)
+    track_matrix = np.bincount(s_owner * n_tracks + s_track, minlength=n * n_tracks).reshape(
+        n, n_tracks
+    )
+    track_counts = (track_matrix > 0).sum(axis=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        shares = track_matrix / np.maximum(session_counts, 1)[:, None]
+        entropy = -np.where(shares > 0, shares * np.log(shares), 0.0).sum(axis=1)
+        diversity = np.where(track_counts > 1, entropy / np.log(np.maximum(track_counts, 2)), 0.0)
+    # Ties go to the alphabetically first track
+    top_track_codes = np.lexsort(
+        (np.broadcast_to(tracks.ranks(), track_matrix.shape), -track_matrix), axis=1
+    )
+
+    # Speakers and connection companies: sparse (owner, code) pair counts
+    sp_pairs = _ranked_pairs(sp_owner, sp_code, max(len(speakers), 1), speakers.ranks())
+    speaker_groups = _group(sp_pairs[0], n)
+    co_pairs = _ranked_pairs(c_owner, c_company, max(len(companies), 1), companies.ranks())
+    company_groups = _group(co_pairs[0], n)
+
+    # Connections who were also speakers the attendee heard
+    speaker_of_person = np.asarray(
+        [speakers.codes.get(person, -1) for person in people.values], dtype=np.int64
+    )
+    n_speakers = max(len(speakers), 1)
+    c_speaker = (
+        speaker_of_person[np.asarray(connection_person, dtype=np.int64)]
+        if people.values
+        else c_owner
+    )
+    known = c_speaker >= 0
+    overlap = np.intersect1d(
+        c_owner[known] * n_speakers + c_speaker[known], sp_owner * n_speakers + sp_code
+    )
+    overlap_owner, overlap_speaker = np.divmod(overlap, n_speakers)
+    overlap_groups = _group(overlap_owner, n)
+
+    session_order = (
+        np.lexsort(
+            (np.arange(len(session_meta)), np.asarray([m[0] for m in session_meta]), s_owner)
+        )
+        if session_meta
+        else np.zeros(0, dtype=np.int64)
+    )
+    session_groups = _group(s_owner[session_order], n)
+
+    profiles = []
+    for index, identity in enumerate(identities):
+        top_codes = [int(c) for c in top_track_codes[index] if track_matrix[index, c] > 0][:TOP_N]
+        top_set = set(top_codes)
+        featured = [
+            session_meta[i][1]
+            for i in session_order[session_groups[index]]
+            if s_track[i] in top_set and session_meta[i][1]
+        ][:TOP_N]
+        speaker_slice = speaker_groups[index]
+        repeat = [
+            speakers.values[code]
+            for code, count in zip(sp_pairs[1][speaker_slice], sp_pairs[2][speaker_slice])
+            if count >= 2
+        ]
+        company_slice = company_groups[index]
+        profiles.append(
+            AttendeeProfile(
+                **identity,
+                session_count=int(session_counts[index]),
+                total_minutes=int(round(minutes[index])),
+                track_count=int(track_counts[index]),
+                top_tracks=[tracks.values[code] for code in top_codes],
+                topic_diversity=round(float(diversity[index]), 2),
+                featured_sessions=featured,
+                speakers_heard=speaker_slice.stop - speaker_slice.start,
+                repeat_speakers=repeat,
+                connection_count=int(connection_counts[index]),
+                top_connection_companies=[
+                    companies.values[code]
+                    for code in co_pairs[1][company_slice][:TOP_N]
+                    if companies.values[code]
+                ],
+                connected_speakers=sorted(
+                    speakers.values[code] for code in overlap_speaker[overlap_groups[index]]
+                ),
+            )
+        )
+    return profiles
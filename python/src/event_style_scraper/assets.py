@@ -0,0 +1,594 @@
+"""Logo and favicon asset pipeline.
+
+The extractors report at most one logo and one favicon URL, picked by a
+single selector, and pages that hotlink them break when the event site
+moves its images (plans/008). This stage:
+
+1. ranks every logo and favicon candidate on the source page: logo-like
+   images in the header, SVGs, ``og:image``, ``apple-touch-icon``, the
+   declared icons and the URLs the extractor found (``find_candidates``)
+2. fetches the top candidates of all events concurrently through one
+   pooled ``httpx.Client`` and an ETag/Last-Modified disk cache, so
+   re-runs only download what changed (``AssetFetcher``)
+3. keeps the best candidate per role that decodes: raster images are
+   written as size-capped PNG variants, SVGs are copied after removing
+   scripts, event handlers and external references
+4. records the site paths in ``EventStyleConfig.local_assets``
+
+Files are written to ``<images_dir>/<event_id>/`` (``logo.svg``,
+``logo-512.png``, ``favicon-32.png``, ...), so the hand-made images next
+to them are never touched.
+"""
+
+import hashlib
+import io
+import json
+import logging
+import re
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Sequence, Tuple
+from urllib.parse import urljoin, urlparse
+
+import httpx
+from pydantic import BaseModel, Field
+
+from event_style_scraper.export import write_atomic
+from event_style_scraper.tools import SecurityError, WebScraperTool
+from event_style_scraper.types import EventStyleConfig, LocalAssets
+
+if TYPE_CHECKING:
+    from bs4 import Tag
+
+logger = logging.getLogger(__name__)
+
+ASSET_ROLES = ("logo", "favicon")
+DEFAULT_CACHE_DIR = Path(".asset-cache")
+DEFAULT_URL_PREFIX = "/static/images"
+
+# Longest side in px of the raster variants written for each role
+VARIANT_SIZES = {"logo": (256, 512), "favicon": (32, 180)}
+
+# Candidates fetched per role; the rest are only tried if all of these fail
+MAX_CANDIDATES = 4
+
+MAX_ASSET_BYTES = 5_000_000
+# Refuse to decode larger images (decompression bombs)
+MAX_PIXELS = 40_000_000
+
+LOGO_HINT = re.compile(r"logo|brand", re.IGNORECASE)
+SVG_DROP_TAGS = {"script", "foreignObject"}
+
+
+class AssetCandidate(BaseModel):
+    """A URL that may hold an event's logo or favicon."""
+
+    role: str = Field(..., description="Asset role: logo or favicon")
+    url: str = Field(..., description="Absolute image URL")
+    score: float = Field(..., description="Rank; higher is tried first")
+    reason: str = Field(..., description="Why the URL is a candidate")
+
+
+class FetchedAsset(BaseModel):
+    """A downloaded response body."""
+
+    url: str = Field(..., description="Requested URL")
+    content: bytes = Field(..., description="Response body")
+    content_type: str = Field(default="", description="Content-Type without parameters")
+    from_cache: bool = Field(default=False, description="Whether the cached copy was still valid")
+
+
+def _path_is_svg(url: str) -> bool:
+    return urlparse(url).path.lower().endswith(".svg")
+
+
+def _attr(node: "Tag", name: str) -> str:
+    """An attribute as text; multi-valued ones such as class are space-joined."""
+    value = node.get(name)
+    if isinstance(value, list):
+        return " ".join(value)
+    return value or ""
+
+
+def _hints(node: "Tag") -> str:
+    """Text that marks an image as a logo: its attributes and those of two ancestors."""
+    parts = [_attr(node, "alt"), _attr(node, "src"), _attr(node, "id"), _attr(node, "class")]
+    for parent in list(node.parents)[:2]:
+        parts += [_attr(parent, "id"), _attr(parent, "class")]
+    return " ".join(parts)
+
+
+def find_candidates(
+    html: str, page_url: str, config: Optional[EventStyleConfig] = None
+) -> List[AssetCandidate]:
+    """
+    Rank logo and favicon candidates on a page.
+
+    Logos: images with a logo hint (alt, src, id or class of the image or
+    its parents) score 3, plus 2 inside header/nav, 1 for a link to the
+    home page and 1 for SVG. The extractor's logo scores 2.5, ``og:image``
+    1.5 (often a banner) and ``apple-touch-icon`` 1. Favicons: SVG icons
+    score 3.5, ``apple-touch-icon`` 3 (180 px), other declared icons and
+    the extractor's favicon 2, and ``/favicon.ico`` 0.5.
+
+    Args:
+        html: Page HTML
+        page_url: URL the page was loaded from, for relative URLs
+        config: Config whose logo_url and favicon_url are also candidates
+
+    Returns:
+        Candidates of both roles, best first; each URL appears once per role
+    """
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(html or "", "lxml")
+    found: List[AssetCandidate] = []
+
+    def add(role: str, url: Optional[str], score: float, reason: str) -> None:
+        if not url or url.startswith("data:"):
+            return
+        url = urljoin(page_url, url.strip())
+        if urlparse(url).scheme in ("http", "https"):
+            found.append(AssetCandidate(role=role, url=url, score=score, reason=reason))
+
+    home = urlparse(page_url)
+    for img in soup.find_all("img"):
+        src = _attr(img, "src") or _attr(img, "data-src")
+        if not src or not LOGO_HINT.search(_hints(img)):
+            continue
+        score, reasons = 3.0, ["logo image"]
+        if img.find_parent(["header", "nav"]) is not None:
+            score, reasons = score + 2, reasons + ["in header"]
+        link = img.find_parent("a")
+        if link is not None and _attr(link, "href"):
+            target = urlparse(urljoin(page_url, _attr(link, "href")))
+            if target.netloc == home.netloc and target.path in ("", "/"):
+                score, reasons = score + 1, reasons + ["links home"]
+        if _path_is_svg(src):
+            score, reasons = score + 1, reasons + ["svg"]
+        add("logo", src, score, ", ".join(reasons))
+
+    if config is not None:
+        add("logo", config.logo_url, 2.5 + _path_is_svg(config.logo_url or ""), "extractor logo")
+        add("favicon", config.favicon_url, 2.0, "extractor favicon")
+
+    og_image = soup.find("meta", property="og:image")
+    if og_image is not None:
+        add("logo", _attr(og_image, "content"), 1.5, "og:image")
+
+    for link in soup.find_all("link", href=True):
+        rel, href = _attr(link, "rel").lower().split(), _attr(link, "href")
+        if "apple-touch-icon" in rel or "apple-touch-icon-precomposed" in rel:
+            add("favicon", href, 3.0, "apple-touch-icon")
+            add("logo", href, 1.0, "apple-touch-icon")
+        elif "icon" in rel:
+            is_svg = _path_is_svg(href) or "svg" in _attr(link, "type")
+            add("favicon", href, 3.5 if is_svg else 2.0, "svg icon" if is_svg else "icon")
+    add("favicon", "/favicon.ico", 0.5, "default favicon.ico")
+
+    best: Dict[Tuple[str, str], AssetCandidate] = {}
+    for candidate in found:
+        key = (candidate.role, candidate.url)
+        if key not in best or candidate.score > best[key].score:
+            best[key] = candidate
+    # sorted() is stable, so equal scores keep page order
+    return sorted(best.values(), key=lambda c: -c.score)
+
+
+class AssetCache:
+    """
+    Disk cache of downloaded assets with their validators.
+
+    Each URL is stored as ``<sha256>.body`` and ``<sha256>.json`` (URL,
+    content type, ETag and Last-Modified). Both are written atomically.
+    """
+
+    def __init__(self, directory: Path = DEFAULT_CACHE_DIR):
+        """
+        Initialize AssetCache.
+
+        Args:
+            directory: Cache directory (created when first written)
+        """
+        self.directory = Path(directory)
+
+    def _paths(self, url: str) -> Tuple[Path, Path]:
+        key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        return self.directory / f"{key}.body", self.directory / f"{key}.json"
+
+    def get(self, url: str) -> Optional[Tuple[Dict[str, str], bytes]]:
+        """Cached metadata and body of a URL, or None."""
+        body_path, meta_path = self._paths(url)
+        try:
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+            return meta, body_path.read_bytes()
+        except (FileNotFoundError, ValueError):
+            return None
+
+    def put(self, url: str, content: bytes, headers: httpx.Headers) -> None:
+        """Store a response, unless it has no validators to revalidate it with."""
+        if not headers.get("etag") and not headers.get("last-modified"):
+            return
+        body_path, meta_path = self._paths(url)
+        meta = {
+            "url": url,
+            "content_type": headers.get("content-type", ""),
+            "etag": headers.get("etag"),
+            "last_modified": headers.get("last-modified"),
+        }
+        # Body first: metadata without its body reads as a miss
+        write_atomic(body_path, content)
+        write_atomic(meta_path, json.dumps(meta))
+
+
+class AssetFetcher:
+    """
+    Fetch assets through one connection pool and the disk cache.
+
+    Every request, including redirects, passes WebScraperTool's URL
+    validation. Responses larger than ``max_bytes`` are rejected.
+    """
+
+    def __init__(
+        self,
+        cache: Optional[AssetCache] = None,
+        concurrency: int = 8,
+        timeout: int = 30,
+        max_bytes: int = MAX_ASSET_BYTES,
+        transport: Optional[httpx.BaseTransport] = None,
+        allowed_hosts: Optional[Iterable[str]] = None,
+    ):
+        """
+        Initialize AssetFetcher.
+
+        Args:
+            cache: Disk cache (default: ``.asset-cache``)
+            concurrency: Requests in flight at once (and pooled connections)
+            timeout: Request timeout in seconds
+            max_bytes: Maximum response size
+            transport: httpx transport (for tests)
+            allowed_hosts: Hostnames exempt from the SSRF checks
+        """
+        self.cache = cache if cache is not None else AssetCache()
+        self.concurrency = max(1, concurrency)
+        self.max_bytes = max_bytes
+        self._security = WebScraperTool(timeout=timeout, allowed_hosts=allowed_hosts)
+        self.client = httpx.Client(
+            timeout=timeout,
+            follow_redirects=True,
+            headers={"User-Agent": self._security.user_agent},
+            limits=httpx.Limits(
+                max_connections=self.concurrency, max_keepalive_connections=self.concurrency
+            ),
+            transport=transport,
+            event_hooks={
+                "request": [lambda request: self._security.validate_url(str(request.url))]
+            },
+        )
+
+    def close(self) -> None:
+        """Close the pooled connections."""
+        self.client.close()
+
+    def __enter__(self) -> "AssetFetcher":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def fetch(self, url: str) -> FetchedAsset:
+        """
+        Fetch a URL, revalidating a cached copy with If-None-Match/If-Modified-Since.
+
+        Raises:
+            SecurityError: If the URL or a redirect fails validation
+            httpx.HTTPError: If the request fails or returns an error status
+            ValueError: If the response exceeds max_bytes
+        """
+        cached = self.cache.get(url)
+        headers = {}
+        if cached is not None:
+            meta = cached[0]
+            if meta.get("etag"):
+                headers["If-None-Match"] = meta["etag"]
+            if meta.get("last_modified"):
+                headers["If-Modified-Since"] = meta["last_modified"]
+
+        with self.client.stream("GET", url, headers=headers) as response:
+            if response.status_code == 304 and cached is not None:
+                meta, content = cached
+                return FetchedAsset(
+                    url=url,
+                    content=content,
+                    content_type=meta.get("content_type", "").split(";")[0].strip(),
+                    from_cache=True,
+                )
+            response.raise_for_status()
+            chunks, size = [], 0
+            for chunk in response.iter_bytes():
+                size += len(chunk)
+                if size > self.max_bytes:
+                    raise ValueError(f"{url} is larger than {self.max_bytes} bytes")
+                chunks.append(chunk)
+        content = b"".join(chunks)
+        self.cache.put(url, content, response.headers)
+        return FetchedAsset(
+            url=url,
+            content=content,
+            content_type=response.headers.get("content-type", "").split(";")[0].strip(),
+        )
+
+    def try_fetch(self, url: str) -> Optional[FetchedAsset]:
+        """Fetch a URL, logging and returning None on failure."""
+        try:
+            return self.fetch(url)
+        except (SecurityError, httpx.HTTPError, ValueError) as e:
+            logger.info("Could not fetch %s: %s", url, e)
+            return None
+
+    def fetch_all(self, urls: Sequence[str]) -> Dict[str, Optional[FetchedAsset]]:
+        """Fetch URLs concurrently; failed ones map to None."""
+        unique = list(dict.fromkeys(urls))
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            return dict(zip(unique, executor.map(self.try_fetch, unique)))
+
+
+def is_svg(asset: FetchedAsset) -> bool:
+    """Whether a response is an SVG document."""
+    head = asset.content[:256].lstrip().lower()
+    return (
+        "svg" in asset.content_type
+        or _path_is_svg(asset.url)
+        or head.startswith(b"<svg")
+        or (head.startswith(b"<?xml") and b"<svg" in asset.content[:1024].lower())
+    )
+
+
+def sanitize_svg(content: bytes) -> bytes:
+    """
+    Parse an SVG and drop anything that could run or load other resources.
+
+    Raises:
+        ValueError: If the content is not an SVG document
+    """
+    from lxml import etree
+
+    parser = etree.XMLParser(resolve_entities=False, no_network=True, remove_comments=True)
+    try:
+        root = etree.fromstring(content, parser=parser)
+    except etree.XMLSyntaxError as e:
+        raise ValueError(f"Invalid SVG: {e}") from e
+    if root is None or etree.QName(root).localname != "svg":
+        raise ValueError("Not an SVG document")
+
+    for element in list(root.iter()):
+        if not isinstance(element.tag, str):
+            continue
+        if etree.QName(element).localname in SVG_DROP_TAGS:
+            element.getparent().remove(element)
+            continue
+        for name in list(element.attrib):
+            localname = etree.QName(name).localname
+            if localname.lower().startswith("on"):
+                del element.attrib[name]
+            elif localname == "href" and not element.attrib[name].startswith("#"):
+                del element.attrib[name]
+    cleaned: bytes = etree.tostring(root, xml_declaration=True, encoding="utf-8")
+    return cleaned
+
+
+def raster_variants(content: bytes, sizes: Sequence[int]) -> Dict[int, bytes]:
+    """
+    Decode an image and encode PNG copies capped at each size.
+
+    Images are never enlarged: sizes above the image's longest side
+    collapse into one copy at its own size.
+
+    Args:
+        content: Image file (any format Pillow reads, including ICO)
+        sizes: Caps on the longest side in px
+
+    Returns:
+        PNG bytes by the copy's longest side in px
+
+    Raises:
+        ValueError: If the content does not decode or is too large
+    """
+    from PIL import Image
+
+    try:
+        image = Image.open(io.BytesIO(content))
+        if image.width * image.height > MAX_PIXELS:
+            raise ValueError(f"Image of {image.width}x{image.height} px is too large")
+        image.load()
+    except (OSError, SyntaxError, Image.DecompressionBombError) as e:
+        raise ValueError(f"Image does not decode: {e}") from e
+
+    rgba = image.convert("RGBA")
+    longest = max(rgba.size)
+    variants: Dict[int, bytes] = {}
+    for size in sorted(sizes):
+        cap = min(size, longest)
+        if cap in variants:
+            continue
+        copy = rgba.copy()
+        copy.thumbnail((cap, cap), Image.Resampling.LANCZOS)
+        output = io.BytesIO()
+        copy.save(output, format="PNG", optimize=True)
+        variants[max(copy.size)] = output.getvalue()
+    return variants
+
+
+def write_variants(asset: FetchedAsset, role: str, event_dir: Path) -> Tuple[str, Dict[int, str]]:
+    """
+    Verify an asset and write its local copies for a role.
+
+    Args:
+        asset: Downloaded asset
+        role: logo or favicon
+        event_dir: The event's directory under the images directory
+
+    Returns:
+        Written file names: the main copy and the raster copies by size in px
+
+    Raises:
+        ValueError: If the asset does not decode
+    """
+    if is_svg(asset):
+        files = {f"{role}.svg": sanitize_svg(asset.content)}
+        main, names = f"{role}.svg", {}
+    else:
+        pngs = raster_variants(asset.content, VARIANT_SIZES[role])
+        files = {f"{role}-{px}.png": png for px, png in pngs.items()}
+        names = {px: f"{role}-{px}.png" for px in pngs}
+        main = names[max(names)]
+
+    for name, content in files.items():
+        write_atomic(event_dir / name, content)
+    for path in event_dir.glob(f"{role}*"):
+        if re.fullmatch(rf"{role}(-\d+\.png|\.svg)", path.name) and path.name not in files:
+            path.unlink()
+    return main, names
+
+
+class AssetPipeline:
+    """
+    Localize event logos and favicons.
+
+    Example:
+        with AssetPipeline(Path("../static/images")) as pipeline:
+            configs = pipeline.localize_many(configs)
+    """
+
+    def __init__(
+        self,
+        images_dir: Path,
+        url_prefix: str = DEFAULT_URL_PREFIX,
+        cache_dir: Path = DEFAULT_CACHE_DIR,
+        concurrency: int = 8,
+        timeout: int = 30,
+        transport: Optional[httpx.BaseTransport] = None,
+        allowed_hosts: Optional[Iterable[str]] = None,
+    ):
+        """
+        Initialize AssetPipeline.
+
+        Args:
+            images_dir: Directory the site serves as ``url_prefix``
+            url_prefix: Site path of images_dir, recorded in the configs
+            cache_dir: Download cache directory
+            concurrency: Downloads in flight at once
+            timeout: Request timeout in seconds
+            transport: httpx transport (for tests)
+            allowed_hosts: Hostnames exempt from the SSRF checks
+        """
+        self.images_dir = Path(images_dir)
+        self.url_prefix = url_prefix.rstrip("/")
+        self.fetcher = AssetFetcher(
+            AssetCache(cache_dir),
+            concurrency=concurrency,
+            timeout=timeout,
+            transport=transport,
+            allowed_hosts=allowed_hosts,
+        )
+
+    def close(self) -> None:
+        """Close the fetcher's connections."""
+        self.fetcher.close()
+
+    def __enter__(self) -> "AssetPipeline":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def _page_html(self, configs: Sequence[EventStyleConfig]) -> Dict[str, str]:
+        pages = self.fetcher.fetch_all([config.source_url for config in configs])
+        return {
+            url: page.content.decode("utf-8", errors="replace") if page is not None else ""
+            for url, page in pages.items()
+        }
+
+    def localize_many(
+        self, configs: Sequence[EventStyleConfig], pages: Optional[Dict[str, str]] = None
+    ) -> List[EventStyleConfig]:
+        """
+        Download, verify and record the logo and favicon of each config.
+
+        The top candidates of every event are fetched in one concurrent
+        pass; lower-ranked ones are fetched only for roles where all of
+        those fail. A role without any usable candidate keeps its previous
+        local copy.
+
+        Args:
+            configs: Configs to localize
+            pages: Page HTML by source URL (default: fetch the source pages)
+
+        Returns:
+            The configs with ``local_assets`` set, in the same order
+        """
+        pages = dict(pages or {})
+        missing = [config for config in configs if config.source_url not in pages]
+        if missing:
+            pages.update(self._page_html(missing))
+
+        ranked = {
+            config.event_id: {
+                role: [
+                    c
+                    for c in find_candidates(
+                        pages.get(config.source_url, ""), config.source_url, config
+                    )
+                    if c.role == role
+                ]
+                for role in ASSET_ROLES
+            }
+            for config in configs
+        }
+        fetched = self.fetcher.fetch_all(
+            [
+                c.url
+                for roles in ranked.values()
+                for candidates in roles.values()
+                for c in candidates[:MAX_CANDIDATES]
+            ]
+        )
+        return [self._localize(config, ranked[config.event_id], fetched) for config in configs]
+
+    def localize(self, config: EventStyleConfig, html: Optional[str] = None) -> EventStyleConfig:
+        """Localize one config (see localize_many)."""
+        pages = {config.source_url: html} if html is not None else None
+        return self.localize_many([config], pages)[0]
+
+    def _localize(
+        self,
+        config: EventStyleConfig,
+        ranked: Dict[str, List[AssetCandidate]],
+        fetched: Dict[str, Optional[FetchedAsset]],
+    ) -> EventStyleConfig:
+        event_dir = self.images_dir / config.event_id
+        local = (config.local_assets or LocalAssets()).model_copy()
+        for role in ASSET_ROLES:
+            for candidate in ranked[role]:
+                if candidate.url not in fetched:
+                    fetched[candidate.url] = self.fetcher.try_fetch(candidate.url)
+                asset = fetched[candidate.url]
+                if asset is None:
+                    continue
+                try:
+                    main, variants = write_variants(asset, role, event_dir)
+                except ValueError as e:
+                    logger.info("Skipping %s candidate %s: %s", role, candidate.url, e)
+                    continue
+                prefix = f"{self.url_prefix}/{config.event_id}"
+                setattr(local, role, f"{prefix}/{main}")
+                setattr(
+                    local,
+                    f"{role}_variants",
+                    {px: f"{prefix}/{name}" for px, name in variants.items()},
+                )
+                setattr(local, f"{role}_source", candidate.url)
+                break
+            else:
+                logger.info("No usable %s for %s", role, config.event_id)
+        return config.model_copy(update={"local_assets": local})
@@ -0,0 +1,440 @@
+"""Checkpointed, resumable batch scraping backed by a SQLite journal.
+
+Every event's status, last finished stage and stage outputs are written to
+the journal as soon as they happen. A resumed run skips completed events
+and restarts the others from their last finished stage:
+
+- crew engine: the crew's tasks (scrape_website, extract_styles,
+  analyze_voice, compile_config); finished tasks are not re-run and their
+  outputs are handed to the remaining tasks as context.
+- deterministic/http engines: scrape_website (raw page data) and
+  compile_config (the EventStyleConfig).
+
+The last stage is always ``export``.
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import nullcontext
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Sequence
+
+from pydantic import BaseModel, Field
+
+from event_style_scraper.engines import ENGINE_MODES, EngineMode
+from event_style_scraper.rate_limit import AdaptiveConcurrency
+from event_style_scraper.store import StyleStore
+
+if TYPE_CHECKING:
+    from event_style_scraper.assets import AssetPipeline
+
+SCRAPE_STAGE = "scrape_website"
+COMPILE_STAGE = "compile_config"
+EXPORT_STAGE = "export"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS events (
+    url TEXT PRIMARY KEY,
+    position INTEGER NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    stage TEXT,
+    event_id TEXT,
+    output_path TEXT,
+    error TEXT,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    updated_at TEXT
+);
+CREATE TABLE IF NOT EXISTS artifacts (
+    url TEXT NOT NULL,
+    stage TEXT NOT NULL,
+    content TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    PRIMARY KEY (url, stage)
+);
+"""
+
+
+class BatchCancelled(Exception):
+    """Raised inside a worker to stop an event at a stage boundary."""
+
+    pass
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+class BatchEvent(BaseModel):
+    """Journaled state of one event in a batch run."""
+
+    url: str = Field(..., description="URL of the event website")
+    position: int = Field(..., description="Order in the batch")
+    # Same values as StyleScrapingState.status
+    status: str = Field(default="pending", description="pending, scraping, completed or failed")
+    stage: Optional[str] = Field(default=None, description="Last finished stage")
+    event_id: Optional[str] = Field(default=None, description="Event ID of the exported config")
+    output_path: Optional[str] = Field(default=None, description="Exported config file")
+    error: Optional[str] = Field(default=None, description="Error message if the event failed")
+    attempts: int = Field(default=0, description="Number of runs that worked on the event")
+    updated_at: Optional[str] = Field(default=None, description="ISO 8601 time of last change")
+
+
+class BatchJournal:
+    """
+    SQLite journal of a batch run.
+
+    Writes are committed immediately (WAL mode), so a crash loses at most
+    the stage that was running. The journal is safe to share between
+    worker threads.
+    """
+
+    def __init__(self, path: Path):
+        """
+        Open (or create) a journal.
+
+        Args:
+            path: SQLite database file
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(str(self.path), check_same_thread=False, isolation_level=None)
+        self._closed = False
+        self._db.row_factory = sqlite3.Row
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.executescript(SCHEMA)
+
+    def close(self) -> None:
+        """Checkpoint the write-ahead log and close the database."""
+        with self._lock:
+            if not self._closed:
+                self._db.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+                self._db.close()
+                self._closed = True
+
+    def __enter__(self) -> "BatchJournal":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def _execute(self, sql: str, params: Sequence[Any] = ()) -> List[sqlite3.Row]:
+        with self._lock:
+            return self._db.execute(sql, params).fetchall()
+
+    def get_meta(self, key: str) -> Optional[str]:
+        """Read a run setting stored in the journal."""
+        rows = self._execute("SELECT value FROM meta WHERE key = ?", (key,))
+        return rows[0]["value"] if rows else None
+
+    def set_meta(self, key: str, value: str) -> None:
+        """Store a run setting in the journal."""
+        self._execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value))
+
+    def reset(self) -> None:
+        """Forget all events, artifacts and settings."""
+        with self._lock:
+            self._db.executescript("DELETE FROM events; DELETE FROM artifacts; DELETE FROM meta;")
+
+    def add_events(self, urls: Sequence[str]) -> None:
+        """Add events that are not journaled yet as pending."""
+        with self._lock:
+            offset = self._db.execute("SELECT COUNT(*) FROM events").fetchone()[0]
+            self._db.execute("BEGIN")
+            for position, url in enumerate(urls, start=offset):
+                self._db.execute(
+                    "INSERT OR IGNORE INTO events (url, position, updated_at) VALUES (?, ?, ?)",
+                    (url, position, _now()),
+                )
+            self._db.execute("COMMIT")
+
+    def events(self) -> List[BatchEvent]:
+        """All journaled events in batch order."""
+        rows = self._execute("SELECT * FROM events ORDER BY position")
+        return [BatchEvent(**dict(row)) for row in rows]
+
+    def get_event(self, url: str) -> Optional[BatchEvent]:
+        """Journaled state of one event."""
+        rows = self._execute("SELECT * FROM events WHERE url = ?", (url,))
+        return BatchEvent(**dict(rows[0])) if rows else None
+
+    def update_event(self, url: str, **fields: Any) -> None:
+        """Update columns of an event."""
+        fields["updated_at"] = _now()
+        assignments = ", ".join(f"{name} = ?" for name in fields)
+        self._execute(f"UPDATE events SET {assignments} WHERE url = ?", (*fields.values(), url))
+
+    def start_event(self, url: str) -> None:
+        """Mark an event as being worked on."""
+        self._execute(
+            "UPDATE events SET status = 'scraping', error = NULL, attempts = attempts + 1, "
+            "updated_at = ? WHERE url = ?",
+            (_now(), url),
+        )
+
+    def save_artifact(self, url: str, stage: str, content: str) -> None:
+        """Store a stage's output and record the stage as finished."""
+        with self._lock:
+            self._db.execute("BEGIN")
+            self._db.execute(
+                "INSERT OR REPLACE INTO artifacts (url, stage, content, created_at) "
+                "VALUES (?, ?, ?, ?)",
+                (url, stage, content, _now()),
+            )
+            self._db.execute(
+                "UPDATE events SET stage = ?, updated_at = ? WHERE url = ?", (stage, _now(), url)
+            )
+            self._db.execute("COMMIT")
+
+    def artifacts(self, url: str) -> Dict[str, str]:
+        """Outputs of an event's finished stages, keyed by stage."""
+        rows = self._execute("SELECT stage, content FROM artifacts WHERE url = ?", (url,))
+        return {row["stage"]: row["content"] for row in rows}
+
+    def counts(self) -> Dict[str, int]:
+        """Number of events per status."""
+        rows = self._execute("SELECT status, COUNT(*) AS n FROM events GROUP BY status")
+        return {row["status"]: row["n"] for row in rows}
+
+
+class BatchSummary(BaseModel):
+    """Outcome of a batch run."""
+
+    total: int = Field(..., description="Events in the batch")
+    completed: int = Field(default=0, description="Events completed in this run")
+    failed: int = Field(default=0, description="Events that failed in this run")
+    skipped: int = Field(default=0, description="Events already completed by an earlier run")
+    resumed: int = Field(default=0, description="Events restarted from a finished stage")
+    interrupted: int = Field(default=0, description="Events left unfinished by cancellation")
+    cancelled: bool = Field(default=False, description="Whether the run was cancelled")
+
+
+class BatchRunner:
+    """
+    Scrape a list of event URLs with bounded concurrency, journaling progress.
+
+    Cancel with ``cancel()`` (the CLI does so on SIGINT): no new events are
+    started, running events stop after their current stage, the journal is
+    flushed and browsers are closed. Unfinished events keep their stage,
+    so ``run(resume=True)`` continues them.
+    """
+
+    def __init__(
+        self,
+        journal: BatchJournal,
+        engine: EngineMode = "crew",
+        concurrency: int = 2,
+        timeout: int = 60,
+        output_dir: Path = Path("style-configs"),
+        on_event: Optional[Callable[[BatchEvent], None]] = None,
+        controller: Optional[AdaptiveConcurrency] = None,
+        history: Optional[StyleStore] = None,
+        compact: bool = False,
+        bundle: bool = False,
+        css: bool = False,
+        assets: Optional["AssetPipeline"] = None,
+    ):
+        """
+        Initialize BatchRunner.
+
+        Args:
+            journal: Journal to record progress in
+            engine: Engine mode ("crew", "deterministic" or "http")
+            concurrency: Events processed at once (the maximum, with a controller)
+            timeout: Timeout in seconds for each scrape
+            output_dir: Directory configs are exported to
+            on_event: Called with an event's state when it finishes or fails
+            controller: Adaptive limit on how many events run at once
+            history: StyleStore that every exported config is also recorded in
+            compact: Also export each config as compact <event_id>.min.json
+            bundle: Also add each config to the output directory's _bundle.json
+            css: Also write each event's hashed stylesheet listed in css/manifest.json
+            assets: Pipeline that downloads each event's logo and favicon
+                before export (a failed download does not fail the event)
+
+        Raises:
+            ValueError: If the engine mode is unknown
+        """
+        if engine not in ENGINE_MODES:
+            raise ValueError(
+                f"Unknown engine mode: {engine}. Choose from {', '.join(ENGINE_MODES)}"
+            )
+        self.journal = journal
+        self.engine = engine
+        self.concurrency = max(1, concurrency)
+        self.timeout = timeout
+        self.output_dir = Path(output_dir)
+        self.on_event = on_event
+        self.controller = controller
+        self.history = history
+        self.compact = compact
+        self.bundle = bundle
+        self.css = css
+        self.assets = assets
+        self.browser_pool: Any = None
+        self._cancelled = threading.Event()
+
+    def cancel(self) -> None:
+        """Stop starting events and stop running ones at the next stage boundary."""
+        self._cancelled.set()
+
+    def _check_cancelled(self) -> None:
+        if self._cancelled.is_set():
+            raise BatchCancelled()
+
+    def _save_task_output(self, url: str, output: Any) -> None:
+        """Crew task callback: journal the finished task, then honour cancellation."""
+        pydantic_output = getattr(output, "pydantic", None)
+        content = pydantic_output.model_dump_json() if pydantic_output is not None else output.raw
+        self.journal.save_artifact(url, output.name, content)
+        self._check_cancelled()
+
+    def _extract(self, url: str, done: Dict[str, str]) -> Any:
+        from event_style_scraper.engines import compile_style_config, scrape_page
+        from event_style_scraper.types import EventStyleConfig
+
+        if COMPILE_STAGE in done:
+            return EventStyleConfig.model_validate_json(done[COMPILE_STAGE])
+
+        if self.engine == "crew":
+            from event_style_scraper.crews.style_extraction_crew import StyleExtractionCrew
+            from event_style_scraper.flows.style_scraping_flow import StyleScrapingFlow
+
+            crew = StyleExtractionCrew(
+                url=url,
+                timeout=self.timeout,
+                browser_pool=self.browser_pool,
+                completed_outputs=done,
+                task_callback=lambda output: self._save_task_output(url, output),
+            ).crew()
+            return StyleScrapingFlow(url=url, timeout=self.timeout, crew=crew).start()
+
+        if SCRAPE_STAGE in done:
+            scraped = json.loads(done[SCRAPE_STAGE])
+        else:
+            scraped = scrape_page(url, self.engine, self.timeout, self.browser_pool)
+            self.journal.save_artifact(url, SCRAPE_STAGE, json.dumps(scraped))
+            self._check_cancelled()
+
+        config = compile_style_config(scraped, url)
+        self.journal.save_artifact(url, COMPILE_STAGE, config.model_dump_json())
+        return config
+
+    def _process(self, url: str) -> Optional[BatchEvent]:
+        from event_style_scraper.flows.style_scraping_flow import StyleScrapingFlow
+
+        if self._cancelled.is_set():
+            return None
+        self.journal.start_event(url)
+        try:
+            start = time.perf_counter()
+            with self.controller.slot() if self.controller is not None else nullcontext():
+                config = self._extract(url, self.journal.artifacts(url))
+            seconds = time.perf_counter() - start
+            self._check_cancelled()
+            if self.assets is not None:
+                config = self.assets.localize(config)
+                self._check_cancelled()
+
+            flow = StyleScrapingFlow(url=url, timeout=self.timeout)
+            flow.output_dir = self.output_dir
+            output_path = flow.export_config(
+                config, compact=self.compact, bundle=self.bundle, css=self.css
+            )
+            if self.history is not None:
+                self.history.record(config, engine=self.engine, seconds=seconds)
+            self.journal.update_event(
+                url,
+                status="completed",
+                stage=EXPORT_STAGE,
+                event_id=config.event_id,
+                output_path=str(output_path),
+            )
+        except Exception as e:
+            if self._cancelled.is_set():
+                # Leave it "scraping" at its last finished stage for --resume
+                return None
+            self.journal.update_event(url, status="failed", error=str(e) or type(e).__name__)
+
+        event = self.journal.get_event(url)
+        if event is not None and self.on_event is not None:
+            self.on_event(event)
+        return event
+
+    def run(self, urls: Sequence[str], resume: bool = False) -> BatchSummary:
+        """
+        Scrape the given URLs.
+
+        Args:
+            urls: Event website URLs
+            resume: Continue the journal's earlier run instead of starting over
+
+        Returns:
+            BatchSummary: Counts for this run
+
+        Raises:
+            ValueError: If resuming a journal written with another engine
+        """
+        if resume:
+            journal_engine = self.journal.get_meta("engine")
+            if journal_engine and journal_engine != self.engine:
+                raise ValueError(
+                    f"Journal was written with the {journal_engine} engine; "
+                    f"resume with --engine {journal_engine}"
+                )
+        else:
+            self.journal.reset()
+        self.journal.set_meta("engine", self.engine)
+        self.journal.add_events(urls)
+
+        todo = []
+        summary = BatchSummary(total=len(self.journal.events()))
+        for event in self.journal.events():
+            if event.status == "completed":
+                summary.skipped += 1
+                continue
+            if event.stage:
+                summary.resumed += 1
+            todo.append(event.url)
+
+        if todo and self.engine in ("crew", "deterministic"):
+            from event_style_scraper.tools import BrowserPool
+
+            self.browser_pool = BrowserPool(size=self.concurrency).start()
+
+        executor = ThreadPoolExecutor(max_workers=self.concurrency)
+        try:
+            futures = [executor.submit(self._process, url) for url in todo]
+            for future in as_completed(futures):
+                processed = future.result()
+                if processed is None:
+                    continue
+                if processed.status == "completed":
+                    summary.completed += 1
+                else:
+                    summary.failed += 1
+        except KeyboardInterrupt:
+            self.cancel()
+        finally:
+            if self._cancelled.is_set():
+                # Workers finish their current stage; queued events never start
+                executor.shutdown(wait=True, cancel_futures=True)
+            else:
+                executor.shutdown(wait=True)
+            if self.browser_pool is not None:
+                self.browser_pool.stop()
+                self.browser_pool = None
+
+        summary.cancelled = self._cancelled.is_set()
+        if summary.cancelled:
+            counts = self.journal.counts()
+            summary.interrupted = counts.get("pending", 0) + counts.get("scraping", 0)
+        return summary
@@ -0,0 +1,36 @@
+"""Offline benchmarking: local fixture sites, a stub LLM and run reports.
+
+Exports are resolved on first access; the runners import crewai, which
+lightweight users such as the fixture server and metrics do not need.
+"""
+
+from importlib import import_module
+from typing import Any, List
+
+_EXPORTS = {
+    "FixtureSiteServer": ".fixture_server",
+    "StubLLMServer": ".stub_llm",
+    "LoadTestReport": ".loadtest",
+    "run_load_test": ".loadtest",
+    "BenchmarkReport": ".runner",
+    "ContentBenchmarkReport": ".content",
+    "run_content_benchmark": ".content",
+    "compare_reports": ".runner",
+    "load_report": ".runner",
+    "run_benchmark": ".runner",
+    "write_report": ".runner",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(list(globals()) + __all__)
@@ -0,0 +1,171 @@
+"""Offline benchmark comparing content generation modes on one event."""
+
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+from pydantic import BaseModel, Field
+
+from event_style_scraper.benchmarks.metrics import MetricSummary, patched_environ, summarize
+from event_style_scraper.benchmarks.runner import environment_info
+from event_style_scraper.benchmarks.stub_llm import StubLLMServer
+from event_style_scraper.content_generation import CONTENT_MODES, generate_event_content
+
+SCHEMA_VERSION = 1
+
+
+class ModeResult(BaseModel):
+    """Cost and latency of generating an event's content in one mode."""
+
+    mode: str = Field(..., description="Content generation mode")
+    attendees: int = Field(..., description="Attendees generated")
+    succeeded: int = Field(..., description="Attendees with content")
+    elapsed_seconds: float = Field(..., description="Wall-clock time of the run")
+    latency: Optional[MetricSummary] = Field(
+        default=None, description="Per-attendee generation time (seconds)"
+    )
+    llm_requests: int = Field(..., description="Chat completions served by the stub")
+    prompt_tokens: int = Field(..., description="Prompt tokens sent to the stub")
+    completion_tokens: int = Field(..., description="Completion tokens returned by the stub")
+    error: Optional[str] = Field(default=None, description="First attendee error, if any failed")
+
+    @property
+    def total_tokens(self) -> int:
+        """Prompt and completion tokens."""
+        return self.prompt_tokens + self.completion_tokens
+
+    def per_attendee(self) -> Dict[str, float]:
+        """Cost metrics divided by the number of attendees."""
+        count = max(self.attendees, 1)
+        return {
+            "seconds_per_attendee": self.elapsed_seconds / count,
+            "llm_requests_per_attendee": self.llm_requests / count,
+            "tokens_per_attendee": self.total_tokens / count,
+        }
+
+
+class ContentBenchmarkReport(BaseModel):
+    """Content generation modes benchmarked on the same attendees."""
+
+    schema_version: int = Field(default=SCHEMA_VERSION, description="Report format version")
+    run_id: str = Field(..., description="Unique run identifier (UTC timestamp)")
+    started_at: str = Field(..., description="ISO 8601 start time")
+    duration_seconds: float = Field(..., description="Total wall-clock time of the run")
+    environment: Dict[str, str] = Field(
+        default_factory=dict, description="Interpreter and package versions"
+    )
+    event_id: str = Field(..., description="Event whose attendees were generated")
+    concurrency: int = Field(..., description="Attendees processed at once")
+    llm_latency_ms: float = Field(..., description="Stub LLM latency per completion")
+    results: List[ModeResult] = Field(
+        default_factory=list, description="One result per mode, in run order"
+    )
+
+    def comparison(self) -> Dict[str, Dict[str, Dict[str, float]]]:
+        """
+        Per-attendee metrics of each mode against the first mode run.
+
+        Returns:
+            Mapping of mode -> metric -> {"baseline", "current", "change_pct"}
+        """
+        if not self.results:
+            return {}
+        baseline = self.results[0].per_attendee()
+        comparison: Dict[str, Dict[str, Dict[str, float]]] = {}
+        for result in self.results[1:]:
+            metrics = {}
+            for metric, value in result.per_attendee().items():
+                old = baseline[metric]
+                metrics[metric] = {
+                    "baseline": old,
+                    "current": value,
+                    "change_pct": (value - old) / old * 100 if old else 0.0,
+                }
+            comparison[result.mode] = metrics
+        return comparison
+
+
+def run_content_benchmark(
+    event_id: str,
+    attendees_dir: Path,
+    style_configs_dir: Path,
+    modes: Sequence[str] = CONTENT_MODES,
+    concurrency: int = 4,
+    llm_latency_ms: float = 50.0,
+    attendees_file: Optional[Path] = None,
+) -> ContentBenchmarkReport:
+    """
+    Generate an event's content once per mode against a stub LLM.
+
+    Every mode regenerates all attendees into a scratch directory, so the
+    runs are comparable and existing content is untouched. Requests and
+    tokens are counted by the stub; latency is the time each attendee's
+    generation took.
+
+    Args:
+        event_id: Event identifier
+        attendees_dir: Directory of attendee JSON files
+        style_configs_dir: Directory of exported style configs
+        modes: Content modes to run, the first being the baseline
+        concurrency: Attendees processed at once
+        llm_latency_ms: Stub LLM delay per completion
+        attendees_file: JSONL or CSV attendee export instead of attendees_dir
+
+    Returns:
+        ContentBenchmarkReport with one result per mode
+
+    Raises:
+        FileNotFoundError: If the style config or attendee source is missing
+        ValueError: If a mode is unknown or the event has no attendees
+    """
+    unknown = sorted(set(modes) - set(CONTENT_MODES))
+    if unknown:
+        raise ValueError(f"Unknown content modes: {', '.join(unknown)}")
+    started = datetime.now(timezone.utc)
+    run_start = time.perf_counter()
+
+    results = []
+    with (
+        StubLLMServer(latency_ms=llm_latency_ms, seed=0) as stub,
+        patched_environ(stub.environment()),
+    ):
+        for mode in modes:
+            before = stub.stats()
+            with tempfile.TemporaryDirectory() as output_dir:
+                report = generate_event_content(
+                    event_id,
+                    attendees_dir=attendees_dir,
+                    style_configs_dir=style_configs_dir,
+                    output_dir=Path(output_dir),
+                    concurrency=concurrency,
+                    force=True,
+                    attendees_file=attendees_file,
+                    mode=mode,
+                )
+            after = stub.stats()
+            results.append(
+                ModeResult(
+                    mode=mode,
+                    attendees=len(report.results),
+                    succeeded=report.succeeded,
+                    elapsed_seconds=report.elapsed_seconds,
+                    latency=summarize([r.seconds for r in report.results]),
+                    llm_requests=after["requests"] - before["requests"],
+                    prompt_tokens=after["prompt_tokens"] - before["prompt_tokens"],
+                    completion_tokens=after["completion_tokens"] - before["completion_tokens"],
+                    error=next((r.error for r in report.results if not r.success), None),
+                )
+            )
+
+    return ContentBenchmarkReport(
+        run_id=started.strftime("%Y%m%dT%H%M%SZ"),
+        started_at=started.isoformat(),
+        duration_seconds=time.perf_counter() - run_start,
+        environment=environment_info(),
+        event_id=event_id,
+        concurrency=concurrency,
+        llm_latency_ms=llm_latency_ms,
+        results=results,
+    )
@@ -0,0 +1,112 @@
+"""Local HTTP server for benchmark fixture sites."""
+
+import threading
+import time
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, List, Optional
+
+
+class _FixtureRequestHandler(SimpleHTTPRequestHandler):
+    """Static file handler with optional simulated network latency."""
+
+    latency_ms: float = 0.0
+
+    def do_GET(self) -> None:
+        if self.latency_ms:
+            time.sleep(self.latency_ms / 1000)
+        super().do_GET()
+
+    def log_message(self, format: str, *args: Any) -> None:
+        """Silence per-request logging so benchmark output stays readable."""
+        pass
+
+
+class FixtureSiteServer:
+    """
+    Serve a corpus of event-site fixtures from a local directory.
+
+    Each subdirectory of ``sites_dir`` that contains an ``index.html`` is a
+    site, served at ``http://127.0.0.1:{port}/{site}/``. Fixtures reference
+    their assets with relative paths so one server can host every site.
+    """
+
+    def __init__(
+        self,
+        sites_dir: Path,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency_ms: float = 0.0,
+    ):
+        """
+        Initialize FixtureSiteServer.
+
+        Args:
+            sites_dir: Directory containing one subdirectory per fixture site
+            host: Interface to bind (loopback by default)
+            port: Port to bind (0 picks a free port)
+            latency_ms: Artificial delay added to every request in milliseconds
+
+        Raises:
+            FileNotFoundError: If sites_dir does not exist
+        """
+        self.sites_dir = Path(sites_dir)
+        if not self.sites_dir.is_dir():
+            raise FileNotFoundError(f"Fixture sites directory not found: {self.sites_dir}")
+
+        self.host = host
+        self.port = port
+        self.latency_ms = latency_ms
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        """Root URL of the running server."""
+        return f"http://{self.host}:{self.port}"
+
+    def site_names(self) -> List[str]:
+        """List fixture site names in sorted order."""
+        return sorted(
+            path.name
+            for path in self.sites_dir.iterdir()
+            if path.is_dir() and (path / "index.html").exists()
+        )
+
+    def site_url(self, name: str) -> str:
+        """Get the URL of a fixture site."""
+        return f"{self.base_url}/{name}/"
+
+    def start(self) -> "FixtureSiteServer":
+        """Start serving in a background thread."""
+        handler = type(
+            "FixtureRequestHandler",
+            (_FixtureRequestHandler,),
+            {"latency_ms": self.latency_ms},
+        )
+        self._server = ThreadingHTTPServer(
+            (self.host, self.port),
+            partial(handler, directory=str(self.sites_dir)),
+        )
+        self._server.daemon_threads = True
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop the server and release the port."""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def __enter__(self) -> "FixtureSiteServer":
+        return self.start()
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.stop()
@@ -0,0 +1,323 @@
+"""Load-test harness for concurrent scrapes against local fixture sites."""
+
+import multiprocessing
+import os
+import resource
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+from pydantic import BaseModel, Field
+
+from event_style_scraper.benchmarks.fixture_server import FixtureSiteServer
+from event_style_scraper.benchmarks.metrics import (
+    MetricSummary,
+    ProcessTreeSampler,
+    patched_environ,
+    peak_rss_mb,
+    summarize,
+)
+from event_style_scraper.benchmarks.runner import SCHEMA_VERSION, environment_info
+from event_style_scraper.benchmarks.stub_llm import StubLLMServer
+from event_style_scraper.engines import ENGINE_MODES, EngineMode, run_engine
+
+
+class ScrapeSample(BaseModel):
+    """Outcome of one scrape executed by a worker process."""
+
+    pid: int = Field(..., description="Worker process id")
+    url: str = Field(..., description="Scraped fixture URL")
+    latency_seconds: float = Field(..., description="Wall-clock time of the scrape")
+    success: bool = Field(..., description="Whether a config was produced")
+    error_type: Optional[str] = Field(default=None, description="Exception class name on failure")
+    error_message: Optional[str] = Field(default=None, description="Exception message on failure")
+    cpu_seconds: float = Field(..., description="Worker CPU time spent on this scrape")
+    browser_cpu_seconds: float = Field(
+        ..., description="CPU time of browser processes reaped during the scrape"
+    )
+    peak_rss_mb: float = Field(..., description="Worker lifetime peak RSS after the scrape")
+
+
+class WorkerStats(BaseModel):
+    """Resource usage aggregated per worker process."""
+
+    pid: int = Field(..., description="Worker process id")
+    scrapes: int = Field(..., description="Scrapes executed")
+    failures: int = Field(..., description="Scrapes that failed")
+    cpu_seconds: float = Field(..., description="Worker CPU time across its scrapes")
+    browser_cpu_seconds: float = Field(..., description="Browser CPU time across its scrapes")
+    peak_rss_mb: float = Field(..., description="Worker peak RSS")
+
+
+class LoadTestResult(BaseModel):
+    """Load-test measurements for one engine mode."""
+
+    engine: str = Field(..., description="Engine mode under test")
+    scrapes: int = Field(..., description="Scrapes fired")
+    concurrency: int = Field(..., description="Concurrent worker processes")
+    successes: int = Field(..., description="Scrapes that produced a config")
+    failures: int = Field(..., description="Scrapes that failed")
+    wall_seconds: float = Field(..., description="Time from first submit to last completion")
+    throughput_per_second: float = Field(..., description="Successful scrapes per second")
+    latency: Optional[MetricSummary] = Field(
+        default=None, description="Latency of successful scrapes"
+    )
+    errors: Dict[str, int] = Field(default_factory=dict, description="Failure counts by error type")
+    error_examples: Dict[str, str] = Field(
+        default_factory=dict, description="First message per error type"
+    )
+    peak_browsers: int = Field(..., description="Most browsers alive at once")
+    peak_total_rss_mb: float = Field(
+        ..., description="Peak RSS of harness, workers and browsers combined"
+    )
+    workers: List[WorkerStats] = Field(default_factory=list)
+
+
+class LoadTestSettings(BaseModel):
+    """Parameters a load test was executed with."""
+
+    engines: List[str] = Field(..., description="Engine modes compared")
+    scrapes: int = Field(..., description="Scrapes per engine")
+    concurrency: int = Field(..., description="Concurrent worker processes")
+    sites: List[str] = Field(..., description="Fixture sites scraped round-robin")
+    llm_latency_ms: float = Field(..., description="Stub LLM latency per completion")
+    timeout: int = Field(..., description="Scrape timeout in seconds")
+
+
+class LoadTestReport(BaseModel):
+    """Complete load-test run, stored as JSON for comparison over time."""
+
+    schema_version: int = Field(default=SCHEMA_VERSION, description="Report format version")
+    run_id: str = Field(..., description="Unique run identifier (UTC timestamp)")
+    started_at: str = Field(..., description="ISO 8601 start time")
+    environment: Dict[str, str] = Field(default_factory=dict)
+    settings: LoadTestSettings
+    results: List[LoadTestResult] = Field(default_factory=list)
+
+
+def _cpu_seconds(who: int) -> float:
+    usage = resource.getrusage(who)
+    return usage.ru_utime + usage.ru_stime
+
+
+def _init_worker(env: Dict[str, str]) -> None:
+    """Configure a worker process before it takes jobs."""
+    os.environ.update(env)
+
+
+def _warm_worker(url: str, mode: EngineMode, timeout: int) -> int:
+    """Run one unmeasured scrape so first-use costs stay out of the results."""
+    start = time.perf_counter()
+    try:
+        run_engine(url, mode, timeout)
+    except Exception:
+        # Failures are measured (and reported) by the real scrapes
+        pass
+    # Keep this worker busy long enough for the others to take a warm-up task
+    time.sleep(max(0.0, 0.2 - (time.perf_counter() - start)))
+    return os.getpid()
+
+
+def _scrape_job(url: str, mode: EngineMode, timeout: int) -> Dict[str, Any]:
+    """Run one scrape in a worker process and measure it."""
+    cpu_before = _cpu_seconds(resource.RUSAGE_SELF)
+    browser_cpu_before = _cpu_seconds(resource.RUSAGE_CHILDREN)
+    error: Optional[Exception] = None
+
+    start = time.perf_counter()
+    try:
+        run_engine(url, mode, timeout)
+    except Exception as e:
+        error = e
+    latency = time.perf_counter() - start
+
+    return ScrapeSample(
+        pid=os.getpid(),
+        url=url,
+        latency_seconds=latency,
+        success=error is None,
+        error_type=type(error).__name__ if error else None,
+        error_message=str(error)[:500] if error else None,
+        cpu_seconds=_cpu_seconds(resource.RUSAGE_SELF) - cpu_before,
+        browser_cpu_seconds=_cpu_seconds(resource.RUSAGE_CHILDREN) - browser_cpu_before,
+        peak_rss_mb=peak_rss_mb(),
+    ).model_dump()
+
+
+def aggregate_samples(
+    engine: str,
+    samples: Sequence[ScrapeSample],
+    concurrency: int,
+    wall_seconds: float,
+    peak_browsers: int,
+    peak_total_rss_mb: float,
+) -> LoadTestResult:
+    """
+    Aggregate per-scrape samples into a LoadTestResult.
+
+    Args:
+        engine: Engine mode the samples were produced with
+        samples: Scrape samples from all workers
+        concurrency: Number of worker processes
+        wall_seconds: Wall-clock duration of the run
+        peak_browsers: Most concurrent browsers observed
+        peak_total_rss_mb: Peak combined RSS observed
+
+    Returns:
+        LoadTestResult with throughput, latency percentiles and breakdowns
+    """
+    successes = [s for s in samples if s.success]
+    failures = [s for s in samples if not s.success]
+
+    error_examples: Dict[str, str] = {}
+    for sample in failures:
+        error_examples.setdefault(sample.error_type or "Unknown", sample.error_message or "")
+
+    workers: Dict[int, List[ScrapeSample]] = {}
+    for sample in samples:
+        workers.setdefault(sample.pid, []).append(sample)
+
+    return LoadTestResult(
+        engine=engine,
+        scrapes=len(samples),
+        concurrency=concurrency,
+        successes=len(successes),
+        failures=len(failures),
+        wall_seconds=wall_seconds,
+        throughput_per_second=len(successes) / wall_seconds if wall_seconds > 0 else 0.0,
+        latency=summarize([s.latency_seconds for s in successes]),
+        errors=dict(Counter(s.error_type or "Unknown" for s in failures)),
+        error_examples=error_examples,
+        peak_browsers=peak_browsers,
+        peak_total_rss_mb=peak_total_rss_mb,
+        workers=[
+            WorkerStats(
+                pid=pid,
+                scrapes=len(worker_samples),
+                failures=sum(1 for s in worker_samples if not s.success),
+                cpu_seconds=sum(s.cpu_seconds for s in worker_samples),
+                browser_cpu_seconds=sum(s.browser_cpu_seconds for s in worker_samples),
+                peak_rss_mb=max(s.peak_rss_mb for s in worker_samples),
+            )
+            for pid, worker_samples in sorted(workers.items())
+        ],
+    )
+
+
+def run_engine_load(
+    engine: EngineMode,
+    urls: Sequence[str],
+    scrapes: int,
+    concurrency: int,
+    timeout: int,
+    env: Dict[str, str],
+) -> LoadTestResult:
+    """
+    Fire ``scrapes`` scrapes at ``concurrency`` worker processes for one engine.
+
+    Each worker runs one unmeasured warm-up scrape first so interpreter
+    start, imports and first-use costs are excluded from the results.
+    """
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(
+        max_workers=concurrency,
+        mp_context=context,
+        initializer=_init_worker,
+        initargs=(env,),
+    ) as pool:
+        list(pool.map(
+            _warm_worker,
+            [urls[n % len(urls)] for n in range(concurrency)],
+            [engine] * concurrency,
+            [timeout] * concurrency,
+        ))
+
+        with ProcessTreeSampler() as sampler:
+            start = time.perf_counter()
+            futures = [
+                pool.submit(_scrape_job, urls[n % len(urls)], engine, timeout)
+                for n in range(scrapes)
+            ]
+            samples = [ScrapeSample(**f.result()) for f in as_completed(futures)]
+            wall_seconds = time.perf_counter() - start
+
+    return aggregate_samples(
+        engine,
+        samples,
+        concurrency,
+        wall_seconds,
+        sampler.peak_browsers,
+        sampler.peak_total_rss_mb,
+    )
+
+
+def run_load_test(
+    sites_dir: Path,
+    engines: Sequence[EngineMode] = ("deterministic",),
+    scrapes: int = 20,
+    concurrency: int = 4,
+    sites: Optional[Sequence[str]] = None,
+    llm_latency_ms: float = 50.0,
+    timeout: int = 30,
+) -> LoadTestReport:
+    """
+    Load-test scraping engines against local fixture sites.
+
+    Each engine gets a fresh pool of ``concurrency`` worker processes that
+    scrape the selected fixture sites round-robin. The crew engine talks to
+    a local stub LLM, so no run needs network access.
+
+    Args:
+        sites_dir: Directory of fixture sites
+        engines: Engine modes to compare ("crew", "deterministic", "http")
+        scrapes: Scrapes fired per engine
+        concurrency: Concurrent worker processes
+        sites: Subset of site names (default: all)
+        llm_latency_ms: Stub LLM delay per completion
+        timeout: Scrape timeout in seconds
+
+    Returns:
+        LoadTestReport with one result per engine
+
+    Raises:
+        ValueError: If an engine or site is unknown
+    """
+    unknown_engines = sorted(set(engines) - set(ENGINE_MODES))
+    if unknown_engines:
+        raise ValueError(f"Unknown engine modes: {', '.join(unknown_engines)}")
+
+    started = datetime.now(timezone.utc)
+    with FixtureSiteServer(sites_dir) as fixtures, StubLLMServer(latency_ms=llm_latency_ms) as stub:
+        available = fixtures.site_names()
+        selected = list(sites) if sites else available
+        unknown = sorted(set(selected) - set(available))
+        if unknown:
+            raise ValueError(f"Unknown fixture sites: {', '.join(unknown)}")
+
+        env = stub.environment()
+        env["SCRAPER_ALLOWED_HOSTS"] = fixtures.host
+        urls = [fixtures.site_url(site) for site in selected]
+
+        with patched_environ(env):
+            results = [
+                run_engine_load(engine, urls, scrapes, concurrency, timeout, env)
+                for engine in engines
+            ]
+
+    return LoadTestReport(
+        run_id=started.strftime("%Y%m%dT%H%M%SZ"),
+        started_at=started.isoformat(),
+        environment=environment_info(),
+        settings=LoadTestSettings(
+            engines=list(engines),
+            scrapes=scrapes,
+            concurrency=concurrency,
+            sites=selected,
+            llm_latency_ms=llm_latency_ms,
+            timeout=timeout,
+        ),
+        results=results,
+    )
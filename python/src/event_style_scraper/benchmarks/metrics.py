@@ -0,0 +1,288 @@
+"""Measurement helpers shared by the benchmark and load-test harnesses."""
+
+import os
+import resource
+import statistics
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Sequence
+
+from pydantic import BaseModel, Field
+
+
+# Process names of Chromium browser processes launched by Playwright
+BROWSER_PROCESS_NAMES = ("chrome", "chromium", "headless_shell")
+
+
+class MetricSummary(BaseModel):
+    """Summary statistics for one measured metric."""
+
+    count: int = Field(..., description="Number of samples")
+    mean: float = Field(..., description="Arithmetic mean")
+    median: float = Field(..., description="Median (p50)")
+    min: float = Field(..., description="Smallest sample")
+    max: float = Field(..., description="Largest sample")
+    p95: Optional[float] = Field(default=None, description="95th percentile")
+    p99: Optional[float] = Field(default=None, description="99th percentile")
+
+
+def percentile(samples: Sequence[float], pct: float) -> float:
+    """
+    Percentile with linear interpolation between closest ranks.
+
+    Args:
+        samples: Non-empty sequence of values
+        pct: Percentile in the range 0-100
+
+    Returns:
+        The interpolated percentile value
+    """
+    ordered = sorted(samples)
+    if len(ordered) == 1:
+        return ordered[0]
+    rank = (len(ordered) - 1) * pct / 100
+    lower = int(rank)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (rank - lower)
+
+
+def summarize(samples: Sequence[float]) -> Optional[MetricSummary]:
+    """
+    Summarize samples, ignoring missing values.
+
+    Args:
+        samples: Measured values
+
+    Returns:
+        MetricSummary, or None if there are no samples
+    """
+    values = [s for s in samples if s is not None]
+    if not values:
+        return None
+    return MetricSummary(
+        count=len(values),
+        mean=statistics.fmean(values),
+        median=statistics.median(values),
+        min=min(values),
+        max=max(values),
+        p95=percentile(values, 95),
+        p99=percentile(values, 99),
+    )
+
+
+def current_rss_mb() -> float:
+    """Current resident set size of this process in megabytes."""
+    try:
+        with open("/proc/self/statm") as f:
+            resident_pages = int(f.read().split()[1])
+        return resident_pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except (OSError, ValueError, IndexError):
+        # Non-Linux fallback: lifetime peak is the best available figure
+        return peak_rss_mb()
+
+
+def _maxrss_to_mb(maxrss: int) -> float:
+    # ru_maxrss is bytes on macOS and kilobytes on Linux
+    if sys.platform == "darwin":
+        return maxrss / (1024 * 1024)
+    return maxrss / 1024
+
+
+def peak_rss_mb() -> float:
+    """Lifetime peak RSS of this process in megabytes."""
+    return _maxrss_to_mb(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+
+
+def peak_children_rss_mb() -> float:
+    """Peak RSS of the largest reaped child process (e.g. Chromium) in megabytes."""
+    return _maxrss_to_mb(resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss)
+
+
+class ProcessInfo(BaseModel):
+    """A process observed in this process's subtree."""
+
+    pid: int
+    ppid: int
+    name: str
+    rss_mb: float
+
+
+def process_tree(root_pid: Optional[int] = None) -> List[ProcessInfo]:
+    """
+    List all descendants of a process (Linux /proc; empty elsewhere).
+
+    Args:
+        root_pid: Process whose descendants to list (default: this process)
+
+    Returns:
+        Descendant processes with their RSS
+    """
+    root_pid = root_pid or os.getpid()
+    page_mb = os.sysconf("SC_PAGE_SIZE") / (1024 * 1024) if hasattr(os, "sysconf") else 0.0
+    processes: Dict[int, ProcessInfo] = {}
+    try:
+        entries = [e for e in os.listdir("/proc") if e.isdigit()]
+    except OSError:
+        return []
+
+    for entry in entries:
+        try:
+            with open(f"/proc/{entry}/stat") as f:
+                stat = f.read()
+        except OSError:
+            continue
+        # The name is parenthesized and may itself contain spaces or parentheses
+        name = stat[stat.index("(") + 1 : stat.rindex(")")]
+        fields = stat[stat.rindex(")") + 2 :].split()
+        processes[int(entry)] = ProcessInfo(
+            pid=int(entry),
+            ppid=int(fields[1]),
+            name=name,
+            rss_mb=int(fields[21]) * page_mb,
+        )
+
+    children: Dict[int, List[int]] = {}
+    for info in processes.values():
+        children.setdefault(info.ppid, []).append(info.pid)
+
+    descendants = []
+    pending = list(children.get(root_pid, []))
+    while pending:
+        pid = pending.pop()
+        descendants.append(processes[pid])
+        pending.extend(children.get(pid, []))
+    return descendants
+
+
+def count_browsers(processes: Sequence[ProcessInfo]) -> int:
+    """Count browser instances (top-level Chromium processes, not their helpers)."""
+    browser_pids = {
+        p.pid for p in processes if any(n in p.name.lower() for n in BROWSER_PROCESS_NAMES)
+    }
+    by_pid = {p.pid: p for p in processes}
+    return sum(1 for pid in browser_pids if by_pid[pid].ppid not in browser_pids)
+
+
+class ProcessTreeSampler:
+    """
+    Sample the process subtree in a background thread.
+
+    Tracks the peak number of concurrent browsers and the peak combined
+    RSS of this process and all of its descendants (workers and browsers).
+    """
+
+    def __init__(self, interval: float = 0.1):
+        """
+        Initialize ProcessTreeSampler.
+
+        Args:
+            interval: Seconds between samples
+        """
+        self.interval = interval
+        self.peak_browsers = 0
+        self.peak_total_rss_mb = 0.0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def sample(self) -> None:
+        """Take one sample of the process tree."""
+        tree = process_tree()
+        self.peak_browsers = max(self.peak_browsers, count_browsers(tree))
+        total = current_rss_mb() + sum(p.rss_mb for p in tree)
+        self.peak_total_rss_mb = max(self.peak_total_rss_mb, total)
+
+    def _loop(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.sample()
+
+    def __enter__(self) -> "ProcessTreeSampler":
+        self.sample()
+        self._thread = threading.Thread(target=self._loop, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+
+class MemorySampler:
+    """
+    Sample process RSS in a background thread to find the peak of a window.
+
+    ``ru_maxrss`` only reports the lifetime peak, which hides per-run peaks
+    once an earlier run has used more memory.
+    """
+
+    def __init__(self, interval: float = 0.05):
+        """
+        Initialize MemorySampler.
+
+        Args:
+            interval: Seconds between samples
+        """
+        self.interval = interval
+        self.peak_mb = 0.0
+        self.samples: List[float] = []
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _sample(self) -> None:
+        rss = current_rss_mb()
+        self.samples.append(rss)
+        self.peak_mb = max(self.peak_mb, rss)
+
+    def _loop(self) -> None:
+        while not self._stop.wait(self.interval):
+            self._sample()
+
+    def __enter__(self) -> "MemorySampler":
+        self._sample()
+        self._thread = threading.Thread(target=self._loop, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        self._sample()
+
+
+@contextmanager
+def patched_environ(values: Dict[str, str]) -> Iterator[None]:
+    """Temporarily set environment variables, restoring previous values on exit."""
+    previous = {key: os.environ.get(key) for key in values}
+    os.environ.update(values)
+    try:
+        yield
+    finally:
+        for key, value in previous.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+
+
+class Stopwatch:
+    """Accumulate wall-clock time across repeated timed sections."""
+
+    def __init__(self) -> None:
+        self.total = 0.0
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def time(self) -> Iterator[None]:
+        """Time one section and add it to the total."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            with self._lock:
+                self.total += elapsed
+                self.calls += 1
@@ -0,0 +1,346 @@
+"""Offline benchmark runner for the style scraping pipeline."""
+
+import functools
+import json
+import platform
+import tempfile
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from importlib import metadata
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Sequence, Type, Union
+
+from pydantic import BaseModel, Field
+
+from event_style_scraper.benchmarks.fixture_server import FixtureSiteServer
+from event_style_scraper.benchmarks.metrics import (
+    MemorySampler,
+    MetricSummary,
+    Stopwatch,
+    patched_environ,
+    peak_children_rss_mb,
+    peak_rss_mb,
+    summarize,
+)
+from event_style_scraper.benchmarks.stub_llm import StubLLMServer
+from event_style_scraper.flows.style_scraping_flow import StyleScrapingFlow
+from event_style_scraper.tools import PlaywrightStyleExtractorTool
+
+if TYPE_CHECKING:
+    from event_style_scraper.benchmarks.content import ContentBenchmarkReport
+    from event_style_scraper.benchmarks.loadtest import LoadTestReport
+
+SCHEMA_VERSION = 1
+
+# Metrics summarized per site and compared between runs
+METRICS = ("scrape_seconds", "extraction_seconds", "end_to_end_seconds", "peak_rss_mb")
+
+
+class BenchmarkSettings(BaseModel):
+    """Parameters a benchmark run was executed with."""
+
+    sites: List[str] = Field(..., description="Fixture sites benchmarked")
+    iterations: int = Field(..., description="Runs per site")
+    llm_latency_ms: float = Field(..., description="Stub LLM latency per completion")
+    llm_jitter_ms: float = Field(default=0.0, description="Stub LLM random extra latency")
+    site_latency_ms: float = Field(default=0.0, description="Fixture server latency per request")
+    timeout: int = Field(..., description="Scrape timeout in seconds")
+
+
+class IterationResult(BaseModel):
+    """Measurements for a single end-to-end run against one site."""
+
+    iteration: int = Field(..., description="Iteration number (1-based)")
+    success: bool = Field(..., description="Whether the flow produced a config")
+    scrape_seconds: Optional[float] = Field(
+        default=None, description="Time inside the Playwright tool"
+    )
+    extraction_seconds: Optional[float] = Field(
+        default=None, description="Crew time excluding scraping (LLM stages and parsing)"
+    )
+    end_to_end_seconds: float = Field(..., description="Flow start through export")
+    peak_rss_mb: float = Field(..., description="Peak process RSS during the run")
+    llm_requests: int = Field(default=0, description="Chat completions served by the stub")
+    tokens: Optional[int] = Field(default=None, description="Tokens reported by the crew")
+    error: Optional[str] = Field(default=None, description="Error message if the run failed")
+
+
+class SiteResult(BaseModel):
+    """All iterations and summary statistics for one fixture site."""
+
+    site: str = Field(..., description="Fixture site name")
+    url: str = Field(..., description="URL the site was served at")
+    iterations: List[IterationResult] = Field(default_factory=list)
+    summary: Dict[str, MetricSummary] = Field(default_factory=dict)
+
+
+class BenchmarkReport(BaseModel):
+    """Complete benchmark run, stored as JSON for comparison over time."""
+
+    schema_version: int = Field(default=SCHEMA_VERSION, description="Report format version")
+    run_id: str = Field(..., description="Unique run identifier (UTC timestamp)")
+    started_at: str = Field(..., description="ISO 8601 start time")
+    duration_seconds: float = Field(..., description="Total wall-clock time of the run")
+    environment: Dict[str, str] = Field(
+        default_factory=dict, description="Interpreter and package versions"
+    )
+    settings: BenchmarkSettings
+    sites: List[SiteResult] = Field(default_factory=list)
+    peak_rss_mb: float = Field(..., description="Lifetime peak RSS of the benchmark process")
+    peak_browser_rss_mb: float = Field(..., description="Peak RSS of the largest browser process")
+
+
+def environment_info() -> Dict[str, str]:
+    """Collect interpreter, platform and dependency versions for a report."""
+    info = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+    }
+    for package in ("event-style-scraper", "crewai", "playwright", "pydantic"):
+        try:
+            info[package] = metadata.version(package)
+        except metadata.PackageNotFoundError:
+            info[package] = "not installed"
+    return info
+
+
+@contextmanager
+def timed_tool(tool_class: Type[Any], stopwatch: Stopwatch, errors: List[str]) -> Iterator[None]:
+    """
+    Time every ``_run`` call of a CrewAI tool class.
+
+    Tool exceptions are recorded in ``errors`` before being re-raised, since
+    CrewAI reports them to the agent instead of failing the crew. The
+    wrapper keeps the original signature because CrewAI derives the tool's
+    argument schema from it.
+    """
+    original = tool_class._run
+
+    @functools.wraps(original)
+    def _run(self: Any, *args: Any, **kwargs: Any) -> Any:
+        with stopwatch.time():
+            try:
+                return original(self, *args, **kwargs)
+            except Exception as e:
+                errors.append(f"{type(e).__name__}: {e}")
+                raise
+
+    tool_class._run = _run
+    try:
+        yield
+    finally:
+        tool_class._run = original
+
+
+def run_iteration(
+    url: str, iteration: int, timeout: int, stub: StubLLMServer
+) -> IterationResult:
+    """
+    Run the full StyleScrapingFlow once and measure each stage.
+
+    Args:
+        url: Fixture site URL
+        iteration: Iteration number for the result
+        timeout: Scrape timeout in seconds
+        stub: Running stub LLM (used for request counts)
+
+    Returns:
+        IterationResult with stage timings and memory peak
+    """
+    requests_before = stub.stats()["requests"]
+    scrape_timer = Stopwatch()
+    tool_errors: List[str] = []
+    flow: Optional[StyleScrapingFlow] = None
+    error: Optional[str] = None
+    flow_seconds: Optional[float] = None
+
+    with tempfile.TemporaryDirectory() as output_dir, MemorySampler() as memory:
+        start = time.perf_counter()
+        try:
+            with timed_tool(PlaywrightStyleExtractorTool, scrape_timer, tool_errors):
+                flow = StyleScrapingFlow(url=url, timeout=timeout)
+                flow.output_dir = Path(output_dir)
+                config = flow.start()
+            flow_seconds = time.perf_counter() - start
+            flow.export_config(config)
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+        end_to_end = time.perf_counter() - start
+
+    if error is None and tool_errors:
+        error = f"Scrape failed: {tool_errors[0]}"
+
+    scraped = scrape_timer.calls > 0
+    return IterationResult(
+        iteration=iteration,
+        success=error is None,
+        scrape_seconds=scrape_timer.total if scraped else None,
+        extraction_seconds=(
+            flow_seconds - scrape_timer.total if flow_seconds is not None else None
+        ),
+        end_to_end_seconds=end_to_end,
+        peak_rss_mb=memory.peak_mb,
+        llm_requests=stub.stats()["requests"] - requests_before,
+        tokens=flow.get_state().token_usage if flow is not None else None,
+        error=error,
+    )
+
+
+def summarize_site(iterations: Sequence[IterationResult]) -> Dict[str, MetricSummary]:
+    """Summarize every benchmark metric over successful iterations."""
+    successful = [i for i in iterations if i.success]
+    summary = {}
+    for metric in METRICS:
+        stats = summarize([getattr(i, metric) for i in successful])
+        if stats is not None:
+            summary[metric] = stats
+    return summary
+
+
+def run_benchmark(
+    sites_dir: Path,
+    iterations: int = 3,
+    sites: Optional[Sequence[str]] = None,
+    llm_latency_ms: float = 50.0,
+    llm_jitter_ms: float = 0.0,
+    site_latency_ms: float = 0.0,
+    timeout: int = 30,
+) -> BenchmarkReport:
+    """
+    Benchmark the scraping pipeline against local fixtures and a stub LLM.
+
+    Nothing leaves the machine: fixture sites are served from ``sites_dir``
+    on the loopback interface and CrewAI is pointed at a local
+    OpenAI-compatible stub.
+
+    Args:
+        sites_dir: Directory of fixture sites (one subdirectory per site)
+        iterations: Runs per site
+        sites: Subset of site names to run (default: all)
+        llm_latency_ms: Stub LLM delay per completion
+        llm_jitter_ms: Stub LLM maximum random extra delay
+        site_latency_ms: Fixture server delay per HTTP request
+        timeout: Scrape timeout in seconds
+
+    Returns:
+        BenchmarkReport with per-site measurements
+
+    Raises:
+        ValueError: If a requested site does not exist
+    """
+    started = datetime.now(timezone.utc)
+    run_start = time.perf_counter()
+
+    with FixtureSiteServer(sites_dir, latency_ms=site_latency_ms) as fixtures, StubLLMServer(
+        latency_ms=llm_latency_ms, jitter_ms=llm_jitter_ms, seed=0
+    ) as stub:
+        available = fixtures.site_names()
+        selected = list(sites) if sites else available
+        unknown = sorted(set(selected) - set(available))
+        if unknown:
+            raise ValueError(f"Unknown fixture sites: {', '.join(unknown)}")
+
+        env = stub.environment()
+        env["SCRAPER_ALLOWED_HOSTS"] = fixtures.host
+
+        results = []
+        with patched_environ(env):
+            for site in selected:
+                url = fixtures.site_url(site)
+                site_iterations = [
+                    run_iteration(url, n, timeout, stub) for n in range(1, iterations + 1)
+                ]
+                results.append(
+                    SiteResult(
+                        site=site,
+                        url=url,
+                        iterations=site_iterations,
+                        summary=summarize_site(site_iterations),
+                    )
+                )
+
+    return BenchmarkReport(
+        run_id=started.strftime("%Y%m%dT%H%M%SZ"),
+        started_at=started.isoformat(),
+        duration_seconds=time.perf_counter() - run_start,
+        environment=environment_info(),
+        settings=BenchmarkSettings(
+            sites=selected,
+            iterations=iterations,
+            llm_latency_ms=llm_latency_ms,
+            llm_jitter_ms=llm_jitter_ms,
+            site_latency_ms=site_latency_ms,
+            timeout=timeout,
+        ),
+        sites=results,
+        peak_rss_mb=peak_rss_mb(),
+        peak_browser_rss_mb=peak_children_rss_mb(),
+    )
+
+
+def write_report(
+    report: Union["BenchmarkReport", "LoadTestReport", "ContentBenchmarkReport"],
+    output_dir: Path,
+    prefix: str = "bench",
+) -> Path:
+    """
+    Write a report as ``{output_dir}/{prefix}-{run_id}.json``.
+
+    Args:
+        report: Report model with a ``run_id`` field
+        output_dir: Directory to write into (created if missing)
+        prefix: Filename prefix identifying the report type
+
+    Returns:
+        Path: Path to the written report
+    """
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    output_path = output_dir / f"{prefix}-{report.run_id}.json"
+    with open(output_path, "w") as f:
+        json.dump(report.model_dump(), f, indent=2, ensure_ascii=False)
+    return output_path
+
+
+def load_report(path: Path) -> BenchmarkReport:
+    """Load a benchmark report written by write_report()."""
+    with open(path) as f:
+        return BenchmarkReport(**json.load(f))
+
+
+def compare_reports(
+    baseline: BenchmarkReport, current: BenchmarkReport
+) -> Dict[str, Dict[str, Dict[str, float]]]:
+    """
+    Compare median metrics of two runs for the sites they share.
+
+    Args:
+        baseline: Earlier report
+        current: Newer report
+
+    Returns:
+        Mapping of site -> metric -> {"baseline", "current", "change_pct"}
+    """
+    baseline_sites = {s.site: s for s in baseline.sites}
+    comparison: Dict[str, Dict[str, Dict[str, float]]] = {}
+
+    for site in current.sites:
+        previous = baseline_sites.get(site.site)
+        if previous is None:
+            continue
+        metrics = {}
+        for metric, stats in site.summary.items():
+            old = previous.summary.get(metric)
+            if old is None:
+                continue
+            change = (stats.median - old.median) / old.median * 100 if old.median else 0.0
+            metrics[metric] = {
+                "baseline": old.median,
+                "current": stats.median,
+                "change_pct": change,
+            }
+        comparison[site.site] = metrics
+
+    return comparison
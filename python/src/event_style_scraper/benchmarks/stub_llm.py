@@ -0,0 +1,417 @@
+"""Local OpenAI-compatible LLM stub with canned, latency-configurable responses."""
+
+import json
+import random
+import re
+import threading
+import time
+from collections import deque
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+from urllib.parse import urlparse
+
+URL_PATTERN = re.compile(r"https?://[^\s'\"<>)}\]]+")
+
+DEFAULT_COMPLETION_TEXT = (
+    "Thank you for joining us! You explored sessions on registration technology, "
+    "AI-powered networking and hybrid engagement, and connected with peers across the "
+    "industry. Your curiosity and energy made the event better for everyone around you. "
+    "We can't wait to see what you build next - see you at the next edition."
+)
+
+# A canned response is either a fixed payload or a callable building one from
+# the first URL found in the conversation (None when the prompt has no URL).
+CannedResponse = Union[str, Dict[str, Any], Callable[[Optional[str]], Any]]
+
+
+def _slug_from_url(url: Optional[str]) -> str:
+    """Derive an event_id-style slug from a URL (last path segment or hostname)."""
+    if not url:
+        return "stub-event"
+    parsed = urlparse(url)
+    segments = [s for s in parsed.path.split("/") if s]
+    base = segments[-1] if segments else (parsed.hostname or "stub-event")
+    return re.sub(r"[^a-z0-9]+", "-", base.lower()).strip("-") or "stub-event"
+
+
+def default_style_config(url: Optional[str]) -> Dict[str, Any]:
+    """Build a valid EventStyleConfig payload for the compiler agent."""
+    slug = _slug_from_url(url)
+    return {
+        "event_id": slug,
+        "event_name": slug.replace("-", " ").title(),
+        "source_url": url or "https://example.com",
+        "colors": {
+            "primary": "#1a3c8f",
+            "secondary": "#f2a900",
+            "accent": "#00b3a4",
+            "background": "#ffffff",
+            "text": "#1f2933",
+        },
+        "typography": {
+            "heading_font": "Poppins, sans-serif",
+            "body_font": "Inter, system-ui, sans-serif",
+            "heading_size": "3rem",
+            "body_size": "1rem",
+            "line_height": "1.6",
+        },
+        "brand_voice": {
+            "tone": "professional, energetic",
+            "keywords": ["innovation", "events", "networking"],
+            "style": "conversational",
+            "personality": "innovative",
+        },
+        "layout": {
+            "grid_system": "grid",
+            "spacing_unit": "8px",
+            "border_radius": "8px",
+            "container_width": "1200px",
+        },
+        "logo_url": None,
+        "favicon_url": None,
+        "scraped_at": datetime.now(timezone.utc).isoformat(),
+    }
+
+
+def default_attendee_content(url: Optional[str]) -> Dict[str, Any]:
+    """Build a valid AttendeeContent payload for single-pass content requests."""
+    return {
+        "themes": ["registration technology", "AI-powered networking", "hybrid engagement"],
+        "greeting": (
+            "Thank you for joining us! Your curiosity and energy made the event better for "
+            "everyone."
+        ),
+        "session_highlights": (
+            "You explored sessions on registration technology, AI-powered networking and hybrid "
+            "engagement, picking up ideas you can put to work right away."
+        ),
+        "networking": (
+            "You connected with peers across the industry and started conversations worth "
+            "continuing."
+        ),
+        "achievements": "",
+        "call_to_action": "We can't wait to see what you build next - see you at the next edition.",
+        "keywords_used": ["innovation", "networking"],
+    }
+
+
+def example_from_schema(schema: Dict[str, Any], defs: Optional[Dict[str, Any]] = None) -> Any:
+    """
+    Build a minimal instance satisfying a JSON schema.
+
+    Used for structured-output requests that have no canned response.
+
+    Args:
+        schema: JSON schema (as sent in ``response_format``)
+        defs: Shared ``$defs`` of the root schema
+
+    Returns:
+        A JSON-compatible value matching the schema's required shape
+    """
+    defs = defs if defs is not None else schema.get("$defs", {})
+    if "$ref" in schema:
+        return example_from_schema(defs[schema["$ref"].split("/")[-1]], defs)
+    for combinator in ("anyOf", "oneOf", "allOf"):
+        if combinator in schema:
+            options = [s for s in schema[combinator] if s.get("type") != "null"]
+            return example_from_schema(options[0] if options else {}, defs)
+    if "enum" in schema:
+        return schema["enum"][0]
+    if "default" in schema:
+        return schema["default"]
+
+    schema_type = schema.get("type", "string")
+    if schema_type == "object":
+        return {
+            name: example_from_schema(prop, defs)
+            for name, prop in schema.get("properties", {}).items()
+        }
+    if schema_type == "array":
+        return [example_from_schema(schema.get("items", {}), defs)]
+    if schema_type == "integer":
+        return 0
+    if schema_type == "number":
+        return 0.0
+    if schema_type == "boolean":
+        return False
+    return "stub"
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token estimate (~4 characters per token)."""
+    return max(1, len(text) // 4)
+
+
+class StubLLMServer:
+    """
+    OpenAI-compatible chat completions server for offline runs.
+
+    Answers ``POST /v1/chat/completions`` the way the crews expect:
+
+    - Requests offering tools get a tool call for the first tool, with URL
+      arguments taken from the prompt; the follow-up request returns the
+      tool output verbatim as the final answer.
+    - Structured-output requests (``response_format`` json_schema) get the
+      canned payload registered under the schema name, or a minimal
+      instance generated from the schema.
+    - All other requests get canned prose.
+
+    Every response is delayed by ``latency_ms`` (plus up to ``jitter_ms``)
+    so runs can model provider latency without network access. With
+    ``requests_per_minute`` set, requests beyond that rate in the last 60
+    seconds get HTTP 429, like a provider rate limit.
+    """
+
+    def __init__(
+        self,
+        latency_ms: float = 0.0,
+        jitter_ms: float = 0.0,
+        responses: Optional[Dict[str, CannedResponse]] = None,
+        model: str = "gpt-4o-mini",
+        host: str = "127.0.0.1",
+        port: int = 0,
+        seed: Optional[int] = None,
+        requests_per_minute: Optional[int] = None,
+    ):
+        """
+        Initialize StubLLMServer.
+
+        Args:
+            latency_ms: Fixed delay per completion in milliseconds
+            jitter_ms: Maximum extra random delay per completion in milliseconds
+            responses: Canned responses keyed by schema name; the "text" key
+                overrides the default prose answer
+            model: Model name reported to clients
+            host: Interface to bind (loopback by default)
+            port: Port to bind (0 picks a free port)
+            seed: Seed for the jitter random generator
+            requests_per_minute: Answer 429 above this many requests per
+                rolling minute (None: never)
+        """
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.responses: Dict[str, CannedResponse] = {
+            "EventStyleConfig": default_style_config,
+            "AttendeeContent": default_attendee_content,
+        }
+        self.responses.update(responses or {})
+        self.model = model
+        self.host = host
+        self.port = port
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+        self.requests_per_minute = requests_per_minute
+        self._recent: "deque[float]" = deque()
+        self.request_count = 0
+        self.rate_limited_count = 0
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+
+    @property
+    def base_url(self) -> str:
+        """OpenAI-style base URL (including ``/v1``)."""
+        return f"http://{self.host}:{self.port}/v1"
+
+    def environment(self) -> Dict[str, str]:
+        """Environment variables that point CrewAI at this stub."""
+        return {
+            "OPENAI_BASE_URL": self.base_url,
+            "OPENAI_API_BASE": self.base_url,
+            "OPENAI_API_KEY": "sk-stub-offline",
+            "MODEL": self.model,
+            "CREWAI_DISABLE_TELEMETRY": "true",
+            "CREWAI_TRACING_ENABLED": "false",
+            "OTEL_SDK_DISABLED": "true",
+        }
+
+    def stats(self) -> Dict[str, int]:
+        """Snapshot of request and token counters."""
+        with self._lock:
+            return {
+                "requests": self.request_count,
+                "rate_limited": self.rate_limited_count,
+                "prompt_tokens": self.prompt_tokens,
+                "completion_tokens": self.completion_tokens,
+            }
+
+    def respond(self, body: Dict[str, Any]) -> Tuple[Dict[str, Any], str]:
+        """
+        Build the assistant message for a chat completion request.
+
+        Args:
+            body: Decoded request body
+
+        Returns:
+            (message, finish_reason) tuple
+        """
+        messages: List[Dict[str, Any]] = body.get("messages", [])
+        prompt = "\n".join(
+            m["content"] for m in messages if isinstance(m.get("content"), str)
+        )
+        urls = URL_PATTERN.findall(prompt)
+        url = urls[0] if urls else None
+        tool_messages = [m for m in messages if m.get("role") == "tool"]
+
+        if body.get("tools") and not tool_messages:
+            function = body["tools"][0]["function"]
+            properties = function.get("parameters", {}).get("properties", {})
+            arguments = {
+                name: (url or "") if prop.get("type", "string") == "string" else None
+                for name, prop in properties.items()
+            }
+            return {
+                "role": "assistant",
+                "content": None,
+                "tool_calls": [
+                    {
+                        "id": f"call_{self.request_count}",
+                        "type": "function",
+                        "function": {
+                            "name": function["name"],
+                            "arguments": json.dumps(arguments),
+                        },
+                    }
+                ],
+            }, "tool_calls"
+
+        if tool_messages:
+            return {"role": "assistant", "content": str(tool_messages[-1]["content"])}, "stop"
+
+        response_format = body.get("response_format") or {}
+        if response_format.get("type") == "json_schema":
+            json_schema = response_format.get("json_schema", {})
+            canned = self.responses.get(json_schema.get("name", ""))
+            if canned is None:
+                payload = example_from_schema(json_schema.get("schema", {}))
+            else:
+                payload = canned(url) if callable(canned) else canned
+            return {"role": "assistant", "content": json.dumps(payload)}, "stop"
+
+        canned = self.responses.get("text", DEFAULT_COMPLETION_TEXT)
+        content = canned(url) if callable(canned) else canned
+        return {"role": "assistant", "content": str(content)}, "stop"
+
+    def _over_rate_limit(self) -> bool:
+        """Record a request and report whether it exceeds requests_per_minute."""
+        if self.requests_per_minute is None:
+            return False
+        now = time.monotonic()
+        with self._lock:
+            while self._recent and now - self._recent[0] >= 60:
+                self._recent.popleft()
+            if len(self._recent) >= self.requests_per_minute:
+                self.rate_limited_count += 1
+                return True
+            self._recent.append(now)
+            return False
+
+    def _delay(self) -> None:
+        delay_ms = self.latency_ms
+        if self.jitter_ms:
+            with self._lock:
+                delay_ms += self._random.uniform(0, self.jitter_ms)
+        if delay_ms:
+            time.sleep(delay_ms / 1000)
+
+    def _handle_completion(self, body: Dict[str, Any]) -> Dict[str, Any]:
+        message, finish_reason = self.respond(body)
+        self._delay()
+
+        prompt_tokens = estimate_tokens(json.dumps(body.get("messages", [])))
+        completion_tokens = estimate_tokens(json.dumps(message))
+        with self._lock:
+            self.request_count += 1
+            self.prompt_tokens += prompt_tokens
+            self.completion_tokens += completion_tokens
+
+        return {
+            "id": f"chatcmpl-stub-{self.request_count}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": body.get("model", self.model),
+            "choices": [{"index": 0, "message": message, "finish_reason": finish_reason}],
+            "usage": {
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "total_tokens": prompt_tokens + completion_tokens,
+            },
+        }
+
+    def _make_handler(self) -> type:
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, format: str, *args: Any) -> None:
+                pass
+
+            def _send_json(self, status: int, payload: Dict[str, Any]) -> None:
+                data = json.dumps(payload).encode("utf-8")
+                self.send_response(status)
+                if status == 429:
+                    # Keep client retries fast in offline runs
+                    self.send_header("retry-after-ms", "10")
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def do_GET(self) -> None:
+                if self.path.rstrip("/").endswith("/models"):
+                    self._send_json(200, {
+                        "object": "list",
+                        "data": [{"id": stub.model, "object": "model", "owned_by": "stub"}],
+                    })
+                else:
+                    self._send_json(404, {"error": {"message": f"Unknown path {self.path}"}})
+
+            def do_POST(self) -> None:
+                length = int(self.headers.get("Content-Length", 0))
+                try:
+                    body = json.loads(self.rfile.read(length) or b"{}")
+                except json.JSONDecodeError as e:
+                    self._send_json(400, {"error": {"message": f"Invalid JSON: {e}"}})
+                    return
+
+                if not self.path.rstrip("/").endswith("/chat/completions"):
+                    self._send_json(404, {"error": {"message": f"Unknown path {self.path}"}})
+                    return
+
+                if stub._over_rate_limit():
+                    self._send_json(429, {"error": {
+                        "message": "Rate limit reached for requests",
+                        "type": "requests",
+                        "code": "rate_limit_exceeded",
+                    }})
+                    return
+
+                self._send_json(200, stub._handle_completion(body))
+
+        return Handler
+
+    def start(self) -> "StubLLMServer":
+        """Start serving in a background thread."""
+        self._server = ThreadingHTTPServer((self.host, self.port), self._make_handler())
+        self._server.daemon_threads = True
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop the server and release the port."""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def __enter__(self) -> "StubLLMServer":
+        return self.start()
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.stop()
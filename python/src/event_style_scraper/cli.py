@@ -4,14 +4,29 @@ import click
 import sys
 import logging
 import os
+import signal
+import threading
 from pathlib import Path
+from types import FrameType
+from typing import TYPE_CHECKING, Any, Callable, List, Optional, Tuple
 from dotenv import load_dotenv
 
-from event_style_scraper.flows.style_scraping_flow import StyleScrapingFlow
+# Only lightweight imports at module level: crewai, playwright and the
+# pydantic models are imported inside the commands that use them, so
+# --help and argument errors return immediately.
+from event_style_scraper.engines import ENGINE_MODES, EngineMode
+
+if TYPE_CHECKING:
+    from event_style_scraper.batch import BatchEvent
+    from event_style_scraper.content_generation import AttendeeResult
+    from event_style_scraper.ingest import Shard
+    from event_style_scraper.rate_limit import AdaptiveConcurrency
+    from event_style_scraper.scheduler import ScheduleResult
+    from event_style_scraper.store import StyleSnapshot, StyleStore
 
 
 @click.group()
-def cli():
+def cli() -> None:
     """Event Style Scraper - Extract styles and brand voice from event websites."""
     # Load environment variables from .env file
     load_dotenv()
@@ -42,7 +57,36 @@ def cli():
     is_flag=True,
     help="Enable debug logging for troubleshooting"
 )
-def scrape(url: str, timeout: int, debug: bool):
+@click.option(
+    "--history",
+    envvar="STYLE_HISTORY",
+    type=click.Path(dir_okay=False, path_type=Path),
+    help="Also record each exported config in this SQLite history store (env: STYLE_HISTORY)"
+)
+@click.option(
+    "--compact",
+    is_flag=True,
+    help="Also export each config as compact <event_id>.min.json"
+)
+@click.option(
+    "--bundle",
+    is_flag=True,
+    help="Also add each config to the output directory's _bundle.json"
+)
+@click.option(
+    "--css",
+    is_flag=True,
+    help="Also write each event's content-hashed stylesheet, listed in css/manifest.json"
+)
+def scrape(
+    url: str,
+    timeout: int,
+    debug: bool,
+    history: Optional[Path],
+    compact: bool,
+    bundle: bool,
+    css: bool,
+) -> None:
     """
     Scrape an event website to extract styles and brand voice.
 
@@ -62,6 +106,10 @@ def scrape(url: str, timeout: int, debug: bool):
         logging.getLogger("openai").setLevel(logging.DEBUG)
         click.echo("🐛 Debug logging enabled", err=True)
 
+    import time
+
+    from event_style_scraper.flows.style_scraping_flow import StyleScrapingFlow
+
     try:
         # Create flow and run scraping
         click.echo(f"🔍 Scraping website: {url}")
@@ -71,7 +119,9 @@ def scrape(url: str, timeout: int, debug: bool):
         flow = StyleScrapingFlow(url=url, timeout=timeout)
 
         click.echo("🤖 Starting style extraction crew...")
+        start = time.perf_counter()
         config = flow.start()
+        seconds = time.perf_counter() - start
 
         click.echo("✅ Style extraction completed!")
         click.echo()
@@ -81,11 +131,20 @@ def scrape(url: str, timeout: int, debug: bool):
         click.echo()
 
         click.echo("💾 Exporting configuration...")
-        output_path = flow.export_config(config)
+        output_path = flow.export_config(config, compact=compact, bundle=bundle, css=css)
+        if history:
+            from event_style_scraper.store import StyleStore
+
+            with StyleStore(history) as store:
+                store.record(
+                    config, engine="crew", seconds=seconds, tokens=flow.get_state().token_usage
+                )
 
         click.echo()
         click.echo(f"✅ Success! Configuration saved to:")
         click.echo(f"   {output_path}")
+        if history:
+            click.echo(f"🗂️  Recorded in history: {history}")
 
     except ValueError as e:
         click.echo(f"❌ Error: {str(e)}", err=True)
@@ -96,5 +155,1735 @@ def scrape(url: str, timeout: int, debug: bool):
         sys.exit(1)
 
 
+@cli.command()
+@click.option(
+    "--sites-dir",
+    default="benchmarks/sites",
+    type=click.Path(file_okay=False, path_type=Path),
+    help="Directory of fixture sites, one subdirectory each (default: benchmarks/sites)"
+)
+@click.option(
+    "--output-dir",
+    default="benchmarks/results",
+    type=click.Path(file_okay=False, path_type=Path),
+    help="Directory for JSON results (default: benchmarks/results)"
+)
+@click.option(
+    "--site",
+    "sites",
+    multiple=True,
+    help="Fixture site to run (repeatable, default: all)"
+)
+@click.option(
+    "--iterations",
+    default=3,
+    type=click.IntRange(min=1),
+    help="Runs per site (default: 3)"
+)
+@click.option(
+    "--llm-latency-ms",
+    default=50.0,
+    type=float,
+    help="Stub LLM latency per completion in ms (default: 50)"
+)
+@click.option(
+    "--llm-jitter-ms",
+    default=0.0,
+    type=float,
+    help="Stub LLM maximum random extra latency in ms (default: 0)"
+)
+@click.option(
+    "--site-latency-ms",
+    default=0.0,
+    type=float,
+    help="Fixture server latency per request in ms (default: 0)"
+)
+@click.option(
+    "--timeout",
+    default=30,
+    type=int,
+    help="Timeout in seconds for scraping operations (default: 30)"
+)
+@click.option(
+    "--baseline",
+    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+    help="Earlier results file to compare medians against"
+)
+def bench(
+    sites_dir: Path,
+    output_dir: Path,
+    sites: Tuple[str, ...],
+    iterations: int,
+    llm_latency_ms: float,
+    llm_jitter_ms: float,
+    site_latency_ms: float,
+    timeout: int,
+    baseline: Path,
+) -> None:
+    """
+    Benchmark the scraper offline against local fixtures and a stub LLM.
+
+    Serves the fixture sites from a local HTTP server, points CrewAI at a
+    local OpenAI-compatible stub, and measures scrape latency, extraction
+    latency, end-to-end flow time and peak memory. Requires a local
+    Chromium (playwright install chromium) but no network access.
+
+    Example:
+        python -m event_style_scraper bench --iterations 5
+        python -m event_style_scraper bench --site tech-summit --baseline benchmarks/baseline.json
+    """
+    from event_style_scraper.benchmarks import (
+        compare_reports,
+        load_report,
+        run_benchmark,
+        write_report,
+    )
+
+    try:
+        click.echo(f"📊 Benchmarking fixtures in {sites_dir} ({iterations} iteration(s) per site)")
+        report = run_benchmark(
+            sites_dir=sites_dir,
+            iterations=iterations,
+            sites=sites or None,
+            llm_latency_ms=llm_latency_ms,
+            llm_jitter_ms=llm_jitter_ms,
+            site_latency_ms=site_latency_ms,
+            timeout=timeout,
+        )
+    except (ValueError, FileNotFoundError) as e:
+        click.echo(f"❌ Error: {str(e)}", err=True)
+        sys.exit(1)
+
+    click.echo()
+    for site in report.sites:
+        failures = sum(1 for i in site.iterations if not i.success)
+        click.echo(
+            f"   {site.site}: {len(site.iterations) - failures}/{len(site.iterations)} succeeded"
+        )
+        for metric, stats in site.summary.items():
+            click.echo(
+                f"      {metric}: median {stats.median:.3f} "
+                f"(min {stats.min:.3f}, max {stats.max:.3f})"
+            )
+        for failed in (i for i in site.iterations if not i.success):
+            click.echo(f"      ⚠️  iteration {failed.iteration}: {failed.error}", err=True)
+
+    output_path = write_report(report, output_dir)
+    click.echo()
+    click.echo(f"💾 Results saved to: {output_path}")
+
+    if baseline:
+        click.echo()
+        click.echo(f"📈 Change vs {baseline.name} (medians):")
+        for site_name, metrics in compare_reports(load_report(baseline), report).items():
+            for metric, values in metrics.items():
+                click.echo(f"   {site_name} {metric}: {values['change_pct']:+.1f}%")
+
+    if any(not i.success for site in report.sites for i in site.iterations):
+        sys.exit(1)
+
+
+@cli.command()
+@click.option(
+    "--sites-dir",
+    default="benchmarks/sites",
+    type=click.Path(file_okay=False, path_type=Path),
+    help="Directory of fixture sites, one subdirectory each (default: benchmarks/sites)"
+)
+@click.option(
+    "--output-dir",
+    default="benchmarks/results",
+    type=click.Path(file_okay=False, path_type=Path),
+    help="Directory for JSON results (default: benchmarks/results)"
+)
+@click.option(
+    "--engine",
+    "engines",
+    multiple=True,
+    type=click.Choice(ENGINE_MODES),
+    help="Engine mode to load-test (repeatable to compare, default: deterministic)"
+)
+@click.option(
+    "--site",
+    "sites",
+    multiple=True,
+    help="Fixture site to scrape (repeatable, default: all)"
+)
+@click.option(
+    "--scrapes",
+    default=20,
+    type=click.IntRange(min=1),
+    help="Scrapes fired per engine (default: 20)"
+)
+@click.option(
+    "--concurrency",
+    default=4,
+    type=click.IntRange(min=1),
+    help="Concurrent worker processes (default: 4)"
+)
+@click.option(
+    "--llm-latency-ms",
+    default=50.0,
+    type=float,
+    help="Stub LLM latency per completion in ms (default: 50)"
+)
+@click.option(
+    "--timeout",
+    default=30,
+    type=int,
+    help="Timeout in seconds for scraping operations (default: 30)"
+)
+def loadtest(
+    sites_dir: Path,
+    output_dir: Path,
+    engines: Tuple[EngineMode, ...],
+    sites: Tuple[str, ...],
+    scrapes: int,
+    concurrency: int,
+    llm_latency_ms: float,
+    timeout: int,
+) -> None:
+    """
+    Load-test concurrent scrapes against local fixtures.
+
+    Fires N scrapes at a pool of worker processes and reports throughput,
+    p50/p95/p99 latency, peak concurrent browsers, peak memory, per-worker
+    CPU and an error breakdown for each engine mode. The crew engine uses
+    the stub LLM, so no network access is needed.
+
+    Example:
+        python -m event_style_scraper loadtest --scrapes 50 --concurrency 8
+        python -m event_style_scraper loadtest --engine crew --engine deterministic --engine http
+    """
+    from event_style_scraper.benchmarks import run_load_test, write_report
+
+    engines = engines or ("deterministic",)
+    try:
+        click.echo(
+            f"🔥 Load-testing {', '.join(engines)}: {scrapes} scrape(s) per engine, "
+            f"concurrency {concurrency}"
+        )
+        report = run_load_test(
+            sites_dir=sites_dir,
+            engines=engines,
+            scrapes=scrapes,
+            concurrency=concurrency,
+            sites=sites or None,
+            llm_latency_ms=llm_latency_ms,
+            timeout=timeout,
+        )
+    except (ValueError, FileNotFoundError) as e:
+        click.echo(f"❌ Error: {str(e)}", err=True)
+        sys.exit(1)
+
+    for result in report.results:
+        click.echo()
+        click.echo(
+            f"   {result.engine}: {result.successes}/{result.scrapes} succeeded "
+            f"in {result.wall_seconds:.2f}s"
+        )
+        click.echo(f"      throughput: {result.throughput_per_second:.2f} scrapes/s")
+        if result.latency:
+            click.echo(
+                f"      latency: p50 {result.latency.median:.3f}s, "
+                f"p95 {result.latency.p95:.3f}s, p99 {result.latency.p99:.3f}s"
+            )
+        click.echo(
+            f"      peak browsers: {result.peak_browsers}, "
+            f"peak memory: {result.peak_total_rss_mb:.0f} MB"
+        )
+        cpu = sum(w.cpu_seconds for w in result.workers)
+        browser_cpu = sum(w.browser_cpu_seconds for w in result.workers)
+        click.echo(
+            f"      CPU: {cpu:.2f}s workers, {browser_cpu:.2f}s browsers "
+            f"across {len(result.workers)} worker(s)"
+        )
+        for error_type, count in result.errors.items():
+            click.echo(
+                f"      ⚠️  {error_type} x{count}: {result.error_examples.get(error_type, '')}",
+                err=True,
+            )
+
+    output_path = write_report(report, output_dir, prefix="loadtest")
+    click.echo()
+    click.echo(f"💾 Results saved to: {output_path}")
+
+    if any(result.failures for result in report.results):
+        sys.exit(1)
+
+
+@cli.command()
+@click.option(
+    "--host",
+    default="127.0.0.1",
+    help="Host to bind the job API to (default: 127.0.0.1)"
+)
+@click.option(
+    "--port",
+    default=8765,
+    type=int,
+    help="Port to bind the job API to (default: 8765)"
+)
+@click.option(
+    "--socket",
+    "socket_path",
+    type=click.Path(dir_okay=False, path_type=Path),
+    help="Serve the job API on this Unix socket instead of TCP"
+)
+@click.option(
+    "--engine",
+    default="crew",
+    type=click.Choice(ENGINE_MODES),
+    help="Engine mode used for jobs (default: crew)"
+)
+@click.option(
+    "--concurrency",
+    default=2,
+    type=click.IntRange(min=1),
+    help="Jobs processed at once, one warm browser each (default: 2)"
+)
+@click.option(
+    "--max-queue",
+    default=100,
+    type=click.IntRange(min=1),
+    help="Maximum pending jobs before submissions are rejected (default: 100)"
+)
+@click.option(
+    "--timeout",
+    default=60,
+    type=int,
+    help="Timeout in seconds for each scrape (default: 60)"
+)
+@click.option(
+    "--output-dir",
+    default="style-configs",
+    type=click.Path(file_okay=False, path_type=Path),
+    help="Directory configs are exported to (default: style-configs)"
+)
+@click.option(
+    "--history",
+    envvar="STYLE_HISTORY",
+    type=click.Path(dir_okay=False, path_type=Path),
+    help="Also record each exported config in this SQLite history store (env: STYLE_HISTORY)"
+)
+def serve(
+    host: str,
+    port: int,
+    socket_path: Path,
+    engine: EngineMode,
+    concurrency: int,
+    max_queue: int,
+    timeout: int,
+    output_dir: Path,
+    history: Optional[Path],
+) -> None:
+    """
+    Run a scrape service with warm browsers and crews behind a local job API.
+
+    Browsers are launched and crews built once at startup, so each job
+    only pays for the scrape itself. Jobs are queued by priority and
+    their status changes (pending/scraping/completed/failed) are
+    streamed as NDJSON. Finished configs are exported to --output-dir.
+
+    Example:
+        python -m event_style_scraper serve --concurrency 4
+        curl -X POST localhost:8765/jobs -d '{"url": "https://example.com", "priority": 5}'
+        curl localhost:8765/events
+    """
+    from event_style_scraper.service import ScrapeService, create_server
+    from event_style_scraper.store import StyleStore
+
+    click.echo(f"🔥 Warming up {concurrency} {engine} worker(s)...")
+    store = StyleStore(history) if history else None
+    service = ScrapeService(
+        concurrency=concurrency,
+        max_queue=max_queue,
+        engine=engine,
+        timeout=timeout,
+        output_dir=output_dir,
+        history=store,
+    )
+    try:
+        service.start()
+        server = create_server(service, host=host, port=port, socket_path=socket_path)
+    except Exception as e:
+        service.stop()
+        if store is not None:
+            store.close()
+        click.echo(f"❌ Failed to start service: {str(e)}", err=True)
+        sys.exit(1)
+
+    address = server.server_address
+    endpoint = (
+        f"http://{host}:{address[1]}" if isinstance(address, tuple) else f"unix:{socket_path}"
+    )
+    click.echo(f"✅ Serving job API on {endpoint} (Ctrl+C to stop)")
+    click.echo("   POST /jobs, GET /jobs/<id>, GET /jobs/<id>/events, GET /events, GET /health")
+
+    subscriber = service.subscribe()
+
+    def echo_events() -> None:
+        icons = {"pending": "⏳", "scraping": "🔍", "completed": "✅", "failed": "❌"}
+        while True:
+            job = subscriber.get()
+            detail = job.output_path or job.error or ""
+            click.echo(f"{icons[job.status]} {job.id} {job.status} {job.url} {detail}".rstrip())
+
+    def handle_sigterm(signum: int, frame: Optional[FrameType]) -> None:
+        raise KeyboardInterrupt
+
+    threading.Thread(target=echo_events, daemon=True).start()
+    signal.signal(signal.SIGTERM, handle_sigterm)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        click.echo()
+        click.echo("🛑 Stopping service...")
+    finally:
+        server.server_close()
+        service.stop()
+        if store is not None:
+            store.close()
+        if socket_path and socket_path.exists():
+            socket_path.unlink()
+
+
+def _install_rate_limits(
+    concurrency: int,
+    requests_per_minute: float,
+    tokens_per_minute: float,
+    rate_limit_dir: Path,
+    adaptive: bool,
+) -> Optional["AdaptiveConcurrency"]:
+    """Route all agents' LLM calls through shared limits; return the concurrency controller."""
+    from event_style_scraper.rate_limit import AdaptiveConcurrency, RateLimiter, install_llm_limits
+
+    limiter = None
+    if requests_per_minute or tokens_per_minute:
+        limiter = RateLimiter(requests_per_minute, tokens_per_minute, state_dir=rate_limit_dir)
+    controller = AdaptiveConcurrency(maximum=concurrency) if adaptive else None
+    install_llm_limits(limiter, controller)
+    return controller
+
+
+def _rate_limit_options(command: Callable[..., Any]) -> Callable[..., Any]:
+    """Add the shared LLM rate limit options to a command."""
+    options = [
+        click.option(
+            "--requests-per-minute",
+            type=click.FloatRange(min=0, min_open=True),
+            help="LLM calls allowed per minute across all agents (default: unlimited)"
+        ),
+        click.option(
+            "--tokens-per-minute",
+            type=click.FloatRange(min=0, min_open=True),
+            help="LLM tokens allowed per minute across all agents (default: unlimited)"
+        ),
+        click.option(
+            "--rate-limit-dir",
+            type=click.Path(file_okay=False, path_type=Path),
+            help="Share the rate limits with other processes using this directory"
+        ),
+        click.option(
+            "--adaptive/--no-adaptive",
+            default=True,
+            help="Lower concurrency on 429s and timeouts, raise it back when healthy (default: on)"
+        ),
+    ]
+    for option in reversed(options):
+        command = option(command)
+    return command
+
+
+def _parse_shard(
+    ctx: click.Context, param: click.Parameter, value: Optional[str]
+) -> Optional["Shard"]:
+    """Click callback turning an i/N spec into a Shard."""
+    if value is None:
+        return None
+    from event_style_scraper.ingest import parse_shard
+
+    try:
+        return parse_shard(value)
+    except ValueError as e:
+        raise click.BadParameter(str(e))
+
+
+@cli.command()
+@click.option("--url", "urls", multiple=True, help="Event website URL to scrape (repeatable)")
+@click.option(
+    "--urls-file",
+    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+    help="File with one URL per line (# starts a comment)",
+)
+@click.option(
+    "--events-dir",
+    type=click.Path(exists=True, file_okay=False, path_type=Path),
+    help="Directory of event JSON files; scrapes each websiteUrl",
+)
+@click.option(
+    "--journal",
+    default=".batch-journal.sqlite",
+    type=click.Path(dir_okay=False, path_type=Path),
+    help="SQLite journal recording progress (default: .batch-journal.sqlite)",
+)
+@click.option(
+    "--resume",
+    is_flag=True,
+    help="Continue the journal's last run: skip completed events, restart the rest from their "
+    "last finished stage",
+)
+@click.option(
+    "--engine",
+    default="crew",
+    type=click.Choice(ENGINE_MODES),
+    help="Engine mode used for each event (default: crew)",
+)
+@click.option(
+    "--concurrency",
+    default=2,
+    type=click.IntRange(min=1),
+    help="Events processed at once (default: 2)",
+)
+@click.option(
+    "--timeout", default=60, type=int, help="Timeout in seconds for each scrape (default: 60)"
+)
+@click.option(
+    "--output-dir",
+    default="style-configs",
+    type=click.Path(file_okay=False, path_type=Path),
+    help="Directory configs are exported to (default: style-configs)",
+)
+@click.option(
+    "--history",
+    envvar="STYLE_HISTORY",
+    type=click.Path(dir_okay=False, path_type=Path),
+    help="Also record each exported config in this SQLite history store (env: STYLE_HISTORY)",
+)
+@click.option(
+    "--compact", is_flag=True, help="Also export each config as compact <event_id>.min.json"
+)
+@click.option(
+    "--bundle", is_flag=True, help="Also add each config to the output directory's _bundle.json"
+)
+@click.option(
+    "--css",
+    is_flag=True,
+    help="Also write each event's content-hashed stylesheet, listed in css/manifest.json",
+)
+@click.option(
+    "--images-dir",
+    type=click.Path(file_okay=False, path_type=Path),
+    help="Also download each event's logo and favicon into this directory (e.g. ../static/images)",
+)
+@_rate_limit_options
+def batch(
+    urls: Tuple[str, ...],
+    urls_file: Path,
+    events_dir: Path,
+    journal: Path,
+    resume: bool,
+    engine: EngineMode,
+    concurrency: int,
+    timeout: int,
+    output_dir: Path,
+    history: Optional[Path],
+    compact: bool,
+    bundle: bool,
+    css: bool,
+    images_dir: Optional[Path],
+    requests_per_minute: float,
+    tokens_per_minute: float,
+    rate_limit_dir: Path,
+    adaptive: bool,
+) -> None:
+    """
+    Scrape many event websites with a checkpointed, resumable journal.
+
+    Each event's progress is journaled stage by stage. If the run is
+    interrupted (Ctrl+C or a crash), rerun with --resume: completed
+    events are skipped and the others restart from their last finished
+    stage instead of from scratch.
+
+    With the crew engine, every agent's LLM calls share the
+    --requests-per-minute/--tokens-per-minute budgets, and concurrency
+    adapts to provider throttling.
+
+    Example:
+        python -m event_style_scraper batch --events-dir ../data/events
+        python -m event_style_scraper batch --events-dir ../data/events --resume
+    """
+    import json
+    from contextlib import nullcontext
+
+    from event_style_scraper.assets import AssetPipeline
+    from event_style_scraper.batch import BatchJournal, BatchRunner
+    from event_style_scraper.rate_limit import uninstall_llm_limits
+    from event_style_scraper.store import StyleStore
+
+    batch_urls = list(urls)
+    if urls_file:
+        for line in urls_file.read_text().splitlines():
+            line = line.strip()
+            if line and not line.startswith("#"):
+                batch_urls.append(line)
+    if events_dir:
+        for event_file in sorted(events_dir.glob("*.json")):
+            website_url = json.loads(event_file.read_text()).get("websiteUrl")
+            if website_url:
+                batch_urls.append(website_url)
+    # Keep the first occurrence of each URL
+    batch_urls = list(dict.fromkeys(batch_urls))
+
+    if not batch_urls and not resume:
+        click.echo("❌ No URLs given (use --url, --urls-file or --events-dir)", err=True)
+        sys.exit(1)
+
+    controller = None
+    if engine == "crew":
+        controller = _install_rate_limits(
+            concurrency, requests_per_minute, tokens_per_minute, rate_limit_dir, adaptive
+        )
+
+    icons = {"completed": "✅", "failed": "❌"}
+
+    def echo_event(event: "BatchEvent") -> None:
+        detail = event.output_path if event.status == "completed" else event.error
+        click.echo(f"{icons.get(event.status, '⏳')} {event.url} {detail or ''}".rstrip())
+
+    with (
+        BatchJournal(journal) as batch_journal,
+        StyleStore(history) if history else nullcontext() as store,
+        AssetPipeline(images_dir) if images_dir else nullcontext() as assets,
+    ):
+        runner = BatchRunner(
+            batch_journal,
+            engine=engine,
+            concurrency=concurrency,
+            timeout=timeout,
+            output_dir=output_dir,
+            on_event=echo_event,
+            controller=controller,
+            history=store,
+            compact=compact,
+            bundle=bundle,
+            css=css,
+            assets=assets,
+        )
+
+        def handle_sigint(signum: int, frame: Optional[FrameType]) -> None:
+            click.echo("\n🛑 Stopping after the current stage of each running event...")
+            runner.cancel()
+
+        previous_handler = signal.signal(signal.SIGINT, handle_sigint)
+        action = "Resuming" if resume else "Starting"
+        click.echo(
+            f"🚀 {action} batch of {len(batch_urls) or 'journaled'} event(s) "
+            f"with the {engine} engine..."
+        )
+        try:
+            summary = runner.run(batch_urls, resume=resume)
+        except ValueError as e:
+            click.echo(f"❌ {str(e)}", err=True)
+            sys.exit(1)
+        finally:
+            signal.signal(signal.SIGINT, previous_handler)
+            if engine == "crew":
+                uninstall_llm_limits()
+
+    click.echo()
+    click.echo(
+        f"📊 {summary.completed} completed, {summary.failed} failed, "
+        f"{summary.skipped} already done, {summary.resumed} resumed mid-way ({summary.total} total)"
+    )
+    if controller is not None and controller.limit < concurrency:
+        click.echo(f"🐢 Provider throttling lowered concurrency to {controller.limit}")
+    click.echo(f"📒 Journal: {journal}")
+    if history:
+        click.echo(f"🗂️  History: {history}")
+    if summary.cancelled:
+        click.echo(
+            f"⏸️  {summary.interrupted} event(s) unfinished; rerun with --resume to continue"
+        )
+        sys.exit(130)
+    if summary.failed:
+        sys.exit(1)
+
+
+@cli.command("generate-content")
+@click.option(
+    "--event",
+    "event_id",
+    required=True,
+    help="Event ID whose attendees get content (e.g. event-tech-live-2025)",
+)
+@click.option(
+    "--attendees-dir",
+    default="../data/attendees",
+    type=click.Path(file_okay=False, path_type=Path),
+    help="Directory of attendee JSON files (default: ../data/attendees)",
+)
+@click.option(
+    "--attendees-file",
+    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+    help="JSONL or CSV attendee export to stream instead of --attendees-dir",
+)
+@click.option(
+    "--style-configs-dir",
+    default="style-configs",
+    type=click.Path(file_okay=False, path_type=Path),
+    help="Directory of scraped style configs (default: style-configs)",
+)
+@click.option(
+    "--output-dir",
+    default="generated-content",
+    type=click.Path(file_okay=False, path_type=Path),
+    help="Directory content is written to, one subdirectory per event (default: generated-content)",
+)
+@click.option(
+    "--concurrency",
+    default=4,
+    type=click.IntRange(min=1),
+    help="Attendees processed at once (default: 4)",
+)
+@click.option(
+    "--mode",
+    type=click.Choice(["crew", "clustered", "single-pass"]),
+    default="crew",
+    help="crew: four-agent crew per attendee; clustered: shared draft per group of similar "
+    "attendees plus one personalization call each; single-pass: one structured call per "
+    "attendee (default: crew)",
+)
+@click.option(
+    "--cluster-threshold",
+    type=click.FloatRange(0, 1),
+    help="Session-similarity needed to share a draft in clustered mode (default: 0.75)",
+)
+@click.option(
+    "--rich-analysis",
+    is_flag=True,
+    help="Have an LLM agent analyze each attendee instead of the computed profile "
+    "(one more call each)",
+)
+@click.option(
+    "--audit-rate",
+    default=0.05,
+    type=click.FloatRange(0, 1),
+    help="Share of content passing the local quality gates still sent to the LLM editor "
+    "(default: 0.05)",
+)
+@click.option(
+    "--review-all",
+    is_flag=True,
+    help="Run the LLM quality editor on every attendee instead of only on gate failures "
+    "(crew mode)",
+)
+@click.option(
+    "--force",
+    is_flag=True,
+    help="Regenerate every attendee, including those whose content is up to date",
+)
+@click.option(
+    "--shard",
+    callback=_parse_shard,
+    metavar="I/N",
+    help="Only generate shard I of N (attendees split by a stable hash of their id)",
+)
+@_rate_limit_options
+def generate_content(
+    event_id: str,
+    attendees_dir: Path,
+    attendees_file: Optional[Path],
+    style_configs_dir: Path,
+    output_dir: Path,
+    concurrency: int,
+    mode: str,
+    cluster_threshold: Optional[float],
+    rich_analysis: bool,
+    audit_rate: float,
+    review_all: bool,
+    force: bool,
+    shard: Optional["Shard"],
+    requests_per_minute: float,
+    tokens_per_minute: float,
+    rate_limit_dir: Path,
+    adaptive: bool,
+) -> None:
+    """
+    Generate personalized content for every attendee of an event.
+
+    Runs the content creation crew for each attendee in the event's
+    brand voice (from its scraped style config). Attendee analyses
+    (sessions, tracks, speakers, connections) are computed directly
+    rather than by an LLM unless --rich-analysis is given. Content is
+    written per attendee as it finishes; failed attendees are reported at
+    the end without stopping the run. Attendees whose record, profile,
+    brand voice, prompts and model are unchanged since their content was
+    generated are skipped unless --force is given.
+
+    In crew mode the LLM quality editor only sees content that fails the
+    local quality gates (word limit, sections, brand keywords,
+    readability, banned phrases, names and counts) plus an --audit-rate
+    sample of the rest; --review-all sends it every attendee.
+
+    Large registration exports can be streamed with --attendees-file
+    (.jsonl or .csv, optionally gzipped); invalid records are skipped and
+    counted. To split an event across machines sharing a filesystem, run
+    each with --shard I/N, then combine the shards with merge-content.
+
+    With --mode clustered, attendees who attended near-identical sessions
+    share one LLM-written highlights draft and each gets a single
+    personalization call; the compression ratio (attendees per draft) is
+    reported. With --mode single-pass, each attendee's analysis, writing
+    and brand voice are one structured LLM call instead of a chain of
+    agents: cheaper and faster, while the crew stays the premium option.
+
+    Every agent's LLM calls share the --requests-per-minute and
+    --tokens-per-minute budgets, and concurrency adapts to provider
+    throttling.
+
+    Example:
+        python -m event_style_scraper generate-content --event event-tech-live-2025 --concurrency 8
+        python -m event_style_scraper generate-content --event event-tech-live-2025 --shard 2/8
+        python -m event_style_scraper generate-content --event event-tech-live-2025 --mode clustered
+        python -m event_style_scraper generate-content --event aws-reinvent-2025 --mode single-pass
+    """
+    from event_style_scraper.content_generation import generate_event_content
+    from event_style_scraper.quality import QualityGates
+    from event_style_scraper.rate_limit import uninstall_llm_limits
+
+    def echo_result(result: "AttendeeResult") -> None:
+        if result.skipped:
+            return
+        if result.success:
+            click.echo(f"✅ {result.attendee_id} ({result.seconds:.1f}s) {result.output_path}")
+        else:
+            click.echo(f"❌ {result.attendee_id}: {result.error}", err=True)
+
+    controller = _install_rate_limits(
+        concurrency, requests_per_minute, tokens_per_minute, rate_limit_dir, adaptive
+    )
+    shard_note = f", shard {shard}" if shard else ""
+    click.echo(
+        f"✍️  Generating content for {event_id} attendees ({concurrency} at a time{shard_note})..."
+    )
+    try:
+        report = generate_event_content(
+            event_id,
+            attendees_dir=attendees_dir,
+            style_configs_dir=style_configs_dir,
+            output_dir=output_dir,
+            concurrency=concurrency,
+            on_result=echo_result,
+            controller=controller,
+            rich_analysis=rich_analysis,
+            force=force,
+            attendees_file=attendees_file,
+            shard=shard,
+            mode=mode,
+            cluster_threshold=cluster_threshold,
+            quality_gates=QualityGates(audit_rate=audit_rate),
+            review_all=review_all,
+        )
+    except (ValueError, FileNotFoundError) as e:
+        click.echo(f"❌ Error: {str(e)}", err=True)
+        sys.exit(1)
+    finally:
+        uninstall_llm_limits()
+
+    click.echo()
+    click.echo(
+        f"📊 {report.succeeded}/{len(report.results)} attendees succeeded "
+        f"in {report.elapsed_seconds:.1f}s"
+    )
+    click.echo(f"   {report.regenerated} regenerated, {report.skipped} unchanged and skipped")
+    if report.compression_ratio is not None:
+        click.echo(
+            f"   🧩 {report.cluster_count} clusters, "
+            f"compression ratio {report.compression_ratio:.1f}x "
+            f"({report.drafts_generated} drafts written, {report.draft_tokens} draft tokens)"
+        )
+    if report.quality is not None and report.quality.checked:
+        quality = report.quality
+        click.echo(
+            f"   🔎 Quality gates: {quality.passed}/{quality.checked} passed "
+            f"({quality.pass_rate:.0%}), "
+            f"{quality.reviewed} sent to the editor ({quality.audited} audits), "
+            f"{quality.llm_calls_avoided} LLM calls avoided"
+        )
+        click.echo(
+            "      "
+            + ", ".join(f"{check} {rate:.0%}" for check, rate in quality.pass_rates.items())
+        )
+    if report.invalid_records:
+        click.echo(f"   ⚠️  {len(report.invalid_records)} invalid export records skipped", err=True)
+    click.echo(
+        f"   Throughput: {report.attendees_per_minute:.1f} attendees/min, "
+        f"{report.total_tokens} tokens"
+    )
+    if controller is not None and controller.limit < concurrency:
+        click.echo(f"   🐢 Provider throttling lowered concurrency to {controller.limit}")
+    click.echo(f"💾 Content saved to: {output_dir / event_id}")
+
+    if report.failed:
+        sys.exit(1)
+
+
+@cli.command("bench-content")
+@click.option(
+    "--event",
+    "event_id",
+    required=True,
+    help="Event ID whose attendees to generate content for"
+)
+@click.option(
+    "--attendees-dir",
+    default="../data/attendees",
+    type=click.Path(file_okay=False, path_type=Path),
+    help="Directory of attendee JSON files (default: ../data/attendees)"
+)
+@click.option(
+    "--attendees-file",
+    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+    help="JSONL or CSV attendee export to stream instead of --attendees-dir"
+)
+@click.option(
+    "--style-configs-dir",
+    default="style-configs",
+    type=click.Path(file_okay=False, path_type=Path),
+    help="Directory of scraped style configs (default: style-configs)"
+)
+@click.option(
+    "--output-dir",
+    default="benchmarks/results",
+    type=click.Path(file_okay=False, path_type=Path),
+    help="Directory for JSON results (default: benchmarks/results)"
+)
+@click.option(
+    "--mode",
+    "modes",
+    multiple=True,
+    type=click.Choice(["crew", "clustered", "single-pass"]),
+    help="Content mode to run (repeatable; the first is the baseline, default: all)"
+)
+@click.option(
+    "--concurrency",
+    default=4,
+    type=click.IntRange(min=1),
+    help="Attendees processed at once (default: 4)"
+)
+@click.option(
+    "--llm-latency-ms",
+    default=50.0,
+    type=float,
+    help="Stub LLM latency per completion in ms (default: 50)"
+)
+def bench_content(
+    event_id: str,
+    attendees_dir: Path,
+    attendees_file: Optional[Path],
+    style_configs_dir: Path,
+    output_dir: Path,
+    modes: Tuple[str, ...],
+    concurrency: int,
+    llm_latency_ms: float,
+) -> None:
+    """
+    Compare content generation modes offline against a stub LLM.
+
+    Generates every attendee of the event once per mode (into a scratch
+    directory) and reports wall-clock time, per-attendee latency, LLM
+    calls and tokens, with each mode's per-attendee cost compared to the
+    first.
+
+    Example:
+        python -m event_style_scraper bench-content --event event-tech-live-2025
+        python -m event_style_scraper bench-content --event aws-reinvent-2025 --mode single-pass
+    """
+    from event_style_scraper.benchmarks import run_content_benchmark, write_report
+
+    modes = modes or ("crew", "clustered", "single-pass")
+    try:
+        click.echo(f"📊 Benchmarking content modes {', '.join(modes)} on {event_id}")
+        report = run_content_benchmark(
+            event_id,
+            attendees_dir=attendees_dir,
+            style_configs_dir=style_configs_dir,
+            modes=modes,
+            concurrency=concurrency,
+            llm_latency_ms=llm_latency_ms,
+            attendees_file=attendees_file,
+        )
+    except (ValueError, FileNotFoundError) as e:
+        click.echo(f"❌ Error: {str(e)}", err=True)
+        sys.exit(1)
+
+    for result in report.results:
+        click.echo()
+        click.echo(
+            f"   {result.mode}: {result.succeeded}/{result.attendees} succeeded "
+            f"in {result.elapsed_seconds:.2f}s"
+        )
+        if result.latency:
+            click.echo(
+                f"      latency: p50 {result.latency.median:.3f}s, "
+                f"p95 {result.latency.p95:.3f}s per attendee"
+            )
+        click.echo(
+            f"      LLM: {result.llm_requests} calls, {result.total_tokens} tokens "
+            f"({result.prompt_tokens} prompt, {result.completion_tokens} completion)"
+        )
+        if result.error:
+            click.echo(f"      ⚠️  {result.error}", err=True)
+
+    comparison = report.comparison()
+    if comparison:
+        click.echo()
+        click.echo(f"📈 Per attendee vs {report.results[0].mode}:")
+        for mode, metrics in comparison.items():
+            changes = ", ".join(
+                f"{metric} {values['change_pct']:+.1f}%" for metric, values in metrics.items()
+            )
+            click.echo(f"   {mode}: {changes}")
+
+    output_path = write_report(report, output_dir, prefix="content")
+    click.echo()
+    click.echo(f"💾 Results saved to: {output_path}")
+
+    if any(result.error for result in report.results):
+        sys.exit(1)
+
+
+@cli.command("merge-content")
+@click.option(
+    "--event",
+    "event_id",
+    required=True,
+    help="Event ID whose shards to merge"
+)
+@click.option(
+    "--output-dir",
+    default="generated-content",
+    type=click.Path(file_okay=False, path_type=Path),
+    help="Root directory of generated content (default: generated-content)"
+)
+@click.option(
+    "--attendees-dir",
+    default="../data/attendees",
+    type=click.Path(file_okay=False, path_type=Path),
+    help="Directory of attendee JSON files to check against (default: ../data/attendees)"
+)
+@click.option(
+    "--attendees-file",
+    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+    help="JSONL or CSV attendee export to check against instead of --attendees-dir"
+)
+def merge_content(
+    event_id: str, output_dir: Path, attendees_dir: Path, attendees_file: Optional[Path]
+) -> None:
+    """
+    Merge an event's sharded content into one file, checking completeness.
+
+    Fails unless every shard finished, no attendee was generated by two
+    shards, and every attendee of the event has content. The merged
+    content is written to <output-dir>/<event>.json.
+
+    Example:
+        python -m event_style_scraper merge-content --event event-tech-live-2025
+    """
+    from event_style_scraper.content_generation import merge_event_content
+    from event_style_scraper.ingest import AttendeeExport
+    from event_style_scraper.repository import AttendeeRepository
+
+    try:
+        source = (
+            AttendeeExport(attendees_file) if attendees_file else AttendeeRepository(attendees_dir)
+        )
+        expected_ids = [str(attendee.get("id", "")) for attendee in source.iter_attendees(event_id)]
+        report = merge_event_content(event_id, output_dir, expected_ids=expected_ids)
+    except (ValueError, FileNotFoundError) as e:
+        click.echo(f"❌ Error: {str(e)}", err=True)
+        sys.exit(1)
+
+    if not report.complete:
+        click.echo(f"❌ {event_id} is incomplete ({report.shard_count} shards):", err=True)
+        for label, ids in (
+            ("Shards not finished", report.missing_shards),
+            ("Attendees missing", report.missing),
+            ("Attendees in more than one shard", report.duplicated),
+            ("Attendees without content", report.failed),
+        ):
+            if ids:
+                click.echo(f"   {label} ({len(ids)}): {', '.join(ids[:10])}", err=True)
+        sys.exit(1)
+
+    click.echo(f"✅ Merged {report.attendee_count} attendees from {report.shard_count} shards")
+    click.echo(f"💾 Content saved to: {report.output_path}")
+
+
+@cli.group()
+@click.option(
+    "--store",
+    "store_path",
+    envvar="STYLE_HISTORY",
+    default=".style-history.sqlite",
+    type=click.Path(dir_okay=False, path_type=Path),
+    help="SQLite history store (env: STYLE_HISTORY, default: .style-history.sqlite)"
+)
+@click.pass_context
+def history(ctx: click.Context, store_path: Path) -> None:
+    """
+    Query and export the versioned history of scraped style configs.
+
+    scrape, batch and serve record every exported config in the store
+    when given --history (or STYLE_HISTORY). Existing style-configs can
+    be backfilled with the import command.
+
+    Example:
+        python -m event_style_scraper history import style-configs
+        python -m event_style_scraper history stale --days 30
+        python -m event_style_scraper history export --output-dir style-configs
+    """
+    ctx.obj = store_path
+
+
+def _open_history(store_path: Path) -> "StyleStore":
+    from event_style_scraper.store import StyleStore
+
+    return StyleStore(store_path)
+
+
+def _echo_snapshot(snapshot: "StyleSnapshot") -> None:
+    click.echo(
+        f"   {snapshot.event_id}  {snapshot.scraped_at}  {snapshot.config.colors.primary}  "
+        f"{snapshot.fingerprint}  {snapshot.domain}"
+    )
+
+
+@history.command("import")
+@click.argument("paths", nargs=-1, required=True, type=click.Path(exists=True, path_type=Path))
+@click.pass_obj
+def history_import(store_path: Path, paths: Tuple[Path, ...]) -> None:
+    """
+    Backfill the store from exported config files or directories of them.
+
+    Configs already in the store are skipped.
+
+    Example:
+        python -m event_style_scraper history import style-configs
+    """
+    from pydantic import ValidationError
+
+    from event_style_scraper.export import config_paths
+
+    files: List[Path] = []
+    for path in paths:
+        files.extend(config_paths(path) if path.is_dir() else [path])
+    try:
+        with _open_history(store_path) as store:
+            added = store.import_configs(files)
+    except (ValidationError, ValueError) as e:
+        click.echo(f"❌ Invalid config: {str(e)}", err=True)
+        sys.exit(1)
+    click.echo(f"✅ Imported {added} of {len(files)} config(s) into {store_path}")
+
+
+@history.command("latest")
+@click.option(
+    "--event",
+    "event_id",
+    help="Show every snapshot of this event instead of the latest of each"
+)
+@click.option(
+    "--domain",
+    help="Only events scraped from this domain"
+)
+@click.pass_obj
+def history_latest(store_path: Path, event_id: Optional[str], domain: Optional[str]) -> None:
+    """
+    List the latest snapshot of every event (or one event's full history).
+
+    Example:
+        python -m event_style_scraper history latest
+        python -m event_style_scraper history latest --event event-tech-live-2025
+    """
+    with _open_history(store_path) as store:
+        snapshots = store.history(event_id) if event_id else store.latest_per_event(domain)
+    if not snapshots:
+        click.echo("📭 No snapshots")
+        return
+    click.echo(f"🗂️  {len(snapshots)} snapshot(s):")
+    for snapshot in snapshots:
+        _echo_snapshot(snapshot)
+
+
+@history.command("stale")
+@click.option(
+    "--days",
+    default=30.0,
+    type=click.FloatRange(min=0),
+    help="Report events last scraped more than this many days ago (default: 30)"
+)
+@click.pass_obj
+def history_stale(store_path: Path, days: float) -> None:
+    """
+    List events whose latest config is older than --days.
+
+    Example:
+        python -m event_style_scraper history stale --days 14
+    """
+    with _open_history(store_path) as store:
+        snapshots = store.stale(days)
+    click.echo(f"⏰ {len(snapshots)} event(s) last scraped more than {days:g} days ago")
+    for snapshot in snapshots:
+        _echo_snapshot(snapshot)
+
+
+@history.command("changed")
+@click.option(
+    "--since",
+    help="Only compare snapshots scraped at or after this ISO 8601 time"
+)
+@click.pass_obj
+def history_changed(store_path: Path, since: Optional[str]) -> None:
+    """
+    List events whose primary color changed between scrapes.
+
+    Example:
+        python -m event_style_scraper history changed --since 2025-01-01
+    """
+    with _open_history(store_path) as store:
+        event_ids = store.primary_color_changed(since)
+        click.echo(f"🎨 {len(event_ids)} event(s) changed primary color")
+        for event_id in event_ids:
+            colors = list(dict.fromkeys(s.config.colors.primary for s in store.history(event_id)))
+            click.echo(f"   {event_id}: {' → '.join(colors)}")
+
+
+@history.command("export")
+@click.option(
+    "--output-dir",
+    default="style-configs",
+    type=click.Path(file_okay=False, path_type=Path),
+    help="Directory to write <event_id>.json files to (default: style-configs)"
+)
+@click.option(
+    "--event",
+    "event_ids",
+    multiple=True,
+    help="Only export this event (repeatable; default: all)"
+)
+@click.option(
+    "--compact",
+    is_flag=True,
+    help="Also export each config as compact <event_id>.min.json"
+)
+@click.option(
+    "--bundle",
+    is_flag=True,
+    help="Also add each config to the output directory's _bundle.json"
+)
+@click.option(
+    "--css",
+    is_flag=True,
+    help="Also write each event's content-hashed stylesheet, listed in css/manifest.json"
+)
+@click.pass_obj
+def history_export(
+    store_path: Path,
+    output_dir: Path,
+    event_ids: Tuple[str, ...],
+    compact: bool,
+    bundle: bool,
+    css: bool,
+) -> None:
+    """
+    Re-export each event's latest config from the store.
+
+    Example:
+        python -m event_style_scraper history export --output-dir style-configs
+    """
+    with _open_history(store_path) as store:
+        paths = store.export_json(
+            output_dir, list(event_ids) or None, compact=compact, bundle=bundle, css=css
+        )
+    click.echo(f"💾 Exported {len(paths)} config(s) to {output_dir}")
+
+
+@cli.command()
+@click.argument("configs", nargs=-1, type=click.Path(exists=True, dir_okay=False, path_type=Path))
+@click.option(
+    "--store",
+    "store_path",
+    envvar="STYLE_HISTORY",
+    default=".style-history.sqlite",
+    type=click.Path(dir_okay=False, path_type=Path),
+    help="SQLite history store to compare against "
+    "(env: STYLE_HISTORY, default: .style-history.sqlite)",
+)
+@click.option(
+    "--event",
+    "event_ids",
+    multiple=True,
+    help="Only compare this event (repeatable; default: whole catalog)",
+)
+@click.option(
+    "--since",
+    help="Compare against each event's config as of this ISO 8601 time "
+    "(default: its previous scrape)",
+)
+@click.option(
+    "--live",
+    is_flag=True,
+    help="Re-scrape each event's site and compare it against its latest stored config",
+)
+@click.option(
+    "--engine",
+    default="http",
+    type=click.Choice(ENGINE_MODES),
+    help="Engine mode for --live scrapes (default: http)",
+)
+@click.option(
+    "--concurrency",
+    default=4,
+    type=click.IntRange(min=1),
+    help="Sites scraped at once with --live (default: 4)",
+)
+@click.option(
+    "--timeout",
+    default=60,
+    type=int,
+    help="Timeout in seconds for each --live scrape (default: 60)",
+)
+@click.option(
+    "--min-score",
+    default=0.05,
+    type=click.FloatRange(min=0, max=1),
+    help="Overall drift score (0-1) from which an event is reported (default: 0.05)",
+)
+@click.option(
+    "--json-report",
+    type=click.Path(dir_okay=False, path_type=Path),
+    help="Also write every drift report to this JSON file",
+)
+@click.option("--fail-on-drift", is_flag=True, help="Exit with status 1 if any event drifted")
+def diff(
+    configs: Tuple[Path, ...],
+    store_path: Path,
+    event_ids: Tuple[str, ...],
+    since: Optional[str],
+    live: bool,
+    engine: EngineMode,
+    concurrency: int,
+    timeout: int,
+    min_score: float,
+    json_report: Optional[Path],
+    fail_on_drift: bool,
+) -> None:
+    """
+    Report style drift between scrapes of events.
+
+    Given two config files, compares them. Otherwise compares every event
+    in the history store (or each --event) with its previous scrape, or
+    with its config as of --since, without re-scraping. With --live, each
+    site is scraped again and compared with its latest stored config; the
+    fresh scrapes are recorded in the store.
+
+    Colors are compared by perceptual distance (CIEDE2000) and font
+    stacks after normalization; each changed field is scored and weighted
+    into an overall drift score from 0 to 1.
+
+    Example:
+        python -m event_style_scraper diff style-configs/old.json style-configs/new.json
+        python -m event_style_scraper diff --since 2025-01-01
+        python -m event_style_scraper diff --live --event event-tech-live-2025
+    """
+    import json
+
+    from pydantic import ValidationError
+
+    from event_style_scraper.drift import catalog_drift, compare_configs, live_drift
+    from event_style_scraper.engines import run_engine
+    from event_style_scraper.store import StyleStore
+    from event_style_scraper.types import EventStyleConfig
+
+    if configs and len(configs) != 2:
+        click.echo(
+            "❌ Give exactly two config files, or none to compare the history store", err=True
+        )
+        sys.exit(1)
+    try:
+        if configs:
+            old, new = (
+                EventStyleConfig.model_validate_json(path.read_text(encoding="utf-8"))
+                for path in configs
+            )
+            reports = [compare_configs(old, new)]
+        else:
+            if not store_path.exists():
+                click.echo(
+                    f"❌ No history store at {store_path} "
+                    "(record one with --history or history import)",
+                    err=True,
+                )
+                sys.exit(1)
+            with StyleStore(store_path) as store:
+                selected = list(event_ids) or None
+                if live:
+                    click.echo(
+                        f"🔍 Re-scraping {'selected' if selected else 'all'} events "
+                        f"with the {engine} engine..."
+                    )
+                    reports = live_drift(
+                        store,
+                        lambda url: run_engine(url, engine, timeout),
+                        event_ids=selected,
+                        concurrency=concurrency,
+                        record=engine,
+                    )
+                else:
+                    reports = catalog_drift(store, since=since, event_ids=selected)
+    except (ValidationError, ValueError) as e:
+        click.echo(f"❌ Error: {str(e)}", err=True)
+        sys.exit(1)
+
+    drifted = [report for report in reports if report.drifted(min_score)]
+    failed = [report for report in reports if report.error]
+    for report in drifted:
+        click.echo(
+            f"🎨 {report.event_id}: drift {report.score:.0%} "
+            f"({report.old_scraped_at or '?'} → {report.new_scraped_at or '?'})"
+        )
+        for field in report.fields:
+            detail = f"  ΔE {field.delta_e:.1f}" if field.delta_e is not None else ""
+            click.echo(f"   {field.field}: {field.old} → {field.new}{detail}")
+    for report in failed:
+        click.echo(f"❌ {report.event_id}: {report.error}", err=True)
+    click.echo(f"📊 {len(drifted)} of {len(reports)} event(s) drifted (score ≥ {min_score:.0%})")
+
+    if json_report:
+        json_report.parent.mkdir(parents=True, exist_ok=True)
+        json_report.write_text(
+            json.dumps([report.model_dump() for report in reports], indent=2, ensure_ascii=False)
+        )
+        click.echo(f"💾 Report saved to: {json_report}")
+
+    if failed or (fail_on_drift and drifted):
+        sys.exit(1)
+
+
+@cli.command()
+@click.option(
+    "--catalog",
+    default="config/events.json",
+    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+    help="Event catalog (default: config/events.json)",
+)
+@click.option(
+    "--events-dir",
+    default="../data/events",
+    type=click.Path(file_okay=False, path_type=Path),
+    help="Event JSON files with start and end dates (default: ../data/events)",
+)
+@click.option(
+    "--output-dir",
+    default="style-configs",
+    type=click.Path(file_okay=False, path_type=Path),
+    help="Directory of exported configs (default: style-configs)",
+)
+@click.option(
+    "--store",
+    "store_path",
+    envvar="STYLE_HISTORY",
+    default=".style-history.sqlite",
+    type=click.Path(dir_okay=False, path_type=Path),
+    help="SQLite history store with past scrapes and failures "
+    "(env: STYLE_HISTORY, default: .style-history.sqlite)",
+)
+@click.option(
+    "--engine",
+    default="crew",
+    type=click.Choice(ENGINE_MODES),
+    help="Engine mode used for each event (default: crew)",
+)
+@click.option(
+    "--limit",
+    type=click.IntRange(min=1),
+    help="Most events to scrape in this run (default: all due events)",
+)
+@click.option(
+    "--max-minutes",
+    type=click.FloatRange(min=0, min_open=True),
+    help="Time budget for the run (default: unlimited)",
+)
+@click.option(
+    "--max-tokens",
+    type=click.IntRange(min=1),
+    help="LLM token budget for the run (default: unlimited)",
+)
+@click.option(
+    "--concurrency",
+    default=1,
+    type=click.IntRange(min=1),
+    help="Events scraped at once (default: 1)",
+)
+@click.option(
+    "--max-age-days",
+    default=30.0,
+    type=click.FloatRange(min=0, min_open=True),
+    help="Config age at which an event is fully stale (default: 30)",
+)
+@click.option("--dry-run", is_flag=True, help="Only print the queue and what would be scraped")
+def schedule(
+    catalog: Path,
+    events_dir: Path,
+    output_dir: Path,
+    store_path: Path,
+    engine: EngineMode,
+    limit: Optional[int],
+    max_minutes: Optional[float],
+    max_tokens: Optional[int],
+    concurrency: int,
+    max_age_days: float,
+    dry_run: bool,
+) -> None:
+    """
+    Re-scrape the catalog's most stale events within a time or token budget.
+
+    Every enabled event in the catalog is prioritized by the age of its
+    config, how soon the event takes place, how often its styles changed
+    in past scrapes and its recent failures (failing events are backed
+    off exponentially). The top events whose estimated cost fits
+    --limit, --max-minutes and --max-tokens are scraped, exported and
+    recorded in the history store; the rest wait for the next run.
+
+    Example:
+        python -m event_style_scraper schedule --limit 5 --max-minutes 20
+        python -m event_style_scraper schedule --engine http --dry-run
+    """
+    from event_style_scraper.scheduler import (
+        SchedulePolicy,
+        build_schedule,
+        load_catalog,
+        run_schedule,
+        select_events,
+    )
+    from event_style_scraper.store import StyleStore
+
+    max_seconds = max_minutes * 60 if max_minutes else None
+    try:
+        events = load_catalog(catalog, events_dir if events_dir.is_dir() else None)
+    except ValueError as e:
+        click.echo(f"❌ Error: {str(e)}", err=True)
+        sys.exit(1)
+
+    with StyleStore(store_path) as store:
+        queue = build_schedule(
+            events,
+            output_dir,
+            store=store,
+            policy=SchedulePolicy(max_age_days=max_age_days),
+            engine=engine,
+        )
+        selected = select_events(queue, limit, max_seconds, max_tokens, concurrency)
+        chosen = {event.event_id for event in selected}
+
+        click.echo(f"🗓️  {sum(e.due for e in queue)} of {len(queue)} event(s) due for re-scraping:")
+        for event in queue:
+            icon = "▶️ " if event.event_id in chosen else "⏳" if event.due else "💤"
+            click.echo(
+                f"   {icon} {event.event_id}  priority {event.priority:.2f}  ({event.reason})"
+            )
+        if dry_run or not selected:
+            return
+
+        icons = {"completed": "✅", "failed": "❌", "deferred": "⏸️ "}
+
+        def echo_result(result: "ScheduleResult") -> None:
+            detail = result.output_path or result.error or "out of budget"
+            click.echo(f"{icons[result.status]} {result.event_id} {detail}")
+
+        click.echo()
+        click.echo(f"🚀 Scraping {len(selected)} event(s) with the {engine} engine...")
+        report = run_schedule(
+            selected,
+            output_dir,
+            store=store,
+            engine=engine,
+            concurrency=concurrency,
+            max_seconds=max_seconds,
+            max_tokens=max_tokens,
+            on_result=echo_result,
+        )
+
+    click.echo()
+    click.echo(
+        f"📊 {report.count('completed')} completed, {report.count('failed')} failed, "
+        f"{report.count('deferred')} deferred in {report.elapsed_seconds:.1f}s "
+        f"({report.tokens} tokens)"
+    )
+    if report.count("failed"):
+        sys.exit(1)
+
+
+@cli.command()
+@click.option(
+    "--output-dir",
+    default="style-configs",
+    type=click.Path(exists=True, file_okay=False, path_type=Path),
+    help="Directory of exported configs (default: style-configs)"
+)
+@click.option(
+    "--css",
+    is_flag=True,
+    help="Also rebuild the content-hashed stylesheets and css/manifest.json"
+)
+def bundle(output_dir: Path, css: bool) -> None:
+    """
+    Rebuild the bundle of every exported config, keyed by event_id.
+
+    Each <event_id>.json in --output-dir is validated and written to
+    <output-dir>/_bundle.json as compact JSON, so a site build can load
+    every config with one read. With --css, each event's precompiled
+    stylesheet is written to <output-dir>/css/<event_id>.<hash>.css and
+    listed in css/manifest.json; stylesheets of removed events are deleted.
+
+    Example:
+        python -m event_style_scraper bundle --output-dir style-configs
+        python -m event_style_scraper bundle --output-dir style-configs --css
+    """
+    import json
+
+    from pydantic import ValidationError
+
+    from event_style_scraper.export import build_bundle, build_css
+
+    try:
+        path = build_bundle(output_dir)
+        manifest = build_css(output_dir) if css else None
+    except (ValidationError, ValueError) as e:
+        click.echo(f"❌ Invalid config: {str(e)}", err=True)
+        sys.exit(1)
+    click.echo(f"📦 Bundled {len(json.loads(path.read_text()))} config(s) into {path}")
+    if manifest:
+        click.echo(
+            f"🎨 Compiled {len(json.loads(manifest.read_text()))} stylesheet(s) "
+            f"listed in {manifest}"
+        )
+
+
+@cli.command()
+@click.argument("configs", nargs=-1, type=click.Path(exists=True, dir_okay=False, path_type=Path))
+@click.option(
+    "--output-dir",
+    default="style-configs",
+    type=click.Path(exists=True, file_okay=False, path_type=Path),
+    help="Directory of exported configs, used when no CONFIGS are given (default: style-configs)"
+)
+@click.option(
+    "--event",
+    "event_ids",
+    multiple=True,
+    help="Only this event (repeatable; default: all)"
+)
+@click.option(
+    "--images-dir",
+    default="../static/images",
+    type=click.Path(file_okay=False, path_type=Path),
+    help="Directory the site serves images from (default: ../static/images)"
+)
+@click.option(
+    "--url-prefix",
+    default="/static/images",
+    help="Site path of --images-dir recorded in the configs (default: /static/images)"
+)
+@click.option(
+    "--cache-dir",
+    default=".asset-cache",
+    type=click.Path(file_okay=False, path_type=Path),
+    help="Download cache, revalidated with ETag/Last-Modified (default: .asset-cache)"
+)
+@click.option(
+    "--concurrency",
+    default=8,
+    type=click.IntRange(min=1),
+    help="Downloads in flight at once (default: 8)"
+)
+@click.option(
+    "--timeout",
+    default=30,
+    type=int,
+    help="Timeout in seconds for each download (default: 30)"
+)
+def assets(
+    configs: Tuple[Path, ...],
+    output_dir: Path,
+    event_ids: Tuple[str, ...],
+    images_dir: Path,
+    url_prefix: str,
+    cache_dir: Path,
+    concurrency: int,
+    timeout: int,
+) -> None:
+    """
+    Download, verify and host each event's logo and favicon locally.
+
+    Logo and favicon candidates on each event's source page are ranked
+    (logo images in the header, SVGs, og:image, apple-touch-icon and the
+    extracted URLs) and fetched concurrently. The best one that decodes
+    is written to <images-dir>/<event_id>/ as size-capped PNG variants
+    (SVGs are sanitized and kept as SVG), and the site paths are recorded
+    in the config's local_assets.
+
+    Example:
+        python -m event_style_scraper assets
+        python -m event_style_scraper assets style-configs/event-tech-live-2025.json
+    """
+    from pydantic import ValidationError
+
+    from event_style_scraper.assets import AssetPipeline
+    from event_style_scraper.export import config_paths, export_lock, pretty_json, write_atomic
+    from event_style_scraper.types import EventStyleConfig
+
+    loaded = []
+    for path in configs or config_paths(output_dir):
+        try:
+            config = EventStyleConfig.model_validate_json(path.read_text(encoding="utf-8"))
+        except (ValidationError, ValueError) as e:
+            click.echo(f"❌ Invalid config {path}: {str(e)}", err=True)
+            sys.exit(1)
+        if not event_ids or config.event_id in event_ids:
+            loaded.append((path, config))
+    if not loaded:
+        click.echo("❌ No configs to process", err=True)
+        sys.exit(1)
+
+    click.echo(f"🖼️  Fetching logos and favicons for {len(loaded)} event(s)...")
+    with AssetPipeline(
+        images_dir,
+        url_prefix=url_prefix,
+        cache_dir=cache_dir,
+        concurrency=concurrency,
+        timeout=timeout,
+    ) as pipeline:
+        localized = pipeline.localize_many([config for _, config in loaded])
+
+    hosted = {"logo": 0, "favicon": 0}
+    for (path, _), config in zip(loaded, localized):
+        with export_lock(path.parent):
+            write_atomic(path, pretty_json(config))
+        for role in hosted:
+            local_path = getattr(config.local_assets, role)
+            if local_path:
+                hosted[role] += 1
+                click.echo(f"   ✅ {config.event_id} {role}: {local_path}")
+            else:
+                click.echo(f"   ⚠️  {config.event_id} {role}: none found")
+    click.echo(
+        f"📊 {hosted['logo']} logo(s) and {hosted['favicon']} favicon(s) "
+        f"of {len(loaded)} event(s) hosted locally"
+    )
+
+
 if __name__ == "__main__":
     cli()
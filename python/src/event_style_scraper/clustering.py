@@ -0,0 +1,173 @@
+"""Group attendees with near-identical session choices.
+
+Attendees are vectorized by session membership (one column per session)
+and their share of sessions in each track, and grouped by cosine
+similarity with leader clustering: identical session sets are merged
+first, then the most common remaining set leads a cluster that absorbs
+every set within the similarity threshold. Each cluster is summarized
+by the sessions most of its members attended, which is what the shared
+content draft for the cluster is written from.
+"""
+
+import hashlib
+import json
+from typing import Any, Dict, Iterable, List
+
+import numpy as np
+from pydantic import BaseModel, Field
+
+# Minimum cosine similarity to a cluster's leader to join it
+DEFAULT_THRESHOLD = 0.75
+
+# Weight of the track-share columns relative to session membership
+TRACK_WEIGHT = 0.5
+
+# How many sessions and tracks summarize a cluster
+TOP_SESSIONS = 5
+TOP_TRACKS = 3
+
+
+class ClusterSummary(BaseModel):
+    """What a cluster's members have in common."""
+
+    label: int = Field(..., description="Cluster number")
+    size: int = Field(..., description="Attendees in the cluster")
+    sessions: List[str] = Field(
+        default_factory=list, description="Titles of sessions most members attended"
+    )
+    tracks: List[str] = Field(
+        default_factory=list, description="Tracks with the largest share of sessions"
+    )
+    key: str = Field(..., description="Stable identifier of the cluster's shared content inputs")
+
+
+class AttendeeClusters(BaseModel):
+    """Cluster assignment for an event's attendees."""
+
+    labels: List[int] = Field(
+        default_factory=list, description="Cluster label per attendee, in input order"
+    )
+    clusters: List[ClusterSummary] = Field(default_factory=list, description="Clusters, by label")
+
+    @property
+    def compression_ratio(self) -> float:
+        """Attendees per cluster: how many times fewer shared drafts than attendees."""
+        if not self.clusters:
+            return 0.0
+        return len(self.labels) / len(self.clusters)
+
+
+def _session_key(session: Dict[str, Any]) -> str:
+    return str(session.get("id") or session.get("title") or "")
+
+
+def cluster_attendees(
+    attendees: Iterable[Dict[str, Any]],
+    threshold: float = DEFAULT_THRESHOLD,
+) -> AttendeeClusters:
+    """
+    Cluster attendees by the sessions and tracks they attended.
+
+    Args:
+        attendees: Attendee dicts (read in a single pass)
+        threshold: Minimum cosine similarity to a cluster's leader (0-1);
+            1.0 only groups identical session sets
+
+    Returns:
+        AttendeeClusters: Labels in input order and a summary per cluster
+    """
+    session_codes: Dict[str, int] = {}
+    session_titles: List[str] = []
+    track_codes: Dict[str, int] = {}
+    rows: List[int] = []
+    session_cols: List[int] = []
+    track_cols: List[int] = []
+    n = 0
+    for n, attendee in enumerate(attendees, 1):
+        for session in attendee.get("sessions") or []:
+            key = _session_key(session)
+            if key not in session_codes:
+                session_codes[key] = len(session_titles)
+                session_titles.append(session.get("title") or key)
+            rows.append(n - 1)
+            session_cols.append(session_codes[key])
+            track_cols.append(
+                track_codes.setdefault(session.get("track") or "General", len(track_codes))
+            )
+    if n == 0:
+        return AttendeeClusters()
+
+    n_sessions, n_tracks = len(session_titles), len(track_codes)
+    row_index = np.asarray(rows, dtype=np.int64)
+    membership = np.zeros((n, n_sessions), dtype=np.uint8)
+    membership[row_index, np.asarray(session_cols, dtype=np.int64)] = 1
+    track_counts = np.zeros((n, n_tracks), dtype=np.float32)
+    np.add.at(track_counts, (row_index, np.asarray(track_cols, dtype=np.int64)), 1.0)
+
+    # Identical session sets share one vector; cluster the distinct ones
+    unique_sets, set_of_attendee, set_sizes = np.unique(
+        membership, axis=0, return_inverse=True, return_counts=True
+    )
+    set_of_attendee = set_of_attendee.reshape(-1)
+    set_tracks = np.zeros((len(unique_sets), n_tracks), dtype=np.float32)
+    np.add.at(set_tracks, set_of_attendee, track_counts)
+    totals = set_tracks.sum(axis=1, keepdims=True)
+    shares = np.divide(set_tracks, totals, out=np.zeros_like(set_tracks), where=totals > 0)
+    vectors = np.hstack([unique_sets.astype(np.float32), TRACK_WEIGHT * shares])
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    vectors = np.divide(vectors, norms, out=np.zeros_like(vectors), where=norms > 0)
+
+    # Most common sets lead first; ties keep first-seen order
+    first_seen = np.full(len(unique_sets), n, dtype=np.int64)
+    np.minimum.at(first_seen, set_of_attendee, np.arange(n))
+    order = np.lexsort((first_seen, -set_sizes))
+    set_label = np.full(len(unique_sets), -1, dtype=np.int64)
+    leaders: List[int] = []
+    for candidate in order:
+        if set_label[candidate] >= 0:
+            continue
+        unassigned = np.flatnonzero(set_label < 0)
+        if norms[candidate, 0] == 0:
+            # Attendees without sessions only match each other
+            members = unassigned[norms[unassigned, 0] == 0]
+        else:
+            members = unassigned[vectors[unassigned] @ vectors[candidate] >= threshold - 1e-6]
+        set_label[members] = len(leaders)
+        leaders.append(int(candidate))
+
+    labels = set_label[set_of_attendee]
+    sizes = np.bincount(labels, minlength=len(leaders))
+    session_share = np.zeros((len(leaders), n_sessions), dtype=np.float32)
+    np.add.at(session_share, set_label, unique_sets * set_sizes[:, None].astype(np.float32))
+    session_share /= sizes[:, None]
+    cluster_tracks = np.zeros((len(leaders), n_tracks), dtype=np.float32)
+    np.add.at(cluster_tracks, set_label, set_tracks)
+    track_names = list(track_codes)
+
+    clusters = []
+    for label in range(len(leaders)):
+        shares_row = session_share[label]
+        ranked = [
+            int(c) for c in np.lexsort((np.arange(n_sessions), -shares_row)) if shares_row[c] >= 0.5
+        ]
+        sessions = [session_titles[c] for c in ranked[:TOP_SESSIONS]]
+        track_row = cluster_tracks[label]
+        tracks = [
+            track_names[int(c)] for c in np.lexsort((np.arange(n_tracks), -track_row))[:TOP_TRACKS]
+            if track_row[c] > 0
+        ]
+        clusters.append(
+            ClusterSummary(
+                label=label,
+                size=int(sizes[label]),
+                sessions=sessions,
+                tracks=tracks,
+                key=_cluster_key(sessions, tracks),
+            )
+        )
+    return AttendeeClusters(labels=labels.tolist(), clusters=clusters)
+
+
+def _cluster_key(sessions: List[str], tracks: List[str]) -> str:
+    encoded = json.dumps([sessions, tracks], separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()[:16]
@@ -0,0 +1,589 @@
+"""CSS color parsing and perceptual color distance.
+
+Parses the color spellings found in scraped CSS (hex, rgb/rgba, hsl/hsla
+and named colors) and compares colors by CIEDE2000 Delta-E, the
+perceptual difference in CIELAB space: about 1 is the smallest
+difference people notice, and below ~2.3 colors read as the same.
+Conversions and distances work on NumPy arrays, so a whole set of
+candidate colors is compared in one call rather than pair by pair.
+
+NumPy is imported inside the array functions: the parsing helpers are
+used by modules the CLI imports at startup.
+"""
+
+import re
+from functools import lru_cache
+from typing import TYPE_CHECKING, Iterable, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# Delta-E below which two colors are treated as the same color
+JUST_NOTICEABLE_DELTA_E = 2.3
+
+# Upper bound of CIEDE2000's lightness weighting S_L (reached at L* 0 and
+# 100): two colors are at least |dL*| / 1.75 apart
+MAX_LIGHTNESS_WEIGHT = 1.75
+
+# Color pairs compared per vectorized Delta-E call when deduplicating
+PAIR_CHUNK = 1 << 18
+
+# D65 reference white for CIELAB
+D65_WHITE = (0.95047, 1.0, 1.08883)
+
+# Linear sRGB -> CIE XYZ (D65)
+SRGB_TO_XYZ = (
+    (0.4124564, 0.3575761, 0.1804375),
+    (0.2126729, 0.7151522, 0.0721750),
+    (0.0193339, 0.1191920, 0.9503041),
+)
+
+# CSS Color Module Level 4 named colors
+NAMED_COLORS = {
+    "aliceblue": "#f0f8ff",
+    "antiquewhite": "#faebd7",
+    "aqua": "#00ffff",
+    "aquamarine": "#7fffd4",
+    "azure": "#f0ffff",
+    "beige": "#f5f5dc",
+    "bisque": "#ffe4c4",
+    "black": "#000000",
+    "blanchedalmond": "#ffebcd",
+    "blue": "#0000ff",
+    "blueviolet": "#8a2be2",
+    "brown": "#a52a2a",
+    "burlywood": "#deb887",
+    "cadetblue": "#5f9ea0",
+    "chartreuse": "#7fff00",
+    "chocolate": "#d2691e",
+    "coral": "#ff7f50",
+    "cornflowerblue": "#6495ed",
+    "cornsilk": "#fff8dc",
+    "crimson": "#dc143c",
+    "cyan": "#00ffff",
+    "darkblue": "#00008b",
+    "darkcyan": "#008b8b",
+    "darkgoldenrod": "#b8860b",
+    "darkgray": "#a9a9a9",
+    "darkgreen": "#006400",
+    "darkgrey": "#a9a9a9",
+    "darkkhaki": "#bdb76b",
+    "darkmagenta": "#8b008b",
+    "darkolivegreen": "#556b2f",
+    "darkorange": "#ff8c00",
+    "darkorchid": "#9932cc",
+    "darkred": "#8b0000",
+    "darksalmon": "#e9967a",
+    "darkseagreen": "#8fbc8f",
+    "darkslateblue": "#483d8b",
+    "darkslategray": "#2f4f4f",
+    "darkslategrey": "#2f4f4f",
+    "darkturquoise": "#00ced1",
+    "darkviolet": "#9400d3",
+    "deeppink": "#ff1493",
+    "deepskyblue": "#00bfff",
+    "dimgray": "#696969",
+    "dimgrey": "#696969",
+    "dodgerblue": "#1e90ff",
+    "firebrick": "#b22222",
+    "floralwhite": "#fffaf0",
+    "forestgreen": "#228b22",
+    "fuchsia": "#ff00ff",
+    "gainsboro": "#dcdcdc",
+    "ghostwhite": "#f8f8ff",
+    "gold": "#ffd700",
+    "goldenrod": "#daa520",
+    "gray": "#808080",
+    "green": "#008000",
+    "greenyellow": "#adff2f",
+    "grey": "#808080",
+    "honeydew": "#f0fff0",
+    "hotpink": "#ff69b4",
+    "indianred": "#cd5c5c",
+    "indigo": "#4b0082",
+    "ivory": "#fffff0",
+    "khaki": "#f0e68c",
+    "lavender": "#e6e6fa",
+    "lavenderblush": "#fff0f5",
+    "lawngreen": "#7cfc00",
+    "lemonchiffon": "#fffacd",
+    "lightblue": "#add8e6",
+    "lightcoral": "#f08080",
+    "lightcyan": "#e0ffff",
+    "lightgoldenrodyellow": "#fafad2",
+    "lightgray": "#d3d3d3",
+    "lightgreen": "#90ee90",
+    "lightgrey": "#d3d3d3",
+    "lightpink": "#ffb6c1",
+    "lightsalmon": "#ffa07a",
+    "lightseagreen": "#20b2aa",
+    "lightskyblue": "#87cefa",
+    "lightslategray": "#778899",
+    "lightslategrey": "#778899",
+    "lightsteelblue": "#b0c4de",
+    "lightyellow": "#ffffe0",
+    "lime": "#00ff00",
+    "limegreen": "#32cd32",
+    "linen": "#faf0e6",
+    "magenta": "#ff00ff",
+    "maroon": "#800000",
+    "mediumaquamarine": "#66cdaa",
+    "mediumblue": "#0000cd",
+    "mediumorchid": "#ba55d3",
+    "mediumpurple": "#9370db",
+    "mediumseagreen": "#3cb371",
+    "mediumslateblue": "#7b68ee",
+    "mediumspringgreen": "#00fa9a",
+    "mediumturquoise": "#48d1cc",
+    "mediumvioletred": "#c71585",
+    "midnightblue": "#191970",
+    "mintcream": "#f5fffa",
+    "mistyrose": "#ffe4e1",
+    "moccasin": "#ffe4b5",
+    "navajowhite": "#ffdead",
+    "navy": "#000080",
+    "oldlace": "#fdf5e6",
+    "olive": "#808000",
+    "olivedrab": "#6b8e23",
+    "orange": "#ffa500",
+    "orangered": "#ff4500",
+    "orchid": "#da70d6",
+    "palegoldenrod": "#eee8aa",
+    "palegreen": "#98fb98",
+    "paleturquoise": "#afeeee",
+    "palevioletred": "#db7093",
+    "papayawhip": "#ffefd5",
+    "peachpuff": "#ffdab9",
+    "peru": "#cd853f",
+    "pink": "#ffc0cb",
+    "plum": "#dda0dd",
+    "powderblue": "#b0e0e6",
+    "purple": "#800080",
+    "rebeccapurple": "#663399",
+    "red": "#ff0000",
+    "rosybrown": "#bc8f8f",
+    "royalblue": "#4169e1",
+    "saddlebrown": "#8b4513",
+    "salmon": "#fa8072",
+    "sandybrown": "#f4a460",
+    "seagreen": "#2e8b57",
+    "seashell": "#fff5ee",
+    "sienna": "#a0522d",
+    "silver": "#c0c0c0",
+    "skyblue": "#87ceeb",
+    "slateblue": "#6a5acd",
+    "slategray": "#708090",
+    "slategrey": "#708090",
+    "snow": "#fffafa",
+    "springgreen": "#00ff7f",
+    "steelblue": "#4682b4",
+    "tan": "#d2b48c",
+    "teal": "#008080",
+    "thistle": "#d8bfd8",
+    "tomato": "#ff6347",
+    "turquoise": "#40e0d0",
+    "violet": "#ee82ee",
+    "wheat": "#f5deb3",
+    "white": "#ffffff",
+    "whitesmoke": "#f5f5f5",
+    "yellow": "#ffff00",
+    "yellowgreen": "#9acd32",
+}
+
+HEX_COLOR = re.compile(r"#([0-9a-f]{3,4}|[0-9a-f]{6}|[0-9a-f]{8})", re.IGNORECASE)
+COLOR_FUNCTION = re.compile(r"(rgba?|hsla?)\(\s*([^()]*?)\s*\)", re.IGNORECASE)
+ARGUMENT_SEPARATOR = re.compile(r"\s*[,/]\s*|\s+")
+NUMBER = re.compile(r"[+-]?(?:\d+\.?\d*|\.\d+)(?:e[+-]?\d+)?", re.IGNORECASE)
+PERCENTAGE = re.compile(rf"({NUMBER.pattern})%", re.IGNORECASE)
+HUE = re.compile(rf"({NUMBER.pattern})(deg|grad|rad|turn)?", re.IGNORECASE)
+
+HUE_UNITS = {"deg": 1.0, "grad": 0.9, "rad": 57.29577951308232, "turn": 360.0}
+
+
+class Color(NamedTuple):
+    """An sRGB color with 8-bit channels and an alpha between 0 and 1."""
+
+    red: int
+    green: int
+    blue: int
+    alpha: float = 1.0
+
+    @property
+    def rgb(self) -> Tuple[int, int, int]:
+        """The color's channels without alpha."""
+        return (self.red, self.green, self.blue)
+
+    @property
+    def hex(self) -> str:
+        """Lowercase ``#rrggbb`` (alpha dropped)."""
+        return "#{:02x}{:02x}{:02x}".format(*self.rgb)
+
+
+def _channel(token: str) -> Optional[int]:
+    """An rgb() channel: a number (0-255) or a percentage, clamped."""
+    percentage = PERCENTAGE.fullmatch(token)
+    if percentage:
+        value = float(percentage.group(1)) / 100 * 255
+    elif NUMBER.fullmatch(token):
+        value = float(token)
+    else:
+        return None
+    return int(round(min(max(value, 0.0), 255.0)))
+
+
+def _alpha(token: Optional[str]) -> Optional[float]:
+    """An alpha value: a number (0-1) or a percentage, clamped."""
+    if token is None:
+        return 1.0
+    percentage = PERCENTAGE.fullmatch(token)
+    if percentage:
+        value = float(percentage.group(1)) / 100
+    elif NUMBER.fullmatch(token):
+        value = float(token)
+    else:
+        return None
+    return min(max(value, 0.0), 1.0)
+
+
+def _hsl_to_rgb(hue: float, saturation: float, lightness: float) -> Tuple[int, int, int]:
+    """CSS hsl() to 8-bit sRGB (hue in degrees, saturation and lightness 0-1)."""
+    def component(n: int) -> int:
+        k = (n + hue / 30) % 12
+        a = saturation * min(lightness, 1 - lightness)
+        return int(round((lightness - a * max(-1.0, min(k - 3, 9 - k, 1.0))) * 255))
+
+    return component(0), component(8), component(4)
+
+
+def _parse_function(name: str, arguments: str) -> Optional[Color]:
+    tokens = [t for t in ARGUMENT_SEPARATOR.split(arguments) if t]
+    if len(tokens) not in (3, 4):
+        return None
+    alpha = _alpha(tokens[3] if len(tokens) == 4 else None)
+    if alpha is None:
+        return None
+
+    if name.startswith("rgb"):
+        red, green, blue = (_channel(t) for t in tokens[:3])
+        if red is None or green is None or blue is None:
+            return None
+        return Color(red, green, blue, alpha)
+
+    hue = HUE.fullmatch(tokens[0])
+    saturation = PERCENTAGE.fullmatch(tokens[1])
+    lightness = PERCENTAGE.fullmatch(tokens[2])
+    if not (hue and saturation and lightness):
+        return None
+    degrees = float(hue.group(1)) * HUE_UNITS[(hue.group(2) or "deg").lower()]
+    red, green, blue = _hsl_to_rgb(
+        degrees % 360,
+        min(max(float(saturation.group(1)) / 100, 0.0), 1.0),
+        min(max(float(lightness.group(1)) / 100, 0.0), 1.0),
+    )
+    return Color(red, green, blue, alpha)
+
+
+def parse_color(value: Optional[str]) -> Optional[Color]:
+    """
+    Parse a CSS color.
+
+    Accepts hex (#rgb, #rgba, #rrggbb, #rrggbbaa), rgb()/rgba() and
+    hsl()/hsla() in comma or space syntax, named colors and
+    ``transparent``.
+
+    Args:
+        value: CSS color value
+
+    Returns:
+        Color, or None if the value is not a color this parser understands
+    """
+    if not value:
+        return None
+    value = value.strip()
+
+    hex_match = HEX_COLOR.fullmatch(value)
+    if hex_match:
+        digits = hex_match.group(1).lower()
+        if len(digits) <= 4:
+            digits = "".join(c * 2 for c in digits)
+        alpha = int(digits[6:8], 16) / 255 if len(digits) == 8 else 1.0
+        return Color(int(digits[0:2], 16), int(digits[2:4], 16), int(digits[4:6], 16), alpha)
+
+    function = COLOR_FUNCTION.fullmatch(value)
+    if function:
+        return _parse_function(function.group(1).lower(), function.group(2))
+
+    name = value.lower()
+    if name == "transparent":
+        return Color(0, 0, 0, 0.0)
+    if name in NAMED_COLORS:
+        return parse_color(NAMED_COLORS[name])
+    return None
+
+
+def is_color(value: Optional[str]) -> bool:
+    """Whether a value is a CSS color ``parse_color`` understands."""
+    return parse_color(value) is not None
+
+
+def normalize_color(value: Optional[str]) -> Optional[str]:
+    """
+    Normalize a CSS color to lowercase ``#rrggbb``.
+
+    Args:
+        value: CSS color in any form ``parse_color`` accepts
+
+    Returns:
+        Hex color, or None if the value is not a color or is fully transparent
+    """
+    color = parse_color(value)
+    if color is None or color.alpha == 0:
+        return None
+    return color.hex
+
+
+@lru_cache(maxsize=4096)
+def canonical_color(value: Optional[str]) -> Optional[str]:
+    """
+    The canonical spelling of a CSS color.
+
+    Memoized: configs repeat the same few colors, so validating many of
+    them mostly hits the cache.
+
+    Args:
+        value: CSS color in any form ``parse_color`` accepts
+
+    Returns:
+        Lowercase ``#rrggbb``, or ``#rrggbbaa`` if the color is translucent;
+        None if the value is not a color
+    """
+    color = parse_color(value)
+    if color is None:
+        return None
+    if color.alpha < 1:
+        return f"{color.hex}{int(round(color.alpha * 255)):02x}"
+    return color.hex
+
+
+def parse_colors(values: Iterable[Optional[str]]) -> Tuple["np.ndarray", "np.ndarray"]:
+    """
+    Parse CSS colors into an array of sRGB channels.
+
+    Args:
+        values: CSS color values
+
+    Returns:
+        (rgb, valid): an (n, 3) float array of 0-255 channels, with zeros
+        for values that are not colors, and an (n,) boolean mask of the
+        values that parsed
+    """
+    import numpy as np
+
+    parsed = [parse_color(v) for v in values]
+    rgb = np.array([c.rgb if c else (0, 0, 0) for c in parsed], dtype=np.float64).reshape(-1, 3)
+    return rgb, np.array([c is not None for c in parsed], dtype=bool)
+
+
+def srgb_to_linear(rgb: "np.ndarray") -> "np.ndarray":
+    """Undo the sRGB transfer curve: 0-255 channels to linear light (0-1)."""
+    import numpy as np
+
+    channels = np.asarray(rgb, dtype=np.float64) / 255.0
+    return np.where(channels <= 0.04045, channels / 12.92, ((channels + 0.055) / 1.055) ** 2.4)
+
+
+def rgb_to_lab(rgb: "np.ndarray") -> "np.ndarray":
+    """
+    Convert sRGB to CIELAB (D65).
+
+    Args:
+        rgb: Array of 0-255 channels, shape (..., 3)
+
+    Returns:
+        Array of (L*, a*, b*), same shape
+    """
+    import numpy as np
+
+    xyz = srgb_to_linear(rgb) @ np.array(SRGB_TO_XYZ).T / np.array(D65_WHITE)
+    epsilon, kappa = 216 / 24389, 24389 / 27
+    f = np.where(xyz > epsilon, np.cbrt(xyz), (kappa * xyz + 16) / 116)
+    return np.stack(
+        [116 * f[..., 1] - 16, 500 * (f[..., 0] - f[..., 1]), 200 * (f[..., 1] - f[..., 2])],
+        axis=-1,
+    )
+
+
+def delta_e_2000(lab1: "np.ndarray", lab2: "np.ndarray") -> "np.ndarray":
+    """
+    CIEDE2000 color difference between CIELAB colors.
+
+    Inputs broadcast against each other, so a (n, 1, 3) and a (1, m, 3)
+    array give an (n, m) matrix of distances.
+
+    Args:
+        lab1: CIELAB colors, shape (..., 3)
+        lab2: CIELAB colors, shape (..., 3)
+
+    Returns:
+        Delta-E values with the broadcast shape of the inputs minus the last axis
+    """
+    import numpy as np
+
+    lab1 = np.asarray(lab1, dtype=np.float64)
+    lab2 = np.asarray(lab2, dtype=np.float64)
+    l1, a1, b1 = lab1[..., 0], lab1[..., 1], lab1[..., 2]
+    l2, a2, b2 = lab2[..., 0], lab2[..., 1], lab2[..., 2]
+
+    c_mean7 = ((np.hypot(a1, b1) + np.hypot(a2, b2)) / 2) ** 7
+    g = 0.5 * (1 - np.sqrt(c_mean7 / (c_mean7 + 25.0 ** 7)))
+    a1p, a2p = (1 + g) * a1, (1 + g) * a2
+    c1p, c2p = np.hypot(a1p, b1), np.hypot(a2p, b2)
+    h1p = np.degrees(np.arctan2(b1, a1p)) % 360
+    h2p = np.degrees(np.arctan2(b2, a2p)) % 360
+    chroma_product = c1p * c2p
+
+    dl = l2 - l1
+    dc = c2p - c1p
+    dh = h2p - h1p
+    dh = np.where(dh > 180, dh - 360, np.where(dh < -180, dh + 360, dh))
+    dh = np.where(chroma_product == 0, 0.0, dh)
+    dh_term = 2 * np.sqrt(chroma_product) * np.sin(np.radians(dh / 2))
+
+    l_mean = (l1 + l2) / 2
+    c_mean = (c1p + c2p) / 2
+    h_sum = h1p + h2p
+    h_mean = np.where(
+        chroma_product == 0,
+        h_sum,
+        np.where(
+            np.abs(h1p - h2p) <= 180,
+            h_sum / 2,
+            np.where(h_sum < 360, (h_sum + 360) / 2, (h_sum - 360) / 2),
+        ),
+    )
+    t = (
+        1
+        - 0.17 * np.cos(np.radians(h_mean - 30))
+        + 0.24 * np.cos(np.radians(2 * h_mean))
+        + 0.32 * np.cos(np.radians(3 * h_mean + 6))
+        - 0.20 * np.cos(np.radians(4 * h_mean - 63))
+    )
+    rotation = 30 * np.exp(-(((h_mean - 275) / 25) ** 2))
+    rc = 2 * np.sqrt(c_mean ** 7 / (c_mean ** 7 + 25.0 ** 7))
+    sl = 1 + 0.015 * (l_mean - 50) ** 2 / np.sqrt(20 + (l_mean - 50) ** 2)
+    sc = 1 + 0.045 * c_mean
+    sh = 1 + 0.015 * c_mean * t
+    rt = -np.sin(np.radians(2 * rotation)) * rc
+
+    distance: "np.ndarray" = np.sqrt(
+        (dl / sl) ** 2 + (dc / sc) ** 2 + (dh_term / sh) ** 2 + rt * (dc / sc) * (dh_term / sh)
+    )
+    return distance
+
+
+def delta_e_matrix(
+    colors_a: Sequence[str], colors_b: Optional[Sequence[str]] = None
+) -> "np.ndarray":
+    """
+    Pairwise CIEDE2000 distances between two lists of CSS colors.
+
+    Args:
+        colors_a: CSS colors (rows)
+        colors_b: CSS colors (columns; default: colors_a)
+
+    Returns:
+        (len(colors_a), len(colors_b)) array of Delta-E values
+
+    Raises:
+        ValueError: If a value is not a color
+    """
+    lab_a = rgb_to_lab(_require_colors(colors_a))
+    lab_b = lab_a if colors_b is None else rgb_to_lab(_require_colors(colors_b))
+    return delta_e_2000(lab_a[:, None, :], lab_b[None, :, :])
+
+
+def color_distance(color_a: str, color_b: str) -> float:
+    """
+    CIEDE2000 distance between two CSS colors (alpha ignored).
+
+    Raises:
+        ValueError: If either value is not a color
+    """
+    return float(delta_e_matrix([color_a], [color_b])[0, 0])
+
+
+def dedupe_colors(
+    colors: Sequence[Optional[str]], threshold: float = JUST_NOTICEABLE_DELTA_E
+) -> List[str]:
+    """
+    Drop colors perceptually indistinguishable from an earlier one.
+
+    Identical colors are collapsed first. Only pairs whose lightness is
+    close enough to fall under the threshold are then compared, all in
+    vectorized chunks, and each remaining color in input order drops the
+    later colors within ``threshold`` of it. Cost grows with the distinct
+    colors: thousands of scraped candidates repeating a few hundred
+    colors take milliseconds, while 5,000 distinct random colors take
+    about half a second.
+
+    Args:
+        colors: CSS colors in priority order; values that are not opaque
+            colors are skipped
+        threshold: Delta-E below which a color counts as a duplicate
+
+    Returns:
+        Kept colors as ``#rrggbb``, in input order
+    """
+    import numpy as np
+
+    hexes = list(dict.fromkeys(c for c in map(normalize_color, dict.fromkeys(colors)) if c))
+    if len(hexes) < 2:
+        return hexes
+    lab = rgb_to_lab(parse_colors(hexes)[0])
+
+    # Delta-E is at least |dL| / MAX_LIGHTNESS_WEIGHT, so only colors in a
+    # lightness window can be duplicates: pair each color with the later
+    # ones in lightness order that are inside it
+    count = len(hexes)
+    order = np.argsort(lab[:, 0], kind="stable")
+    lightness = lab[order, 0]
+    ends = np.searchsorted(lightness, lightness + threshold * MAX_LIGHTNESS_WEIGHT, side="left")
+    partners = np.maximum(ends - np.arange(count) - 1, 0)
+    starts = np.repeat(np.cumsum(partners) - partners, partners)
+    first = np.repeat(np.arange(count), partners)
+    second = first + 1 + np.arange(len(first)) - starts
+
+    leaders, followers = [], []
+    for chunk in range(0, len(first), PAIR_CHUNK):
+        a = order[first[chunk:chunk + PAIR_CHUNK]]
+        b = order[second[chunk:chunk + PAIR_CHUNK]]
+        # The lightness term alone rules out most pairs cheaply
+        offset = (lab[a, 0] + lab[b, 0]) / 2 - 50
+        weight = 1 + 0.015 * offset ** 2 / np.sqrt(20 + offset ** 2)
+        near = np.abs(lab[b, 0] - lab[a, 0]) < threshold * weight
+        a, b = a[near], b[near]
+        close = delta_e_2000(lab[a], lab[b]) < threshold
+        leaders.append(np.minimum(a, b)[close])
+        followers.append(np.maximum(a, b)[close])
+    leader = np.concatenate(leaders) if leaders else np.empty(0, dtype=np.int64)
+    follower = np.concatenate(followers) if followers else np.empty(0, dtype=np.int64)
+
+    by_leader = np.argsort(leader, kind="stable")
+    leader, follower = leader[by_leader], follower[by_leader]
+    bounds = np.searchsorted(leader, np.arange(count + 1))
+    dropped = np.zeros(count, dtype=bool)
+    kept = []
+    for index in range(count):
+        if not dropped[index]:
+            kept.append(hexes[index])
+            dropped[follower[bounds[index]:bounds[index + 1]]] = True
+    return kept
+
+
+def _require_colors(values: Union[Sequence[str], Iterable[str]]) -> "np.ndarray":
+    values = list(values)
+    rgb, valid = parse_colors(values)
+    if not valid.all():
+        invalid = [v for v, ok in zip(values, valid) if not ok]
+        raise ValueError(f"Invalid colors: {', '.join(map(repr, invalid[:5]))}")
+    return rgb
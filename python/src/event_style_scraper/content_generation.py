@@ -0,0 +1,931 @@
+"""Generate personalized content for every attendee of an event.
+
+Runs ContentCreationCrew for each attendee with bounded concurrency. One
+EventStyleConfig is shared by the whole run, and each worker thread
+builds one template crew for the event (agents, tasks and brand voice
+prompt) and kicks it off once per attendee. Each attendee's content is
+written as soon as it is ready, so an interrupted run keeps everything
+finished so far, and a failed attendee is reported without stopping the
+others.
+
+Each content file records a hash of everything that shaped it (the
+attendee record and profile, the brand voice, the prompt version and the
+model), so a rerun only regenerates attendees whose inputs changed.
+
+Attendees are streamed, never all held as full records: from an
+AttendeeRepository (sessions stored once, not per attendee) or straight
+from a JSONL/CSV export (AttendeeExport). Only a bounded number of
+attendees wait for a worker at any time.
+
+Large events can be split across machines that share a filesystem: each
+worker runs one shard (attendees assigned by a stable hash of their id)
+and records what it did in a shard manifest, and ``merge_event_content``
+checks the manifests for completeness and bundles the event's content.
+
+In ``clustered`` mode attendees with near-identical session choices are
+grouped, a session-highlights draft is written once per cluster (and
+kept under ``drafts/`` for reruns and other shards), and each attendee
+only gets one short personalization call on top of their cluster's draft.
+In ``single-pass`` mode each attendee's analysis, writing and brand voice
+are folded into one structured LLM call instead of the crew's sequential
+agents.
+
+In crew mode the Quality Editor does not run on every attendee: once the
+content is written, local quality gates check it in batches, and only
+content that fails a gate (plus a random audit sample) is sent to the
+editor. Content only records its input hash, and so only counts as up to
+date, once it has passed the gates or been reviewed.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, as_completed, wait
+from contextlib import nullcontext
+from datetime import datetime, timezone
+from functools import partial
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple, cast
+
+from pydantic import BaseModel, Field
+
+import numpy as np
+
+from event_style_scraper.ingest import AttendeeExport, InvalidRecord, Shard, shard_of
+from event_style_scraper.quality import (
+    QualityGates,
+    QualityGateSummary,
+    check_content,
+    select_for_review,
+)
+from event_style_scraper.rate_limit import AdaptiveConcurrency
+from event_style_scraper.repository import AttendeeRepository
+from event_style_scraper.types import AttendeeContent, BrandVoice, EventStyleConfig
+
+# Content generation strategies: the four-agent crew per attendee, a shared
+# draft per cluster of similar attendees plus a personalization pass, or
+# one structured call per attendee
+CONTENT_MODES = ("crew", "clustered", "single-pass")
+
+# Generated contents run through the quality gates at a time
+GATE_BATCH_SIZE = 256
+
+
+class AttendeeResult(BaseModel):
+    """Outcome of generating one attendee's content."""
+
+    attendee_id: str = Field(..., description="Attendee identifier")
+    success: bool = Field(..., description="Whether content was generated")
+    output_path: Optional[str] = Field(default=None, description="Written content file")
+    error: Optional[str] = Field(default=None, description="Error message if generation failed")
+    seconds: float = Field(..., description="Time spent on this attendee")
+    token_usage: Optional[int] = Field(default=None, description="Total LLM tokens used")
+    skipped: bool = Field(default=False, description="Existing content was up to date and kept")
+
+
+class ContentGenerationReport(BaseModel):
+    """Results and throughput of a content generation run."""
+
+    event_id: str = Field(..., description="Event the content was generated for")
+    shard: str = Field(
+        default="1/1", description="Shard of the event's attendees this run covered (i/N)"
+    )
+    results: List[AttendeeResult] = Field(default_factory=list, description="Per-attendee results")
+    concurrency: int = Field(..., description="Attendees processed at once")
+    mode: str = Field(default="crew", description="Generation strategy (one of CONTENT_MODES)")
+    rich_analysis: bool = Field(
+        default=False, description="Whether an LLM wrote the attendee analyses"
+    )
+    cluster_count: Optional[int] = Field(
+        default=None, description="Clusters the shard's attendees fall in (clustered mode)"
+    )
+    drafts_generated: int = Field(
+        default=0, description="Cluster drafts written by the LLM in this run"
+    )
+    draft_tokens: int = Field(default=0, description="LLM tokens used for cluster drafts")
+    analysis_seconds: float = Field(default=0.0, description="Time computing attendee profiles")
+    quality: Optional[QualityGateSummary] = Field(
+        default=None, description="Quality gate pass rates and editor calls (gated crew mode)"
+    )
+    invalid_records: List[InvalidRecord] = Field(
+        default_factory=list, description="Export records skipped because they failed validation"
+    )
+    elapsed_seconds: float = Field(default=0.0, description="Wall-clock time of the run")
+
+    @property
+    def succeeded(self) -> int:
+        """Number of attendees with generated content."""
+        return sum(1 for r in self.results if r.success)
+
+    @property
+    def failed(self) -> int:
+        """Number of attendees whose generation failed."""
+        return sum(1 for r in self.results if not r.success)
+
+    @property
+    def regenerated(self) -> int:
+        """Number of attendees whose content was (re)generated."""
+        return sum(1 for r in self.results if r.success and not r.skipped)
+
+    @property
+    def skipped(self) -> int:
+        """Number of attendees whose content was already up to date."""
+        return sum(1 for r in self.results if r.skipped)
+
+    @property
+    def attendees_per_minute(self) -> float:
+        """Attendees run through the crew (successful or not) per minute of wall-clock time."""
+        if self.elapsed_seconds <= 0:
+            return 0.0
+        return (len(self.results) - self.skipped) * 60 / self.elapsed_seconds
+
+    @property
+    def total_tokens(self) -> int:
+        """LLM tokens used by all attendees and cluster drafts."""
+        return sum(r.token_usage or 0 for r in self.results) + self.draft_tokens
+
+    @property
+    def compression_ratio(self) -> Optional[float]:
+        """Attendees per cluster in clustered mode: how many attendees share each draft."""
+        if not self.cluster_count:
+            return None
+        return len(self.results) / self.cluster_count
+
+
+class MergeReport(BaseModel):
+    """Completeness check and output of merging an event's shards."""
+
+    event_id: str = Field(..., description="Event whose content was merged")
+    shard_count: int = Field(default=0, description="Number of shards the event was split into")
+    attendee_count: int = Field(default=0, description="Attendees in the merged output")
+    missing_shards: List[str] = Field(
+        default_factory=list, description="Shards without a manifest (i/N)"
+    )
+    missing: List[str] = Field(
+        default_factory=list, description="Expected attendees no shard covered"
+    )
+    duplicated: List[str] = Field(
+        default_factory=list, description="Attendees covered by more than one shard"
+    )
+    failed: List[str] = Field(
+        default_factory=list, description="Attendees without generated content"
+    )
+    output_path: Optional[str] = Field(default=None, description="Merged event content file")
+
+    @property
+    def complete(self) -> bool:
+        """Whether every attendee has content from exactly one shard."""
+        return not (self.missing_shards or self.missing or self.duplicated or self.failed)
+
+
+def shard_manifest_path(output_dir: Path, event_id: str, shard: Shard) -> Path:
+    """Where a shard run records its attendees and results."""
+    return Path(output_dir) / event_id / "shards" / f"shard-{shard.index}-of-{shard.count}.json"
+
+
+def load_style_config(style_configs_dir: Path, event_id: str) -> EventStyleConfig:
+    """
+    Load an event's exported style config.
+
+    Args:
+        style_configs_dir: Directory of <event_id>.json configs
+        event_id: Event identifier
+
+    Returns:
+        EventStyleConfig: The event's style config
+
+    Raises:
+        FileNotFoundError: If the event has no style config
+    """
+    path = Path(style_configs_dir) / f"{event_id}.json"
+    if not path.exists():
+        raise FileNotFoundError(f"No style config for event {event_id} at {path}")
+    return EventStyleConfig.model_validate_json(path.read_text())
+
+
+def configured_model() -> str:
+    """Model CrewAI agents use, from the same environment variables CrewAI reads."""
+    for name in ("MODEL", "MODEL_NAME", "OPENAI_MODEL_NAME"):
+        if os.environ.get(name):
+            return os.environ[name]
+    from crewai.constants import DEFAULT_LLM_MODEL
+
+    return DEFAULT_LLM_MODEL
+
+
+def content_input_hash(
+    attendee: Dict[str, Any],
+    profile: Optional[str],
+    brand_voice: BrandVoice,
+    prompt_version: str,
+    model: str,
+    variant: Optional[str] = None,
+) -> str:
+    """
+    Hash of the inputs that determine an attendee's generated content.
+
+    Args:
+        attendee: Attendee record
+        profile: Computed attendee profile, built from the attendee record
+            alone (None with rich analysis)
+        brand_voice: Event brand voice
+        prompt_version: Version of the crew's prompts
+        model: LLM model name
+        variant: Anything else the content depends on, e.g. the
+            generation mode and cluster (omitted for the default crew)
+
+    Returns:
+        str: Hex SHA-256 digest, stable across runs and key order
+    """
+    inputs = {
+        "attendee": attendee,
+        "profile": profile,
+        "brand_voice": brand_voice.model_dump(mode="json"),
+        "prompt_version": prompt_version,
+        "model": model,
+    }
+    if variant is not None:
+        inputs["variant"] = variant
+    encoded = json.dumps(inputs, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def stored_input_hash(output_dir: Path, attendee_id: str) -> Optional[str]:
+    """Input hash recorded in an attendee's existing content file, if any."""
+    try:
+        input_hash: Optional[str] = json.loads(
+            (output_dir / f"{attendee_id}.json").read_text()
+        ).get("input_hash")
+        return input_hash
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+def write_attendee_content(output_dir: Path, attendee_id: str, payload: Dict[str, Any]) -> Path:
+    """
+    Write one attendee's content, replacing any earlier file atomically.
+
+    Args:
+        output_dir: Directory for the event's content files
+        attendee_id: Attendee identifier (file name)
+        payload: JSON-serializable content record
+
+    Returns:
+        Path: The written file
+    """
+    return _write_json_atomic(output_dir / f"{attendee_id}.json", payload)
+
+
+def _write_json_atomic(path: Path, payload: Dict[str, Any]) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    tmp_path.write_text(json.dumps(payload, indent=2))
+    os.replace(tmp_path, path)
+    return path
+
+
+def _kickoff(
+    crews: threading.local, attr: str, crew: Any, inputs: Dict[str, Any]
+) -> Tuple[str, int]:
+    """Run a reused crew; return its output and the tokens this run used."""
+    # Usage accumulates across kickoffs of a reused crew
+    tokens_before = crew.calculate_usage_metrics().total_tokens
+    try:
+        output = crew.kickoff(inputs=inputs)
+    except Exception:
+        # Don't carry a half-run crew over to the next attendee
+        setattr(crews, attr, None)
+        raise
+    content = (
+        output.pydantic.to_text() if isinstance(output.pydantic, AttendeeContent) else output.raw
+    )
+    return content, crew.calculate_usage_metrics().total_tokens - tokens_before
+
+
+def _run_content_crew(
+    crews: threading.local,
+    style_config: EventStyleConfig,
+    attendee: Dict[str, Any],
+    profile: Optional[str],
+    run_quality_check: bool = True,
+) -> Tuple[str, int]:
+    """Generate one attendee's content with the four-agent ContentCreationCrew."""
+    from event_style_scraper.crews.content_creation_crew import (
+        ContentCreationCrew,
+        attendee_inputs,
+    )
+
+    # Crews are not thread-safe, so each worker reuses its own
+    if getattr(crews, "crew", None) is None:
+        crews.template = ContentCreationCrew(
+            None,
+            style_config,
+            verbose=False,
+            rich_analysis=profile is None,
+            run_quality_check=run_quality_check,
+        )
+        crews.crew = crews.template.crew()
+    if profile is not None:
+        crews.template.set_attendee_profile(profile)
+    return _kickoff(crews, "crew", crews.crew, attendee_inputs(attendee))
+
+
+def _run_review_crew(
+    crews: threading.local,
+    style_config: EventStyleConfig,
+    attendee: Dict[str, Any],
+    profile: Optional[str],
+    content: str,
+) -> Tuple[str, int]:
+    """Have the Quality Editor review and correct one attendee's content."""
+    from event_style_scraper.crews.content_creation_crew import (
+        ContentCreationCrew,
+        attendee_inputs,
+    )
+
+    if getattr(crews, "review", None) is None:
+        crews.review_template = ContentCreationCrew(
+            None, style_config, verbose=False, rich_analysis=profile is None
+        )
+        crews.review = crews.review_template.review_crew()
+    if profile is not None:
+        crews.review_template.set_attendee_profile(profile)
+    crews.review_template.set_task_output("apply_brand_voice", content)
+    return _kickoff(crews, "review", crews.review, attendee_inputs(attendee))
+
+
+def _run_single_pass_crew(
+    crews: threading.local, style_config: EventStyleConfig, attendee: Dict[str, Any], profile: str
+) -> Tuple[str, int]:
+    """Generate one attendee's content in a single structured call."""
+    from event_style_scraper.crews.content_creation_crew import attendee_inputs
+    from event_style_scraper.crews.single_pass_content_crew import SinglePassContentCrew
+
+    if getattr(crews, "single_pass", None) is None:
+        crews.single_pass_template = SinglePassContentCrew(style_config, verbose=False)
+        crews.single_pass = crews.single_pass_template.crew()
+    inputs = crews.single_pass_template.inputs(attendee_inputs(attendee)["attendee_name"], profile)
+    return _kickoff(crews, "single_pass", crews.single_pass, inputs)
+
+
+def _cluster_template(crews: threading.local, style_config: EventStyleConfig) -> Any:
+    from event_style_scraper.crews.cluster_content_crew import ClusterContentCrew
+
+    if getattr(crews, "cluster_template", None) is None:
+        crews.cluster_template = ClusterContentCrew(style_config, verbose=False)
+    return crews.cluster_template
+
+
+def _run_highlights_crew(
+    crews: threading.local, style_config: EventStyleConfig, cluster: Any
+) -> Tuple[str, int]:
+    """Write a cluster's shared highlights draft."""
+    template = _cluster_template(crews, style_config)
+    if getattr(crews, "highlights", None) is None:
+        crews.highlights = template.highlights_crew()
+    return _kickoff(crews, "highlights", crews.highlights, template.highlights_inputs(cluster))
+
+
+def _run_personalization_crew(
+    crews: threading.local, style_config: EventStyleConfig, draft: str, profile: str
+) -> Tuple[str, int]:
+    """Personalize a cluster draft for one attendee."""
+    template = _cluster_template(crews, style_config)
+    if getattr(crews, "personalization", None) is None:
+        crews.personalization = template.personalization_crew()
+    return _kickoff(
+        crews,
+        "personalization",
+        crews.personalization,
+        template.personalization_inputs(profile, draft),
+    )
+
+
+def _generate_one(
+    attendee: Dict[str, Any],
+    input_hash: Optional[str],
+    event_id: str,
+    output_dir: Path,
+    run: Callable[[], Tuple[str, int]],
+    controller: Optional[AdaptiveConcurrency] = None,
+) -> AttendeeResult:
+    attendee_id = str(attendee.get("id", ""))
+    start = time.perf_counter()
+    try:
+        with controller.slot() if controller is not None else nullcontext():
+            content, token_usage = run()
+        path = write_attendee_content(
+            output_dir,
+            attendee_id,
+            {
+                "attendee_id": attendee_id,
+                "event_id": event_id,
+                "content": content,
+                "generated_at": datetime.now(timezone.utc).isoformat(),
+                "token_usage": token_usage,
+                "input_hash": input_hash,
+            },
+        )
+    except Exception as e:
+        return AttendeeResult(
+            attendee_id=attendee_id,
+            success=False,
+            error=str(e) or type(e).__name__,
+            seconds=time.perf_counter() - start,
+        )
+    return AttendeeResult(
+        attendee_id=attendee_id,
+        success=True,
+        output_path=str(path),
+        seconds=time.perf_counter() - start,
+        token_usage=token_usage,
+    )
+
+
+def generate_event_content(
+    event_id: str,
+    attendees_dir: Path,
+    style_configs_dir: Path = Path("style-configs"),
+    output_dir: Path = Path("generated-content"),
+    concurrency: int = 4,
+    on_result: Optional[Callable[[AttendeeResult], None]] = None,
+    controller: Optional[AdaptiveConcurrency] = None,
+    rich_analysis: bool = False,
+    force: bool = False,
+    attendees_file: Optional[Path] = None,
+    shard: Optional[Shard] = None,
+    mode: str = "crew",
+    cluster_threshold: Optional[float] = None,
+    quality_gates: Optional[QualityGates] = None,
+    review_all: bool = False,
+) -> ContentGenerationReport:
+    """
+    Generate content for all attendees of an event.
+
+    Attendee profiles are computed for the whole event up front and
+    replace the LLM analysis task, unless ``rich_analysis`` is set.
+    Content for each attendee is written to
+    ``<output_dir>/<event_id>/<attendee_id>.json`` as soon as it is ready.
+    Attendees whose existing file was generated from the same inputs are
+    skipped unless ``force`` is set. With ``shard``, only that shard's
+    attendees are generated; profiles (and clusters) are still computed
+    over the whole event, so content does not depend on how the event was
+    sharded. Every run writes a shard manifest (shard 1/1 when unsharded)
+    for ``merge_event_content``. In crew mode, generated content goes
+    through the local quality gates and only flagged or audited content
+    gets the LLM quality check, unless ``review_all`` is set.
+
+    Args:
+        event_id: Event identifier
+        attendees_dir: Directory of attendee JSON files
+        style_configs_dir: Directory of exported style configs
+        output_dir: Root directory for generated content
+        concurrency: Attendees processed at once (the maximum, with a controller)
+        on_result: Called with each attendee's result as it finishes
+        controller: Adaptive limit on how many attendees run at once
+        rich_analysis: Have an LLM agent analyze each attendee (one more
+            model call per attendee; crew mode only)
+        force: Regenerate every attendee, even if its content is up to date
+        attendees_file: JSONL or CSV attendee export to stream instead of
+            attendees_dir; invalid records are skipped and reported
+        shard: Only generate the attendees ``shard_of`` assigns to this shard
+        mode: Generation strategy, one of CONTENT_MODES
+        cluster_threshold: Similarity needed to share a cluster draft
+            (clustered mode; default: clustering.DEFAULT_THRESHOLD)
+        quality_gates: Gate thresholds and audit rate (crew mode;
+            default: QualityGates())
+        review_all: Run the LLM quality check on every attendee instead
+            of gating it (crew mode)
+
+    Returns:
+        ContentGenerationReport: Per-attendee results and throughput
+
+    Raises:
+        FileNotFoundError: If the style config or attendee source is missing
+        ValueError: If concurrency < 1, the mode is unknown or does not
+            support rich analysis, or the event has no attendees
+    """
+    if concurrency < 1:
+        raise ValueError("Concurrency must be at least 1")
+    if mode not in CONTENT_MODES:
+        raise ValueError(
+            f"Unknown content mode {mode!r}; expected one of {', '.join(CONTENT_MODES)}"
+        )
+    if rich_analysis and mode != "crew":
+        raise ValueError("Rich analysis is only available in crew mode")
+    style_config = load_style_config(style_configs_dir, event_id)
+    # The export is read once per pass; each bad record is reported once
+    invalid: Dict[int, InvalidRecord] = {}
+
+    def on_invalid(record: InvalidRecord) -> None:
+        invalid.setdefault(record.line, record)
+
+    source = (
+        AttendeeExport(attendees_file, on_invalid=on_invalid)
+        if attendees_file is not None
+        else AttendeeRepository(attendees_dir)
+    )
+
+    # Pay the crewai import before the clock starts
+    from event_style_scraper.crews.content_creation_crew import prompt_version
+
+    event_output_dir = Path(output_dir) / event_id
+    crews = threading.local()
+    shard = shard or Shard(1, 1)
+    gated = mode == "crew" and not review_all
+    report = ContentGenerationReport(
+        event_id=event_id,
+        shard=str(shard),
+        concurrency=concurrency,
+        mode=mode,
+        rich_analysis=rich_analysis,
+    )
+    start = time.perf_counter()
+
+    if rich_analysis:
+        profiles: List[Optional[str]] = [None for _ in source.iter_attendees(event_id)]
+    else:
+        from event_style_scraper.analytics import compute_profiles
+
+        profiles = [
+            profile.to_context() for profile in compute_profiles(source.iter_attendees(event_id))
+        ]
+    version, model = prompt_version(), configured_model()
+    labels: List[Optional[int]] = [None] * len(profiles)
+    clusters: List[Any] = []
+    if mode == "clustered":
+        from event_style_scraper.clustering import DEFAULT_THRESHOLD, cluster_attendees
+        from event_style_scraper.crews.cluster_content_crew import (
+            prompt_version as cluster_prompt_version,
+        )
+
+        clustering = cluster_attendees(
+            source.iter_attendees(event_id),
+            threshold=cluster_threshold if cluster_threshold is not None else DEFAULT_THRESHOLD,
+        )
+        labels, clusters = list(clustering.labels), clustering.clusters
+        version = f"{version}+{cluster_prompt_version()}"
+    elif mode == "single-pass":
+        from event_style_scraper.crews.single_pass_content_crew import (
+            prompt_version as single_pass_prompt_version,
+        )
+
+        version = single_pass_prompt_version()
+    report.analysis_seconds = time.perf_counter() - start
+    report.invalid_records = sorted(invalid.values())
+    if not profiles:
+        raise ValueError(
+            f"No attendees found for event {event_id} in {attendees_file or attendees_dir}"
+        )
+
+    def record(result: AttendeeResult) -> None:
+        report.results.append(result)
+        if on_result is not None:
+            on_result(result)
+
+    # Find this shard's attendees whose content is out of date
+    shard_ids: List[str] = []
+    pending: Dict[str, str] = {}
+    pending_clusters: Set[int] = set()
+    shard_clusters: Set[int] = set()
+    for attendee, profile, label in zip(source.iter_attendees(event_id), profiles, labels):
+        attendee_id = str(attendee.get("id", ""))
+        if shard_of(attendee_id, shard.count) != shard.index:
+            continue
+        shard_ids.append(attendee_id)
+        if label is not None:
+            shard_clusters.add(label)
+        variant = f"clustered:{clusters[label].key}" if label is not None else None
+        if mode == "single-pass":
+            variant = mode
+        input_hash = content_input_hash(
+            attendee, profile, style_config.brand_voice, version, model, variant
+        )
+        if not force and stored_input_hash(event_output_dir, attendee_id) == input_hash:
+            record(AttendeeResult(
+                attendee_id=attendee_id,
+                success=True,
+                output_path=str(event_output_dir / f"{attendee_id}.json"),
+                seconds=0.0,
+                skipped=True,
+            ))
+        else:
+            pending[attendee_id] = input_hash
+            if label is not None:
+                pending_clusters.add(label)
+    if mode == "clustered":
+        # Clusters span the event; only count those this shard's attendees fall in
+        report.cluster_count = len(shard_clusters)
+
+    executor = ThreadPoolExecutor(max_workers=concurrency)
+    in_flight: "Set[Future[AttendeeResult]]" = set()
+    try:
+        drafts: Dict[int, str] = {}
+        draft_errors: Dict[int, str] = {}
+        if mode == "clustered":
+            drafts, draft_errors = _cluster_drafts(
+                [clusters[label] for label in sorted(pending_clusters)],
+                style_config,
+                version,
+                model,
+                event_output_dir,
+                force,
+                executor,
+                crews,
+                controller,
+                report,
+            )
+
+        for attendee, profile, label in zip(source.iter_attendees(event_id), profiles, labels):
+            attendee_id = str(attendee.get("id", ""))
+            if attendee_id not in pending:
+                continue
+            if label in draft_errors:
+                record(
+                    AttendeeResult(
+                        attendee_id=attendee_id,
+                        success=False,
+                        error=f"Cluster draft failed: {draft_errors[label]}",
+                        seconds=0.0,
+                    )
+                )
+                continue
+            # Only clustered mode labels attendees; profiles are missing only with rich analysis
+            if label is not None and profile is not None:
+                run = partial(
+                    _run_personalization_crew, crews, style_config, drafts[label], profile
+                )
+            elif mode == "single-pass" and profile is not None:
+                run = partial(_run_single_pass_crew, crews, style_config, attendee, profile)
+            else:
+                run = partial(_run_content_crew, crews, style_config, attendee, profile, not gated)
+            # Keep the queue short so attendees are not all materialized at once
+            if len(in_flight) >= 2 * concurrency:
+                done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    record(future.result())
+            # Gated content records its hash once it has passed the gates
+            content_hash = None if gated else pending[attendee_id]
+            in_flight.add(executor.submit(
+                _generate_one, attendee, content_hash, event_id, event_output_dir, run, controller
+            ))
+        for future in as_completed(in_flight):
+            record(future.result())
+
+        if gated:
+            report.quality = QualityGateSummary()
+            gates = quality_gates or QualityGates()
+            rng = np.random.default_rng(gates.seed)
+            generated = {r.attendee_id: r for r in report.results if r.success and not r.skipped}
+            batch: List[Tuple[Dict[str, Any], Optional[str], AttendeeResult, str]] = []
+            for attendee, profile in zip(source.iter_attendees(event_id), profiles):
+                result = generated.get(str(attendee.get("id", "")))
+                if result is None:
+                    continue
+                batch.append((attendee, profile, result, pending[result.attendee_id]))
+                if len(batch) == GATE_BATCH_SIZE:
+                    _gate_batch(
+                        batch, style_config, gates, rng, executor, crews, controller, report.quality
+                    )
+                    batch = []
+            if batch:
+                _gate_batch(
+                    batch, style_config, gates, rng, executor, crews, controller, report.quality
+                )
+    finally:
+        # On Ctrl+C, running attendees finish and queued ones never start
+        executor.shutdown(wait=True, cancel_futures=True)
+        report.elapsed_seconds = time.perf_counter() - start
+
+    report.results.sort(key=lambda r: r.attendee_id)
+    _write_json_atomic(
+        shard_manifest_path(output_dir, event_id, shard),
+        {
+            "event_id": event_id,
+            "shard": str(shard),
+            "attendee_ids": shard_ids,
+            "results": [
+                r.model_dump(include={"attendee_id", "success", "skipped", "error"})
+                for r in report.results
+            ],
+            "completed_at": datetime.now(timezone.utc).isoformat(),
+        },
+    )
+    return report
+
+
+def _gate_batch(
+    batch: List[Tuple[Dict[str, Any], Optional[str], AttendeeResult, str]],
+    style_config: EventStyleConfig,
+    gates: QualityGates,
+    rng: np.random.Generator,
+    executor: ThreadPoolExecutor,
+    crews: threading.local,
+    controller: Optional[AdaptiveConcurrency],
+    summary: QualityGateSummary,
+) -> None:
+    """
+    Gate a batch of generated content and send flagged content to the editor.
+
+    Content that passes (and is not audited) is marked up to date as is;
+    reviewed content is replaced by the editor's version. If a review
+    fails, the attendee is reported as failed and its content keeps no
+    input hash, so the next run regenerates it.
+    """
+    # Generated results always name their content file
+    paths = [Path(cast(str, result.output_path)) for _, _, result, _ in batch]
+    payloads = [json.loads(path.read_text()) for path in paths]
+    results = check_content(
+        [payload["content"] for payload in payloads],
+        [attendee for attendee, _, _, _ in batch],
+        style_config.brand_voice,
+        gates,
+    )
+    review = select_for_review(results, gates.audit_rate, rng)
+    summary.add(results)
+    summary.reviewed += sum(review)
+    summary.audited += sum(
+        1 for quality, flagged in zip(results, review) if flagged and quality.passed
+    )
+
+    def finish(index: int, reviewed: bool) -> None:
+        _, _, result, input_hash = batch[index]
+        quality = results[index]
+        payloads[index]["input_hash"] = input_hash
+        payloads[index]["quality"] = {
+            "passed": quality.passed,
+            "failed_checks": quality.failed_checks,
+            "reviewed": reviewed,
+        }
+        write_attendee_content(paths[index].parent, result.attendee_id, payloads[index])
+
+    def run_review(index: int) -> Tuple[str, int]:
+        attendee, profile, _, _ = batch[index]
+        with controller.slot() if controller is not None else nullcontext():
+            return _run_review_crew(
+                crews, style_config, attendee, profile, payloads[index]["content"]
+            )
+
+    futures = {}
+    for index, flagged in enumerate(review):
+        if flagged:
+            futures[executor.submit(run_review, index)] = (index, time.perf_counter())
+        else:
+            finish(index, reviewed=False)
+    for future in as_completed(futures):
+        index, started = futures[future]
+        result = batch[index][2]
+        result.seconds += time.perf_counter() - started
+        try:
+            content, tokens = future.result()
+        except Exception as e:
+            result.success = False
+            result.error = f"Quality review failed: {str(e) or type(e).__name__}"
+            continue
+        payloads[index]["content"] = content
+        payloads[index]["token_usage"] = (payloads[index].get("token_usage") or 0) + tokens
+        result.token_usage = (result.token_usage or 0) + tokens
+        finish(index, reviewed=True)
+
+
+def _cluster_drafts(
+    clusters: List[Any],
+    style_config: EventStyleConfig,
+    version: str,
+    model: str,
+    event_output_dir: Path,
+    force: bool,
+    executor: ThreadPoolExecutor,
+    crews: threading.local,
+    controller: Optional[AdaptiveConcurrency],
+    report: ContentGenerationReport,
+) -> Tuple[Dict[int, str], Dict[int, str]]:
+    """
+    Highlights drafts for clusters, reusing ones saved by earlier runs or shards.
+
+    Returns:
+        Drafts and draft errors, by cluster label
+    """
+    drafts: Dict[int, str] = {}
+    errors: Dict[int, str] = {}
+    drafts_dir = event_output_dir / "drafts"
+    futures = {}
+    for cluster in clusters:
+        draft_hash = content_input_hash(
+            {}, None, style_config.brand_voice, version, model, f"draft:{cluster.key}"
+        )
+        path = drafts_dir / f"{cluster.key}.json"
+        if not force and stored_input_hash(drafts_dir, cluster.key) == draft_hash:
+            drafts[cluster.label] = json.loads(path.read_text())["content"]
+            continue
+
+        def draft(cluster: Any = cluster) -> Tuple[str, int]:
+            with controller.slot() if controller is not None else nullcontext():
+                return _run_highlights_crew(crews, style_config, cluster)
+
+        futures[executor.submit(draft)] = (cluster, draft_hash)
+    for future in as_completed(futures):
+        cluster, draft_hash = futures[future]
+        try:
+            content, tokens = future.result()
+        except Exception as e:
+            errors[cluster.label] = str(e) or type(e).__name__
+            continue
+        _write_json_atomic(
+            drafts_dir / f"{cluster.key}.json",
+            {
+                "cluster_key": cluster.key,
+                "sessions": cluster.sessions,
+                "tracks": cluster.tracks,
+                "content": content,
+                "input_hash": draft_hash,
+            },
+        )
+        drafts[cluster.label] = content
+        report.drafts_generated += 1
+        report.draft_tokens += tokens
+    return drafts, errors
+
+
+def merge_event_content(
+    event_id: str,
+    output_dir: Path = Path("generated-content"),
+    expected_ids: Optional[Iterable[str]] = None,
+) -> MergeReport:
+    """
+    Check an event's shard runs for completeness and bundle their content.
+
+    Reads the shard manifests under ``<output_dir>/<event_id>/shards``.
+    The event is complete when a manifest exists for every shard, no
+    attendee is claimed by two shards, every attendee has a successfully
+    generated content file and, with ``expected_ids``, no expected
+    attendee is missing. Only then is ``<output_dir>/<event_id>.json``
+    written, holding every attendee's content record sorted by id.
+
+    Args:
+        event_id: Event identifier
+        output_dir: Root directory for generated content
+        expected_ids: Attendee ids the event should have (e.g. from the
+            attendee data), to catch attendees no shard saw
+
+    Returns:
+        MergeReport: What is missing, duplicated or failed, and the output path
+
+    Raises:
+        FileNotFoundError: If the event has no shard manifests
+        ValueError: If manifests come from different shard counts
+    """
+    event_dir = Path(output_dir) / event_id
+    manifest_paths = sorted((event_dir / "shards").glob("shard-*-of-*.json"))
+    if not manifest_paths:
+        raise FileNotFoundError(
+            f"No shard manifests for event {event_id} in {event_dir / 'shards'}"
+        )
+    manifests = [json.loads(path.read_text()) for path in manifest_paths]
+    shards = [Shard(*(int(part) for part in m["shard"].split("/"))) for m in manifests]
+    counts = sorted({shard.count for shard in shards})
+    if len(counts) > 1:
+        raise ValueError(
+            f"Shard manifests for {event_id} come from different shard counts {counts}; "
+            "remove stale ones"
+        )
+
+    report = MergeReport(event_id=event_id, shard_count=counts[0])
+    present = {shard.index for shard in shards}
+    report.missing_shards = [
+        f"{i}/{report.shard_count}" for i in range(1, report.shard_count + 1) if i not in present
+    ]
+
+    claimed: Dict[str, int] = {}
+    succeeded: Set[str] = set()
+    for manifest in manifests:
+        for attendee_id in manifest["attendee_ids"]:
+            claimed[attendee_id] = claimed.get(attendee_id, 0) + 1
+        succeeded.update(r["attendee_id"] for r in manifest["results"] if r["success"])
+    report.duplicated = sorted(attendee_id for attendee_id, count in claimed.items() if count > 1)
+    report.failed = sorted(
+        attendee_id for attendee_id in claimed
+        if attendee_id not in succeeded or not (event_dir / f"{attendee_id}.json").is_file()
+    )
+    if expected_ids is not None:
+        report.missing = sorted(set(expected_ids) - set(claimed))
+    if not report.complete:
+        return report
+
+    # Stream the records into the bundle rather than loading them all
+    path = Path(output_dir) / f"{event_id}.json"
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(
+            f'{{"event_id":{json.dumps(event_id)},"shard_count":{report.shard_count},"attendees":['
+        )
+        for position, attendee_id in enumerate(sorted(claimed)):
+            record = json.loads((event_dir / f"{attendee_id}.json").read_text())
+            f.write(("," if position else "") + json.dumps(record, separators=(",", ":")))
+        f.write("]}")
+    os.replace(tmp_path, path)
+    report.attendee_count = len(claimed)
+    report.output_path = str(path)
+    return report
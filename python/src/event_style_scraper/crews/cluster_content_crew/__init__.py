@@ -0,0 +1,8 @@
+"""Cluster content crew module."""
+
+from event_style_scraper.crews.cluster_content_crew.cluster_content_crew import (
+    ClusterContentCrew,
+    prompt_version,
+)
+
+__all__ = ["ClusterContentCrew", "prompt_version"]
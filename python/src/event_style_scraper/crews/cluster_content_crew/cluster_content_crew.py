@@ -0,0 +1,143 @@
+"""Cluster-then-personalize crew: one shared draft per cluster, one cheap pass per attendee."""
+
+import copy
+from pathlib import Path
+from typing import Any, Dict
+
+from crewai import Agent, Crew, Process, Task
+from crewai.project import CrewBase, agent, task
+
+from event_style_scraper.clustering import ClusterSummary
+from event_style_scraper.crews import crew_config
+from event_style_scraper.types import EventStyleConfig
+
+CONFIG_DIR = Path(__file__).parent / "config"
+
+
+def prompt_version() -> str:
+    """Version of the crew's prompts (see crew_config.prompt_version)."""
+    return crew_config.prompt_version(CONFIG_DIR)
+
+
+@CrewBase
+class ClusterContentCrew:
+    """
+    Content crew for attendees grouped by similar session choices.
+
+    ``highlights_crew()`` writes a session-highlights draft once per
+    cluster; ``personalization_crew()`` then turns the draft into each
+    attendee's content in a single call, adding their name, connections
+    and achievements from the computed attendee profile. Both are
+    template crews: build them once and kick them off with
+    ``highlights_inputs()`` and ``personalization_inputs()``.
+    """
+
+    agents_config: Any = "config/agents.yaml"
+    tasks_config: Any = "config/tasks.yaml"
+
+    def __init__(self, style_config: EventStyleConfig, verbose: bool = True):
+        """
+        Initialize ClusterContentCrew.
+
+        Args:
+            style_config: EventStyleConfig with brand voice settings
+            verbose: Log agent and task progress (default: True)
+        """
+        self.style_config = style_config
+        self.verbose = verbose
+        self.config_dir = CONFIG_DIR
+        self.load_configurations = self._load_shared_configurations
+
+    def _load_shared_configurations(self) -> None:
+        """Load agent and task configurations from the cached YAML parse."""
+        agents_config, tasks_config = crew_config.parsed_configs(CONFIG_DIR)
+        self.agents_config = copy.deepcopy(agents_config)
+        self.tasks_config = copy.deepcopy(tasks_config)
+
+    @agent
+    def highlights_writer_agent(self) -> Agent:
+        """Create session highlights writer agent."""
+        return Agent(
+            config=self.agents_config["highlights_writer_agent"],
+            verbose=self.verbose
+        )
+
+    @agent
+    def personalization_agent(self) -> Agent:
+        """Create personalization specialist agent."""
+        return Agent(
+            config=self.agents_config["personalization_agent"],
+            verbose=self.verbose
+        )
+
+    @task
+    def draft_highlights(self) -> Task:
+        """Create task to draft a cluster's shared session highlights."""
+        return Task(
+            config=self.tasks_config["draft_highlights"],
+            agent=self.highlights_writer_agent()
+        )
+
+    @task
+    def personalize_content(self) -> Task:
+        """Create task to personalize the draft for one attendee."""
+        return Task(
+            config=self.tasks_config["personalize_content"],
+            agent=self.personalization_agent()
+        )
+
+    def _brand_inputs(self) -> Dict[str, str]:
+        brand_voice = self.style_config.brand_voice
+        return {
+            "brand_tone": brand_voice.tone,
+            "brand_style": brand_voice.style,
+            "brand_keywords": ", ".join(brand_voice.keywords),
+        }
+
+    def highlights_inputs(self, cluster: ClusterSummary) -> Dict[str, Any]:
+        """
+        Kickoff inputs for a cluster's highlights draft.
+
+        Args:
+            cluster: Summary of the cluster
+
+        Returns:
+            Inputs for ``highlights_crew().kickoff(inputs=...)``
+        """
+        return {
+            "cluster_size": cluster.size,
+            "cluster_sessions": "; ".join(cluster.sessions) or "a varied mix of sessions",
+            "cluster_tracks": ", ".join(cluster.tracks) or "General",
+            **self._brand_inputs(),
+        }
+
+    def personalization_inputs(self, profile: str, draft: str) -> Dict[str, Any]:
+        """
+        Kickoff inputs for one attendee's personalization pass.
+
+        Args:
+            profile: Attendee profile (AttendeeProfile.to_context())
+            draft: The attendee's cluster draft
+
+        Returns:
+            Inputs for ``personalization_crew().kickoff(inputs=...)``
+        """
+        return {"attendee_profile": profile, "highlights_draft": draft, **self._brand_inputs()}
+
+    def highlights_crew(self) -> Crew:
+        """Create the crew that drafts a cluster's shared highlights."""
+        return Crew(
+            agents=[self.highlights_writer_agent()],
+            tasks=[self.draft_highlights()],
+            process=Process.sequential,
+            verbose=self.verbose
+        )
+
+    def personalization_crew(self) -> Crew:
+        """Create the crew that personalizes a draft for one attendee."""
+        return Crew(
+            agents=[self.personalization_agent()],
+            tasks=[self.personalize_content()],
+            process=Process.sequential,
+            verbose=self.verbose
+        )
@@ -2,6 +2,8 @@
 
 from event_style_scraper.crews.content_creation_crew.content_creation_crew import (
     ContentCreationCrew,
+    attendee_inputs,
+    prompt_version,
 )
 
-__all__ = ["ContentCreationCrew"]
+__all__ = ["ContentCreationCrew", "attendee_inputs", "prompt_version"]
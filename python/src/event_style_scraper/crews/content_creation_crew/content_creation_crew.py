@@ -1,12 +1,42 @@
 """Content creation crew for generating personalized attendee content."""
 
+import copy
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Optional
+
 from crewai import Agent, Crew, Process, Task
 from crewai.project import CrewBase, agent, crew, task
+from crewai.tasks.task_output import TaskOutput
 
+from event_style_scraper.crews import crew_config
 from event_style_scraper.types import EventStyleConfig
 
+CONFIG_DIR = Path(__file__).parent / "config"
+
+
+def prompt_version() -> str:
+    """Version of the crew's prompts (see crew_config.prompt_version)."""
+    return crew_config.prompt_version(CONFIG_DIR)
+
+
+def attendee_inputs(attendee_data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Values for the attendee placeholders in the analyze_attendee task.
+
+    Args:
+        attendee_data: Dictionary containing attendee information
+
+    Returns:
+        Inputs for ``crew().kickoff(inputs=...)`` on a template crew
+    """
+    first_name = attendee_data.get("firstName", "")
+    last_name = attendee_data.get("lastName", "")
+    return {
+        "attendee_name": f"{first_name} {last_name}".strip(),
+        "session_count": len(attendee_data.get("sessions", [])),
+        "connection_count": len(attendee_data.get("connections", [])),
+    }
+
 
 @CrewBase
 class ContentCreationCrew:
@@ -15,31 +45,70 @@ class ContentCreationCrew:
 
     This crew uses 4 specialized agents to create engaging, personalized
     content for event attendees that matches the event's brand voice.
-    """
 
-    agents_config = "config/agents.yaml"
-    tasks_config = "config/tasks.yaml"
+    By default the attendee analysis is not an LLM task: an AttendeeProfile
+    computed by event_style_scraper.analytics stands in for the
+    analyze_attendee output, and only the three writing tasks run. Set
+    ``rich_analysis`` to have the Personalization Specialist agent write
+    the analysis instead.
+
+    With ``run_quality_check`` off, ``crew()`` stops after the brand voice
+    task and ``review_crew()`` runs the Quality Editor separately, only
+    on the content that local quality gates (event_style_scraper.quality)
+    flag.
+    """
 
-    def __init__(self, attendee_data: Dict[str, Any], style_config: EventStyleConfig):
+    agents_config: Any = "config/agents.yaml"
+    tasks_config: Any = "config/tasks.yaml"
+
+    def __init__(
+        self,
+        attendee_data: Optional[Dict[str, Any]],
+        style_config: EventStyleConfig,
+        verbose: bool = True,
+        rich_analysis: bool = False,
+        run_quality_check: bool = True,
+    ):
         """
         Initialize ContentCreationCrew.
 
         Args:
-            attendee_data: Dictionary containing attendee information
+            attendee_data: Dictionary containing attendee information. If None,
+                the crew is a reusable template for the event: agents are
+                built once and each attendee is supplied per run with
+                ``crew().kickoff(inputs=attendee_inputs(attendee))``.
             style_config: EventStyleConfig with brand voice settings
+            verbose: Log agent and task progress (default: True)
+            rich_analysis: Run the LLM analyze_attendee task instead of using
+                the computed attendee profile (default: False)
+            run_quality_check: End ``crew()`` with the quality_check task
+                (default: True)
         """
         self.attendee_data = attendee_data
         self.style_config = style_config
+        self.verbose = verbose
+        self.rich_analysis = rich_analysis
+        self.run_quality_check = run_quality_check
 
         # Get config directory path
-        self.config_dir = Path(__file__).parent / "config"
+        self.config_dir = CONFIG_DIR
+
+        # CrewBase would re-read the YAML for every attendee; copy the
+        # process-wide parse instead (agent/task mapping mutates it)
+        self.load_configurations = self._load_shared_configurations
+
+    def _load_shared_configurations(self) -> None:
+        """Load agent and task configurations from the cached YAML parse."""
+        agents_config, tasks_config = crew_config.parsed_configs(CONFIG_DIR)
+        self.agents_config = copy.deepcopy(agents_config)
+        self.tasks_config = copy.deepcopy(tasks_config)
 
     @agent
     def content_writer_agent(self) -> Agent:
         """Create content writer agent."""
         return Agent(
             config=self.agents_config["content_writer_agent"],
-            verbose=True
+            verbose=self.verbose
         )
 
     @agent
@@ -47,7 +116,7 @@ class ContentCreationCrew:
         """Create personalization specialist agent."""
         return Agent(
             config=self.agents_config["personalization_agent"],
-            verbose=True
+            verbose=self.verbose
         )
 
     @agent
@@ -55,7 +124,7 @@ class ContentCreationCrew:
         """Create brand voice guardian agent."""
         return Agent(
             config=self.agents_config["brand_voice_agent"],
-            verbose=True
+            verbose=self.verbose
         )
 
     @agent
@@ -63,25 +132,19 @@ class ContentCreationCrew:
         """Create quality editor agent."""
         return Agent(
             config=self.agents_config["quality_editor_agent"],
-            verbose=True
+            verbose=self.verbose
         )
 
     @task
     def analyze_attendee(self) -> Task:
         """Create task to analyze attendee experience."""
-        # Extract attendee info for task description interpolation
-        attendee_name = f"{self.attendee_data.get('firstName', '')} {self.attendee_data.get('lastName', '')}".strip()
-        session_count = len(self.attendee_data.get('sessions', []))
-        connection_count = len(self.attendee_data.get('connections', []))
-
         task_config = self.tasks_config["analyze_attendee"].copy()
 
-        # Interpolate variables in description
-        task_config["description"] = task_config["description"].format(
-            attendee_name=attendee_name,
-            session_count=session_count,
-            connection_count=connection_count
-        )
+        # Template crews keep the placeholders for kickoff inputs
+        if self.attendee_data is not None:
+            task_config["description"] = task_config["description"].format(
+                **attendee_inputs(self.attendee_data)
+            )
 
         return Task(
             config=task_config,
@@ -121,12 +184,69 @@ class ContentCreationCrew:
             agent=self.quality_editor_agent()
         )
 
+    def set_attendee_profile(self, profile: str) -> None:
+        """
+        Use a computed profile as the analyze_attendee output.
+
+        Template crews call this before each attendee's kickoff; the
+        writing tasks receive the profile as their analysis context.
+
+        Args:
+            profile: Attendee profile (AttendeeProfile.to_context())
+        """
+        self.set_task_output("analyze_attendee", profile)
+
+    def set_task_output(self, task_name: str, raw: str) -> None:
+        """
+        Preset a task's output so later tasks receive it as context.
+
+        Args:
+            task_name: Task method name, e.g. "apply_brand_voice"
+            raw: Output text
+        """
+        preset = getattr(self, task_name)()
+        preset.output = TaskOutput(
+            name=task_name,
+            description=preset.description,
+            raw=raw,
+            agent=preset.agent.role if preset.agent else "",
+        )
+
     @crew
     def crew(self) -> Crew:
         """Create the content creation crew."""
+        tasks = self.tasks
+        agents = self.agents
+        if not self.rich_analysis:
+            # Later tasks list analyze_attendee as context, so its preset
+            # output reaches them even though the task does not run
+            if self.attendee_data is not None:
+                from event_style_scraper.analytics import compute_profiles
+
+                self.set_attendee_profile(compute_profiles([self.attendee_data])[0].to_context())
+            tasks = [t for t in tasks if t.name != "analyze_attendee"]
+        if not self.run_quality_check:
+            tasks = [t for t in tasks if t.name != "quality_check"]
+        agents = [a for a in agents if any(t.agent is a for t in tasks)]
+
+        return Crew(
+            agents=agents,
+            tasks=tasks,
+            process=Process.sequential,
+            verbose=self.verbose
+        )
+
+    def review_crew(self) -> Crew:
+        """
+        Create a crew running only the quality_check task.
+
+        Preset the content to review with
+        ``set_task_output("apply_brand_voice", content)`` (and the analysis
+        with ``set_attendee_profile``) before each kickoff.
+        """
         return Crew(
-            agents=self.agents,
-            tasks=self.tasks,
+            agents=[self.quality_editor_agent()],
+            tasks=[self.quality_check()],
             process=Process.sequential,
-            verbose=True
+            verbose=self.verbose
         )
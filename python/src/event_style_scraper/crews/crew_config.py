@@ -0,0 +1,39 @@
+"""Loading and versioning of a crew's agents.yaml and tasks.yaml."""
+
+import hashlib
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Tuple
+
+import yaml
+
+CONFIG_FILES = ("agents.yaml", "tasks.yaml")
+
+
+@lru_cache(maxsize=None)
+def parsed_configs(config_dir: Path) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """
+    Parse a crew's agents.yaml and tasks.yaml once per process.
+
+    The dicts are shared between callers; deep-copy them before changing them.
+    """
+    agents_path, tasks_path = (config_dir / name for name in CONFIG_FILES)
+    with open(agents_path, encoding="utf-8") as f:
+        agents_config = yaml.safe_load(f)
+    with open(tasks_path, encoding="utf-8") as f:
+        tasks_config = yaml.safe_load(f)
+    return agents_config, tasks_config
+
+
+@lru_cache(maxsize=None)
+def prompt_version(config_dir: Path) -> str:
+    """
+    Version of a crew's prompts: a hash of its agents.yaml and tasks.yaml.
+
+    Changes whenever an agent or task prompt is edited, so content
+    generated with older prompts can be told apart.
+    """
+    digest = hashlib.sha256()
+    for name in CONFIG_FILES:
+        digest.update((config_dir / name).read_bytes())
+    return digest.hexdigest()[:12]
@@ -0,0 +1,8 @@
+"""Single-pass content crew module."""
+
+from event_style_scraper.crews.single_pass_content_crew.single_pass_content_crew import (
+    SinglePassContentCrew,
+    prompt_version,
+)
+
+__all__ = ["SinglePassContentCrew", "prompt_version"]
@@ -0,0 +1,101 @@
+"""Single-pass content crew: analysis, writing and brand voice in one structured call."""
+
+import copy
+from pathlib import Path
+from typing import Any, Dict
+
+from crewai import Agent, Crew, Process, Task
+from crewai.project import CrewBase, agent, crew, task
+
+from event_style_scraper.crews import crew_config
+from event_style_scraper.types import AttendeeContent, EventStyleConfig
+
+CONFIG_DIR = Path(__file__).parent / "config"
+
+
+def prompt_version() -> str:
+    """Version of the crew's prompts (see crew_config.prompt_version)."""
+    return crew_config.prompt_version(CONFIG_DIR)
+
+
+@CrewBase
+class SinglePassContentCrew:
+    """
+    Content crew that writes an attendee's content in a single LLM call.
+
+    One task folds the attendee analysis, the five content sections and
+    the brand voice constraints into one structured generation with an
+    AttendeeContent output, instead of ContentCreationCrew's chain of
+    writer, brand voice and quality editor agents that each re-send the
+    growing context. Build it once per event and kick it off per attendee
+    with ``inputs()``.
+    """
+
+    agents_config: Any = "config/agents.yaml"
+    tasks_config: Any = "config/tasks.yaml"
+
+    def __init__(self, style_config: EventStyleConfig, verbose: bool = True):
+        """
+        Initialize SinglePassContentCrew.
+
+        Args:
+            style_config: EventStyleConfig with brand voice settings
+            verbose: Log agent and task progress (default: True)
+        """
+        self.style_config = style_config
+        self.verbose = verbose
+        self.config_dir = CONFIG_DIR
+        self.load_configurations = self._load_shared_configurations
+
+    def _load_shared_configurations(self) -> None:
+        """Load agent and task configurations from the cached YAML parse."""
+        agents_config, tasks_config = crew_config.parsed_configs(CONFIG_DIR)
+        self.agents_config = copy.deepcopy(agents_config)
+        self.tasks_config = copy.deepcopy(tasks_config)
+
+    @agent
+    def content_writer_agent(self) -> Agent:
+        """Create personalized content writer agent."""
+        return Agent(
+            config=self.agents_config["content_writer_agent"],
+            verbose=self.verbose
+        )
+
+    @task
+    def write_attendee_content(self) -> Task:
+        """Create task to write an attendee's structured, on-brand content."""
+        return Task(
+            config=self.tasks_config["write_attendee_content"],
+            agent=self.content_writer_agent(),
+            output_pydantic=AttendeeContent
+        )
+
+    def inputs(self, attendee_name: str, profile: str) -> Dict[str, Any]:
+        """
+        Kickoff inputs for one attendee.
+
+        Args:
+            attendee_name: Attendee's display name
+            profile: Attendee profile (AttendeeProfile.to_context())
+
+        Returns:
+            Inputs for ``crew().kickoff(inputs=...)``
+        """
+        brand_voice = self.style_config.brand_voice
+        return {
+            "attendee_name": attendee_name or "the attendee",
+            "attendee_profile": profile,
+            "brand_tone": brand_voice.tone,
+            "brand_style": brand_voice.style,
+            "brand_keywords": ", ".join(brand_voice.keywords),
+        }
+
+    @crew
+    def crew(self) -> Crew:
+        """Create the single-pass content crew."""
+        return Crew(
+            agents=self.agents,
+            tasks=self.tasks,
+            process=Process.sequential,
+            verbose=self.verbose
+        )
@@ -1,10 +1,11 @@
 """StyleExtractionCrew - Multi-agent crew for web scraping and style extraction."""
 
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, Dict, Optional
 
 from crewai import Agent, Crew, Process, Task
 from crewai.project import CrewBase, agent, crew, task
+from crewai.tasks.task_output import TaskOutput
 
 from event_style_scraper.tools import WebScraperTool, SecurityError, PlaywrightStyleExtractorTool
 
@@ -24,23 +25,41 @@ class StyleExtractionCrew:
     agents_config = "config/agents.yaml"
     tasks_config = "config/tasks.yaml"
 
-    def __init__(self, url: str, timeout: int = 60):
+    def __init__(
+        self,
+        url: Optional[str] = None,
+        timeout: int = 60,
+        browser_pool: Optional[Any] = None,
+        completed_outputs: Optional[Dict[str, str]] = None,
+        task_callback: Optional[Callable[[TaskOutput], Any]] = None,
+    ):
         """
         Initialize StyleExtractionCrew.
 
         Args:
-            url: URL of the event website to scrape
+            url: URL of the event website to scrape. If omitted, the crew is a
+                reusable template: the URL is supplied per run with
+                ``crew().kickoff(inputs={"url": ...})``.
             timeout: Maximum time in seconds for scraping operations
+            browser_pool: Optional BrowserPool the Playwright tool scrapes with
+            completed_outputs: Raw outputs of tasks finished by an earlier,
+                interrupted run, keyed by task name. Those tasks are skipped
+                and their outputs are passed on as context instead.
+            task_callback: Called with each TaskOutput as its task finishes
         """
         self.url = url
         self.timeout = timeout
+        self.browser_pool = browser_pool
+        self.completed_outputs = completed_outputs or {}
+        self.task_callback = task_callback
 
         # Validate URL using security tool
-        scraper_tool = WebScraperTool(timeout=timeout)
-        try:
-            scraper_tool.validate_url(url)
-        except SecurityError as e:
-            raise ValueError(str(e)) from e
+        if url is not None:
+            scraper_tool = WebScraperTool(timeout=timeout)
+            try:
+                scraper_tool.validate_url(url)
+            except SecurityError as e:
+                raise ValueError(str(e)) from e
 
         # Get config directory path
         self.config_dir = Path(__file__).parent / "config"
@@ -50,7 +69,12 @@ class StyleExtractionCrew:
         """Create web scraper agent with Playwright tool."""
         return Agent(
             config=self.agents_config["web_scraper_agent"],
-            tools=[PlaywrightStyleExtractorTool(timeout=self.timeout * 1000)],  # Convert seconds to milliseconds
+            tools=[
+                PlaywrightStyleExtractorTool(
+                    timeout=self.timeout * 1000,  # Convert seconds to milliseconds
+                    browser_pool=self.browser_pool,
+                )
+            ],
             verbose=True,
             allow_delegation=False
         )
@@ -86,7 +110,14 @@ class StyleExtractionCrew:
     def scrape_website(self) -> Task:
         """Create task to scrape website."""
         task_config = self.tasks_config["scrape_website"].copy()
-        task_config["description"] = task_config["description"].format(url=self.url)
+        if self.url is not None:
+            task_config["description"] = task_config["description"].format(url=self.url)
+        else:
+            # Keep {url} for CrewAI's kickoff interpolation, which leaves
+            # JSON braces alone, so only the format escapes are undone
+            task_config["description"] = (
+                task_config["description"].replace("{{", "{").replace("}}", "}")
+            )
 
         return Task(
             config=task_config,
@@ -123,9 +154,24 @@ class StyleExtractionCrew:
     @crew
     def crew(self) -> Crew:
         """Create the style extraction crew."""
+        tasks = self.tasks
+        if self.completed_outputs:
+            # Later tasks list earlier ones as context, so restored outputs
+            # reach them even though the finished tasks do not run again
+            for finished in tasks:
+                if finished.name in self.completed_outputs:
+                    finished.output = TaskOutput(
+                        name=finished.name,
+                        description=finished.description,
+                        raw=self.completed_outputs[finished.name],
+                        agent=finished.agent.role if finished.agent else "",
+                    )
+            tasks = [t for t in tasks if t.name not in self.completed_outputs]
+
         return Crew(
             agents=self.agents,
-            tasks=self.tasks,
+            tasks=tasks,
             process=Process.sequential,
-            verbose=True
+            verbose=True,
+            task_callback=self.task_callback,
         )
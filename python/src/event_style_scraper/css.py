@@ -0,0 +1,93 @@
+"""Precompiled event CSS.
+
+``generate_event_css`` emits the same custom properties as
+``generateEventCSS`` in ``src/cssGenerator.ts`` (colors, derived color
+states, gradient, typography and layout tokens), minified and without the
+metadata comment. The result only depends on the styling, so it can be
+named by its content hash and served with long-lived cache headers: a
+re-scrape that changes no style token keeps the same file name.
+"""
+
+import hashlib
+import re
+from typing import List, Tuple
+
+from event_style_scraper.types import EventStyleConfig, LayoutConfig
+
+HASH_LENGTH = 12
+
+_QUOTED_OR_SPACE = re.compile(r"""("[^"]*"|'[^']*')|\s*,\s*|\s+""")
+
+
+def minify_value(value: str) -> str:
+    """
+    Drop optional whitespace from a CSS value, leaving quoted strings alone.
+
+    Example:
+        >>> minify_value("'Open Sans',  Arial , sans-serif")
+        "'Open Sans',Arial,sans-serif"
+    """
+
+    def replace(match: "re.Match[str]") -> str:
+        if match.group(1):
+            return match.group(1)
+        return "," if "," in match.group(0) else " "
+
+    return _QUOTED_OR_SPACE.sub(replace, value.strip())
+
+
+def css_properties(config: EventStyleConfig) -> List[Tuple[str, str]]:
+    """Custom properties of a config, in the order cssGenerator.ts writes them."""
+    colors, typography = config.colors, config.typography
+    layout = config.layout or LayoutConfig()
+    return [
+        ("--color-primary", colors.primary),
+        ("--color-secondary", colors.secondary),
+        ("--color-accent", colors.accent),
+        ("--color-background", colors.background),
+        ("--color-text", colors.text),
+        ("--color-primary-hover", colors.primary),
+        ("--color-hover", colors.accent),
+        (
+            "--gradient-primary",
+            f"linear-gradient(135deg, {colors.primary} 0%, {colors.secondary} 100%)",
+        ),
+        ("--font-heading", typography.heading_font),
+        ("--font-body", typography.body_font),
+        ("--font-size-heading", typography.heading_size),
+        ("--font-size-body", typography.body_size),
+        ("--line-height", typography.line_height),
+        ("--spacing-unit", layout.spacing_unit),
+        ("--border-radius", layout.border_radius),
+        ("--container-width", layout.container_width),
+    ]
+
+
+def generate_event_css(config: EventStyleConfig) -> str:
+    """
+    Minified ``:root`` block of an event's custom properties.
+
+    Args:
+        config: Style config to compile
+
+    Returns:
+        str: CSS ending in a newline
+    """
+    declarations = ";".join(
+        f"{name}:{minify_value(value)}" for name, value in css_properties(config)
+    )
+    return f":root{{{declarations}}}\n"
+
+
+def css_filename(event_id: str, css: str) -> str:
+    """Content-hashed file name, e.g. ``tech-summit.3f2a9c1b7d4e.css``."""
+    digest = hashlib.sha256(css.encode("utf-8")).hexdigest()[:HASH_LENGTH]
+    return f"{event_id}.{digest}.css"
+
+
+def is_css_for(filename: str, event_id: str) -> bool:
+    """Whether a file name is a hashed stylesheet of the event."""
+    return (
+        re.fullmatch(rf"{re.escape(event_id)}\.[0-9a-f]{{{HASH_LENGTH}}}\.css", filename)
+        is not None
+    )
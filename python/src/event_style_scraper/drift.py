@@ -0,0 +1,334 @@
+"""Style drift between two scrapes of an event.
+
+Compares two EventStyleConfig snapshots field by field and scores how far
+the event's style has moved. Palette colors are compared by perceptual
+distance (CIEDE2000), so a re-scrape that returns a visually identical
+shade is not drift; font stacks are compared after normalizing quotes,
+case and whitespace, and a change of fallback fonts weighs less than a
+change of the main family. Each field's drift (0-1) is weighted into an
+overall score (0-1).
+
+Across the catalog, baselines come from the style history store, and
+every pair's colors are compared in one vectorized Delta-E computation.
+"""
+
+import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from pydantic import BaseModel, Field
+
+from event_style_scraper.colors import JUST_NOTICEABLE_DELTA_E
+from event_style_scraper.store import StyleSnapshot, StyleStore
+from event_style_scraper.types import EventStyleConfig
+
+if TYPE_CHECKING:
+    import numpy as np
+
+COLOR_ROLES = ("primary", "secondary", "accent", "background", "text")
+
+# Share of the overall score carried by each field (sums to 1)
+FIELD_WEIGHTS = {
+    "colors.primary": 0.2,
+    "colors.secondary": 0.1,
+    "colors.accent": 0.1,
+    "colors.background": 0.05,
+    "colors.text": 0.05,
+    "typography.heading_font": 0.1,
+    "typography.body_font": 0.1,
+    "typography.heading_size": 0.02,
+    "typography.body_size": 0.02,
+    "typography.line_height": 0.01,
+    "brand_voice.tone": 0.05,
+    "brand_voice.style": 0.04,
+    "brand_voice.keywords": 0.04,
+    "brand_voice.personality": 0.02,
+    "layout.grid_system": 0.01,
+    "layout.spacing_unit": 0.01,
+    "layout.border_radius": 0.01,
+    "layout.container_width": 0.01,
+    "logo_url": 0.03,
+    "favicon_url": 0.02,
+    "event_name": 0.01,
+}
+FONT_FIELDS = ("typography.heading_font", "typography.body_font")
+
+# Delta-E at which a color counts as completely different
+FULL_COLOR_DRIFT_DELTA_E = 25.0
+# Drift of a font stack whose main family is unchanged
+FALLBACK_FONT_DRIFT = 0.25
+# Default overall score from which an event is reported as drifted
+DEFAULT_MIN_SCORE = 0.05
+
+FONT_SEPARATOR = re.compile(r"\s*,\s*")
+WHITESPACE = re.compile(r"\s+")
+
+
+class FieldDrift(BaseModel):
+    """A field that differs between two scrapes."""
+
+    field: str = Field(..., description="Dotted field path, e.g. colors.primary")
+    old: Optional[str] = Field(default=None, description="Baseline value")
+    new: Optional[str] = Field(default=None, description="Current value")
+    score: float = Field(..., description="How far the field moved (0-1)")
+    weight: float = Field(..., description="Share of the overall score the field carries")
+    delta_e: Optional[float] = Field(default=None, description="CIEDE2000 distance, for colors")
+
+
+class DriftReport(BaseModel):
+    """Field-level drift of one event between two scrapes."""
+
+    event_id: str = Field(..., description="Event identifier")
+    old_scraped_at: Optional[str] = Field(default=None, description="Scrape time of the baseline")
+    new_scraped_at: Optional[str] = Field(
+        default=None, description="Scrape time of the current config"
+    )
+    score: float = Field(default=0.0, description="Weighted drift over all fields (0-1)")
+    fields: List[FieldDrift] = Field(
+        default_factory=list, description="Changed fields, most drifted first"
+    )
+    error: Optional[str] = Field(default=None, description="Why the event could not be compared")
+
+    def drifted(self, min_score: float = DEFAULT_MIN_SCORE) -> bool:
+        """Whether the overall score reaches min_score."""
+        return self.error is None and self.score >= min_score
+
+
+def normalize_font_stack(stack: Optional[str]) -> Tuple[str, ...]:
+    """
+    Font families of a CSS font-family value, normalized for comparison.
+
+    Quotes, case and repeated whitespace are dropped, so
+    ``"Open Sans", Arial`` and ``open sans,arial`` are the same stack.
+    """
+    families = []
+    for family in FONT_SEPARATOR.split((stack or "").strip().strip(";")):
+        family = WHITESPACE.sub(" ", family.strip().strip("'\"").strip()).casefold()
+        if family and family not in families:
+            families.append(family)
+    return tuple(families)
+
+
+def _font_drift(old: Optional[str], new: Optional[str]) -> float:
+    old_stack, new_stack = normalize_font_stack(old), normalize_font_stack(new)
+    if old_stack == new_stack:
+        return 0.0
+    if old_stack and new_stack and old_stack[0] == new_stack[0]:
+        return FALLBACK_FONT_DRIFT
+    return 1.0
+
+
+def _normalize_text(value: Any) -> str:
+    return WHITESPACE.sub(" ", str(value)).strip().casefold() if value is not None else ""
+
+
+def _keyword_drift(old: Sequence[str], new: Sequence[str]) -> float:
+    """Jaccard distance between two keyword sets."""
+    old_set = {_normalize_text(k) for k in old} - {""}
+    new_set = {_normalize_text(k) for k in new} - {""}
+    union = old_set | new_set
+    return len(old_set ^ new_set) / len(union) if union else 0.0
+
+
+def _field_values(config: EventStyleConfig) -> Dict[str, Any]:
+    """Compared fields of a config, keyed like FIELD_WEIGHTS."""
+    values: Dict[str, Any] = {}
+    for section in ("colors", "typography", "brand_voice", "layout"):
+        for name, value in (
+            getattr(config, section).model_dump() if getattr(config, section) else {}
+        ).items():
+            values[f"{section}.{name}"] = value
+    for name in ("logo_url", "favicon_url", "event_name"):
+        values[name] = getattr(config, name)
+    return values
+
+
+def _display(value: Any) -> Optional[str]:
+    if value is None:
+        return None
+    return ", ".join(value) if isinstance(value, list) else str(value)
+
+
+def _color_distances(pairs: Sequence[Tuple[EventStyleConfig, EventStyleConfig]]) -> "np.ndarray":
+    """(len(pairs), len(COLOR_ROLES)) Delta-E of each pair's palette, computed at once."""
+    from event_style_scraper.colors import delta_e_2000, parse_colors, rgb_to_lab
+
+    # Validated configs only hold parseable colors
+    old_rgb, _ = parse_colors(
+        [getattr(old.colors, role) for old, _ in pairs for role in COLOR_ROLES]
+    )
+    new_rgb, _ = parse_colors(
+        [getattr(new.colors, role) for _, new in pairs for role in COLOR_ROLES]
+    )
+    return delta_e_2000(rgb_to_lab(old_rgb), rgb_to_lab(new_rgb)).reshape(
+        len(pairs), len(COLOR_ROLES)
+    )
+
+
+def _report(
+    old: EventStyleConfig, new: EventStyleConfig, color_distances: Sequence[float]
+) -> DriftReport:
+    old_values, new_values = _field_values(old), _field_values(new)
+    fields = []
+    for role, delta_e in zip(COLOR_ROLES, color_distances):
+        if delta_e >= JUST_NOTICEABLE_DELTA_E:
+            field = f"colors.{role}"
+            fields.append(
+                FieldDrift(
+                    field=field,
+                    old=old_values[field],
+                    new=new_values[field],
+                    score=min(float(delta_e) / FULL_COLOR_DRIFT_DELTA_E, 1.0),
+                    weight=FIELD_WEIGHTS[field],
+                    delta_e=round(float(delta_e), 2),
+                )
+            )
+    for field, weight in FIELD_WEIGHTS.items():
+        if field.startswith("colors."):
+            continue
+        old_value, new_value = old_values.get(field), new_values.get(field)
+        if field in FONT_FIELDS:
+            score = _font_drift(old_value, new_value)
+        elif field == "brand_voice.keywords":
+            score = _keyword_drift(old_value or [], new_value or [])
+        else:
+            score = float(_normalize_text(old_value) != _normalize_text(new_value))
+        if score:
+            fields.append(
+                FieldDrift(
+                    field=field,
+                    old=_display(old_value),
+                    new=_display(new_value),
+                    score=score,
+                    weight=weight,
+                )
+            )
+    fields.sort(key=lambda f: f.score * f.weight, reverse=True)
+    return DriftReport(
+        event_id=old.event_id,
+        old_scraped_at=old.scraped_at,
+        new_scraped_at=new.scraped_at,
+        score=round(sum(f.score * f.weight for f in fields), 4),
+        fields=fields,
+    )
+
+
+def compare_many(pairs: Sequence[Tuple[EventStyleConfig, EventStyleConfig]]) -> List[DriftReport]:
+    """
+    Drift reports for (baseline, current) config pairs.
+
+    Args:
+        pairs: (old, new) configs
+
+    Returns:
+        One DriftReport per pair, in input order
+    """
+    if not pairs:
+        return []
+    distances = _color_distances(pairs)
+    return [_report(old, new, distances[i]) for i, (old, new) in enumerate(pairs)]
+
+
+def compare_configs(old: EventStyleConfig, new: EventStyleConfig) -> DriftReport:
+    """
+    Drift of an event's style from one config to another.
+
+    Args:
+        old: Baseline config
+        new: Current config
+
+    Returns:
+        DriftReport with the changed fields and the overall score
+    """
+    return compare_many([(old, new)])[0]
+
+
+def _wanted(
+    snapshots: List[StyleSnapshot], event_ids: Optional[Sequence[str]]
+) -> List[StyleSnapshot]:
+    if event_ids is None:
+        return snapshots
+    wanted = set(event_ids)
+    return [s for s in snapshots if s.event_id in wanted]
+
+
+def catalog_drift(
+    store: StyleStore, since: Optional[str] = None, event_ids: Optional[Sequence[str]] = None
+) -> List[DriftReport]:
+    """
+    Drift of every stored event from its history, without re-scraping.
+
+    Each event's latest snapshot is compared with its previous one, or with
+    its latest snapshot at ``since`` when given. Events without a baseline
+    are left out.
+
+    Args:
+        store: Style history store
+        since: ISO 8601 time whose configs are the baseline (default: previous scrape)
+        event_ids: Only these events (default: all)
+
+    Returns:
+        DriftReports ordered by event_id
+    """
+    current = {s.event_id: s for s in _wanted(store.latest_per_event(), event_ids)}
+    baselines = store.latest_per_event(before=since) if since else store.latest_per_event(recency=2)
+    pairs = [
+        (baseline.config, current[baseline.event_id].config)
+        for baseline in baselines
+        if baseline.event_id in current and baseline.id != current[baseline.event_id].id
+    ]
+    return compare_many(pairs)
+
+
+def live_drift(
+    store: StyleStore,
+    scrape: Callable[[str], EventStyleConfig],
+    event_ids: Optional[Sequence[str]] = None,
+    concurrency: int = 4,
+    record: Optional[str] = None,
+) -> List[DriftReport]:
+    """
+    Drift of each stored event's live site from its latest stored config.
+
+    Args:
+        store: Style history store holding the baselines
+        scrape: Scrapes a URL into a config (e.g. run_engine with a fixed mode)
+        event_ids: Only these events (default: all)
+        concurrency: Sites scraped at once
+        record: Engine name to record the fresh scrapes in the store under
+            (default: don't record them)
+
+    Returns:
+        DriftReports ordered by event_id; failed scrapes carry an error
+    """
+    baselines = _wanted(store.latest_per_event(), event_ids)
+
+    def fetch(
+        snapshot: StyleSnapshot,
+    ) -> Tuple[StyleSnapshot, Optional[EventStyleConfig], Optional[str]]:
+        try:
+            # The scraper names configs after the URL; keep the stored event's id
+            config = scrape(snapshot.source_url).model_copy(update={"event_id": snapshot.event_id})
+            return snapshot, config, None
+        except Exception as e:
+            return snapshot, None, str(e) or type(e).__name__
+
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+        fetched = list(executor.map(fetch, baselines))
+
+    scraped = [(s, config) for s, config, _ in fetched if config is not None]
+    if record is not None:
+        for _, config in scraped:
+            store.record(config, engine=record)
+    reports = {
+        s.event_id: report
+        for (s, _), report in zip(
+            scraped, compare_many([(s.config, config) for s, config in scraped])
+        )
+    }
+    for snapshot, _, error in fetched:
+        if error is not None:
+            reports[snapshot.event_id] = DriftReport(
+                event_id=snapshot.event_id, old_scraped_at=snapshot.config.scraped_at, error=error
+            )
+    return [reports[s.event_id] for s in baselines]
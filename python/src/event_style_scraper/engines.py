@@ -0,0 +1,293 @@
+"""Scraping engine modes: full crew, deterministic, and HTTP fast path.
+
+- ``crew``: StyleScrapingFlow with the four-agent StyleExtractionCrew.
+- ``deterministic``: Playwright scrape compiled into an EventStyleConfig by
+  rules, with no LLM calls.
+- ``http``: plain HTTP fetch and CSS parsing (no browser, no LLM), compiled
+  by the same rules.
+"""
+
+import re
+from collections import Counter
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any, Dict, List, Literal, Optional, get_args
+from urllib.parse import urlparse
+
+from event_style_scraper.colors import dedupe_colors, delta_e_matrix
+
+if TYPE_CHECKING:
+    # Imported lazily at runtime: the CLI reads ENGINE_MODES at startup
+    from bs4 import BeautifulSoup
+
+    from event_style_scraper.types import EventStyleConfig
+
+EngineMode = Literal["crew", "deterministic", "http"]
+ENGINE_MODES = get_args(EngineMode)
+
+# CSS variable name fragments hinting at each palette role, in priority order
+COLOR_ROLE_HINTS = {
+    "primary": ("primary", "brand"),
+    "secondary": ("secondary",),
+    "accent": ("accent", "highlight", "link"),
+    "background": ("background", "surface", "bg"),
+    "text": ("text", "ink", "foreground", "fg"),
+}
+
+# Computed style (element, property) used when no CSS variable matches a role
+COLOR_ROLE_ELEMENTS = {
+    "primary": [("header", "backgroundColor"), ("button", "backgroundColor"), ("h1", "color")],
+    "secondary": [("button", "backgroundColor"), ("nav", "backgroundColor"), ("h1", "color")],
+    "accent": [("a", "color"), ("button", "color")],
+    "background": [("body", "backgroundColor")],
+    "text": [("body", "color")],
+}
+
+# Roles that should read as distinct brand colors: a candidate within this
+# CIEDE2000 distance of a role already chosen is passed over
+BRAND_ROLES = ("primary", "secondary", "accent")
+MIN_BRAND_DELTA_E = 10.0
+
+DEFAULT_COLORS = {
+    "primary": "#1a202c",
+    "secondary": "#4a5568",
+    "accent": "#3182ce",
+    "background": "#ffffff",
+    "text": "#1a202c",
+}
+
+STOPWORDS = frozenset(
+    """
+    about after also and are based been before being both but can could each event events
+    from have here into just like made more most much must only other our over same should
+    some such than that their them then there these they this those through under very
+    want were what when where which while will with within without would your you yours
+    """.split()
+)
+
+WORD_PATTERN = re.compile(r"[A-Za-z][A-Za-z'-]{3,}")
+
+
+def event_id_from_url(url: str) -> str:
+    """Generate an event_id from a URL (e.g. "example-com" from "https://www.example.com")."""
+    parsed = urlparse(url)
+    hostname = (parsed.hostname or "event").lower()
+    if hostname.startswith("www."):
+        hostname = hostname[4:]
+    parts = [hostname] + [p for p in parsed.path.split("/") if p and "." not in p]
+    return re.sub(r"[^a-z0-9]+", "-", "-".join(parts).lower()).strip("-")
+
+
+def _color_candidates(role: str, scraped: Dict[str, Any]) -> List[str]:
+    """Colors for a role in priority order, with perceptual duplicates dropped."""
+    variables: Dict[str, str] = scraped.get("css_variables") or {}
+    styles: Dict[str, Dict[str, str]] = scraped.get("computed_styles") or {}
+    candidates: List[Optional[str]] = [
+        value
+        for hint in COLOR_ROLE_HINTS[role]
+        for name, value in variables.items()
+        if hint in name.lower()
+    ]
+    candidates.extend(
+        styles.get(element, {}).get(prop) for element, prop in COLOR_ROLE_ELEMENTS[role]
+    )
+    return dedupe_colors(candidates)
+
+
+def pick_palette(scraped: Dict[str, Any]) -> Dict[str, str]:
+    """
+    Choose a color for each palette role from scraper output.
+
+    Each role takes its first candidate, except that secondary and accent
+    skip candidates perceptually close to a brand color already chosen
+    (so a button shared by two roles does not make them the same color)
+    unless every candidate is.
+
+    Args:
+        scraped: Output of PlaywrightStyleExtractorTool or HttpStyleExtractor
+
+    Returns:
+        Mapping of role -> ``#rrggbb``
+    """
+    palette: Dict[str, str] = {}
+    for role in COLOR_ROLE_HINTS:
+        candidates = _color_candidates(role, scraped)
+        chosen = [palette[r] for r in BRAND_ROLES if r in palette]
+        if role in BRAND_ROLES and chosen and len(candidates) > 1:
+            distances = delta_e_matrix(candidates, chosen).min(axis=1)
+            candidates = [
+                c for c, d in zip(candidates, distances) if d >= MIN_BRAND_DELTA_E
+            ] or candidates
+        palette[role] = candidates[0] if candidates else DEFAULT_COLORS[role]
+    return palette
+
+
+def _page_text(soup: "BeautifulSoup") -> str:
+    for node in soup(["script", "style", "noscript"]):
+        node.decompose()
+    return soup.get_text(" ", strip=True)
+
+
+def _event_name(soup: "BeautifulSoup", url: str) -> str:
+    title = soup.title.get_text(strip=True) if soup.title else ""
+    if title:
+        return re.split(r"\s+[|–—-]\s+", title)[0].strip()
+    heading = soup.find("h1")
+    if heading and heading.get_text(strip=True):
+        return heading.get_text(strip=True)
+    return urlparse(url).hostname or url
+
+
+def extract_keywords(text: str, limit: int = 8) -> List[str]:
+    """Pick the most frequent non-stopword terms from page text."""
+    counts = Counter(
+        word.lower() for word in WORD_PATTERN.findall(text) if word.lower() not in STOPWORDS
+    )
+    return [word for word, _ in counts.most_common(limit)]
+
+
+def compile_style_config(scraped: Dict[str, Any], url: Optional[str] = None) -> "EventStyleConfig":
+    """
+    Compile scraper output into an EventStyleConfig without an LLM.
+
+    Colors come from role-named CSS variables first, then from computed
+    styles of key elements; typography from the computed h1/body styles;
+    brand keywords from term frequency. Tone and style cannot be judged
+    by rules, so they default to the compiler task's documented defaults.
+
+    Args:
+        scraped: Output of PlaywrightStyleExtractorTool or HttpStyleExtractor
+        url: Source URL (defaults to ``scraped["url"]``)
+
+    Returns:
+        EventStyleConfig: Validated configuration
+    """
+    from bs4 import BeautifulSoup
+
+    from event_style_scraper.types import (
+        BrandVoice,
+        ColorPalette,
+        EventStyleConfig,
+        LayoutConfig,
+        Typography,
+    )
+
+    url = url or scraped.get("url", "")
+    soup = BeautifulSoup(scraped.get("html") or "", "lxml")
+    styles: Dict[str, Dict[str, str]] = scraped.get("computed_styles") or {}
+    body = styles.get("body", {})
+    heading = styles.get("h1", {})
+    variables: Dict[str, str] = scraped.get("css_variables") or {}
+    assets: Dict[str, Optional[str]] = scraped.get("assets") or {}
+
+    line_height = body.get("lineHeight")
+    if not line_height or line_height == "normal":
+        line_height = "1.6"
+
+    layout = LayoutConfig()
+    for name, value in variables.items():
+        if ("max-width" in name or "container" in name) and value.strip():
+            layout.container_width = value.strip()
+        elif ("radius" in name or "corner" in name) and value.strip():
+            layout.border_radius = value.strip()
+
+    return EventStyleConfig(
+        event_id=event_id_from_url(url),
+        event_name=_event_name(soup, url),
+        source_url=url,
+        colors=ColorPalette(**pick_palette(scraped)),
+        typography=Typography(
+            heading_font=heading.get("fontFamily")
+            or body.get("fontFamily")
+            or "system-ui, sans-serif",
+            body_font=body.get("fontFamily") or "system-ui, sans-serif",
+            heading_size=heading.get("fontSize") or "2rem",
+            body_size=body.get("fontSize") or "1rem",
+            line_height=line_height,
+        ),
+        brand_voice=BrandVoice(
+            tone="professional",
+            keywords=extract_keywords(_page_text(soup)),
+            style="conversational",
+        ),
+        layout=layout,
+        logo_url=assets.get("logo"),
+        favicon_url=assets.get("favicon"),
+        scraped_at=datetime.now(timezone.utc).isoformat(),
+    )
+
+
+def scrape_page(
+    url: str,
+    mode: EngineMode = "deterministic",
+    timeout: int = 60,
+    browser_pool: Optional[Any] = None,
+) -> Dict[str, Any]:
+    """
+    Scrape a URL without compiling it (the first stage of the rule-based engines).
+
+    Args:
+        url: URL of the event website
+        mode: "deterministic" (Playwright) or "http"
+        timeout: Timeout in seconds for scraping operations
+        browser_pool: Optional started BrowserPool for the deterministic
+            mode (default: launch a browser for this scrape)
+
+    Returns:
+        Scraper output as returned by PlaywrightStyleExtractorTool
+
+    Raises:
+        ValueError: If the mode has no separate scrape stage or the URL
+            fails validation
+    """
+    from event_style_scraper.tools import SecurityError, WebScraperTool
+
+    if mode not in ("deterministic", "http"):
+        raise ValueError(f"Engine mode {mode} has no separate scrape stage")
+
+    try:
+        WebScraperTool(timeout=timeout).validate_url(url)
+    except SecurityError as e:
+        raise ValueError(f"Invalid URL: {str(e)}") from e
+
+    if mode == "deterministic":
+        from event_style_scraper.tools import PlaywrightStyleExtractorTool
+
+        tool = PlaywrightStyleExtractorTool(timeout=timeout * 1000, browser_pool=browser_pool)
+        return tool._run(url)
+
+    from event_style_scraper.tools import HttpStyleExtractor
+
+    return HttpStyleExtractor(timeout=timeout).extract(url)
+
+
+def run_engine(
+    url: str,
+    mode: EngineMode = "crew",
+    timeout: int = 60,
+    browser_pool: Optional[Any] = None,
+) -> "EventStyleConfig":
+    """
+    Scrape a URL into an EventStyleConfig with the given engine mode.
+
+    Args:
+        url: URL of the event website
+        mode: "crew", "deterministic" or "http"
+        timeout: Timeout in seconds for scraping operations
+        browser_pool: Optional started BrowserPool for the deterministic
+            mode (default: launch a browser for this scrape)
+
+    Returns:
+        EventStyleConfig: Extracted style configuration
+
+    Raises:
+        ValueError: If the mode is unknown or the URL fails validation
+    """
+    if mode == "crew":
+        from event_style_scraper.flows.style_scraping_flow import StyleScrapingFlow
+
+        return StyleScrapingFlow(url=url, timeout=timeout).start()
+
+    if mode not in ENGINE_MODES:
+        raise ValueError(f"Unknown engine mode: {mode}. Choose from {', '.join(ENGINE_MODES)}")
+
+    return compile_style_config(scrape_page(url, mode, timeout, browser_pool), url)
@@ -0,0 +1,235 @@
+"""Crash-safe export of style configs.
+
+Every file is written to a temporary file in the target directory and
+renamed over the target, so readers (e.g. ``loadStyleConfig`` on the
+Node side) see either the old or the new file, never a truncated one.
+Writers in one output directory are serialized by an ``flock`` on
+``.export.lock``, so concurrent batch workers and processes cannot
+interleave updates of the shared bundle.
+
+Besides the pretty-printed ``<event_id>.json`` an export can write:
+
+- ``<event_id>.min.json``: the same config as compact JSON
+- ``_bundle.json``: every config in the directory keyed by event_id, so
+  a site build loads them all with one read
+- ``css/<event_id>.<hash>.css``: the event's precompiled CSS (see
+  ``event_style_scraper.css``), listed in ``css/manifest.json`` by event_id
+
+Event IDs are slugs, so these names cannot collide with a config file.
+A stylesheet is written before the manifest points at it, and replaced
+ones are deleted afterwards.
+"""
+
+import json
+import os
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Union
+
+from event_style_scraper.css import css_filename, generate_event_css, is_css_for
+from event_style_scraper.types import EventStyleConfig
+
+try:
+    import fcntl
+except ImportError:  # Windows: writers are only serialized within the process
+    fcntl = None  # type: ignore[assignment]
+
+LOCK_NAME = ".export.lock"
+BUNDLE_NAME = "_bundle.json"
+COMPACT_SUFFIX = ".min.json"
+CSS_DIR = "css"
+CSS_MANIFEST_NAME = "manifest.json"
+
+# flock locks an open file, so it also excludes other threads; this lock
+# covers platforms without fcntl
+_thread_lock = threading.Lock()
+
+
+def write_atomic(path: Path, content: Union[str, bytes]) -> Path:
+    """
+    Replace a file's content atomically.
+
+    Args:
+        path: File to write
+        content: Text (written as UTF-8) or bytes to write
+
+    Returns:
+        Path: The written file
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(content.encode("utf-8") if isinstance(content, str) else content)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    finally:
+        if tmp_path.exists():
+            tmp_path.unlink()
+    return path
+
+
+@contextmanager
+def export_lock(output_dir: Path) -> Iterator[None]:
+    """Hold the output directory's export lock."""
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    with _thread_lock, open(output_dir / LOCK_NAME, "a") as f:
+        if fcntl is not None:
+            fcntl.flock(f, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+
+def pretty_json(config: EventStyleConfig) -> str:
+    """A config as exported to ``<event_id>.json``."""
+    return json.dumps(config.model_dump(), indent=2, ensure_ascii=False)
+
+
+def compact_json(value: Any) -> str:
+    """JSON without whitespace."""
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False)
+
+
+def config_paths(directory: Path) -> List[Path]:
+    """Exported ``<event_id>.json`` files in a directory (not compact copies or the bundle)."""
+    return [
+        path
+        for path in sorted(Path(directory).glob("*.json"))
+        if not path.name.endswith(COMPACT_SUFFIX) and not path.name.startswith("_")
+    ]
+
+
+def _read_bundle(path: Path) -> Dict[str, Any]:
+    try:
+        bundle = json.loads(path.read_text(encoding="utf-8"))
+    except (FileNotFoundError, ValueError):
+        return {}
+    return bundle if isinstance(bundle, dict) else {}
+
+
+def _write_bundle(path: Path, configs: Dict[str, Any]) -> Path:
+    return write_atomic(path, compact_json(dict(sorted(configs.items()))))
+
+
+def _write_css(css_dir: Path, config: EventStyleConfig) -> str:
+    stylesheet = generate_event_css(config)
+    filename = css_filename(config.event_id, stylesheet)
+    if not (css_dir / filename).exists():
+        write_atomic(css_dir / filename, stylesheet)
+    return filename
+
+
+def _remove_unlisted_css(
+    css_dir: Path, manifest: Dict[str, str], event_ids: Optional[List[str]] = None
+) -> None:
+    """Delete stylesheets not in the manifest (only those of ``event_ids`` if given)."""
+    listed = set(manifest.values())
+    for path in css_dir.glob("*.css"):
+        if path.name in listed:
+            continue
+        if event_ids is None or any(is_css_for(path.name, event_id) for event_id in event_ids):
+            path.unlink()
+
+
+def export_style_config(
+    config: EventStyleConfig,
+    output_dir: Path,
+    compact: bool = False,
+    bundle: bool = False,
+    css: bool = False,
+) -> Path:
+    """
+    Export a config to ``<output_dir>/<event_id>.json`` atomically.
+
+    Args:
+        config: Config to export
+        output_dir: Directory to write to
+        compact: Also write ``<event_id>.min.json``
+        bundle: Also add the config to ``_bundle.json``
+        css: Also write the hashed stylesheet and list it in ``css/manifest.json``
+
+    Returns:
+        Path: The pretty-printed config file
+    """
+    output_dir = Path(output_dir)
+    output_path = output_dir / f"{config.event_id}.json"
+    with export_lock(output_dir):
+        write_atomic(output_path, pretty_json(config))
+        if compact:
+            write_atomic(
+                output_dir / f"{config.event_id}{COMPACT_SUFFIX}", compact_json(config.model_dump())
+            )
+        if bundle:
+            bundle_path = output_dir / BUNDLE_NAME
+            configs = _read_bundle(bundle_path)
+            configs[config.event_id] = config.model_dump()
+            _write_bundle(bundle_path, configs)
+        if css:
+            css_dir = output_dir / CSS_DIR
+            manifest_path = css_dir / CSS_MANIFEST_NAME
+            manifest = _read_bundle(manifest_path)
+            manifest[config.event_id] = _write_css(css_dir, config)
+            _write_bundle(manifest_path, manifest)
+            _remove_unlisted_css(css_dir, manifest, [config.event_id])
+    return output_path
+
+
+def build_bundle(output_dir: Path) -> Path:
+    """
+    Rebuild ``_bundle.json`` from every config file in a directory.
+
+    Each file is validated, so a bundle never holds an invalid config.
+
+    Args:
+        output_dir: Directory of exported configs
+
+    Returns:
+        Path: The bundle
+
+    Raises:
+        ValidationError: If a config file is invalid
+    """
+    from event_style_scraper.types import validate_configs_json
+
+    output_dir = Path(output_dir)
+    with export_lock(output_dir):
+        paths = config_paths(output_dir)
+        documents = ",".join(path.read_text(encoding="utf-8") for path in paths)
+        configs = {c.event_id: c.model_dump() for c in validate_configs_json(f"[{documents}]")}
+        return _write_bundle(output_dir / BUNDLE_NAME, configs)
+
+
+def build_css(output_dir: Path) -> Path:
+    """
+    Rebuild the hashed stylesheets and ``css/manifest.json`` from every config file.
+
+    Stylesheets of events without a config file are deleted.
+
+    Args:
+        output_dir: Directory of exported configs
+
+    Returns:
+        Path: The manifest
+
+    Raises:
+        ValidationError: If a config file is invalid
+    """
+    from event_style_scraper.types import validate_configs_json
+
+    output_dir = Path(output_dir)
+    css_dir = output_dir / CSS_DIR
+    with export_lock(output_dir):
+        paths = config_paths(output_dir)
+        documents = ",".join(path.read_text(encoding="utf-8") for path in paths)
+        configs = validate_configs_json(f"[{documents}]")
+        manifest = {config.event_id: _write_css(css_dir, config) for config in configs}
+        manifest_path = _write_bundle(css_dir / CSS_MANIFEST_NAME, manifest)
+        _remove_unlisted_css(css_dir, manifest)
+        return manifest_path
@@ -2,7 +2,7 @@
 
 import json
 from pathlib import Path
-from typing import Optional, Literal
+from typing import Any, Optional, Literal
 from pydantic import BaseModel, Field
 
 from event_style_scraper.types import EventStyleConfig
@@ -26,6 +26,32 @@ class StyleScrapingState(BaseModel):
         default=None,
         description="Error message if scraping failed"
     )
+    token_usage: Optional[int] = Field(
+        default=None,
+        description="Total LLM tokens reported by the crew"
+    )
+
+
+def extract_token_count(result: Any) -> Optional[int]:
+    """
+    Get the total token count from a crew result.
+
+    CrewAI reports ``token_usage`` either as a plain integer or as a
+    UsageMetrics object exposing ``total_tokens``.
+
+    Args:
+        result: CrewOutput returned by ``Crew.kickoff()``
+
+    Returns:
+        Total tokens used, or None if the result does not report usage
+    """
+    usage = getattr(result, "token_usage", None)
+    if isinstance(usage, int):
+        return usage
+    total = getattr(usage, "total_tokens", None)
+    if isinstance(total, int):
+        return total
+    return None
 
 
 class StyleScrapingFlow:
@@ -36,19 +62,23 @@ class StyleScrapingFlow:
     extract styles, and export JSON configurations.
     """
 
-    def __init__(self, url: str, timeout: int = 60):
+    def __init__(self, url: str, timeout: int = 60, crew: Optional[Any] = None):
         """
         Initialize StyleScrapingFlow.
 
         Args:
             url: URL of the event website to scrape
             timeout: Maximum time in seconds for scraping operations
+            crew: Optional pre-built Crew from a template StyleExtractionCrew
+                (created without a URL); it is kicked off with this flow's URL
+                instead of building a new crew
 
         Raises:
             ValueError: If URL fails security validation
         """
         self.url = url
         self.timeout = timeout
+        self.crew = crew
         self.output_dir = Path("style-configs")
 
         # Validate URL using security tool
@@ -83,12 +113,21 @@ class StyleScrapingFlow:
             self._state.status = "scraping"
 
             # Initialize and run crew
-            crew_instance = StyleExtractionCrew(url=self.url, timeout=self.timeout)
-            result = crew_instance.crew().kickoff()
+            tokens_before = 0
+            if self.crew is not None:
+                # A reused crew's LLMs keep counting tokens across runs
+                tokens_before = self.crew.calculate_usage_metrics().total_tokens
+                result = self.crew.kickoff(inputs={"url": self.url})
+            else:
+                crew_instance = StyleExtractionCrew(url=self.url, timeout=self.timeout)
+                result = crew_instance.crew().kickoff()
 
             # Log API token usage for cost tracking
-            if hasattr(result, 'token_usage') and result.token_usage:
-                tokens = result.token_usage
+            tokens = extract_token_count(result)
+            if tokens is not None:
+                tokens -= tokens_before
+            if tokens:
+                self._state.token_usage = tokens
                 estimated_cost = tokens * 0.00002  # Rough estimate: $0.02 per 1K tokens
                 print(f"\n💰 API Cost Tracking:")
                 print(f"   Tokens used: {tokens:,}")
@@ -126,30 +165,28 @@ class StyleScrapingFlow:
             self._state.error = str(e)
             raise
 
-    def export_config(self, config: EventStyleConfig) -> Path:
+    def export_config(
+        self,
+        config: EventStyleConfig,
+        compact: bool = False,
+        bundle: bool = False,
+        css: bool = False,
+    ) -> Path:
         """
         Export style configuration to JSON file.
 
+        The file is replaced atomically under the output directory's
+        export lock, so concurrent exports never leave a truncated file.
+
         Args:
             config: EventStyleConfig to export
+            compact: Also write a compact <event_id>.min.json
+            bundle: Also add the config to the directory's _bundle.json
+            css: Also write the hashed stylesheet listed in css/manifest.json
 
         Returns:
             Path: Path to the exported JSON file
         """
-        # Create output directory if it doesn't exist
-        self.output_dir.mkdir(parents=True, exist_ok=True)
-
-        # Generate filename from event_id
-        filename = f"{config.event_id}.json"
-        output_path = self.output_dir / filename
-
-        # Write JSON file with proper formatting
-        with open(output_path, 'w') as f:
-            json.dump(
-                config.model_dump(),
-                f,
-                indent=2,
-                ensure_ascii=False
-            )
-
-        return output_path
+        from event_style_scraper.export import export_style_config
+
+        return export_style_config(config, self.output_dir, compact=compact, bundle=bundle, css=css)
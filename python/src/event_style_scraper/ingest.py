@@ -0,0 +1,259 @@
+"""Streaming ingest of attendee exports (JSONL or CSV).
+
+Registration platforms export whole events as one large file. Instead of
+exploding it into per-attendee JSON files, AttendeeExport reads the file
+record by record, validates each record and yields attendee dicts shaped
+like data/attendees/*.json. Memory stays constant however large the file:
+nothing is kept between records, and every pass re-reads the file.
+
+Attendees are assigned to shards by a stable hash of their id, so
+parallel workers can each read the same export and keep only their share.
+"""
+
+import csv
+import gzip
+import hashlib
+import io
+import json
+import logging
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple, Optional, TextIO, Tuple, Union
+
+from pydantic import BaseModel, Field, ValidationError
+
+logger = logging.getLogger(__name__)
+
+# CSV columns holding nested values, written as JSON in the cell
+JSON_COLUMNS = frozenset({
+    "sessions",
+    "connections",
+    "stats",
+    "callsToAction",
+    "productsExplored",
+    "boothsVisited",
+    "sponsorInteractions",
+})
+
+
+class AttendeeRecord(BaseModel):
+    """Validation schema for one exported attendee."""
+
+    model_config = {"extra": "allow"}
+
+    id: Union[str, int] = Field(..., description="Attendee identifier")
+    eventId: str = Field(..., min_length=1, description="Event the attendee registered for")
+    firstName: str = Field(default="", description="First name")
+    lastName: str = Field(default="", description="Last name")
+    sessions: List[Dict[str, Any]] = Field(default_factory=list, description="Sessions attended")
+    connections: List[Dict[str, Any]] = Field(default_factory=list, description="Connections made")
+
+
+class InvalidRecord(NamedTuple):
+    """An export record that failed validation."""
+
+    line: int
+    error: str
+
+
+class Shard(NamedTuple):
+    """One of ``count`` shards, numbered from 1."""
+
+    # Shadow tuple.index() and tuple.count(), which shards never need
+    index: int  # type: ignore[assignment]
+    count: int  # type: ignore[assignment]
+
+    def __str__(self) -> str:
+        return f"{self.index}/{self.count}"
+
+
+def parse_shard(spec: str) -> Shard:
+    """
+    Parse an ``i/N`` shard spec.
+
+    Args:
+        spec: Shard number and count, e.g. "2/8"
+
+    Returns:
+        Shard: The parsed shard
+
+    Raises:
+        ValueError: If the spec is malformed or out of range
+    """
+    try:
+        index, count = (int(part) for part in spec.split("/"))
+    except ValueError:
+        raise ValueError(f"Invalid shard {spec!r}: expected i/N, e.g. 1/4") from None
+    if not 1 <= index <= count:
+        raise ValueError(f"Invalid shard {spec!r}: i must be between 1 and N")
+    return Shard(index, count)
+
+
+def shard_of(attendee_id: Any, count: int) -> int:
+    """
+    Shard (1 to ``count``) an attendee belongs to.
+
+    Uses a hash of the id that is stable across processes and machines
+    (unlike ``hash()``), so every worker agrees on the assignment.
+    """
+    digest = hashlib.blake2b(str(attendee_id).encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "big") % count + 1
+
+
+def _open_text(path: Path) -> TextIO:
+    if path.suffix == ".gz":
+        return io.TextIOWrapper(gzip.open(path, "rb"), encoding="utf-8", newline="")
+    return open(path, encoding="utf-8", newline="")
+
+
+def _export_format(path: Path) -> str:
+    suffixes = [s for s in path.suffixes if s != ".gz"]
+    suffix = suffixes[-1] if suffixes else ""
+    if suffix in (".jsonl", ".ndjson"):
+        return "jsonl"
+    if suffix == ".csv":
+        return "csv"
+    raise ValueError(
+        f"Unsupported attendee export {path.name}: "
+        "expected .jsonl, .ndjson or .csv (optionally .gz)"
+    )
+
+
+def _csv_record(row: Dict[str, str]) -> Dict[str, Any]:
+    """Attendee dict from a CSV row, decoding JSON cells and dropping empty ones."""
+    record: Dict[str, Any] = {}
+    for column, value in row.items():
+        if column is None or value is None or value == "":
+            continue
+        record[column] = json.loads(value) if column in JSON_COLUMNS else value
+    return record
+
+
+class AttendeeExport:
+    """
+    A JSONL or CSV attendee export, read as a stream.
+
+    Each iteration re-reads the file, so the export can be passed over
+    several times without being held in memory. Invalid records are
+    skipped and reported to ``on_invalid``.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        shard: Optional[Shard] = None,
+        on_invalid: Optional[Callable[[InvalidRecord], None]] = None,
+    ):
+        """
+        Initialize AttendeeExport.
+
+        Args:
+            path: .jsonl/.ndjson or .csv file, optionally gzipped
+            shard: Only yield attendees in this shard
+            on_invalid: Called with each record that fails validation
+
+        Raises:
+            FileNotFoundError: If the export does not exist
+            ValueError: If the file type is not supported
+        """
+        self.path = Path(path)
+        if not self.path.is_file():
+            raise FileNotFoundError(f"Attendee export not found: {self.path}")
+        self.format = _export_format(self.path)
+        self.shard = shard
+        self.on_invalid = on_invalid
+
+    def _raw_records(self, f: TextIO) -> Iterator[Tuple[int, Any]]:
+        """(line number, record or parse error) for each record in the file."""
+        if self.format == "jsonl":
+            for line_number, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    yield line_number, json.loads(line)
+                except ValueError as e:
+                    yield line_number, InvalidRecord(line_number, f"Invalid JSON: {e}")
+        else:
+            reader = csv.DictReader(f)
+            for row in reader:
+                try:
+                    yield reader.line_num, _csv_record(row)
+                except ValueError as e:
+                    yield reader.line_num, InvalidRecord(reader.line_num, f"Invalid JSON cell: {e}")
+
+    def _invalid(self, record: InvalidRecord) -> None:
+        logger.warning("Skipping %s line %d: %s", self.path.name, record.line, record.error)
+        if self.on_invalid is not None:
+            self.on_invalid(record)
+
+    def iter_attendees(self, event_id: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Stream valid attendees, in file order.
+
+        Args:
+            event_id: Only attendees of this event
+
+        Yields:
+            Attendee dicts shaped like data/attendees/*.json
+        """
+        with _open_text(self.path) as f:
+            for line_number, record in self._raw_records(f):
+                if isinstance(record, InvalidRecord):
+                    self._invalid(record)
+                    continue
+                if not isinstance(record, dict):
+                    self._invalid(InvalidRecord(line_number, "Record is not an object"))
+                    continue
+                try:
+                    AttendeeRecord.model_validate(record)
+                except ValidationError as e:
+                    first = e.errors()[0]
+                    field = ".".join(str(part) for part in first["loc"])
+                    self._invalid(InvalidRecord(line_number, f"{field}: {first['msg']}"))
+                    continue
+                if event_id is not None and record["eventId"] != event_id:
+                    continue
+                if (
+                    self.shard is not None
+                    and shard_of(record["id"], self.shard.count) != self.shard.index
+                ):
+                    continue
+                yield record
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        return self.iter_attendees()
+
+
+def split_export(path: Path, output_dir: Path, count: int) -> List[Path]:
+    """
+    Split an export into ``count`` JSONL shard files in one pass.
+
+    Shard files are named ``<stem>.shard-<i>-of-<N>.jsonl`` and contain
+    the attendees ``shard_of`` assigns to them, so workers without access
+    to the whole export can each be given one file.
+
+    Args:
+        path: Attendee export to split
+        output_dir: Directory for the shard files
+        count: Number of shards
+
+    Returns:
+        Paths of the shard files, in shard order
+
+    Raises:
+        ValueError: If count < 1
+    """
+    if count < 1:
+        raise ValueError("Shard count must be at least 1")
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    stem = Path(path).name.split(".")[0]
+    paths = [output_dir / f"{stem}.shard-{i}-of-{count}.jsonl" for i in range(1, count + 1)]
+    files = [open(p, "w", encoding="utf-8") for p in paths]
+    try:
+        for attendee in AttendeeExport(path):
+            shard = shard_of(attendee.get("id"), count)
+            files[shard - 1].write(json.dumps(attendee, separators=(",", ":")) + "\n")
+    finally:
+        for f in files:
+            f.close()
+    return paths
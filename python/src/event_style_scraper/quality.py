@@ -0,0 +1,289 @@
+"""Local quality gates for generated attendee content.
+
+Checks a batch of generated content without an LLM: the 300-word limit
+and the five sections the writing task asks for, brand keyword coverage,
+Flesch reading ease, banned phrases, and that the attendee's name and
+any session or connection counts match their record. Each text is
+reduced to a few counts by precompiled regexes, and the batch's
+thresholds are then evaluated at once as NumPy arrays.
+
+Only content that fails a gate, plus a random audit sample of content
+that passed, needs the LLM quality editor.
+"""
+
+import re
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+from pydantic import BaseModel, Field
+
+from event_style_scraper.types import BrandVoice
+
+# Gate names, in report order
+CHECKS = ("word_limit", "sections", "brand_keywords", "readability", "banned_phrases", "facts")
+
+# The five sections the generate_content task asks for
+SECTIONS = ("greeting", "session_highlights", "networking", "achievements", "call_to_action")
+
+DEFAULT_BANNED_PHRASES = (
+    "as an ai",
+    "language model",
+    "lorem ipsum",
+    "[insert",
+    "placeholder",
+    "in conclusion",
+    "delve into",
+    "rich tapestry",
+    "i hope this message finds you well",
+)
+
+WORD = re.compile(r"[A-Za-z0-9]+(?:['’][A-Za-z]+)*")
+SENTENCE_END = re.compile(r"[.!?]+(?=\s|$)")
+VOWEL_GROUP = re.compile(r"[aeiouy]+", re.IGNORECASE)
+SILENT_E = re.compile(r"[^aeiouy\s]e\b", re.IGNORECASE)
+PLACEHOLDER = re.compile(r"\{[A-Za-z_]+\}")
+COUNT_CLAIM = re.compile(r"\b(\d+)\s+(?:[A-Za-z-]+\s+)?(sessions?|connections?)\b", re.IGNORECASE)
+
+# Cues for each section; the greeting is looked for at the start of the
+# text and the call-to-action at the end
+SECTION_CUES = {
+    "greeting": re.compile(
+        r"\b(hi|hello|hey|dear|welcome|congratulations|thank you|thanks)\b", re.IGNORECASE
+    ),
+    "session_highlights": re.compile(
+        r"\b(sessions?|talks?|keynotes?|workshops?|panels?|tracks?)\b", re.IGNORECASE
+    ),
+    "networking": re.compile(
+        r"\b(connect\w*|network\w*|met|conversations?|peers?)\b", re.IGNORECASE
+    ),
+    "achievements": re.compile(
+        r"\b(achiev\w*|milestones?|recogni\w*|congratulat\w*|standout|impressive"
+        r"|top \d+%?|\d+ (sessions|connections))\b",
+        re.IGNORECASE,
+    ),
+    "call_to_action": re.compile(
+        r"\b(see you|join us|register|stay (in touch|connected)|can['’]t wait|cannot wait"
+        r"|looking forward|next (year|edition|event|time))\b",
+        re.IGNORECASE,
+    ),
+}
+EDGE_CHARS = 300
+
+
+class QualityGates(BaseModel):
+    """Thresholds for the local quality gates and the audit sample."""
+
+    max_words: int = Field(default=300, description="Word limit from the generate_content task")
+    min_keyword_coverage: float = Field(
+        default=0.3, description="Share of brand keywords the content must use (0-1)"
+    )
+    min_readability: float = Field(default=30.0, description="Minimum Flesch reading ease")
+    banned_phrases: List[str] = Field(
+        default_factory=lambda: list(DEFAULT_BANNED_PHRASES),
+        description="Phrases that fail content (case-insensitive)",
+    )
+    audit_rate: float = Field(
+        default=0.05,
+        ge=0.0,
+        le=1.0,
+        description="Share of passing content still sent to the editor",
+    )
+    seed: Optional[int] = Field(default=None, description="Seed for the audit sample")
+
+
+class QualityResult(BaseModel):
+    """Gate outcome for one piece of content."""
+
+    passed: bool = Field(..., description="Whether every gate passed")
+    failed_checks: List[str] = Field(
+        default_factory=list, description="Gates that failed, in CHECKS order"
+    )
+    missing_sections: List[str] = Field(
+        default_factory=list, description="Sections without a cue in the text"
+    )
+    word_count: int = Field(..., description="Words in the content")
+    readability: float = Field(..., description="Flesch reading ease")
+    keyword_coverage: float = Field(
+        ..., description="Share of brand keywords used (1.0 without keywords)"
+    )
+
+
+class QualityGateSummary(BaseModel):
+    """Quality gate outcomes for a content generation run."""
+
+    checked: int = Field(default=0, description="Contents run through the gates")
+    passed: int = Field(default=0, description="Contents that passed every gate")
+    audited: int = Field(
+        default=0, description="Passing contents sent to the editor as an audit sample"
+    )
+    reviewed: int = Field(
+        default=0, description="Contents sent to the LLM editor (failures and audits)"
+    )
+    check_failures: Dict[str, int] = Field(
+        default_factory=lambda: dict.fromkeys(CHECKS, 0), description="Contents failing each gate"
+    )
+
+    @property
+    def pass_rate(self) -> float:
+        """Share of checked contents that passed every gate."""
+        return self.passed / self.checked if self.checked else 0.0
+
+    @property
+    def pass_rates(self) -> Dict[str, float]:
+        """Share of checked contents passing each gate."""
+        if not self.checked:
+            return {check: 0.0 for check in CHECKS}
+        return {
+            check: 1 - failures / self.checked for check, failures in self.check_failures.items()
+        }
+
+    @property
+    def llm_calls_avoided(self) -> int:
+        """Editor calls saved compared with reviewing every content."""
+        return self.checked - self.reviewed
+
+    def add(self, results: Sequence[QualityResult]) -> None:
+        """Count a checked batch."""
+        self.checked += len(results)
+        self.passed += sum(1 for r in results if r.passed)
+        for result in results:
+            for check in result.failed_checks:
+                self.check_failures[check] += 1
+
+
+def _text_counts(text: str) -> Dict[str, int]:
+    """Words, sentences and estimated syllables in a text."""
+    words = WORD.findall(text)
+    syllables = len(VOWEL_GROUP.findall(text)) - len(SILENT_E.findall(text))
+    return {
+        "words": len(words),
+        "sentences": max(len(SENTENCE_END.findall(text)), 1),
+        # Every word has at least one syllable
+        "syllables": max(syllables, len(words)),
+    }
+
+
+def _missing_sections(text: str) -> List[str]:
+    start, end = text[:EDGE_CHARS], text[-EDGE_CHARS:]
+    missing = []
+    for section in SECTIONS:
+        window = start if section == "greeting" else end if section == "call_to_action" else text
+        if not SECTION_CUES[section].search(window):
+            missing.append(section)
+    return missing
+
+
+def _facts_consistent(text: str, attendee: Dict[str, Any]) -> bool:
+    """Whether the attendee's first name is used and stated counts match the record."""
+    first_name = str(attendee.get("firstName") or "").strip()
+    if first_name and not re.search(rf"\b{re.escape(first_name)}\b", text):
+        return False
+    actual = {
+        "session": len(attendee.get("sessions") or []),
+        "connection": len(attendee.get("connections") or []),
+    }
+    for number, noun in COUNT_CLAIM.findall(text):
+        if int(number) != actual[noun.lower().rstrip("s")]:
+            return False
+    return True
+
+
+def check_content(
+    contents: Sequence[str],
+    attendees: Sequence[Dict[str, Any]],
+    brand_voice: BrandVoice,
+    gates: Optional[QualityGates] = None,
+) -> List[QualityResult]:
+    """
+    Run the quality gates over a batch of generated content.
+
+    Args:
+        contents: Generated content, one per attendee
+        attendees: Attendee records the content was generated from, in the same order
+        brand_voice: Event brand voice whose keywords should be used
+        gates: Thresholds (default: QualityGates())
+
+    Returns:
+        One QualityResult per content, in input order
+
+    Raises:
+        ValueError: If contents and attendees differ in length
+    """
+    if len(contents) != len(attendees):
+        raise ValueError("Each content needs the attendee record it was generated from")
+    gates = gates or QualityGates()
+    if not contents:
+        return []
+
+    lowered = [text.lower() for text in contents]
+    counts = [_text_counts(text) for text in contents]
+    words = np.array([c["words"] for c in counts], dtype=np.float64)
+    sentences = np.array([c["sentences"] for c in counts], dtype=np.float64)
+    syllables = np.array([c["syllables"] for c in counts], dtype=np.float64)
+    safe_words = np.maximum(words, 1)
+    readability = 206.835 - 1.015 * (words / sentences) - 84.6 * (syllables / safe_words)
+
+    keywords = [k.lower() for k in brand_voice.keywords if k.strip()]
+    if keywords:
+        used = np.array([[keyword in text for keyword in keywords] for text in lowered], dtype=bool)
+        coverage = used.mean(axis=1)
+    else:
+        coverage = np.ones(len(contents))
+    banned = [p.lower() for p in gates.banned_phrases]
+    missing = [_missing_sections(text) for text in contents]
+
+    passes: np.ndarray = np.column_stack(
+        [
+            words <= gates.max_words,
+            np.array([not m for m in missing], dtype=bool),
+            coverage >= gates.min_keyword_coverage - 1e-9,
+            readability >= gates.min_readability,
+            np.array(
+                [
+                    not any(p in text for p in banned) and not PLACEHOLDER.search(text)
+                    for text in lowered
+                ],
+                dtype=bool,
+            ),
+            np.array(
+                [_facts_consistent(text, a) for text, a in zip(contents, attendees)], dtype=bool
+            ),
+        ]
+    )
+    passed = np.asarray(passes.all(axis=1))
+
+    return [
+        QualityResult(
+            passed=bool(passed[i]),
+            failed_checks=[check for check, ok in zip(CHECKS, passes[i]) if not ok],
+            missing_sections=missing[i],
+            word_count=int(words[i]),
+            readability=round(float(readability[i]), 1),
+            keyword_coverage=round(float(coverage[i]), 3),
+        )
+        for i in range(len(contents))
+    ]
+
+
+def select_for_review(
+    results: Sequence[QualityResult], audit_rate: float, rng: np.random.Generator
+) -> List[bool]:
+    """
+    Which contents go to the LLM editor: every failure plus an audit sample.
+
+    Args:
+        results: Gate results for a batch
+        audit_rate: Share of passing contents to sample (0-1)
+        rng: Random generator for the sample
+
+    Returns:
+        Per content, whether it should be reviewed
+    """
+    passed = np.array([r.passed for r in results], dtype=bool)
+    review = ~passed
+    passing = np.flatnonzero(passed)
+    # Binomial size: small batches are still audited at the expected rate
+    sample_size = int(rng.binomial(len(passing), audit_rate))
+    if sample_size:
+        review[rng.choice(passing, size=sample_size, replace=False)] = True
+    return [bool(flag) for flag in review]
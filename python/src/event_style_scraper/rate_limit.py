@@ -0,0 +1,395 @@
+"""Shared LLM rate limiting and adaptive concurrency.
+
+``install_llm_limits()`` registers one process-wide CrewAI hook, so every
+agent of every crew (StyleExtractionCrew and ContentCreationCrew alike)
+waits on the same RateLimiter before each LLM call. Token buckets can keep
+their state in a file guarded by ``flock`` so several processes share one
+budget. The same hook feeds an AdaptiveConcurrency controller: 429s and
+timeouts shrink the number of crews allowed to run at once, and a streak
+of healthy calls grows it back.
+"""
+
+import json
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Rough size of a token in characters, for estimating prompts before a call
+CHARS_PER_TOKEN = 4
+
+# Longest single sleep while waiting on a bucket, so waits stay responsive
+MAX_SLEEP_SECONDS = 1.0
+
+_THROTTLE_MARKERS = ("429", "rate limit", "ratelimit", "too many requests", "timed out", "timeout")
+
+
+def is_throttle_error(error: Any) -> bool:
+    """
+    Whether an error (exception or message) means the provider is overloaded.
+
+    Rate-limit responses (HTTP 429) and timeouts count; other failures do not.
+    """
+    text = f"{type(error).__name__} {error}" if isinstance(error, BaseException) else str(error)
+    text = text.lower()
+    return any(marker in text for marker in _THROTTLE_MARKERS)
+
+
+def estimate_tokens(messages: Any) -> int:
+    """Estimate the prompt tokens of chat messages from their length."""
+    if isinstance(messages, str):
+        return len(messages) // CHARS_PER_TOKEN
+    total = 0
+    for message in messages or []:
+        content = message.get("content") if isinstance(message, dict) else message
+        total += len(str(content or "")) // CHARS_PER_TOKEN
+    return total
+
+
+class TokenBucket:
+    """
+    Token bucket refilled continuously at ``per_minute``.
+
+    With ``state_path`` the bucket level lives in that file and every
+    update holds an exclusive ``flock`` on it, so all processes using the
+    same path share one budget.
+    """
+
+    def __init__(
+        self, per_minute: float, burst: Optional[float] = None, state_path: Optional[Path] = None
+    ):
+        """
+        Initialize TokenBucket.
+
+        Args:
+            per_minute: Refill rate
+            burst: Bucket capacity (default: one minute's worth)
+            state_path: File holding the shared bucket state
+
+        Raises:
+            ValueError: If the rate is not positive
+        """
+        if per_minute <= 0:
+            raise ValueError("Rate must be positive")
+        self.per_minute = per_minute
+        self.capacity = burst if burst is not None else per_minute
+        self.state_path = Path(state_path) if state_path else None
+        self._lock = threading.Lock()
+        # Wall time is comparable across processes; monotonic is not
+        self._clock = time.time if self.state_path else time.monotonic
+        self._level = self.capacity
+        self._updated = self._clock()
+
+    @contextmanager
+    def _state(self) -> Iterator[Dict[str, float]]:
+        """Lock the bucket and yield its refilled state for updating."""
+        with self._lock:
+            if self.state_path is None:
+                state = {"level": self._level, "updated": self._updated}
+                self._refill(state)
+                yield state
+                self._level, self._updated = state["level"], state["updated"]
+                return
+
+            import fcntl
+
+            self.state_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.state_path, "a+") as f:
+                fcntl.flock(f, fcntl.LOCK_EX)
+                try:
+                    f.seek(0)
+                    raw = f.read()
+                    state = (
+                        json.loads(raw)
+                        if raw
+                        else {"level": self.capacity, "updated": self._clock()}
+                    )
+                    self._refill(state)
+                    yield state
+                    f.seek(0)
+                    f.truncate()
+                    f.write(json.dumps(state))
+                    f.flush()
+                finally:
+                    fcntl.flock(f, fcntl.LOCK_UN)
+
+    def _refill(self, state: Dict[str, float]) -> None:
+        now = self._clock()
+        elapsed = max(0.0, now - state["updated"])
+        state["level"] = min(self.capacity, state["level"] + elapsed * self.per_minute / 60)
+        state["updated"] = now
+
+    @property
+    def level(self) -> float:
+        """Tokens currently available (negative after an overdraft)."""
+        with self._state() as state:
+            return state["level"]
+
+    def acquire(self, amount: float = 1.0, timeout: Optional[float] = None) -> float:
+        """
+        Take ``amount`` tokens, waiting for the bucket to refill if needed.
+
+        Amounts larger than the capacity are granted once the bucket is
+        full, leaving it overdrawn.
+
+        Args:
+            amount: Tokens to take
+            timeout: Seconds to wait at most (None waits as long as needed)
+
+        Returns:
+            float: Seconds spent waiting
+
+        Raises:
+            TimeoutError: If the tokens were not available within the timeout
+        """
+        start = time.monotonic()
+        needed = min(amount, self.capacity)
+        while True:
+            with self._state() as state:
+                if state["level"] >= needed:
+                    state["level"] -= amount
+                    return time.monotonic() - start
+                wait = (needed - state["level"]) * 60 / self.per_minute
+            if timeout is not None and time.monotonic() - start + wait > timeout:
+                raise TimeoutError(f"Rate limit: {amount:g} tokens not available within {timeout}s")
+            time.sleep(min(wait, MAX_SLEEP_SECONDS))
+
+    def debit(self, amount: float) -> None:
+        """Take tokens without waiting; the bucket may go negative."""
+        with self._state() as state:
+            state["level"] -= amount
+
+
+class RateLimiter:
+    """Request and token budgets for LLM calls, both per minute."""
+
+    def __init__(
+        self,
+        requests_per_minute: Optional[float] = None,
+        tokens_per_minute: Optional[float] = None,
+        state_dir: Optional[Path] = None,
+    ):
+        """
+        Initialize RateLimiter.
+
+        Args:
+            requests_per_minute: LLM calls allowed per minute (None: unlimited)
+            tokens_per_minute: LLM tokens allowed per minute (None: unlimited)
+            state_dir: Directory for bucket files shared between processes
+        """
+        state_dir = Path(state_dir) if state_dir else None
+        self.requests = (
+            TokenBucket(
+                requests_per_minute, state_path=state_dir / "requests.bucket" if state_dir else None
+            )
+            if requests_per_minute
+            else None
+        )
+        self.tokens = (
+            TokenBucket(
+                tokens_per_minute, state_path=state_dir / "tokens.bucket" if state_dir else None
+            )
+            if tokens_per_minute
+            else None
+        )
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.waited_seconds = 0.0
+
+    def acquire(self, estimated_tokens: int = 0) -> float:
+        """
+        Wait until one request and the estimated prompt tokens fit the budgets.
+
+        Args:
+            estimated_tokens: Expected prompt tokens of the call
+
+        Returns:
+            float: Seconds spent waiting
+        """
+        waited = 0.0
+        if self.requests is not None:
+            waited += self.requests.acquire(1)
+        if self.tokens is not None and estimated_tokens > 0:
+            waited += self.tokens.acquire(estimated_tokens)
+        with self._lock:
+            self.calls += 1
+            self.waited_seconds += waited
+        return waited
+
+    def record_tokens(self, tokens: int) -> None:
+        """Charge tokens known only after a call (e.g. its completion)."""
+        if self.tokens is not None and tokens > 0:
+            self.tokens.debit(tokens)
+
+
+class AdaptiveConcurrency:
+    """
+    Concurrency limit that backs off under throttling (AIMD).
+
+    Each throttle signal (429 or timeout) halves the limit, at most once
+    per ``cooldown_seconds`` so one burst of errors counts once. Every
+    ``increase_after`` consecutive successes raise it by one, up to
+    ``maximum``. Work runs inside ``slot()``.
+    """
+
+    def __init__(
+        self,
+        maximum: int,
+        minimum: int = 1,
+        initial: Optional[int] = None,
+        increase_after: int = 10,
+        cooldown_seconds: float = 10.0,
+    ):
+        """
+        Initialize AdaptiveConcurrency.
+
+        Args:
+            maximum: Highest limit
+            minimum: Lowest limit
+            initial: Starting limit (default: maximum)
+            increase_after: Consecutive successes before growing by one
+            cooldown_seconds: Minimum time between two decreases
+
+        Raises:
+            ValueError: If the bounds are inconsistent
+        """
+        if not 1 <= minimum <= maximum:
+            raise ValueError("Concurrency bounds must satisfy 1 <= minimum <= maximum")
+        self.maximum = maximum
+        self.minimum = minimum
+        self.increase_after = increase_after
+        self.cooldown_seconds = cooldown_seconds
+        self._limit = max(minimum, min(maximum, initial if initial is not None else maximum))
+        self._active = 0
+        self._successes = 0
+        self._last_decrease = float("-inf")
+        self._condition = threading.Condition()
+        self.history: List[Tuple[float, int]] = [(time.monotonic(), self._limit)]
+
+    @property
+    def limit(self) -> int:
+        """Current number of slots."""
+        return self._limit
+
+    @property
+    def active(self) -> int:
+        """Slots in use."""
+        return self._active
+
+    @contextmanager
+    def slot(self) -> Iterator[None]:
+        """
+        Hold one slot for the duration of the block, waiting for a free one.
+
+        Throttle errors raised from the block are recorded before they
+        propagate.
+        """
+        with self._condition:
+            while self._active >= self._limit:
+                self._condition.wait()
+            self._active += 1
+        try:
+            yield
+        except Exception as e:
+            if is_throttle_error(e):
+                self.record_throttle()
+            raise
+        finally:
+            with self._condition:
+                self._active -= 1
+                self._condition.notify_all()
+
+    def _set_limit(self, limit: int) -> None:
+        self._limit = limit
+        self.history.append((time.monotonic(), limit))
+        self._condition.notify_all()
+
+    def record_success(self) -> None:
+        """Count a healthy call; grow the limit after enough in a row."""
+        with self._condition:
+            self._successes += 1
+            if self._successes >= self.increase_after and self._limit < self.maximum:
+                self._successes = 0
+                self._set_limit(self._limit + 1)
+                logger.info("Concurrency raised to %d", self._limit)
+
+    def record_throttle(self) -> None:
+        """Count a 429 or timeout; halve the limit unless recently decreased."""
+        with self._condition:
+            self._successes = 0
+            now = time.monotonic()
+            if now - self._last_decrease < self.cooldown_seconds or self._limit <= self.minimum:
+                return
+            self._last_decrease = now
+            self._set_limit(max(self.minimum, self._limit // 2))
+            logger.warning("LLM throttled; concurrency lowered to %d", self._limit)
+
+
+_installed: Optional[Tuple[Any, ...]] = None
+_install_lock = threading.Lock()
+
+
+def install_llm_limits(
+    limiter: Optional[RateLimiter] = None,
+    controller: Optional[AdaptiveConcurrency] = None,
+) -> None:
+    """
+    Route every CrewAI agent LLM call in this process through the limits.
+
+    Replaces limits installed earlier. Must be called before crews are
+    kicked off; agents pick up hooks when their tasks start.
+
+    Args:
+        limiter: Budgets each call waits on
+        controller: Receives success and throttle signals from each call
+    """
+    from crewai.events import LLMCallCompletedEvent, LLMCallFailedEvent, crewai_event_bus
+    from crewai.hooks import register_before_llm_call_hook
+
+    uninstall_llm_limits()
+
+    def before_llm_call(context: Any) -> None:
+        if limiter is not None:
+            limiter.acquire(estimate_tokens(context.messages))
+        return None
+
+    def on_completed(source: Any, event: Any) -> None:
+        if limiter is not None:
+            usage = event.usage or {}
+            completion_tokens = usage.get("completion_tokens")
+            if completion_tokens is None:
+                completion_tokens = estimate_tokens(str(event.response or ""))
+            limiter.record_tokens(int(completion_tokens))
+        if controller is not None:
+            controller.record_success()
+
+    def on_failed(source: Any, event: Any) -> None:
+        if controller is not None and is_throttle_error(event.error):
+            controller.record_throttle()
+
+    global _installed
+    with _install_lock:
+        register_before_llm_call_hook(before_llm_call)
+        crewai_event_bus.on(LLMCallCompletedEvent)(on_completed)
+        crewai_event_bus.on(LLMCallFailedEvent)(on_failed)
+        _installed = (before_llm_call, on_completed, on_failed)
+
+
+def uninstall_llm_limits() -> None:
+    """Remove limits installed by ``install_llm_limits()``."""
+    global _installed
+    with _install_lock:
+        if _installed is None:
+            return
+        from crewai.events import LLMCallCompletedEvent, LLMCallFailedEvent, crewai_event_bus
+        from crewai.hooks import unregister_before_llm_call_hook
+
+        before_llm_call, on_completed, on_failed = _installed
+        unregister_before_llm_call_hook(before_llm_call)
+        crewai_event_bus.off(LLMCallCompletedEvent, on_completed)
+        crewai_event_bus.off(LLMCallFailedEvent, on_failed)
+        _installed = None
@@ -0,0 +1,279 @@
+"""Indexed in-memory repository of events, sessions and attendees.
+
+Attendee files embed full session objects (title, description, speakers),
+so the same session is repeated in every attendee who attended it. The
+repository keeps one copy of each distinct session and stores attendees
+as compact records that refer to sessions by index. Full attendee dicts,
+identical to the files on disk, are materialized only when asked for.
+
+Sessions come from ``sessions/<event_id>-sessions.json`` where available
+and otherwise from the attendee files. Sessions are keyed by event and
+session id; if attendee files disagree about a session with the same id,
+each distinct version is kept so materialization stays lossless, and
+lookups by id return the first one (the sessions file's, if any).
+"""
+
+import copy
+import json
+import sys
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+from event_style_scraper.analytics import speaker_name
+
+
+def _intern_strings(value: Any) -> Any:
+    """Intern every string in a JSON value, so repeated names share memory."""
+    if isinstance(value, str):
+        return sys.intern(value)
+    if isinstance(value, dict):
+        return {sys.intern(k): _intern_strings(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_intern_strings(v) for v in value]
+    return value
+
+
+class AttendeeRepository:
+    """
+    Events, sessions and attendees loaded once and indexed for lookup.
+
+    Sessions are looked up by event, track and speaker; attendees by
+    event and by the sessions, tracks or speakers they attended.
+    Session dicts returned by lookups are shared and must not be
+    modified; ``attendee()`` and ``iter_attendees()`` return fresh copies.
+    """
+
+    def __init__(
+        self,
+        attendees_dir: Path,
+        sessions_dir: Optional[Path] = None,
+        events_dir: Optional[Path] = None,
+    ):
+        """
+        Load and index a data directory.
+
+        Args:
+            attendees_dir: Directory of <attendee_id>.json files
+            sessions_dir: Directory of <event_id>-sessions.json files
+                (default: ``sessions`` next to attendees_dir, if present)
+            events_dir: Directory of <event_id>.json files
+                (default: ``events`` next to attendees_dir, if present)
+
+        Raises:
+            FileNotFoundError: If the attendees directory does not exist
+        """
+        attendees_dir = Path(attendees_dir)
+        if not attendees_dir.is_dir():
+            raise FileNotFoundError(f"Attendees directory not found: {attendees_dir}")
+        sessions_dir = Path(sessions_dir) if sessions_dir else attendees_dir.parent / "sessions"
+        events_dir = Path(events_dir) if events_dir else attendees_dir.parent / "events"
+
+        self._events: Dict[str, Dict[str, Any]] = {}
+        # Distinct session versions, and their identity for deduplication
+        self._sessions: List[Dict[str, Any]] = []
+        self._session_keys: Dict[Tuple[str, str], int] = {}
+        self._session_event: List[str] = []
+        # (event_id, session_id) -> versions, first is canonical
+        self._session_versions: Dict[Tuple[str, str], List[int]] = {}
+        self._sessions_by_event: Dict[str, List[int]] = {}
+        self._sessions_by_track: Dict[str, List[int]] = {}
+        self._sessions_by_speaker: Dict[str, List[int]] = {}
+        # Attendee records with "sessions" replaced by a tuple of indices
+        self._attendees: List[Dict[str, Any]] = []
+        self._attendee_index: Dict[str, int] = {}
+        self._attendees_by_event: Dict[str, List[int]] = {}
+        self._attendees_by_session: Dict[int, List[int]] = {}
+
+        if events_dir.is_dir():
+            for path in sorted(events_dir.glob("*.json")):
+                event = json.loads(path.read_text())
+                self._events[event.get("id", path.stem)] = _intern_strings(event)
+        if sessions_dir.is_dir():
+            for path in sorted(sessions_dir.glob("*-sessions.json")):
+                event_id = path.name[: -len("-sessions.json")]
+                for session in json.loads(path.read_text()).get("sessions", []):
+                    self._intern_session(event_id, session)
+        for path in sorted(attendees_dir.glob("*.json")):
+            self._add_attendee(json.loads(path.read_text()))
+
+    def _intern_session(self, event_id: str, session: Dict[str, Any]) -> int:
+        """Index of a session version, adding it if it is new."""
+        key = (event_id, json.dumps(session, sort_keys=True, separators=(",", ":")))
+        index = self._session_keys.get(key)
+        if index is not None:
+            return index
+        index = len(self._sessions)
+        session = _intern_strings(session)
+        self._sessions.append(session)
+        self._session_keys[key] = index
+        self._session_event.append(event_id)
+        self._session_versions.setdefault((event_id, str(session.get("id", ""))), []).append(index)
+        self._sessions_by_event.setdefault(event_id, []).append(index)
+        self._sessions_by_track.setdefault(session.get("track") or "General", []).append(index)
+        for speaker in {speaker_name(s) for s in session.get("speakers") or []}:
+            self._sessions_by_speaker.setdefault(speaker, []).append(index)
+        return index
+
+    def _add_attendee(self, attendee: Dict[str, Any]) -> None:
+        event_id = attendee.get("eventId", "")
+        position = len(self._attendees)
+        record = {}
+        for key, value in attendee.items():
+            if key == "sessions":
+                indices = tuple(self._intern_session(event_id, s) for s in value or [])
+                for index in dict.fromkeys(indices):
+                    self._attendees_by_session.setdefault(index, []).append(position)
+                record[key] = indices
+            else:
+                record[sys.intern(key)] = _intern_strings(value)
+        self._attendees.append(record)
+        self._attendee_index[str(attendee.get("id", ""))] = position
+        self._attendees_by_event.setdefault(event_id, []).append(position)
+
+    def __len__(self) -> int:
+        """Number of attendees."""
+        return len(self._attendees)
+
+    def __contains__(self, attendee_id: object) -> bool:
+        """Whether an attendee is in the repository."""
+        return attendee_id in self._attendee_index
+
+    @property
+    def session_count(self) -> int:
+        """Number of distinct sessions (all versions) held."""
+        return len(self._sessions)
+
+    def event_ids(self) -> List[str]:
+        """Events with a definition or at least one attendee, sorted."""
+        return sorted(set(self._events) | set(self._attendees_by_event))
+
+    def event(self, event_id: str) -> Optional[Dict[str, Any]]:
+        """An event's definition from events/<event_id>.json, if loaded."""
+        return self._events.get(event_id)
+
+    def session(self, event_id: str, session_id: str) -> Optional[Dict[str, Any]]:
+        """An event's session by id (the sessions file's version, if any)."""
+        versions = self._session_versions.get((event_id, session_id))
+        return self._sessions[versions[0]] if versions else None
+
+    def sessions(
+        self,
+        event_id: Optional[str] = None,
+        track: Optional[str] = None,
+        speaker: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Sessions matching every given filter, in load order.
+
+        Args:
+            event_id: Only sessions of this event
+            track: Only sessions in this track
+            speaker: Only sessions with this speaker (name, without title)
+
+        Returns:
+            Shared session dicts, one per distinct version
+        """
+        return [self._sessions[i] for i in self._session_indices(event_id, track, speaker)]
+
+    def _session_indices(
+        self, event_id: Optional[str], track: Optional[str], speaker: Optional[str]
+    ) -> List[int]:
+        matches = [
+            index.get(value, [])
+            for value, index in (
+                (event_id, self._sessions_by_event),
+                (track, self._sessions_by_track),
+                (speaker, self._sessions_by_speaker),
+            )
+            if value is not None
+        ]
+        if not matches:
+            return list(range(len(self._sessions)))
+        return sorted(set(matches[0]).intersection(*matches[1:]))
+
+    def attendee_ids(
+        self,
+        event_id: Optional[str] = None,
+        session_id: Optional[str] = None,
+        track: Optional[str] = None,
+        speaker: Optional[str] = None,
+    ) -> List[str]:
+        """
+        Attendees matching every given filter, in file order.
+
+        Args:
+            event_id: Only attendees of this event
+            session_id: Only attendees of this session (requires event_id)
+            track: Only attendees of a session in this track
+            speaker: Only attendees of a session with this speaker
+
+        Returns:
+            Attendee ids
+
+        Raises:
+            ValueError: If session_id is given without event_id
+        """
+        if session_id is None and track is None and speaker is None:
+            positions = (
+                self._attendees_by_event.get(event_id, []) if event_id is not None
+                else range(len(self._attendees))
+            )
+        else:
+            sessions: Set[int]
+            if session_id is not None:
+                if event_id is None:
+                    raise ValueError("session_id lookups need an event_id")
+                sessions = set(self._session_versions.get((event_id, session_id), []))
+                if track is not None or speaker is not None:
+                    sessions &= set(self._session_indices(event_id, track, speaker))
+            else:
+                sessions = set(self._session_indices(event_id, track, speaker))
+            matched: Set[int] = set()
+            for index in sessions:
+                matched.update(self._attendees_by_session.get(index, []))
+            positions = sorted(matched)
+        return [str(self._attendees[p].get("id", "")) for p in positions]
+
+    def _materialize(self, position: int) -> Dict[str, Any]:
+        record = self._attendees[position]
+        return {
+            key: (
+                [copy.deepcopy(self._sessions[i]) for i in value]
+                if key == "sessions"
+                else copy.deepcopy(value)
+            )
+            for key, value in record.items()
+        }
+
+    def attendee(self, attendee_id: str) -> Dict[str, Any]:
+        """
+        Materialize one attendee as a full dict, as in its JSON file.
+
+        Args:
+            attendee_id: Attendee identifier
+
+        Returns:
+            A fresh attendee dict with embedded sessions
+
+        Raises:
+            KeyError: If the attendee is unknown
+        """
+        return self._materialize(self._attendee_index[attendee_id])
+
+    def iter_attendees(self, event_id: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Materialize attendees one at a time, in file order.
+
+        Args:
+            event_id: Only attendees of this event
+
+        Yields:
+            Fresh attendee dicts with embedded sessions
+        """
+        positions = (
+            self._attendees_by_event.get(event_id, [])
+            if event_id is not None
+            else range(len(self._attendees))
+        )
+        for position in positions:
+            yield self._materialize(position)
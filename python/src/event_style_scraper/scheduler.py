@@ -0,0 +1,449 @@
+"""Staleness-aware re-scrape scheduling for the event catalog.
+
+Each event in ``config/events.json`` gets a priority from how old its
+style config is, how soon the event takes place, how often past
+re-scrapes found changed styles, and how many scrapes have failed since
+the last success. Failing events are backed off exponentially. A run
+scrapes only the highest-priority due events that fit its time and
+token budget, estimated from each event's recorded scrape cost.
+"""
+
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from pydantic import BaseModel, Field
+
+from event_style_scraper.engines import ENGINE_MODES, EngineMode, event_id_from_url
+from event_style_scraper.store import EventStats, StyleStore
+from event_style_scraper.types import EventStyleConfig
+
+# Priority multiplier for events that ended more than PAST_EVENT_GRACE_DAYS ago
+PAST_EVENT_FACTOR = 0.25
+PAST_EVENT_GRACE_DAYS = 7
+
+
+class CatalogEvent(BaseModel):
+    """An event of the scraping catalog."""
+
+    id: str = Field(..., description="Event identifier")
+    name: str = Field(default="", description="Event display name")
+    website: str = Field(..., description="URL of the event website")
+    enabled: bool = Field(default=True, description="Whether the event should be scraped")
+    timeout: int = Field(default=60, description="Timeout in seconds for scraping the site")
+    start_date: Optional[str] = Field(default=None, description="ISO 8601 event start")
+    end_date: Optional[str] = Field(default=None, description="ISO 8601 event end")
+
+
+class SchedulePolicy(BaseModel):
+    """How staleness, event dates, drift and failures become a priority."""
+
+    max_age_days: float = Field(
+        default=30.0, description="Config age at which the age score reaches 1"
+    )
+    min_age_days: float = Field(
+        default=1.0, description="Configs younger than this are not re-scraped"
+    )
+    horizon_days: float = Field(
+        default=60.0, description="Events starting within this many days gain priority"
+    )
+    backoff_hours: float = Field(
+        default=6.0, description="Wait after the first failure, doubled per failure"
+    )
+    max_backoff_days: float = Field(default=7.0, description="Longest wait after failures")
+    default_seconds: float = Field(
+        default=60.0, description="Scrape time assumed without recorded scrapes"
+    )
+    default_tokens: int = Field(
+        default=20000, description="Crew tokens assumed without recorded scrapes"
+    )
+
+
+class ScheduledEvent(BaseModel):
+    """An event's place in the re-scrape queue."""
+
+    event_id: str = Field(..., description="Event identifier")
+    url: str = Field(..., description="URL of the event website")
+    timeout: int = Field(..., description="Timeout in seconds for the scrape")
+    priority: float = Field(..., description="Higher is scraped first")
+    due: bool = Field(..., description="Whether the event may be scraped now")
+    reason: str = Field(..., description="Why the event is due, or why not")
+    age_days: Optional[float] = Field(
+        default=None, description="Age of the current config (None if never scraped)"
+    )
+    days_until_event: Optional[float] = Field(
+        default=None, description="Days until the event starts"
+    )
+    drift_rate: float = Field(
+        default=0.0, description="Share of past re-scrapes that found changes"
+    )
+    failures: int = Field(default=0, description="Failed scrapes since the last success")
+    estimated_seconds: float = Field(..., description="Expected scrape time")
+    estimated_tokens: int = Field(default=0, description="Expected LLM tokens")
+
+
+class ScheduleResult(BaseModel):
+    """Outcome of one scheduled event in a run."""
+
+    event_id: str = Field(..., description="Event identifier")
+    status: str = Field(..., description="completed, failed or deferred (budget exhausted)")
+    seconds: float = Field(default=0.0, description="Time the scrape took")
+    tokens: int = Field(default=0, description="LLM tokens the scrape used")
+    output_path: Optional[str] = Field(default=None, description="Exported config file")
+    error: Optional[str] = Field(default=None, description="Error message if the scrape failed")
+
+
+class ScheduleReport(BaseModel):
+    """Outcome of a scheduled run."""
+
+    results: List[ScheduleResult] = Field(
+        default_factory=list, description="One result per selected event"
+    )
+    elapsed_seconds: float = Field(default=0.0, description="Wall-clock time of the run")
+
+    @property
+    def tokens(self) -> int:
+        """LLM tokens used by the run."""
+        return sum(r.tokens for r in self.results)
+
+    def count(self, status: str) -> int:
+        """Number of events with a status."""
+        return sum(1 for r in self.results if r.status == status)
+
+
+def _parse_time(value: Optional[str]) -> Optional[datetime]:
+    if not value:
+        return None
+    try:
+        moment = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    return moment if moment.tzinfo else moment.replace(tzinfo=timezone.utc)
+
+
+def load_catalog(path: Path, events_dir: Optional[Path] = None) -> List[CatalogEvent]:
+    """
+    Read the scraping catalog.
+
+    Args:
+        path: Catalog JSON file (a list of events with id, name, website and scraping settings)
+        events_dir: Directory of <event_id>.json event files whose
+            startDate/endDate fill in dates the catalog does not give
+
+    Returns:
+        Catalog events in file order
+
+    Raises:
+        FileNotFoundError: If the catalog does not exist
+        ValueError: If the catalog is not a list of events
+    """
+    entries = json.loads(Path(path).read_text(encoding="utf-8"))
+    if not isinstance(entries, list):
+        raise ValueError(f"Catalog {path} must be a JSON list of events")
+    events = []
+    for entry in entries:
+        scraping = entry.get("scraping") or {}
+        dates = {"start_date": entry.get("startDate"), "end_date": entry.get("endDate")}
+        event_file = Path(events_dir) / f"{entry.get('id')}.json" if events_dir else None
+        if event_file is not None and event_file.exists():
+            details = json.loads(event_file.read_text(encoding="utf-8"))
+            dates = {
+                "start_date": dates["start_date"] or details.get("startDate"),
+                "end_date": dates["end_date"] or details.get("endDate"),
+            }
+        events.append(
+            CatalogEvent(
+                id=entry.get("id"),
+                name=entry.get("name", ""),
+                website=entry.get("website"),
+                enabled=scraping.get("enabled", True),
+                timeout=scraping.get("timeout", 60),
+                **dates,
+            )
+        )
+    return events
+
+
+def _config_scraped_at(configs_dir: Path, event: CatalogEvent) -> Optional[datetime]:
+    """Scrape time of the event's exported config (by catalog id, then by URL-derived id)."""
+    for event_id in (event.id, event_id_from_url(event.website)):
+        path = configs_dir / f"{event_id}.json"
+        if path.exists():
+            try:
+                return _parse_time(json.loads(path.read_text(encoding="utf-8")).get("scraped_at"))
+            except (ValueError, AttributeError):
+                return None
+    return None
+
+
+def _backoff(policy: SchedulePolicy, failures: int) -> timedelta:
+    hours = policy.backoff_hours * 2 ** (failures - 1)
+    return min(timedelta(hours=hours), timedelta(days=policy.max_backoff_days))
+
+
+def build_schedule(
+    catalog: Sequence[CatalogEvent],
+    configs_dir: Path,
+    store: Optional[StyleStore] = None,
+    policy: Optional[SchedulePolicy] = None,
+    engine: EngineMode = "crew",
+    now: Optional[datetime] = None,
+) -> List[ScheduledEvent]:
+    """
+    Prioritize the catalog for re-scraping.
+
+    The priority adds an age score (config age / max_age_days, capped at
+    2, and 2 for events never scraped), an event-date score (rising from
+    0 to 1 as the start approaches within horizon_days, 1 while the event
+    runs) and the drift rate. Events long past are scaled down by
+    PAST_EVENT_FACTOR, and the total is divided by 1 + the failure streak.
+
+    Args:
+        catalog: Catalog events
+        configs_dir: Directory of exported configs
+        store: History store with scrape times, drift and failures
+        policy: Scoring settings (default: SchedulePolicy())
+        engine: Engine mode the run will use (only crew spends tokens)
+        now: Reference time (default: now)
+
+    Returns:
+        Due events by descending priority, then events that are not due
+    """
+    policy = policy or SchedulePolicy()
+    now = now or datetime.now(timezone.utc)
+    stats: Dict[str, EventStats] = store.event_stats() if store is not None else {}
+
+    schedule = []
+    for event in catalog:
+        event_stats = stats.get(event.id) or EventStats(event_id=event.id)
+        scraped_times = [
+            t
+            for t in (
+                _parse_time(event_stats.last_scraped_at),
+                _config_scraped_at(configs_dir, event),
+            )
+            if t
+        ]
+        last_scraped = max(scraped_times) if scraped_times else None
+        age_days = (now - last_scraped).total_seconds() / 86400 if last_scraped else None
+
+        start, end = _parse_time(event.start_date), _parse_time(event.end_date)
+        days_until = (start - now).total_seconds() / 86400 if start else None
+        last_day = end or start
+        days_since_end = (now - last_day).total_seconds() / 86400 if last_day else None
+
+        age_score = 2.0 if age_days is None else min(age_days / policy.max_age_days, 2.0)
+        date_score = 0.0
+        if days_until is not None:
+            if 0 <= days_until <= policy.horizon_days:
+                date_score = 1 - days_until / policy.horizon_days
+            elif days_until < 0 and days_since_end is not None and days_since_end <= 0:
+                date_score = 1.0
+        priority = age_score + date_score + event_stats.drift_rate
+        past = days_since_end is not None and days_since_end > PAST_EVENT_GRACE_DAYS
+        if past:
+            priority *= PAST_EVENT_FACTOR
+        priority /= 1 + event_stats.failure_streak
+
+        due, reason = True, (
+            "never scraped" if age_days is None else f"config {age_days:.1f} days old"
+        )
+        last_failure = _parse_time(event_stats.last_failure_at)
+        if not event.enabled:
+            due, reason = False, "scraping disabled"
+        elif (
+            event_stats.failure_streak
+            and last_failure
+            and now < last_failure + _backoff(policy, event_stats.failure_streak)
+        ):
+            retry_at = last_failure + _backoff(policy, event_stats.failure_streak)
+            due, reason = (
+                False,
+                f"backing off after {event_stats.failure_streak} failure(s) "
+                f"until {retry_at.isoformat()}",
+            )
+        elif age_days is not None and age_days < policy.min_age_days:
+            due, reason = False, f"scraped {age_days * 24:.1f} hours ago"
+        elif date_score and days_until is not None:
+            reason += f", event in {max(days_until, 0):.0f} days"
+        elif past:
+            reason += ", event is over"
+
+        tokens = (
+            event_stats.mean_tokens
+            if event_stats.mean_tokens is not None
+            else policy.default_tokens
+        )
+        schedule.append(
+            ScheduledEvent(
+                event_id=event.id,
+                url=event.website,
+                timeout=event.timeout,
+                priority=round(priority, 3),
+                due=due,
+                reason=reason,
+                age_days=round(age_days, 2) if age_days is not None else None,
+                days_until_event=round(days_until, 1) if days_until is not None else None,
+                drift_rate=round(event_stats.drift_rate, 3),
+                failures=event_stats.failure_streak,
+                estimated_seconds=event_stats.mean_seconds or policy.default_seconds,
+                estimated_tokens=int(tokens) if engine == "crew" else 0,
+            )
+        )
+    schedule.sort(key=lambda e: (not e.due, -e.priority, e.event_id))
+    return schedule
+
+
+def select_events(
+    schedule: Sequence[ScheduledEvent],
+    limit: Optional[int] = None,
+    max_seconds: Optional[float] = None,
+    max_tokens: Optional[int] = None,
+    concurrency: int = 1,
+) -> List[ScheduledEvent]:
+    """
+    The top due events whose estimated cost fits the budget.
+
+    Events are taken in priority order; one that would overrun the budget
+    is skipped in favour of cheaper ones after it.
+
+    Args:
+        schedule: Output of build_schedule
+        limit: Most events to select (default: no limit)
+        max_seconds: Wall-clock budget (default: unlimited)
+        max_tokens: LLM token budget (default: unlimited)
+        concurrency: Events scraped at once, dividing the time estimate
+
+    Returns:
+        Selected events in priority order
+    """
+    selected: List[ScheduledEvent] = []
+    seconds = tokens = 0.0
+    for event in schedule:
+        if not event.due or (limit is not None and len(selected) >= limit):
+            continue
+        event_seconds = event.estimated_seconds / max(1, concurrency)
+        if max_seconds is not None and seconds + event_seconds > max_seconds:
+            continue
+        if max_tokens is not None and tokens + event.estimated_tokens > max_tokens:
+            continue
+        selected.append(event)
+        seconds += event_seconds
+        tokens += event.estimated_tokens
+    return selected
+
+
+def scrape_event(url: str, engine: EngineMode, timeout: int) -> Tuple[EventStyleConfig, int]:
+    """Scrape a site with an engine mode, returning the config and the LLM tokens used."""
+    if engine == "crew":
+        from event_style_scraper.flows.style_scraping_flow import StyleScrapingFlow
+
+        flow = StyleScrapingFlow(url=url, timeout=timeout)
+        config = flow.start()
+        return config, flow.get_state().token_usage or 0
+
+    from event_style_scraper.engines import run_engine
+
+    return run_engine(url, engine, timeout), 0
+
+
+def run_schedule(
+    selected: Sequence[ScheduledEvent],
+    output_dir: Path,
+    store: Optional[StyleStore] = None,
+    engine: EngineMode = "crew",
+    concurrency: int = 1,
+    max_seconds: Optional[float] = None,
+    max_tokens: Optional[int] = None,
+    scrape: Optional[Callable[[str, EngineMode, int], Tuple[EventStyleConfig, int]]] = None,
+    on_result: Optional[Callable[[ScheduleResult], None]] = None,
+) -> ScheduleReport:
+    """
+    Scrape the selected events, exporting each config under its catalog id.
+
+    The budget is re-checked before each event starts against the time
+    and tokens actually spent so far; events that no longer fit are
+    deferred to the next run. Successes are recorded in the store and
+    failures are recorded for backoff.
+
+    Args:
+        selected: Events in priority order (from select_events)
+        output_dir: Directory configs are exported to
+        store: History store to record scrapes and failures in
+        engine: Engine mode ("crew", "deterministic" or "http")
+        concurrency: Events scraped at once
+        max_seconds: Wall-clock budget (default: unlimited)
+        max_tokens: LLM token budget (default: unlimited)
+        scrape: Scrape function (default: scrape_event)
+        on_result: Called with each event's result as it finishes
+
+    Returns:
+        ScheduleReport with one result per selected event, in priority order
+
+    Raises:
+        ValueError: If the engine mode is unknown
+    """
+    if engine not in ENGINE_MODES:
+        raise ValueError(f"Unknown engine mode: {engine}. Choose from {', '.join(ENGINE_MODES)}")
+    from event_style_scraper.flows.style_scraping_flow import StyleScrapingFlow
+
+    scrape = scrape or scrape_event
+    lock = threading.Lock()
+    spent = {"tokens": 0, "reserved_tokens": 0}
+    run_start = time.perf_counter()
+
+    def process(event: ScheduledEvent) -> ScheduleResult:
+        with lock:
+            elapsed = time.perf_counter() - run_start
+            over_time = max_seconds is not None and elapsed + event.estimated_seconds > max_seconds
+            committed = spent["tokens"] + spent["reserved_tokens"]
+            over_tokens = max_tokens is not None and committed + event.estimated_tokens > max_tokens
+            if over_time or over_tokens:
+                result = ScheduleResult(event_id=event.event_id, status="deferred")
+                if on_result is not None:
+                    on_result(result)
+                return result
+            spent["reserved_tokens"] += event.estimated_tokens
+
+        start = time.perf_counter()
+        tokens = 0
+        try:
+            config, tokens = scrape(event.url, engine, event.timeout)
+            config = config.model_copy(update={"event_id": event.event_id})
+            seconds = time.perf_counter() - start
+            flow = StyleScrapingFlow(url=event.url, timeout=event.timeout)
+            flow.output_dir = Path(output_dir)
+            output_path = flow.export_config(config)
+            if store is not None:
+                store.record(config, engine=engine, seconds=seconds, tokens=tokens or None)
+            result = ScheduleResult(
+                event_id=event.event_id,
+                status="completed",
+                seconds=seconds,
+                tokens=tokens,
+                output_path=str(output_path),
+            )
+        except Exception as e:
+            error = str(e) or type(e).__name__
+            if store is not None:
+                store.record_failure(event.event_id, event.url, error)
+            result = ScheduleResult(
+                event_id=event.event_id,
+                status="failed",
+                seconds=time.perf_counter() - start,
+                error=error,
+            )
+        with lock:
+            spent["reserved_tokens"] -= event.estimated_tokens
+            spent["tokens"] += tokens
+        if on_result is not None:
+            on_result(result)
+        return result
+
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+        results = list(executor.map(process, selected))
+    return ScheduleReport(results=results, elapsed_seconds=time.perf_counter() - run_start)
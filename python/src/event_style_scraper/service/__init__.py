@@ -0,0 +1,13 @@
+"""Long-running scrape service: warm workers behind a local job API."""
+
+from event_style_scraper.service.jobs import JobQueue, QueueFullError, ScrapeJob
+from event_style_scraper.service.worker import ScrapeService
+from event_style_scraper.service.api import create_server
+
+__all__ = [
+    "JobQueue",
+    "QueueFullError",
+    "ScrapeJob",
+    "ScrapeService",
+    "create_server",
+]
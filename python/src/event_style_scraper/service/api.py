@@ -0,0 +1,184 @@
+"""Local HTTP job API for ScrapeService, over TCP or a Unix socket.
+
+Endpoints:
+    POST /jobs                 {"url": ..., "priority": 0} -> 202 job
+    GET  /jobs                 all tracked jobs
+    GET  /jobs/<id>            one job
+    GET  /jobs/<id>/events     NDJSON status stream until the job finishes
+    GET  /events               NDJSON status stream of all jobs
+    GET  /health               service stats
+"""
+
+import json
+import os
+import queue
+import socketserver
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Optional, Union
+
+from event_style_scraper.service.jobs import QueueFullError, ScrapeJob
+from event_style_scraper.service.worker import ScrapeService
+
+# Largest accepted request body
+MAX_BODY_BYTES = 64 * 1024
+
+
+class JobAPIHandler(BaseHTTPRequestHandler):
+    """HTTP handler exposing a ScrapeService (``self.server.service``)."""
+
+    server_version = "EventStyleScraper"
+
+    @property
+    def service(self) -> ScrapeService:
+        service: ScrapeService = self.server.service  # type: ignore[attr-defined]
+        return service
+
+    def log_message(self, format: str, *args: Any) -> None:
+        # Keep the daemon's output to job events
+        pass
+
+    def _send_json(self, status: int, payload: Any) -> None:
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_error(self, status: int, message: str) -> None:
+        self._send_json(status, {"error": message})
+
+    def _stream(self, job_id: Optional[str] = None) -> None:
+        """Stream job snapshots as NDJSON until the job finishes (or forever)."""
+        subscriber = self.service.subscribe()
+        try:
+            self.send_response(200)
+            self.send_header("Content-Type", "application/x-ndjson")
+            self.send_header("Cache-Control", "no-cache")
+            self.end_headers()
+
+            if job_id is not None:
+                # Current state first, so changes before subscribing are not missed
+                job = self.service.get_job(job_id)
+                if job is None:
+                    return
+                self._write_event(job)
+                if job.finished:
+                    return
+
+            while self.service.running or not subscriber.empty():
+                try:
+                    event: ScrapeJob = subscriber.get(timeout=0.5)
+                except queue.Empty:
+                    continue
+                if job_id is not None and event.id != job_id:
+                    continue
+                self._write_event(event)
+                if job_id is not None and event.finished:
+                    return
+        except (BrokenPipeError, ConnectionResetError):
+            # Client went away
+            pass
+        finally:
+            self.service.unsubscribe(subscriber)
+
+    def _write_event(self, job: ScrapeJob) -> None:
+        self.wfile.write(job.model_dump_json().encode() + b"\n")
+        self.wfile.flush()
+
+    def do_GET(self) -> None:
+        """Serve job lookups, status streams and health."""
+        parts = [p for p in self.path.split("?", 1)[0].split("/") if p]
+
+        if parts == ["health"]:
+            self._send_json(200, self.service.stats())
+        elif parts == ["jobs"]:
+            self._send_json(200, [job.model_dump() for job in self.service.list_jobs()])
+        elif parts == ["events"]:
+            self._stream()
+        elif len(parts) in (2, 3) and parts[0] == "jobs":
+            job = self.service.get_job(parts[1])
+            if job is None:
+                self._send_error(404, f"Unknown job: {parts[1]}")
+            elif len(parts) == 2:
+                self._send_json(200, job.model_dump())
+            elif parts[2] == "events":
+                self._stream(parts[1])
+            else:
+                self._send_error(404, f"Not found: {self.path}")
+        else:
+            self._send_error(404, f"Not found: {self.path}")
+
+    def do_POST(self) -> None:
+        """Submit a scrape job."""
+        if self.path.split("?", 1)[0].rstrip("/") != "/jobs":
+            self._send_error(404, f"Not found: {self.path}")
+            return
+
+        length = int(self.headers.get("Content-Length") or 0)
+        if length > MAX_BODY_BYTES:
+            self._send_error(413, "Request body too large")
+            return
+        try:
+            payload = json.loads(self.rfile.read(length) or b"{}")
+            url = payload["url"]
+            priority = int(payload.get("priority", 0))
+        except (ValueError, KeyError, TypeError, AttributeError):
+            self._send_error(400, 'Expected JSON body {"url": "...", "priority": 0}')
+            return
+
+        try:
+            job = self.service.submit(url, priority=priority)
+        except ValueError as e:
+            self._send_error(400, str(e))
+        except QueueFullError as e:
+            self._send_error(503, str(e))
+        except RuntimeError as e:
+            self._send_error(503, str(e))
+        else:
+            self._send_json(202, job.model_dump())
+
+
+class UnixJobAPIServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """Threaded HTTP server listening on a Unix domain socket."""
+
+    daemon_threads = True
+
+    def get_request(self) -> Any:
+        request, _ = super().get_request()
+        # BaseHTTPRequestHandler expects an address tuple
+        return request, ("unix", 0)
+
+
+def create_server(
+    service: ScrapeService,
+    host: str = "127.0.0.1",
+    port: int = 8765,
+    socket_path: Optional[Path] = None,
+) -> Union[ThreadingHTTPServer, UnixJobAPIServer]:
+    """
+    Create the job API server for a service.
+
+    Args:
+        service: Started ScrapeService to expose
+        host: TCP host to bind (ignored with socket_path)
+        port: TCP port to bind, 0 for any free port (ignored with socket_path)
+        socket_path: Unix socket to listen on instead of TCP
+
+    Returns:
+        Server ready for ``serve_forever()``
+    """
+    if socket_path is not None:
+        socket_path = Path(socket_path)
+        if socket_path.exists():
+            # Stale socket from an earlier run
+            os.unlink(socket_path)
+        server: Union[ThreadingHTTPServer, UnixJobAPIServer] = UnixJobAPIServer(
+            str(socket_path), JobAPIHandler
+        )
+    else:
+        server = ThreadingHTTPServer((host, port), JobAPIHandler)
+        server.daemon_threads = True
+    server.service = service  # type: ignore[union-attr]
+    return server
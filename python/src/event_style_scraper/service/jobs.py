@@ -0,0 +1,122 @@
+"""Scrape jobs and the bounded priority queue feeding service workers."""
+
+import itertools
+import queue
+import threading
+import time
+import uuid
+from datetime import datetime, timezone
+from typing import Dict, List, Literal, Optional, Tuple
+
+from pydantic import BaseModel, Field
+
+# Mirrors StyleScrapingState.status
+JobStatus = Literal["pending", "scraping", "completed", "failed"]
+TERMINAL_STATUSES = ("completed", "failed")
+
+
+class QueueFullError(Exception):
+    """Raised when a job is submitted while the queue is at capacity."""
+
+    pass
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+class ScrapeJob(BaseModel):
+    """A scrape request and its progress through the service."""
+
+    id: str = Field(default_factory=lambda: uuid.uuid4().hex[:12], description="Job identifier")
+    url: str = Field(..., description="URL to scrape")
+    priority: int = Field(default=0, description="Higher priorities run first")
+    status: JobStatus = Field(default="pending", description="Current status of the job")
+    event_id: Optional[str] = Field(default=None, description="Event ID of the extracted config")
+    output_path: Optional[str] = Field(default=None, description="Exported config file")
+    error: Optional[str] = Field(default=None, description="Error message if the job failed")
+    token_usage: Optional[int] = Field(default=None, description="Total LLM tokens used")
+    submitted_at: str = Field(default_factory=_now, description="ISO 8601 submit time")
+    started_at: Optional[str] = Field(default=None, description="ISO 8601 start time")
+    finished_at: Optional[str] = Field(default=None, description="ISO 8601 finish time")
+    queue_seconds: Optional[float] = Field(
+        default=None, description="Time spent waiting for a worker"
+    )
+    work_seconds: Optional[float] = Field(
+        default=None, description="Time spent scraping and exporting"
+    )
+
+    @property
+    def finished(self) -> bool:
+        """Whether the job reached a terminal status."""
+        return self.status in TERMINAL_STATUSES
+
+
+class JobQueue:
+    """
+    Bounded priority queue of jobs.
+
+    Jobs with a higher priority are taken first; equal priorities are
+    first-in, first-out.
+    """
+
+    def __init__(self, maxsize: int = 100):
+        """
+        Initialize JobQueue.
+
+        Args:
+            maxsize: Maximum number of queued jobs
+        """
+        self.maxsize = maxsize
+        self._queue: "queue.PriorityQueue[Tuple[int, int, ScrapeJob]]" = queue.PriorityQueue(
+            maxsize
+        )
+        self._sequence = itertools.count()
+        self._enqueued_at: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return self._queue.qsize()
+
+    def put(self, job: ScrapeJob) -> None:
+        """
+        Queue a job without blocking.
+
+        Raises:
+            QueueFullError: If the queue is at capacity
+        """
+        with self._lock:
+            self._enqueued_at[job.id] = time.perf_counter()
+        try:
+            self._queue.put_nowait((-job.priority, next(self._sequence), job))
+        except queue.Full:
+            with self._lock:
+                self._enqueued_at.pop(job.id, None)
+            raise QueueFullError(f"Job queue is full ({self.maxsize} jobs)")
+
+    def get(self, timeout: Optional[float] = None) -> Optional[Tuple[ScrapeJob, float]]:
+        """
+        Take the highest-priority job.
+
+        Args:
+            timeout: Seconds to wait for a job (None waits forever)
+
+        Returns:
+            (job, seconds it waited in the queue), or None on timeout
+        """
+        try:
+            _, _, job = self._queue.get(timeout=timeout)
+        except queue.Empty:
+            return None
+        with self._lock:
+            enqueued_at = self._enqueued_at.pop(job.id, time.perf_counter())
+        return job, time.perf_counter() - enqueued_at
+
+    def drain(self) -> List[ScrapeJob]:
+        """Remove and return all queued jobs in priority order."""
+        jobs: List[ScrapeJob] = []
+        while True:
+            item = self.get(timeout=0)
+            if item is None:
+                return jobs
+            jobs.append(item[0])
@@ -0,0 +1,281 @@
+"""Long-running scrape service with warm browsers and pre-built crews."""
+
+import logging
+import queue
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from event_style_scraper.engines import ENGINE_MODES, EngineMode
+from event_style_scraper.service.jobs import JobQueue, ScrapeJob
+from event_style_scraper.store import StyleStore
+from event_style_scraper.tools import SecurityError, WebScraperTool
+
+logger = logging.getLogger(__name__)
+
+
+class ScrapeService:
+    """
+    Run scrape jobs on a fixed set of worker threads.
+
+    Interpreter start, crewai imports, YAML config loading and Chromium
+    launch are paid once in ``start()``: each worker gets a crew built
+    from a template StyleExtractionCrew, and all workers share a
+    BrowserPool with one warm browser per worker. A job's ``work_seconds``
+    is then only the scrape, extraction and export.
+
+    Every status change (``pending``, ``scraping``, ``completed``,
+    ``failed``) is published to subscribers as a ScrapeJob snapshot.
+    """
+
+    def __init__(
+        self,
+        concurrency: int = 2,
+        max_queue: int = 100,
+        engine: EngineMode = "crew",
+        timeout: int = 60,
+        output_dir: Path = Path("style-configs"),
+        max_history: int = 1000,
+        history: Optional[StyleStore] = None,
+    ):
+        """
+        Initialize ScrapeService.
+
+        Args:
+            concurrency: Number of jobs processed at once
+            max_queue: Maximum number of pending jobs
+            engine: Engine mode ("crew", "deterministic" or "http")
+            timeout: Timeout in seconds for each scrape
+            output_dir: Directory configs are exported to
+            max_history: Finished jobs kept for status lookups
+            history: StyleStore that every exported config is also recorded in
+
+        Raises:
+            ValueError: If the engine mode is unknown or concurrency < 1
+        """
+        if engine not in ENGINE_MODES:
+            raise ValueError(
+                f"Unknown engine mode: {engine}. Choose from {', '.join(ENGINE_MODES)}"
+            )
+        if concurrency < 1:
+            raise ValueError("Concurrency must be at least 1")
+        self.concurrency = concurrency
+        self.engine = engine
+        self.timeout = timeout
+        self.output_dir = Path(output_dir)
+        self.max_history = max_history
+        self.history = history
+        self.queue = JobQueue(max_queue)
+        self.browser_pool: Any = None
+        self._crews: List[Any] = []
+        self._jobs: "OrderedDict[str, ScrapeJob]" = OrderedDict()
+        self._jobs_lock = threading.Lock()
+        self._subscribers: List["queue.Queue[ScrapeJob]"] = []
+        self._subscribers_lock = threading.Lock()
+        self._stopping = threading.Event()
+        self._workers: List[threading.Thread] = []
+        self._validator = WebScraperTool(timeout=timeout)
+
+    @property
+    def running(self) -> bool:
+        """Whether workers are accepting jobs."""
+        return bool(self._workers) and not self._stopping.is_set()
+
+    def start(self) -> "ScrapeService":
+        """
+        Warm up browsers and crews, then start the worker threads.
+
+        Returns:
+            ScrapeService: This service, for chaining
+        """
+        if self._workers:
+            return self
+
+        # Pay the crewai import now rather than in the first job
+        import event_style_scraper.flows.style_scraping_flow  # noqa: F401
+
+        if self.engine in ("crew", "deterministic"):
+            from event_style_scraper.tools import BrowserPool
+
+            self.browser_pool = BrowserPool(size=self.concurrency).start()
+
+        if self.engine == "crew":
+            from event_style_scraper.crews.style_extraction_crew import StyleExtractionCrew
+
+            # Crews are not thread-safe, so each worker owns one
+            self._crews = [
+                StyleExtractionCrew(timeout=self.timeout, browser_pool=self.browser_pool).crew()
+                for _ in range(self.concurrency)
+            ]
+
+        self._stopping.clear()
+        self._workers = [
+            threading.Thread(
+                target=self._work, args=(index,), name=f"scrape-worker-{index}", daemon=True
+            )
+            for index in range(self.concurrency)
+        ]
+        for worker in self._workers:
+            worker.start()
+        return self
+
+    def stop(self) -> None:
+        """
+        Stop the workers after their current jobs and release browsers.
+
+        Jobs still queued are marked failed.
+        """
+        self._stopping.set()
+        for worker in self._workers:
+            worker.join()
+        self._workers = []
+
+        for job in self.queue.drain():
+            self._finish(job, error="Service stopped before the job ran")
+
+        if self.browser_pool is not None:
+            self.browser_pool.stop()
+            self.browser_pool = None
+        self._crews = []
+
+    def __enter__(self) -> "ScrapeService":
+        return self.start()
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.stop()
+
+    def submit(self, url: str, priority: int = 0) -> ScrapeJob:
+        """
+        Queue a scrape job.
+
+        Args:
+            url: URL of the event website to scrape
+            priority: Higher priorities run first (default: 0)
+
+        Returns:
+            ScrapeJob: Snapshot of the pending job
+
+        Raises:
+            ValueError: If the URL fails security validation
+            QueueFullError: If the queue is at capacity
+            RuntimeError: If the service is not running
+        """
+        if not self.running:
+            raise RuntimeError("Scrape service is not running")
+        try:
+            self._validator.validate_url(url)
+        except SecurityError as e:
+            raise ValueError(f"Invalid URL: {str(e)}") from e
+
+        job = ScrapeJob(url=url, priority=priority)
+        # Holding the lock keeps workers from publishing "scraping" first
+        with self._jobs_lock:
+            self.queue.put(job)
+            self._jobs[job.id] = job
+            self._publish(job)
+        return job.model_copy()
+
+    def get_job(self, job_id: str) -> Optional[ScrapeJob]:
+        """Get a snapshot of a job, or None if it is unknown."""
+        with self._jobs_lock:
+            job = self._jobs.get(job_id)
+            return job.model_copy() if job else None
+
+    def list_jobs(self) -> List[ScrapeJob]:
+        """Snapshots of all tracked jobs, oldest first."""
+        with self._jobs_lock:
+            return [job.model_copy() for job in self._jobs.values()]
+
+    def stats(self) -> Dict[str, Any]:
+        """Service health and job counts by status."""
+        counts = {"pending": 0, "scraping": 0, "completed": 0, "failed": 0}
+        for job in self.list_jobs():
+            counts[job.status] += 1
+        return {
+            "running": self.running,
+            "engine": self.engine,
+            "concurrency": self.concurrency,
+            "queued": len(self.queue),
+            "max_queue": self.queue.maxsize,
+            "warm_browsers": self.browser_pool.size if self.browser_pool else 0,
+            "jobs": counts,
+        }
+
+    def subscribe(self) -> "queue.Queue[ScrapeJob]":
+        """Register for status changes; every change is put on the returned queue."""
+        subscriber: "queue.Queue[ScrapeJob]" = queue.Queue()
+        with self._subscribers_lock:
+            self._subscribers.append(subscriber)
+        return subscriber
+
+    def unsubscribe(self, subscriber: "queue.Queue[ScrapeJob]") -> None:
+        """Stop receiving status changes."""
+        with self._subscribers_lock:
+            if subscriber in self._subscribers:
+                self._subscribers.remove(subscriber)
+
+    def _publish(self, job: ScrapeJob) -> None:
+        snapshot = job.model_copy()
+        with self._subscribers_lock:
+            for subscriber in self._subscribers:
+                subscriber.put(snapshot)
+
+    def _finish(
+        self, job: ScrapeJob, error: Optional[str] = None, work_seconds: Optional[float] = None
+    ) -> None:
+        with self._jobs_lock:
+            job.work_seconds = work_seconds
+            job.status = "failed" if error else "completed"
+            job.error = error
+            job.finished_at = datetime.now(timezone.utc).isoformat()
+            # Forget the oldest finished jobs beyond max_history
+            finished = [j.id for j in self._jobs.values() if j.finished and j.id != job.id]
+            for job_id in finished[: max(0, len(finished) + 1 - self.max_history)]:
+                del self._jobs[job_id]
+        self._publish(job)
+
+    def _run_job(self, job: ScrapeJob, worker_index: int) -> None:
+        from event_style_scraper.engines import run_engine
+        from event_style_scraper.flows.style_scraping_flow import StyleScrapingFlow
+
+        crew = self._crews[worker_index] if self._crews else None
+        flow = StyleScrapingFlow(url=job.url, timeout=self.timeout, crew=crew)
+        flow.output_dir = self.output_dir
+
+        start = time.perf_counter()
+        if self.engine == "crew":
+            config = flow.start()
+            job.token_usage = flow.get_state().token_usage
+        else:
+            config = run_engine(job.url, self.engine, self.timeout, browser_pool=self.browser_pool)
+        seconds = time.perf_counter() - start
+
+        job.event_id = config.event_id
+        job.output_path = str(flow.export_config(config))
+        if self.history is not None:
+            self.history.record(config, engine=self.engine, seconds=seconds, tokens=job.token_usage)
+
+    def _work(self, worker_index: int) -> None:
+        while not self._stopping.is_set():
+            item = self.queue.get(timeout=0.2)
+            if item is None:
+                continue
+            job, queue_seconds = item
+
+            with self._jobs_lock:
+                job.status = "scraping"
+                job.started_at = datetime.now(timezone.utc).isoformat()
+                job.queue_seconds = queue_seconds
+            self._publish(job)
+
+            start = time.perf_counter()
+            error = None
+            try:
+                self._run_job(job, worker_index)
+            except Exception as e:
+                logger.warning("Job %s for %s failed: %s", job.id, job.url, e)
+                error = str(e) or type(e).__name__
+            self._finish(job, error, work_seconds=time.perf_counter() - start)
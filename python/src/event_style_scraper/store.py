@@ -0,0 +1,423 @@
+"""Versioned history of scraped style configs in a local SQLite store.
+
+Exported ``style-configs/<event_id>.json`` files only hold the latest
+scrape. The store keeps every scrape as a snapshot: the config itself
+plus its fingerprint, source domain, engine, timing and token cost.
+Snapshots are indexed by event, domain and scrape time, so catalog-wide
+questions (latest config per event, configs older than N days, events
+whose primary color changed) are single queries, and the JSON files can
+be re-exported from the store at any time.
+"""
+
+import hashlib
+import sqlite3
+import threading
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, cast
+from urllib.parse import urlparse
+
+from pydantic import BaseModel, Field
+
+from event_style_scraper.types import EventStyleConfig
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS snapshots (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    event_id TEXT NOT NULL,
+    domain TEXT NOT NULL,
+    source_url TEXT NOT NULL,
+    scraped_at TEXT NOT NULL,
+    fingerprint TEXT NOT NULL,
+    primary_color TEXT NOT NULL,
+    engine TEXT,
+    seconds REAL,
+    tokens INTEGER,
+    config TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS snapshots_event ON snapshots (event_id, scraped_at);
+CREATE INDEX IF NOT EXISTS snapshots_domain ON snapshots (domain);
+CREATE INDEX IF NOT EXISTS snapshots_scraped_at ON snapshots (scraped_at);
+CREATE TABLE IF NOT EXISTS failures (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    event_id TEXT NOT NULL,
+    source_url TEXT NOT NULL,
+    attempted_at TEXT NOT NULL,
+    error TEXT
+);
+CREATE INDEX IF NOT EXISTS failures_event ON failures (event_id, attempted_at);
+"""
+
+# Each event's most recent (recency 1) or earlier snapshot, ties broken by
+# insertion order
+LATEST = """
+SELECT * FROM (
+    SELECT *, ROW_NUMBER() OVER (PARTITION BY event_id ORDER BY scraped_at DESC, id DESC) AS recency
+    FROM snapshots {where}
+) WHERE recency = {recency}
+"""
+
+# Per-event scrape counts, content changes, cost and the failures since
+# the last successful scrape
+EVENT_STATS = """
+WITH ordered AS (
+    SELECT event_id, scraped_at, seconds, tokens,
+        fingerprint != LAG(fingerprint) OVER (
+            PARTITION BY event_id ORDER BY scraped_at, id
+        ) AS changed
+    FROM snapshots
+), scraped AS (
+    SELECT event_id, COUNT(*) AS scrapes, COALESCE(SUM(changed), 0) AS changes,
+        MAX(scraped_at) AS last_scraped_at, AVG(seconds) AS mean_seconds, AVG(tokens) AS mean_tokens
+    FROM ordered GROUP BY event_id
+), failed AS (
+    SELECT f.event_id, COUNT(*) AS failure_streak, MAX(f.attempted_at) AS last_failure_at
+    FROM failures f LEFT JOIN scraped s ON s.event_id = f.event_id
+    WHERE s.last_scraped_at IS NULL OR f.attempted_at > s.last_scraped_at
+    GROUP BY f.event_id
+)
+SELECT s.*, f.failure_streak, f.last_failure_at FROM scraped s LEFT JOIN failed f USING (event_id)
+UNION ALL
+SELECT f.event_id, 0, 0, NULL, NULL, NULL, f.failure_streak, f.last_failure_at
+FROM failed f WHERE f.event_id NOT IN (SELECT event_id FROM scraped)
+"""
+
+
+def config_fingerprint(config: EventStyleConfig) -> str:
+    """Hash of a config's content, ignoring when it was scraped and local asset copies."""
+    content = config.model_dump_json(exclude={"scraped_at", "local_assets"})
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()[:16]
+
+
+def url_domain(url: str) -> str:
+    """Lowercase hostname of a URL without a leading ``www.``."""
+    hostname = (urlparse(url).hostname or "").lower()
+    return hostname[4:] if hostname.startswith("www.") else hostname
+
+
+def _utc_timestamp(value: Optional[str]) -> str:
+    """ISO 8601 UTC timestamp, so stored times sort and compare as text."""
+    if value:
+        try:
+            moment = datetime.fromisoformat(value)
+        except ValueError:
+            pass
+        else:
+            if moment.tzinfo is None:
+                moment = moment.replace(tzinfo=timezone.utc)
+            return moment.astimezone(timezone.utc).isoformat()
+    return datetime.now(timezone.utc).isoformat()
+
+
+class StyleSnapshot(BaseModel):
+    """One stored scrape of an event's style config."""
+
+    id: int = Field(..., description="Snapshot number, increasing with each record")
+    event_id: str = Field(..., description="Event identifier")
+    domain: str = Field(..., description="Source website domain")
+    source_url: str = Field(..., description="Source website URL")
+    scraped_at: str = Field(..., description="ISO 8601 UTC scrape time")
+    fingerprint: str = Field(..., description="Hash of the config content (scrape time excluded)")
+    engine: Optional[str] = Field(default=None, description="Engine mode that produced the config")
+    seconds: Optional[float] = Field(default=None, description="Time the scrape took")
+    tokens: Optional[int] = Field(default=None, description="LLM tokens the scrape used")
+    config: EventStyleConfig = Field(..., description="The scraped config")
+
+
+class EventStats(BaseModel):
+    """Scrape history of one event, summarized."""
+
+    event_id: str = Field(..., description="Event identifier")
+    scrapes: int = Field(default=0, description="Stored snapshots")
+    changes: int = Field(
+        default=0, description="Snapshots whose content differed from the previous one"
+    )
+    last_scraped_at: Optional[str] = Field(
+        default=None, description="ISO 8601 UTC time of the latest snapshot"
+    )
+    mean_seconds: Optional[float] = Field(default=None, description="Average recorded scrape time")
+    mean_tokens: Optional[float] = Field(default=None, description="Average recorded LLM tokens")
+    failure_streak: int = Field(default=0, description="Failed scrapes since the latest snapshot")
+    last_failure_at: Optional[str] = Field(
+        default=None, description="ISO 8601 UTC time of the latest of them"
+    )
+
+    @property
+    def drift_rate(self) -> float:
+        """Share of re-scrapes that found changed content."""
+        return self.changes / (self.scrapes - 1) if self.scrapes > 1 else 0.0
+
+
+class StyleStore:
+    """
+    SQLite store of style config snapshots.
+
+    Writes are committed immediately (WAL mode). The store is safe to
+    share between worker threads.
+    """
+
+    def __init__(self, path: Path):
+        """
+        Open (or create) a store.
+
+        Args:
+            path: SQLite database file
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(str(self.path), check_same_thread=False, isolation_level=None)
+        self._closed = False
+        self._db.row_factory = sqlite3.Row
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.executescript(SCHEMA)
+
+    def close(self) -> None:
+        """Checkpoint the write-ahead log and close the database."""
+        with self._lock:
+            if not self._closed:
+                self._db.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+                self._db.close()
+                self._closed = True
+
+    def __enter__(self) -> "StyleStore":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        count: int = self._execute("SELECT COUNT(*) AS n FROM snapshots")[0]["n"]
+        return count
+
+    def _execute(self, sql: str, params: Sequence[Any] = ()) -> List[sqlite3.Row]:
+        with self._lock:
+            return self._db.execute(sql, params).fetchall()
+
+    def _snapshots(self, sql: str, params: Sequence[Any] = ()) -> List[StyleSnapshot]:
+        return [
+            StyleSnapshot(
+                id=row["id"],
+                event_id=row["event_id"],
+                domain=row["domain"],
+                source_url=row["source_url"],
+                scraped_at=row["scraped_at"],
+                fingerprint=row["fingerprint"],
+                engine=row["engine"],
+                seconds=row["seconds"],
+                tokens=row["tokens"],
+                config=EventStyleConfig.model_validate_json(row["config"]),
+            )
+            for row in self._execute(sql, params)
+        ]
+
+    def record(
+        self,
+        config: EventStyleConfig,
+        engine: Optional[str] = None,
+        seconds: Optional[float] = None,
+        tokens: Optional[int] = None,
+    ) -> StyleSnapshot:
+        """
+        Store a scrape of an event.
+
+        Args:
+            config: Scraped config; its scraped_at (default: now) dates the snapshot
+            engine: Engine mode that produced it
+            seconds: Time the scrape took
+            tokens: LLM tokens the scrape used
+
+        Returns:
+            StyleSnapshot: The stored snapshot
+        """
+        snapshot = StyleSnapshot(
+            id=0,
+            event_id=config.event_id,
+            domain=url_domain(config.source_url),
+            source_url=config.source_url,
+            scraped_at=_utc_timestamp(config.scraped_at),
+            fingerprint=config_fingerprint(config),
+            engine=engine,
+            seconds=seconds,
+            tokens=tokens,
+            config=config,
+        )
+        with self._lock:
+            cursor = self._db.execute(
+                "INSERT INTO snapshots (event_id, domain, source_url, scraped_at, fingerprint, "
+                "primary_color, engine, seconds, tokens, config) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    snapshot.event_id,
+                    snapshot.domain,
+                    snapshot.source_url,
+                    snapshot.scraped_at,
+                    snapshot.fingerprint,
+                    config.colors.primary,
+                    engine,
+                    seconds,
+                    tokens,
+                    config.model_dump_json(),
+                ),
+            )
+        # An INSERT into a rowid table always sets lastrowid
+        snapshot.id = cast(int, cursor.lastrowid)
+        return snapshot
+
+    def record_failure(self, event_id: str, source_url: str, error: Optional[str] = None) -> None:
+        """Store a failed scrape of an event, for retry backoff."""
+        self._execute(
+            "INSERT INTO failures (event_id, source_url, attempted_at, error) VALUES (?, ?, ?, ?)",
+            (event_id, source_url, _utc_timestamp(None), error),
+        )
+
+    def event_stats(self) -> Dict[str, EventStats]:
+        """Scrape counts, content changes, cost and failure streak of every event."""
+        stats = {}
+        for row in self._execute(EVENT_STATS):
+            values = {name: row[name] for name in row.keys() if row[name] is not None}
+            stats[row["event_id"]] = EventStats(**values)
+        return stats
+
+    def import_configs(self, paths: Iterable[Path], engine: Optional[str] = None) -> int:
+        """
+        Backfill snapshots from exported config files.
+
+        A file whose event, scrape time and content are already stored is
+        skipped (content alone for files without a scrape time), so
+        importing the same directory twice is harmless.
+
+        Args:
+            paths: Config JSON files
+            engine: Engine mode to record for them, if known
+
+        Returns:
+            Number of snapshots added
+
+        Raises:
+            ValidationError: If a file is not a valid config
+        """
+        added = 0
+        for path in paths:
+            config = EventStyleConfig.model_validate_json(Path(path).read_text(encoding="utf-8"))
+            sql = "SELECT 1 FROM snapshots WHERE event_id = ? AND fingerprint = ?"
+            params = [config.event_id, config_fingerprint(config)]
+            if config.scraped_at:
+                sql += " AND scraped_at = ?"
+                params.append(_utc_timestamp(config.scraped_at))
+            if not self._execute(sql + " LIMIT 1", params):
+                self.record(config, engine=engine)
+                added += 1
+        return added
+
+    def latest(self, event_id: str) -> Optional[StyleSnapshot]:
+        """An event's most recent snapshot."""
+        snapshots = self._snapshots(
+            "SELECT * FROM snapshots WHERE event_id = ? ORDER BY scraped_at DESC, id DESC LIMIT 1",
+            (event_id,),
+        )
+        return snapshots[0] if snapshots else None
+
+    def latest_per_event(
+        self, domain: Optional[str] = None, before: Optional[str] = None, recency: int = 1
+    ) -> List[StyleSnapshot]:
+        """
+        The most recent snapshot of every event.
+
+        Args:
+            domain: Only events scraped from this domain
+            before: Only snapshots scraped at or before this ISO 8601 time
+            recency: 1 for the most recent snapshot, 2 for the one before it, ...
+
+        Returns:
+            Snapshots ordered by event_id
+        """
+        conditions, params = [], []
+        if domain is not None:
+            conditions.append("domain = ?")
+            params.append(url_domain(f"//{domain}"))
+        if before is not None:
+            conditions.append("scraped_at <= ?")
+            params.append(_utc_timestamp(before))
+        where = "WHERE " + " AND ".join(conditions) if conditions else ""
+        return self._snapshots(
+            LATEST.format(where=where, recency=int(recency)) + " ORDER BY event_id", params
+        )
+
+    def history(self, event_id: str) -> List[StyleSnapshot]:
+        """All snapshots of an event, oldest first."""
+        return self._snapshots(
+            "SELECT * FROM snapshots WHERE event_id = ? ORDER BY scraped_at, id", (event_id,)
+        )
+
+    def stale(self, days: float, now: Optional[datetime] = None) -> List[StyleSnapshot]:
+        """
+        Events whose most recent snapshot is older than a number of days.
+
+        Args:
+            days: Maximum age
+            now: Reference time (default: now)
+
+        Returns:
+            Latest snapshots of the stale events, oldest first
+        """
+        cutoff = ((now or datetime.now(timezone.utc)) - timedelta(days=days)).astimezone(
+            timezone.utc
+        )
+        return self._snapshots(
+            LATEST.format(where="", recency=1)
+            + " AND scraped_at < ? ORDER BY scraped_at, event_id",
+            (cutoff.isoformat(),),
+        )
+
+    def primary_color_changed(self, since: Optional[str] = None) -> List[str]:
+        """
+        Events whose stored snapshots disagree on the primary color.
+
+        Args:
+            since: Only consider snapshots scraped at or after this ISO 8601 time
+
+        Returns:
+            Event IDs, sorted
+        """
+        where, params = ("WHERE scraped_at >= ?", (_utc_timestamp(since),)) if since else ("", ())
+        rows = self._execute(
+            f"SELECT event_id FROM snapshots {where} GROUP BY event_id "
+            "HAVING COUNT(DISTINCT primary_color) > 1 ORDER BY event_id",
+            params,
+        )
+        return [row["event_id"] for row in rows]
+
+    def export_json(
+        self,
+        output_dir: Path,
+        event_ids: Optional[Sequence[str]] = None,
+        compact: bool = False,
+        bundle: bool = False,
+        css: bool = False,
+    ) -> List[Path]:
+        """
+        Write each event's latest config as ``<event_id>.json``.
+
+        Files are exported like StyleScrapingFlow.export_config.
+
+        Args:
+            output_dir: Directory to write to
+            event_ids: Only these events (default: all)
+            compact: Also write compact <event_id>.min.json files
+            bundle: Also add the configs to the directory's _bundle.json
+            css: Also write hashed stylesheets listed in css/manifest.json
+
+        Returns:
+            Paths written, ordered by event_id
+        """
+        from event_style_scraper.export import export_style_config
+
+        wanted = set(event_ids) if event_ids is not None else None
+        return [
+            export_style_config(
+                snapshot.config, output_dir, compact=compact, bundle=bundle, css=css
+            )
+            for snapshot in self.latest_per_event()
+            if wanted is None or snapshot.event_id in wanted
+        ]
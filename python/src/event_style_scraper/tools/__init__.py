@@ -1,6 +1,38 @@
-"""Tools for event style scraping."""
+"""Tools for event style scraping.
 
-from .web_scraper import WebScraperTool, SecurityError
-from .playwright_scraper import PlaywrightStyleExtractorTool
+Exports are resolved on first access so that importing one tool does not
+pull in the dependencies of the others (PlaywrightStyleExtractorTool
+loads crewai and playwright).
+"""
 
-__all__ = ["WebScraperTool", "SecurityError", "PlaywrightStyleExtractorTool"]
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    from .browser_pool import BrowserPool as BrowserPool
+    from .http_scraper import HttpStyleExtractor as HttpStyleExtractor
+    from .playwright_scraper import PlaywrightStyleExtractorTool as PlaywrightStyleExtractorTool
+    from .web_scraper import SecurityError as SecurityError
+    from .web_scraper import WebScraperTool as WebScraperTool
+
+_EXPORTS = {
+    "WebScraperTool": ".web_scraper",
+    "SecurityError": ".web_scraper",
+    "PlaywrightStyleExtractorTool": ".playwright_scraper",
+    "HttpStyleExtractor": ".http_scraper",
+    "BrowserPool": ".browser_pool",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(list(globals()) + __all__)
@@ -0,0 +1,154 @@
+"""Pool of long-lived Chromium browsers for repeated scrapes."""
+
+import asyncio
+import threading
+from typing import Any, Dict, List, Optional
+
+from playwright.async_api import async_playwright
+
+from .playwright_scraper import extract_page
+
+
+class BrowserPool:
+    """
+    Keep Chromium browsers running between scrapes.
+
+    Playwright's async API is bound to one event loop, so the pool runs its
+    own loop in a background thread and exposes a thread-safe, blocking
+    ``scrape()``. Each scrape gets a fresh browser context (no shared
+    cookies or storage) in one of ``size`` warm browsers; callers beyond
+    ``size`` wait for a browser to be released. Browsers that crash are
+    relaunched on next use.
+    """
+
+    def __init__(self, size: int = 2, headless: bool = True):
+        """
+        Initialize BrowserPool.
+
+        Args:
+            size: Number of browsers kept running
+            headless: Launch browsers in headless mode
+
+        Raises:
+            ValueError: If size is less than 1
+        """
+        if size < 1:
+            raise ValueError("Browser pool size must be at least 1")
+        self.size = size
+        self.headless = headless
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._playwright: Any = None
+        self._browsers: List[Any] = []
+        self._idle: Optional["asyncio.Queue[Any]"] = None
+
+    @property
+    def started(self) -> bool:
+        """Whether the pool's browsers are running."""
+        return self._loop is not None
+
+    def _submit(self, coroutine: Any) -> Any:
+        if self._loop is None:
+            coroutine.close()
+            raise RuntimeError("BrowserPool is not started")
+        return asyncio.run_coroutine_threadsafe(coroutine, self._loop).result()
+
+    async def _launch(self) -> Any:
+        return await self._playwright.chromium.launch(headless=self.headless)
+
+    async def _start(self) -> None:
+        self._playwright = await async_playwright().start()
+        idle: "asyncio.Queue[Any]" = asyncio.Queue()
+        self._idle = idle
+        for _ in range(self.size):
+            browser = await self._launch()
+            self._browsers.append(browser)
+            idle.put_nowait(browser)
+
+    async def _stop(self) -> None:
+        for browser in self._browsers:
+            try:
+                await browser.close()
+            except Exception:
+                # Already disconnected
+                pass
+        self._browsers = []
+        if self._playwright is not None:
+            await self._playwright.stop()
+            self._playwright = None
+
+    async def _scrape(self, url: str, timeout: int) -> Dict[str, Any]:
+        idle = self._idle
+        if idle is None:
+            raise RuntimeError("BrowserPool is not started")
+        browser = await idle.get()
+        try:
+            if not browser.is_connected():
+                self._browsers.remove(browser)
+                browser = await self._launch()
+                self._browsers.append(browser)
+            context = await browser.new_context()
+            try:
+                page = await context.new_page()
+                return await extract_page(page, url, timeout)
+            finally:
+                await context.close()
+        finally:
+            idle.put_nowait(browser)
+
+    def start(self) -> "BrowserPool":
+        """
+        Start the event loop thread and launch the browsers.
+
+        Returns:
+            BrowserPool: This pool, for chaining
+        """
+        if self.started:
+            return self
+        loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=loop.run_forever, name="browser-pool", daemon=True)
+        self._thread.start()
+        self._loop = loop
+        try:
+            self._submit(self._start())
+        except Exception:
+            self.stop()
+            raise
+        return self
+
+    def stop(self) -> None:
+        """Close all browsers and stop the event loop thread."""
+        if self._loop is None:
+            return
+        try:
+            self._submit(self._stop())
+        finally:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            if self._thread is not None:
+                self._thread.join()
+            self._loop.close()
+            self._loop = None
+            self._thread = None
+
+    def scrape(self, url: str, timeout: int = 30000) -> Dict[str, Any]:
+        """
+        Scrape a URL in a pooled browser (blocks until a browser is free).
+
+        Args:
+            url: URL to scrape (http://, https://, or file://)
+            timeout: Maximum time in milliseconds for page load
+
+        Returns:
+            Dictionary with the same keys as PlaywrightStyleExtractorTool
+
+        Raises:
+            RuntimeError: If the pool is not started
+        """
+        result: Dict[str, Any] = self._submit(self._scrape(url, timeout))
+        return result
+
+    def __enter__(self) -> "BrowserPool":
+        return self.start()
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.stop()
@@ -0,0 +1,249 @@
+"""Browserless HTTP fast path for style extraction."""
+
+import re
+import urllib.request
+from http.client import HTTPMessage
+from typing import IO, Any, Dict, List, Optional, Tuple
+from urllib.parse import urljoin
+
+from bs4 import BeautifulSoup
+
+from .web_scraper import SecurityError, WebScraperTool
+
+# Elements inspected by PlaywrightStyleExtractorTool, in the same order
+KEY_ELEMENTS = ["body", "header", "nav", "h1", "button", "a"]
+
+# CSS property -> computed style key used by PlaywrightStyleExtractorTool
+STYLE_PROPERTIES = {
+    "background-color": "backgroundColor",
+    "color": "color",
+    "font-family": "fontFamily",
+    "font-size": "fontSize",
+    "line-height": "lineHeight",
+}
+
+# Properties children inherit from body when they do not set them
+INHERITED_PROPERTIES = ("color", "fontFamily", "fontSize", "lineHeight")
+
+TRANSPARENT = "rgba(0, 0, 0, 0)"
+
+COMMENT_PATTERN = re.compile(r"/\*.*?\*/", re.DOTALL)
+RULE_PATTERN = re.compile(r"([^{}]+)\{([^{}]*)\}")
+VAR_PATTERN = re.compile(r"var\(\s*(--[\w-]+)\s*(?:,\s*([^()]*(?:\([^()]*\))?[^()]*))?\)")
+BACKGROUND_COLOR_PATTERN = re.compile(r"(#[0-9a-fA-F]{3,8}\b|(?:rgba?|hsla?)\([^)]*\))")
+
+
+def parse_declarations(block: str) -> Dict[str, str]:
+    """Parse a CSS declaration block into a property -> value dict."""
+    declarations = {}
+    for declaration in block.split(";"):
+        if ":" not in declaration:
+            continue
+        name, value = declaration.split(":", 1)
+        value = value.replace("!important", "").strip()
+        if name.strip() and value:
+            declarations[name.strip().lower()] = value
+    return declarations
+
+
+def parse_rules(css: str) -> List[Tuple[List[str], Dict[str, str]]]:
+    """
+    Parse CSS into (selectors, declarations) rules in source order.
+
+    At-rule wrappers such as @media are flattened: their inner rules are
+    kept, which is close enough for picking brand styles.
+    """
+    css = COMMENT_PATTERN.sub("", css)
+    rules = []
+    for selector_text, block in RULE_PATTERN.findall(css):
+        # Statements such as "@import url(...);" can precede a selector
+        selector_text = selector_text.rsplit(";", 1)[-1].strip()
+        if not selector_text or selector_text.startswith("@"):
+            # Declaration-only at-rules such as @font-face and @page
+            continue
+        selectors = [s.strip() for s in selector_text.split(",") if s.strip()]
+        rules.append((selectors, parse_declarations(block)))
+    return rules
+
+
+def resolve_vars(value: str, variables: Dict[str, str], depth: int = 0) -> str:
+    """Substitute var(--name, fallback) references using the given variables."""
+    if depth > 10 or "var(" not in value:
+        return value
+
+    def replace(match: "re.Match[str]") -> str:
+        name, fallback = match.group(1), match.group(2)
+        if name in variables:
+            return variables[name]
+        return fallback.strip() if fallback else ""
+
+    return resolve_vars(VAR_PATTERN.sub(replace, value), variables, depth + 1)
+
+
+def selector_targets(selector: str, element: str) -> bool:
+    """Check whether a selector's subject (last compound) is the given element type."""
+    subject = re.split(r"[\s>+~]+", selector.strip())[-1]
+    tag = re.split(r"[.#:\[]", subject, maxsplit=1)[0]
+    return tag.lower() == element
+
+
+class _ValidatingRedirectHandler(urllib.request.HTTPRedirectHandler):
+    """Follow redirects only to URLs that pass the scraper's security checks."""
+
+    def __init__(self, security: WebScraperTool):
+        self.security = security
+
+    def redirect_request(
+        self,
+        req: urllib.request.Request,
+        fp: IO[bytes],
+        code: int,
+        msg: str,
+        headers: HTTPMessage,
+        newurl: str,
+    ) -> Optional[urllib.request.Request]:
+        # A public page can redirect to localhost or a private address
+        try:
+            self.security.validate_url(newurl)
+        except SecurityError:
+            fp.close()
+            raise
+        return super().redirect_request(req, fp, code, msg, headers, newurl)
+
+
+class HttpStyleExtractor:
+    """
+    Extract styles over plain HTTP without launching a browser.
+
+    Fetches the page and its stylesheets, then approximates the computed
+    styles PlaywrightStyleExtractorTool would return by applying matching
+    CSS rules, inline styles and body inheritance. JavaScript is not run,
+    so client-rendered pages yield fewer elements. The returned dictionary
+    has the same shape as the Playwright tool's output.
+    """
+
+    def __init__(self, timeout: int = 30, max_stylesheets: int = 5, max_bytes: int = 5_000_000):
+        """
+        Initialize HttpStyleExtractor.
+
+        Args:
+            timeout: Request timeout in seconds
+            max_stylesheets: Maximum number of linked stylesheets to fetch
+            max_bytes: Maximum response size read per request
+        """
+        self.timeout = timeout
+        self.max_stylesheets = max_stylesheets
+        self.max_bytes = max_bytes
+        self._security = WebScraperTool(timeout=timeout)
+        self._opener = urllib.request.build_opener(_ValidatingRedirectHandler(self._security))
+
+    def _fetch(self, url: str) -> str:
+        """Fetch a URL after security validation of it and every redirect, and decode it as text."""
+        self._security.validate_url(url)
+        request = urllib.request.Request(url, headers={"User-Agent": self._security.user_agent})
+        with self._opener.open(request, timeout=self.timeout) as response:
+            charset = response.headers.get_content_charset() or "utf-8"
+            body: bytes = response.read(self.max_bytes)
+            return body.decode(charset, errors="replace")
+
+    def _collect_css(self, soup: BeautifulSoup, url: str) -> str:
+        """Concatenate inline <style> blocks and linked stylesheets in document order."""
+        parts = []
+        fetched = 0
+        for node in soup.find_all(["style", "link"]):
+            if node.name == "style":
+                parts.append(node.get_text())
+            elif "stylesheet" in (node.get("rel") or []) and node.get("href"):
+                if fetched >= self.max_stylesheets:
+                    continue
+                fetched += 1
+                try:
+                    parts.append(self._fetch(urljoin(url, str(node["href"]))))
+                except Exception:
+                    # A missing stylesheet should not fail the whole extraction
+                    continue
+        return "\n".join(parts)
+
+    def _computed_styles(
+        self,
+        soup: BeautifulSoup,
+        rules: List[Tuple[List[str], Dict[str, str]]],
+        variables: Dict[str, str],
+    ) -> Dict[str, Dict[str, str]]:
+        styles: Dict[str, Dict[str, str]] = {}
+        for element in KEY_ELEMENTS:
+            node = soup.find(element)
+            if node is None:
+                continue
+
+            declared: Dict[str, str] = {}
+            for selectors, declarations in rules:
+                if any(selector_targets(s, element) for s in selectors):
+                    declared.update(declarations)
+            if node.get("style"):
+                declared.update(parse_declarations(str(node["style"])))
+
+            computed: Dict[str, str] = {}
+            for css_property, key in STYLE_PROPERTIES.items():
+                if css_property in declared:
+                    computed[key] = resolve_vars(declared[css_property], variables)
+            if "backgroundColor" not in computed and "background" in declared:
+                background = resolve_vars(declared["background"], variables)
+                match = BACKGROUND_COLOR_PATTERN.search(background)
+                if match:
+                    computed["backgroundColor"] = match.group(1)
+
+            computed.setdefault("backgroundColor", TRANSPARENT)
+            if element != "body" and "body" in styles:
+                for key in INHERITED_PROPERTIES:
+                    if key not in computed and key in styles["body"]:
+                        computed[key] = styles["body"][key]
+            styles[element] = computed
+        return styles
+
+    def _assets(self, soup: BeautifulSoup, url: str) -> Dict[str, Optional[str]]:
+        logo = soup.select_one('img[alt*="logo" i], .logo img, #logo img, img#logo')
+        favicon = soup.select_one('link[rel~="icon"]')
+        return {
+            "logo": (
+                urljoin(url, str(logo["src"])) if logo is not None and logo.get("src") else None
+            ),
+            "favicon": (
+                urljoin(url, str(favicon["href"]))
+                if favicon is not None and favicon.get("href")
+                else None
+            ),
+        }
+
+    def extract(self, url: str) -> Dict[str, Any]:
+        """
+        Extract HTML, approximate computed styles, CSS variables and assets.
+
+        Args:
+            url: URL to scrape (http:// or https://)
+
+        Returns:
+            Dictionary with the same keys as PlaywrightStyleExtractorTool
+
+        Raises:
+            SecurityError: If the URL or a redirect target fails security validation
+            urllib.error.URLError: If the page cannot be fetched
+        """
+        html = self._fetch(url)
+        soup = BeautifulSoup(html, "lxml")
+        rules = parse_rules(self._collect_css(soup, url))
+
+        variables: Dict[str, str] = {}
+        for selectors, declarations in rules:
+            if any(s in (":root", "html") for s in selectors):
+                variables.update({k: v for k, v in declarations.items() if k.startswith("--")})
+        variables = {name: resolve_vars(value, variables) for name, value in variables.items()}
+
+        return {
+            "url": url,
+            "html": html,
+            "computed_styles": self._computed_styles(soup, rules, variables),
+            "css_variables": variables,
+            "assets": self._assets(soup, url),
+            "success": True,
+        }
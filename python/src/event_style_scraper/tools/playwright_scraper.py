@@ -1,9 +1,10 @@
 """Playwright-based style extraction tool for accurate web scraping."""
 
 import asyncio
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 from crewai.tools import BaseTool
 from playwright.async_api import async_playwright
+from pydantic import Field
 
 
 class PlaywrightStyleExtractorTool(BaseTool):
@@ -27,16 +28,21 @@ class PlaywrightStyleExtractorTool(BaseTool):
         "styles, colors, typography, and layout properties."
     )
     timeout: int = 30000  # Declare as Pydantic field
+    browser_pool: Optional[Any] = Field(default=None, exclude=True)
 
-    def __init__(self, timeout: int = 30000, **kwargs):
+    def __init__(self, timeout: int = 30000, browser_pool: Optional[Any] = None, **kwargs: Any):
         """
         Initialize PlaywrightStyleExtractorTool.
 
         Args:
             timeout: Maximum time in milliseconds for page load (default: 30000ms = 30s)
+            browser_pool: Optional BrowserPool of warm browsers; when set, pages
+                are opened in a pooled browser instead of launching one per call
             **kwargs: Additional arguments passed to BaseTool
         """
-        super().__init__(timeout=timeout, **kwargs)
+        super().__init__(  # type: ignore[call-arg]
+            timeout=timeout, browser_pool=browser_pool, **kwargs
+        )
 
     def _run(self, url: str) -> Dict[str, Any]:
         """
@@ -54,6 +60,9 @@ class PlaywrightStyleExtractorTool(BaseTool):
                 - assets: Logo and favicon URLs
                 - success: True if scraping succeeded
         """
+        if self.browser_pool is not None:
+            result: Dict[str, Any] = self.browser_pool.scrape(url, timeout=self.timeout)
+            return result
         return asyncio.run(self._async_run(url))
 
     async def _async_run(self, url: str) -> Dict[str, Any]:
@@ -71,73 +80,93 @@ class PlaywrightStyleExtractorTool(BaseTool):
             browser = await p.chromium.launch(headless=True)
             page = await browser.new_page()
 
-            # Navigate to URL and wait for network to be idle
-            await page.goto(url, wait_until="networkidle", timeout=self.timeout)
-
-            # Extract raw HTML
-            html = await page.content()
-
-            # Extract computed styles for key elements
-            computed_styles = await page.evaluate(
-                """() => {
-                    const selectors = ['body', 'header', 'nav', 'h1', 'button', 'a'];
-                    const styles = {};
-
-                    selectors.forEach(sel => {
-                        const el = document.querySelector(sel);
-                        if (el) {
-                            const computed = window.getComputedStyle(el);
-                            styles[sel] = {
-                                backgroundColor: computed.backgroundColor,
-                                color: computed.color,
-                                fontFamily: computed.fontFamily,
-                                fontSize: computed.fontSize,
-                                lineHeight: computed.lineHeight
-                            };
-                        }
-                    });
-
-                    return styles;
-                }"""
-            )
-
-            # Extract CSS custom properties (variables) from :root
-            css_vars = await page.evaluate(
-                """() => {
-                    const rootStyle = getComputedStyle(document.documentElement);
-                    const vars = {};
-
-                    // Get all custom properties from :root
-                    for (let prop of rootStyle) {
-                        if (prop.startsWith('--')) {
-                            vars[prop] = rootStyle.getPropertyValue(prop).trim();
-                        }
-                    }
-
-                    return vars;
-                }"""
-            )
-
-            # Extract logo and favicon URLs
-            assets = await page.evaluate(
-                """() => {
-                    const logo = document.querySelector('img[alt*="logo" i], .logo img, #logo');
-                    const favicon = document.querySelector('link[rel="icon"], link[rel="shortcut icon"]');
-
-                    return {
-                        logo: logo ? logo.src : null,
-                        favicon: favicon ? favicon.href : null
-                    };
-                }"""
-            )
+            result = await extract_page(page, url, self.timeout)
 
             await browser.close()
 
-            return {
-                "url": url,
-                "html": html,
-                "computed_styles": computed_styles,
-                "css_variables": css_vars,
-                "assets": assets,
-                "success": True,
+            return result
+
+
+async def extract_page(page: Any, url: str, timeout: int) -> Dict[str, Any]:
+    """
+    Navigate a Playwright page to a URL and extract its styles.
+
+    Shared by PlaywrightStyleExtractorTool (one browser per call) and
+    BrowserPool (long-lived browsers).
+
+    Args:
+        page: Playwright Page to navigate
+        url: URL to scrape
+        timeout: Maximum time in milliseconds for page load
+
+    Returns:
+        Dictionary with scraped data
+    """
+    # Navigate to URL and wait for network to be idle
+    await page.goto(url, wait_until="networkidle", timeout=timeout)
+
+    # Extract raw HTML
+    html = await page.content()
+
+    # Extract computed styles for key elements
+    computed_styles = await page.evaluate(
+        """() => {
+            const selectors = ['body', 'header', 'nav', 'h1', 'button', 'a'];
+            const styles = {};
+
+            selectors.forEach(sel => {
+                const el = document.querySelector(sel);
+                if (el) {
+                    const computed = window.getComputedStyle(el);
+                    styles[sel] = {
+                        backgroundColor: computed.backgroundColor,
+                        color: computed.color,
+                        fontFamily: computed.fontFamily,
+                        fontSize: computed.fontSize,
+                        lineHeight: computed.lineHeight
+                    };
+                }
+            });
+
+            return styles;
+        }"""
+    )
+
+    # Extract CSS custom properties (variables) from :root
+    css_vars = await page.evaluate(
+        """() => {
+            const rootStyle = getComputedStyle(document.documentElement);
+            const vars = {};
+
+            // Get all custom properties from :root
+            for (let prop of rootStyle) {
+                if (prop.startsWith('--')) {
+                    vars[prop] = rootStyle.getPropertyValue(prop).trim();
+                }
             }
+
+            return vars;
+        }"""
+    )
+
+    # Extract logo and favicon URLs
+    assets = await page.evaluate(
+        """() => {
+            const logo = document.querySelector('img[alt*="logo" i], .logo img, #logo');
+            const favicon = document.querySelector('link[rel="icon"], link[rel="shortcut icon"]');
+
+            return {
+                logo: logo ? logo.src : null,
+                favicon: favicon ? favicon.href : null
+            };
+        }"""
+    )
+
+    return {
+        "url": url,
+        "html": html,
+        "computed_styles": computed_styles,
+        "css_variables": css_vars,
+        "assets": assets,
+        "success": True,
+    }
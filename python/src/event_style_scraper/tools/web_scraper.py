@@ -1,9 +1,14 @@
 """Security-hardened tool wrappers for web scraping."""
 
+from typing import Iterable, Optional
 from urllib.parse import urlparse
 import ipaddress
+import os
 import validators
 
+# Comma-separated hostnames exempt from SSRF checks (e.g. local benchmark fixtures)
+ALLOWED_HOSTS_ENV = "SCRAPER_ALLOWED_HOSTS"
+
 
 class SecurityError(Exception):
     """Raised when a security violation is detected."""
@@ -30,6 +35,7 @@ class WebScraperTool:
         timeout: int = 60,
         respect_robots_txt: bool = True,
         rate_limit_delay: float = 1.0,
+        allowed_hosts: Optional[Iterable[str]] = None,
     ):
         """
         Initialize WebScraperTool.
@@ -38,7 +44,12 @@ class WebScraperTool:
             timeout: Maximum request timeout in seconds
             respect_robots_txt: Whether to respect robots.txt
             rate_limit_delay: Delay between requests in seconds
+            allowed_hosts: Hostnames exempt from private/localhost checks.
+                Defaults to the SCRAPER_ALLOWED_HOSTS environment variable.
         """
+        if allowed_hosts is None:
+            allowed_hosts = os.getenv(ALLOWED_HOSTS_ENV, "").split(",")
+        self.allowed_hosts = {h.strip().lower() for h in allowed_hosts if h.strip()}
         self.timeout = timeout
         self.respect_robots_txt = respect_robots_txt
         self.rate_limit_delay = rate_limit_delay
@@ -76,6 +87,10 @@ class WebScraperTool:
         if not parsed.hostname:
             raise SecurityError(f"Invalid URL format: Missing hostname")
 
+        # Explicitly allowlisted hosts skip the SSRF checks below
+        if parsed.hostname.lower() in self.allowed_hosts:
+            return
+
         # Block localhost (BEFORE validators.url which may reject these)
         if parsed.hostname in {"localhost", "127.0.0.1", "::1"}:
             raise SecurityError("Localhost URLs are not allowed (SSRF prevention)")
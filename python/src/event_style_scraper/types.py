@@ -1,8 +1,10 @@
 """Pydantic data models for event style configuration."""
 
-from typing import Optional
-from pydantic import BaseModel, Field, field_validator
-import re
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Union
+from pydantic import BaseModel, Field, TypeAdapter, field_validator
+
+from event_style_scraper.colors import canonical_color
 
 
 class ColorPalette(BaseModel):
@@ -17,23 +19,14 @@ class ColorPalette(BaseModel):
     @field_validator("primary", "secondary", "accent", "background", "text")
     @classmethod
     def validate_color(cls, v: str) -> str:
-        """Validate color is in valid CSS format."""
-        # Accept hex format (#RGB, #RRGGBB, #RRGGBBAA)
-        hex_pattern = r"^#([A-Fa-f0-9]{3}|[A-Fa-f0-9]{6}|[A-Fa-f0-9]{8})$"
-        # Accept rgb/rgba format
-        rgb_pattern = r"^rgba?\(\s*\d+\s*,\s*\d+\s*,\s*\d+\s*(,\s*[\d.]+\s*)?\)$"
-        # Accept hsl/hsla format
-        hsl_pattern = r"^hsla?\(\s*\d+\s*,\s*\d+%\s*,\s*\d+%\s*(,\s*[\d.]+\s*)?\)$"
-
-        if not (
-            re.match(hex_pattern, v)
-            or re.match(rgb_pattern, v)
-            or re.match(hsl_pattern, v)
-        ):
+        """Validate a CSS color and normalize it to #rrggbb (#rrggbbaa if translucent)."""
+        color = canonical_color(v)
+        if color is None:
             raise ValueError(
-                f"Invalid color format: {v}. Must be hex (#RGB), rgb(r,g,b), or hsl(h,s,l)"
+                f"Invalid color format: {v}. "
+                "Must be hex (#RGB), rgb(r,g,b), hsl(h,s,l) or a named color"
             )
-        return v
+        return color
 
 
 class Typography(BaseModel):
@@ -70,6 +63,28 @@ class LayoutConfig(BaseModel):
     container_width: str = Field(default="1200px", description="Max container width")
 
 
+class LocalAssets(BaseModel):
+    """Logo and favicon copies hosted with the site (see event_style_scraper.assets)."""
+
+    logo: Optional[str] = Field(
+        default=None, description="Site path of the logo (SVG or largest variant)"
+    )
+    logo_variants: Dict[int, str] = Field(
+        default_factory=dict, description="Site paths of raster logo variants by longest side in px"
+    )
+    logo_source: Optional[str] = Field(default=None, description="URL the logo was downloaded from")
+    favicon: Optional[str] = Field(
+        default=None, description="Site path of the favicon (SVG or largest variant)"
+    )
+    favicon_variants: Dict[int, str] = Field(
+        default_factory=dict,
+        description="Site paths of raster favicon variants by longest side in px",
+    )
+    favicon_source: Optional[str] = Field(
+        default=None, description="URL the favicon was downloaded from"
+    )
+
+
 class EventStyleConfig(BaseModel):
     """Complete style configuration for an event."""
 
@@ -84,6 +99,71 @@ class EventStyleConfig(BaseModel):
     )
     logo_url: Optional[str] = Field(default=None, description="Logo image URL")
     favicon_url: Optional[str] = Field(default=None, description="Favicon URL")
+    local_assets: Optional[LocalAssets] = Field(
+        default=None, description="Locally hosted logo and favicon copies"
+    )
     scraped_at: Optional[str] = Field(default=None, description="Timestamp of scraping")
 
     model_config = {"extra": "forbid"}  # Prevent extra fields
+
+
+class AttendeeContent(BaseModel):
+    """Personalized attendee content written in one structured generation call."""
+
+    themes: list[str] = Field(
+        default_factory=list, description="Top themes of the attendee's session choices"
+    )
+    greeting: str = Field(..., description="Personal greeting (2-3 sentences)")
+    session_highlights: str = Field(..., description="Session highlights (4-5 sentences)")
+    networking: str = Field(default="", description="Networking celebration (3-4 sentences)")
+    achievements: str = Field(
+        default="", description="Achievement recognition (2-3 sentences, if any)"
+    )
+    call_to_action: str = Field(..., description="Forward-looking call-to-action (2 sentences)")
+    keywords_used: list[str] = Field(
+        default_factory=list, description="Brand keywords worked into the content"
+    )
+
+    def to_text(self) -> str:
+        """The five content sections as plain text, one paragraph each."""
+        sections = (
+            self.greeting,
+            self.session_highlights,
+            self.networking,
+            self.achievements,
+            self.call_to_action,
+        )
+        return "\n\n".join(section.strip() for section in sections if section.strip())
+
+
+@lru_cache(maxsize=1)
+def _config_list_adapter() -> "TypeAdapter[List[EventStyleConfig]]":
+    return TypeAdapter(List[EventStyleConfig])
+
+
+def validate_configs(
+    configs: Iterable[Union[Dict[str, Any], EventStyleConfig]],
+) -> List[EventStyleConfig]:
+    """
+    Validate many configs in a single pass.
+
+    Args:
+        configs: Config dicts (or models)
+
+    Returns:
+        Validated configs, in input order
+
+    Raises:
+        ValidationError: With each error located by list index
+    """
+    return _config_list_adapter().validate_python(list(configs))
+
+
+def validate_configs_json(data: Union[str, bytes]) -> List[EventStyleConfig]:
+    """
+    Parse and validate a JSON array of configs in a single pass.
+
+    Raises:
+        ValidationError: If the JSON is malformed or a config is invalid
+    """
+    return _config_list_adapter().validate_json(data)
@@ -8,14 +8,17 @@ These tests validate that:
 """
 
 import pytest
+from event_style_scraper.colors import parse_color
 from event_style_scraper.crews.style_extraction_crew import StyleExtractionCrew
 from event_style_scraper.types import EventStyleConfig
 
 
 def hex_to_rgb(hex_color: str) -> tuple:
     """Convert hex color to RGB tuple for comparison."""
-    hex_color = hex_color.lstrip('#')
-    return tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
+    color = parse_color(hex_color)
+    if color is None:
+        raise ValueError(f"Invalid color: {hex_color}")
+    return color.rgb
 
 
 @pytest.mark.integration
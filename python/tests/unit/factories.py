@@ -0,0 +1,54 @@
+"""Builders for test data shared by the unit tests."""
+
+from typing import Any, Dict, Optional
+
+from pydantic import BaseModel
+
+from event_style_scraper.types import BrandVoice, ColorPalette, EventStyleConfig, Typography
+
+DEFAULT_COLORS = {
+    "primary": "#1a3c8f",
+    "secondary": "#764ba2",
+    "accent": "#f093fb",
+    "background": "#ffffff",
+    "text": "#1a202c",
+}
+DEFAULT_FONTS = {"heading_font": "Inter, sans-serif", "body_font": "system-ui, sans-serif"}
+DEFAULT_VOICE = {"tone": "professional", "style": "modern", "keywords": ["innovation"]}
+
+
+def make_style_config(
+    event_id: str = "tech-summit", scraped_at: Optional[str] = None, **overrides: Any
+) -> EventStyleConfig:
+    """
+    Style config with a fixed palette, fonts and brand voice.
+
+    Overrides are applied by field name: color (``primary``), typography
+    (``heading_font``, ``line_height``) and brand voice (``tone``,
+    ``keywords``) fields replace that one value, and any other
+    EventStyleConfig field (``event_name``, ``source_url``, ``layout``,
+    ``local_assets``, ...) is set as given. The event name defaults to
+    the title-cased id and the source URL to ``https://<event_id>.example.com/``.
+    """
+    sections: Dict[str, Any] = {
+        "colors": (ColorPalette, dict(DEFAULT_COLORS)),
+        "typography": (Typography, dict(DEFAULT_FONTS)),
+        "brand_voice": (BrandVoice, dict(DEFAULT_VOICE)),
+    }
+    fields: Dict[str, Any] = {
+        "event_name": event_id.replace("-", " ").title(),
+        "source_url": f"https://{event_id}.example.com/",
+        "scraped_at": scraped_at,
+    }
+    for name, value in overrides.items():
+        section = next(
+            (values for model, values in sections.values() if name in model.model_fields), None
+        )
+        if section is not None:
+            section[name] = value
+        else:
+            fields[name] = value
+    for name, (model, values) in sections.items():
+        if not isinstance(fields.get(name), BaseModel):
+            fields[name] = model(**values)
+    return EventStyleConfig(event_id=event_id, **fields)
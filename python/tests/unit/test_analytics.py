@@ -0,0 +1,130 @@
+"""Tests for deterministic attendee analytics."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from event_style_scraper.analytics import AttendeeProfile, compute_profiles, speaker_name
+
+ATTENDEES_DIR = Path(__file__).parent.parent.parent.parent / "data" / "attendees"
+
+
+def session(track, minutes=60, speakers=(), title="", date_time=""):
+    """Build a session record."""
+    return {
+        "title": title,
+        "track": track,
+        "durationMinutes": minutes,
+        "speakers": list(speakers),
+        "dateTime": date_time,
+    }
+
+
+class TestComputeProfiles:
+    """Tests for compute_profiles."""
+
+    def test_counts_and_minutes(self):
+        """Test session, minute and connection totals."""
+        attendee = {
+            "id": "1",
+            "firstName": "Jane",
+            "lastName": "Doe",
+            "sessions": [session("AI", 45), session("AI", 30), session("Ops", 60)],
+            "connections": [
+                {"name": "A", "company": "X"},
+                {"name": "B", "company": "X"},
+                {"name": "C", "company": "Y"},
+            ],
+            "stats": {"topAchievement": "Explorer"},
+        }
+
+        profile = compute_profiles([attendee])[0]
+
+        assert profile.name == "Jane Doe"
+        assert (profile.session_count, profile.total_minutes, profile.connection_count) == (
+            3,
+            135,
+            3,
+        )
+        assert profile.top_tracks == ["AI", "Ops"]
+        assert profile.track_count == 2
+        assert profile.top_connection_companies == ["X", "Y"]
+        assert profile.top_achievement == "Explorer"
+
+    def test_topic_diversity(self):
+        """Test that diversity is 0 for one track and 1 for an even spread."""
+        focused = {"id": "1", "sessions": [session("AI"), session("AI")]}
+        spread = {"id": "2", "sessions": [session("AI"), session("Ops"), session("Data")]}
+
+        profiles = compute_profiles([focused, spread])
+
+        assert profiles[0].topic_diversity == 0
+        assert profiles[1].topic_diversity == 1
+
+    def test_speaker_overlaps(self):
+        """Test repeat speakers and connections who spoke at attended sessions."""
+        attendee = {
+            "id": "1",
+            "sessions": [
+                session("AI", speakers=["Alex Zhang, Lead, Erleah", "Sam Lee, CTO, Komo"]),
+                session("AI", speakers=["Alex Zhang, Lead, Erleah"]),
+            ],
+            "connections": [
+                {"name": "Alex Zhang", "company": "Erleah"},
+                {"name": "Pat Doe", "company": "Z"},
+            ],
+        }
+        other = {"id": "2", "connections": [{"name": "Sam Lee", "company": "Komo"}]}
+
+        profiles = compute_profiles([attendee, other])
+
+        assert profiles[0].speakers_heard == 2
+        assert profiles[0].repeat_speakers == ["Alex Zhang"]
+        assert profiles[0].connected_speakers == ["Alex Zhang"]
+        # Sam Lee spoke, but not at a session attendee 2 attended
+        assert profiles[1].connected_speakers == []
+
+    def test_featured_sessions_from_top_tracks_in_time_order(self):
+        """Test that featured sessions come from top tracks, earliest first."""
+        sessions = [
+            session("AI", title="Late AI", date_time="2025-11-12T15:00:00Z"),
+            session("AI", title="Early AI", date_time="2025-11-12T09:00:00Z"),
+        ]
+
+        profile = compute_profiles([{"id": "1", "sessions": sessions}])[0]
+
+        assert profile.featured_sessions == ["Early AI", "Late AI"]
+
+    def test_empty_attendee_and_event(self):
+        """Test attendees without sessions or connections, and empty events."""
+        profile = compute_profiles([{"id": "1", "firstName": "Solo"}])[0]
+
+        assert profile == AttendeeProfile(attendee_id="1", name="Solo")
+        assert compute_profiles([]) == []
+
+    def test_matches_per_attendee_computation(self):
+        """Test that batching the event gives each attendee the same profile as alone."""
+        attendees = [json.loads(p.read_text()) for p in sorted(ATTENDEES_DIR.glob("*.json"))]
+        if not attendees:
+            pytest.skip("No attendee data")
+
+        together = compute_profiles(attendees)
+        alone = [compute_profiles([a])[0] for a in attendees]
+
+        assert together == alone
+
+    def test_to_context_is_compact_json(self):
+        """Test the profile text handed to the writing tasks."""
+        profile = compute_profiles([{"id": "1", "firstName": "Jane"}])[0]
+
+        context = profile.to_context()
+
+        assert json.loads(context)["name"] == "Jane"
+        assert "title" not in json.loads(context)
+        assert "\n" not in context
+
+    def test_speaker_name(self):
+        """Test that speaker titles and companies are dropped."""
+        assert speaker_name("Alex Zhang, Technical Lead, Erleah") == "Alex Zhang"
+        assert speaker_name("Alex Zhang") == "Alex Zhang"
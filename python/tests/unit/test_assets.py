@@ -0,0 +1,196 @@
+"""Tests for the logo and favicon asset pipeline."""
+
+import io
+from functools import partial
+
+import httpx
+import pytest
+from PIL import Image
+
+from event_style_scraper.assets import (
+    AssetCache,
+    AssetFetcher,
+    AssetPipeline,
+    find_candidates,
+    raster_variants,
+    sanitize_svg,
+)
+from event_style_scraper.types import EventStyleConfig
+from unit.factories import make_style_config
+
+PAGE = """
+<html><head>
+  <meta property="og:image" content="/social.png">
+  <link rel="icon" href="/favicon-16.png">
+  <link rel="apple-touch-icon" href="/touch.png">
+</head><body>
+  <header><a href="/"><img src="/img/brand-logo.svg" alt="Summit"></a></header>
+  <img src="/speaker.jpg" alt="Speaker">
+</body></html>
+"""
+
+SVG = (
+    b'<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 10 10">'
+    b'<rect width="10" height="10"/></svg>'
+)
+
+
+def png(width, height):
+    """PNG image of the given size."""
+    output = io.BytesIO()
+    Image.new("RGBA", (width, height), (26, 60, 143, 255)).save(output, format="PNG")
+    return output.getvalue()
+
+
+make_config = partial(make_style_config, "summit", source_url="https://example.com/")
+
+
+class FakeSite:
+    """Serves fixed responses by path and records the requests."""
+
+    def __init__(self, routes):
+        """Routes map a path to (status, content, headers)."""
+        self.routes = routes
+        self.requests = []
+
+    def __call__(self, request):
+        self.requests.append(request)
+        status, content, headers = self.routes.get(request.url.path, (404, b"", {}))
+        return httpx.Response(status, content=content, headers=headers)
+
+    def paths(self):
+        """Requested paths in order."""
+        return [request.url.path for request in self.requests]
+
+
+class TestFindCandidates:
+    """Tests for ranking candidates."""
+
+    def test_ranking(self):
+        """Test that the header SVG logo leads and touch icons beat plain icons as favicons."""
+        candidates = find_candidates(
+            PAGE, "https://example.com/", make_config(logo_url="https://cdn.example.com/logo.png")
+        )
+
+        logos = [(c.url, c.score) for c in candidates if c.role == "logo"]
+        favicons = [c.url for c in candidates if c.role == "favicon"]
+        assert logos == [
+            ("https://example.com/img/brand-logo.svg", 7.0),
+            ("https://cdn.example.com/logo.png", 2.5),
+            ("https://example.com/social.png", 1.5),
+            ("https://example.com/touch.png", 1.0),
+        ]
+        assert favicons == [
+            "https://example.com/touch.png",
+            "https://example.com/favicon-16.png",
+            "https://example.com/favicon.ico",
+        ]
+
+
+class TestAssetFetcher:
+    """Tests for pooled, cached downloads."""
+
+    def test_etag_revalidation(self, tmp_path):
+        """Test that a cached response is revalidated and reused on 304."""
+        site = FakeSite(
+            {"/logo.png": (200, b"image", {"ETag": '"v1"', "Content-Type": "image/png"})}
+        )
+        cache = AssetCache(tmp_path)
+        with AssetFetcher(cache, transport=httpx.MockTransport(site)) as fetcher:
+            first = fetcher.fetch("https://example.com/logo.png")
+            site.routes["/logo.png"] = (304, b"", {})
+            second = fetcher.fetch("https://example.com/logo.png")
+
+        assert (first.from_cache, second.from_cache) == (False, True)
+        assert second.content == b"image" and second.content_type == "image/png"
+        assert site.requests[1].headers["If-None-Match"] == '"v1"'
+
+    def test_redirects_are_validated(self, tmp_path):
+        """Test that a redirect to a private address is refused."""
+        site = FakeSite({"/logo.png": (302, b"", {"Location": "http://10.0.0.1/logo.png"})})
+        with AssetFetcher(AssetCache(tmp_path), transport=httpx.MockTransport(site)) as fetcher:
+            assert fetcher.fetch_all(["https://example.com/logo.png"]) == {
+                "https://example.com/logo.png": None
+            }
+
+        assert site.paths() == ["/logo.png"]
+
+
+class TestDecoding:
+    """Tests for verifying and resizing assets."""
+
+    def test_sanitize_svg(self):
+        """Test that scripts, handlers and external references are removed."""
+        svg = (
+            b'<svg xmlns="http://www.w3.org/2000/svg" xmlns:xlink="http://www.w3.org/1999/xlink"'
+            b' onload="x()"><script>alert(1)</script>'
+            b'<use xlink:href="https://evil.example/a.svg#p"/><use href="#local"/></svg>'
+        )
+
+        cleaned = sanitize_svg(svg)
+
+        assert b"script" not in cleaned and b"onload" not in cleaned and b"evil" not in cleaned
+        assert b'href="#local"' in cleaned
+        with pytest.raises(ValueError):
+            sanitize_svg(b"<html><body>Not found</body></html>")
+
+    def test_variants_are_capped_and_never_enlarged(self):
+        """Test that variants fit their caps and small images keep their size."""
+        variants = raster_variants(png(1000, 250), (256, 512))
+        small = raster_variants(png(100, 40), (256, 512))
+
+        assert sorted(variants) == [256, 512]
+        assert Image.open(io.BytesIO(variants[256])).size == (256, 64)
+        assert list(small) == [100]
+        with pytest.raises(ValueError):
+            raster_variants(b"<html>", (32,))
+
+
+class TestAssetPipeline:
+    """Tests for localizing configs."""
+
+    def test_localize_falls_back_and_records_paths(self, tmp_path):
+        """Test that a broken top logo falls back to the next one and its files are recorded."""
+        site = FakeSite({
+            "/": (200, PAGE.encode(), {"Content-Type": "text/html"}),
+            "/img/brand-logo.svg": (200, b"<html>Moved</html>", {"Content-Type": "text/html"}),
+            "/social.png": (200, png(1200, 630), {"Content-Type": "image/png"}),
+            "/touch.png": (200, png(180, 180), {"Content-Type": "image/png"}),
+        })
+        images_dir = tmp_path / "images"
+        (images_dir / "summit").mkdir(parents=True)
+        (images_dir / "summit" / "logo.svg").write_bytes(SVG)
+
+        with AssetPipeline(
+            images_dir, cache_dir=tmp_path / "cache", transport=httpx.MockTransport(site)
+        ) as pipeline:
+            config = pipeline.localize(make_config())
+
+        local = config.local_assets
+        assert local.logo == "/static/images/summit/logo-512.png"
+        assert local.logo_source == "https://example.com/social.png"
+        assert local.logo_variants == {
+            256: "/static/images/summit/logo-256.png",
+            512: "/static/images/summit/logo-512.png",
+        }
+        assert (local.favicon, local.favicon_source) == (
+            "/static/images/summit/favicon-180.png",
+            "https://example.com/touch.png",
+        )
+        assert sorted(p.name for p in (images_dir / "summit").iterdir()) == [
+            "favicon-180.png", "favicon-32.png", "logo-256.png", "logo-512.png"
+        ]
+        assert EventStyleConfig.model_validate_json(config.model_dump_json()) == config
+
+    def test_failed_role_keeps_previous_copy(self, tmp_path):
+        """Test that a role without a usable candidate keeps its earlier local copy."""
+        previous = make_config(local_assets={"logo": "/static/images/summit/logo.svg"})
+        site = FakeSite({"/": (200, b"<html></html>", {}), "/favicon.ico": (200, png(64, 64), {})})
+
+        with AssetPipeline(
+            tmp_path, cache_dir=tmp_path / "cache", transport=httpx.MockTransport(site)
+        ) as pipeline:
+            config = pipeline.localize(previous)
+
+        assert config.local_assets.logo == "/static/images/summit/logo.svg"
+        assert config.local_assets.favicon == "/static/images/summit/favicon-64.png"
@@ -0,0 +1,258 @@
+"""Tests for checkpointed, resumable batch runs."""
+
+import json
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+from click.testing import CliRunner
+
+from event_style_scraper.batch import BatchJournal, BatchRunner
+from event_style_scraper.benchmarks import FixtureSiteServer, StubLLMServer
+from event_style_scraper.benchmarks.metrics import patched_environ
+from event_style_scraper.cli import cli
+from event_style_scraper.store import StyleStore
+from event_style_scraper.tools import PlaywrightStyleExtractorTool
+from event_style_scraper.types import LocalAssets
+
+SITES_DIR = Path(__file__).parent.parent.parent / "benchmarks" / "sites"
+
+
+@pytest.fixture
+def fixtures():
+    """Fixture site server whose host the scraper is allowed to fetch."""
+    with FixtureSiteServer(SITES_DIR) as server:
+        with patched_environ({"SCRAPER_ALLOWED_HOSTS": server.host}):
+            yield server
+
+
+@pytest.fixture
+def journal(tmp_path):
+    """Journal in a temporary directory."""
+    with BatchJournal(tmp_path / "journal.sqlite") as journal:
+        yield journal
+
+
+class TestBatchJournal:
+    """Tests for the SQLite journal."""
+
+    def test_add_events_keeps_order_and_ignores_duplicates(self, journal):
+        """Test that events are journaled once, in batch order."""
+        journal.add_events(["https://a.example.com", "https://b.example.com"])
+        journal.add_events(["https://b.example.com", "https://c.example.com"])
+
+        assert [e.url for e in journal.events()] == [
+            "https://a.example.com",
+            "https://b.example.com",
+            "https://c.example.com",
+        ]
+        assert journal.counts() == {"pending": 3}
+
+    def test_progress_survives_reopening(self, tmp_path):
+        """Test that stages and artifacts are durable across connections."""
+        path = tmp_path / "journal.sqlite"
+        with BatchJournal(path) as journal:
+            journal.add_events(["https://a.example.com"])
+            journal.start_event("https://a.example.com")
+            journal.save_artifact("https://a.example.com", "scrape_website", '{"html": ""}')
+
+        with BatchJournal(path) as journal:
+            event = journal.get_event("https://a.example.com")
+            assert event.status == "scraping"
+            assert event.stage == "scrape_website"
+            assert event.attempts == 1
+            assert journal.artifacts("https://a.example.com") == {"scrape_website": '{"html": ""}'}
+
+
+class TestBatchRunner:
+    """Tests for BatchRunner with the HTTP engine."""
+
+    def test_run_exports_all_events(self, fixtures, journal, tmp_path):
+        """Test that every event is scraped, exported and journaled as completed."""
+        urls = [fixtures.site_url("tech-summit"), fixtures.site_url("expo-dark")]
+
+        summary = BatchRunner(journal, engine="http", output_dir=tmp_path / "out").run(urls)
+
+        assert (summary.completed, summary.failed, summary.total) == (2, 0, 2)
+        for event in journal.events():
+            assert event.status == "completed"
+            assert event.stage == "export"
+            assert json.loads(Path(event.output_path).read_text())["event_id"] == event.event_id
+
+    def test_exports_are_recorded_in_history(self, fixtures, journal, tmp_path):
+        """Test that each exported config is also recorded as a timed snapshot."""
+        urls = [fixtures.site_url("tech-summit"), fixtures.site_url("expo-dark")]
+
+        with StyleStore(tmp_path / "history.sqlite") as store:
+            BatchRunner(journal, engine="http", output_dir=tmp_path / "out", history=store).run(
+                urls
+            )
+            snapshots = store.latest_per_event()
+
+        assert sorted(s.event_id for s in snapshots) == sorted(e.event_id for e in journal.events())
+        assert all(s.engine == "http" and s.seconds > 0 for s in snapshots)
+
+    def test_assets_are_localized_before_export(self, fixtures, journal, tmp_path):
+        """Test that the asset stage's local paths end up in the exported config."""
+        assets = MagicMock()
+        assets.localize.side_effect = lambda config: config.model_copy(
+            update={"local_assets": LocalAssets(logo=f"/static/images/{config.event_id}/logo.svg")}
+        )
+
+        BatchRunner(journal, engine="http", output_dir=tmp_path, assets=assets).run(
+            [fixtures.site_url("tech-summit")]
+        )
+
+        event = journal.events()[0]
+        exported = json.loads(Path(event.output_path).read_text())
+        assert exported["local_assets"]["logo"] == f"/static/images/{event.event_id}/logo.svg"
+
+    def test_failures_do_not_stop_the_batch(self, fixtures, journal, tmp_path):
+        """Test that a failing event is journaled with its error and others complete."""
+        urls = [fixtures.site_url("no-such-site"), fixtures.site_url("minimal-meetup")]
+
+        summary = BatchRunner(journal, engine="http", output_dir=tmp_path).run(urls)
+
+        assert (summary.completed, summary.failed) == (1, 1)
+        failed = journal.get_event(urls[0])
+        assert failed.status == "failed"
+        assert "404" in failed.error
+
+    def test_resume_skips_completed_and_restarts_from_stage(self, fixtures, journal, tmp_path):
+        """Test that resume skips completed events and reuses finished stages."""
+        done, interrupted = fixtures.site_url("tech-summit"), fixtures.site_url("expo-dark")
+        BatchRunner(journal, engine="http", output_dir=tmp_path).run([done, interrupted])
+        # Simulate a crash after expo-dark was scraped but before compile/export
+        journal.update_event(interrupted, status="scraping", stage="scrape_website")
+        journal._execute(
+            "DELETE FROM artifacts WHERE url = ? AND stage = 'compile_config'", (interrupted,)
+        )
+
+        with patch("event_style_scraper.engines.scrape_page") as scrape_page:
+            summary = BatchRunner(journal, engine="http", output_dir=tmp_path).run(
+                [done, interrupted], resume=True
+            )
+
+        scrape_page.assert_not_called()
+        assert (summary.skipped, summary.resumed, summary.completed) == (1, 1, 1)
+        assert journal.get_event(interrupted).status == "completed"
+        assert journal.get_event(interrupted).attempts == 2
+        assert journal.get_event(done).attempts == 1
+
+    def test_run_without_resume_starts_over(self, fixtures, journal, tmp_path):
+        """Test that a fresh run forgets the previous journal."""
+        url = fixtures.site_url("minimal-meetup")
+        BatchRunner(journal, engine="http", output_dir=tmp_path).run([url])
+
+        summary = BatchRunner(journal, engine="http", output_dir=tmp_path).run([url])
+
+        assert (summary.skipped, summary.completed) == (0, 1)
+        assert journal.get_event(url).attempts == 1
+
+    def test_cancel_leaves_events_for_resume(self, fixtures, journal, tmp_path):
+        """Test that a cancelled run starts nothing new and reports unfinished events."""
+        runner = BatchRunner(journal, engine="http", output_dir=tmp_path)
+        runner.cancel()
+
+        summary = runner.run([fixtures.site_url("tech-summit"), fixtures.site_url("expo-dark")])
+
+        assert summary.cancelled
+        assert (summary.completed, summary.interrupted) == (0, 2)
+        assert journal.counts() == {"pending": 2}
+
+    def test_cancel_stops_at_stage_boundary(self, fixtures, journal, tmp_path):
+        """Test that cancelling mid-event keeps the finished stage for resume."""
+        url = fixtures.site_url("tech-summit")
+        runner = BatchRunner(journal, engine="http", output_dir=tmp_path)
+        save_artifact = journal.save_artifact
+
+        def save_then_cancel(*args):
+            save_artifact(*args)
+            runner.cancel()
+
+        with patch.object(journal, "save_artifact", side_effect=save_then_cancel):
+            summary = runner.run([url])
+
+        event = journal.get_event(url)
+        assert summary.interrupted == 1
+        assert (event.status, event.stage) == ("scraping", "scrape_website")
+
+        summary = BatchRunner(journal, engine="http", output_dir=tmp_path).run([url], resume=True)
+        assert (summary.resumed, summary.completed) == (1, 1)
+
+    def test_resume_rejects_other_engine(self, journal):
+        """Test that a journal is only resumed with the engine that wrote it."""
+        journal.set_meta("engine", "crew")
+
+        with pytest.raises(ValueError, match="crew engine"):
+            BatchRunner(journal, engine="http").run([], resume=True)
+
+
+class TestBatchRunnerCrew:
+    """Tests for resuming crew-engine events from a finished task."""
+
+    def test_resume_runs_only_remaining_tasks(self, journal, tmp_path):
+        """Test that restored task outputs are not recomputed by the crew."""
+        url = "https://example.com/"
+        journal.add_events([url])
+        journal.start_event(url)
+        journal.save_artifact(
+            url, "scrape_website", '{"url": "https://example.com/", "html": "<h1>Hi</h1>"}'
+        )
+        journal.save_artifact(url, "extract_styles", "Primary color #1a73e8, font Inter")
+        journal.set_meta("engine", "crew")
+        scraper = MagicMock()
+
+        with StubLLMServer() as stub, patched_environ(stub.environment()), \
+                patch.object(PlaywrightStyleExtractorTool, "_run", scraper), \
+                patch("event_style_scraper.tools.BrowserPool"):
+            summary = BatchRunner(journal, engine="crew", output_dir=tmp_path).run(
+                [url], resume=True
+            )
+            llm_requests = stub.stats()["requests"]
+
+        scraper.assert_not_called()
+        assert summary.completed == 1, journal.get_event(url).error
+        assert llm_requests == 2
+        assert set(journal.artifacts(url)) == {
+            "scrape_website",
+            "extract_styles",
+            "analyze_voice",
+            "compile_config",
+        }
+
+
+class TestBatchCommand:
+    """Tests for the batch CLI command."""
+
+    def test_batch_and_resume(self, fixtures, tmp_path):
+        """Test a batch from an events directory, then a resume that skips everything."""
+        events_dir = tmp_path / "events"
+        events_dir.mkdir()
+        for site in ("tech-summit", "minimal-meetup"):
+            (events_dir / f"{site}.json").write_text(
+                json.dumps({"id": site, "websiteUrl": fixtures.site_url(site)})
+            )
+        args = [
+            "batch",
+            "--events-dir", str(events_dir),
+            "--engine", "http",
+            "--journal", str(tmp_path / "journal.sqlite"),
+            "--output-dir", str(tmp_path / "out"),
+        ]
+
+        first = CliRunner().invoke(cli, args)
+        second = CliRunner().invoke(cli, args + ["--resume"])
+
+        assert first.exit_code == 0, first.output
+        assert "2 completed" in first.output
+        assert second.exit_code == 0, second.output
+        assert "0 completed" in second.output
+        assert "2 already done" in second.output
+
+    def test_batch_requires_urls(self, tmp_path):
+        """Test that a batch without URLs fails."""
+        result = CliRunner().invoke(cli, ["batch", "--journal", str(tmp_path / "journal.sqlite")])
+
+        assert result.exit_code == 1
+        assert "No URLs" in result.output
@@ -0,0 +1,277 @@
+"""Tests for the offline benchmark suite (fixture server, stub LLM, runner)."""
+
+import json
+import time
+import urllib.request
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from click.testing import CliRunner
+
+from event_style_scraper.benchmarks import (
+    FixtureSiteServer,
+    StubLLMServer,
+    compare_reports,
+    load_report,
+    run_benchmark,
+    write_report,
+)
+from event_style_scraper.benchmarks.metrics import summarize
+from event_style_scraper.benchmarks.stub_llm import example_from_schema
+from event_style_scraper.cli import cli
+from event_style_scraper.tools import PlaywrightStyleExtractorTool
+from event_style_scraper.types import EventStyleConfig
+
+SITES_DIR = Path(__file__).parent.parent.parent / "benchmarks" / "sites"
+
+
+def post_json(url, payload):
+    """POST JSON and decode the JSON response."""
+    request = urllib.request.Request(
+        url,
+        data=json.dumps(payload).encode(),
+        headers={"Content-Type": "application/json"},
+    )
+    with urllib.request.urlopen(request, timeout=5) as response:
+        return json.loads(response.read())
+
+
+def fake_scrape(self, url: str):
+    """Stand-in for the Playwright tool so tests need no browser."""
+    return {"url": url, "html": "<html><h1>Fixture</h1></html>", "success": True}
+
+
+class TestFixtureSiteServer:
+    """Tests for the local fixture site server."""
+
+    def test_lists_fixture_sites(self):
+        """Test that every fixture directory with an index.html is a site."""
+        server = FixtureSiteServer(SITES_DIR)
+        sites = server.site_names()
+
+        assert "tech-summit" in sites
+        assert "minimal-meetup" in sites
+        assert sites == sorted(sites)
+
+    def test_serves_pages_and_assets(self):
+        """Test that site pages and relative assets are served over HTTP."""
+        with FixtureSiteServer(SITES_DIR) as server:
+            with urllib.request.urlopen(server.site_url("tech-summit"), timeout=5) as r:
+                html = r.read().decode()
+            with urllib.request.urlopen(
+                server.site_url("tech-summit") + "styles.css", timeout=5
+            ) as r:
+                css = r.read().decode()
+
+        assert "Tech Summit" in html
+        assert "--primary-color" in css
+
+    def test_missing_directory_raises(self, tmp_path):
+        """Test that a missing sites directory is reported."""
+        with pytest.raises(FileNotFoundError):
+            FixtureSiteServer(tmp_path / "missing")
+
+
+class TestStubLLMServer:
+    """Tests for the OpenAI-compatible stub."""
+
+    def test_tool_request_returns_tool_call_with_url(self):
+        """Test that tool-enabled requests get a tool call for the prompt URL."""
+        with StubLLMServer() as stub:
+            response = post_json(f"{stub.base_url}/chat/completions", {
+                "model": "gpt-4o-mini",
+                "messages": [{"role": "user", "content": "Scrape https://example.com/site/ now"}],
+                "tools": [{"type": "function", "function": {
+                    "name": "playwright_style_extractor",
+                    "parameters": {"properties": {"url": {"type": "string"}}},
+                }}],
+            })
+
+        choice = response["choices"][0]
+        assert choice["finish_reason"] == "tool_calls"
+        call = choice["message"]["tool_calls"][0]["function"]
+        assert call["name"] == "playwright_style_extractor"
+        assert json.loads(call["arguments"]) == {"url": "https://example.com/site/"}
+
+    def test_tool_result_is_returned_verbatim(self):
+        """Test that the follow-up after a tool call echoes the tool output."""
+        stub = StubLLMServer()
+        message, finish_reason = stub.respond({
+            "messages": [
+                {"role": "user", "content": "Scrape https://example.com"},
+                {"role": "tool", "tool_call_id": "call_0", "content": "{'html': '<html>'}"},
+            ],
+            "tools": [{"type": "function", "function": {"name": "t", "parameters": {}}}],
+        })
+
+        assert finish_reason == "stop"
+        assert message["content"] == "{'html': '<html>'}"
+
+    def test_structured_output_returns_valid_style_config(self):
+        """Test that EventStyleConfig requests get a config that validates."""
+        stub = StubLLMServer()
+        message, _ = stub.respond(
+            {
+                "messages": [
+                    {
+                        "role": "user",
+                        "content": "Compile config for http://127.0.0.1:9/tech-summit/",
+                    }
+                ],
+                "response_format": {
+                    "type": "json_schema",
+                    "json_schema": {"name": "EventStyleConfig"},
+                },
+            }
+        )
+
+        config = EventStyleConfig(**json.loads(message["content"]))
+        assert config.event_id == "tech-summit"
+        assert config.source_url == "http://127.0.0.1:9/tech-summit/"
+
+    def test_unknown_schema_is_filled_from_schema(self):
+        """Test that schemas without canned responses get a generated instance."""
+        stub = StubLLMServer()
+        schema = {
+            "type": "object",
+            "properties": {
+                "title": {"type": "string"},
+                "count": {"type": "integer"},
+                "tags": {"type": "array", "items": {"type": "string"}},
+            },
+        }
+        message, _ = stub.respond(
+            {
+                "messages": [{"role": "user", "content": "Structure this"}],
+                "response_format": {
+                    "type": "json_schema",
+                    "json_schema": {"name": "Other", "schema": schema},
+                },
+            }
+        )
+
+        assert json.loads(message["content"]) == {"title": "stub", "count": 0, "tags": ["stub"]}
+
+    def test_canned_text_override(self):
+        """Test that plain completions use the configured canned text."""
+        stub = StubLLMServer(responses={"text": "canned answer"})
+        message, _ = stub.respond({"messages": [{"role": "user", "content": "Write copy"}]})
+
+        assert message["content"] == "canned answer"
+
+    def test_latency_and_usage_accounting(self):
+        """Test that latency is applied and requests/tokens are counted."""
+        with StubLLMServer(latency_ms=100) as stub:
+            start = time.perf_counter()
+            response = post_json(f"{stub.base_url}/chat/completions", {
+                "messages": [{"role": "user", "content": "Hello"}],
+            })
+            elapsed = time.perf_counter() - start
+            stats = stub.stats()
+
+        assert elapsed >= 0.1
+        assert stats["requests"] == 1
+        assert (
+            response["usage"]["total_tokens"] == stats["prompt_tokens"] + stats["completion_tokens"]
+        )
+
+    def test_environment_points_at_stub(self):
+        """Test that the environment targets the stub and disables telemetry."""
+        with StubLLMServer() as stub:
+            env = stub.environment()
+
+        assert env["OPENAI_BASE_URL"] == stub.base_url
+        assert env["CREWAI_DISABLE_TELEMETRY"] == "true"
+
+    def test_example_from_schema_resolves_refs(self):
+        """Test that $ref and nullable unions are resolved."""
+        schema = {
+            "type": "object",
+            "properties": {
+                "inner": {"$ref": "#/$defs/Inner"},
+                "note": {"anyOf": [{"type": "string"}, {"type": "null"}], "default": None},
+            },
+            "$defs": {"Inner": {"type": "object", "properties": {"ok": {"type": "boolean"}}}},
+        }
+
+        assert example_from_schema(schema) == {"inner": {"ok": False}, "note": "stub"}
+
+
+class TestBenchmarkRunner:
+    """Tests for benchmark runs against the stub LLM and fixture server."""
+
+    def test_run_benchmark_measures_full_flow(self):
+        """Test a real StyleScrapingFlow run against the stub LLM."""
+        with patch.object(PlaywrightStyleExtractorTool, "_run", fake_scrape):
+            report = run_benchmark(SITES_DIR, iterations=1, sites=["tech-summit"], llm_latency_ms=0)
+
+        site = report.sites[0]
+        iteration = site.iterations[0]
+        assert iteration.success, iteration.error
+        assert iteration.scrape_seconds is not None
+        assert iteration.extraction_seconds > 0
+        assert iteration.end_to_end_seconds >= iteration.extraction_seconds
+        assert iteration.llm_requests == 5
+        assert iteration.tokens > 0
+        assert iteration.peak_rss_mb > 0
+        assert set(site.summary) == {
+            "scrape_seconds", "extraction_seconds", "end_to_end_seconds", "peak_rss_mb"
+        }
+
+    def test_run_benchmark_rejects_unknown_site(self):
+        """Test that unknown site names are rejected."""
+        with pytest.raises(ValueError, match="Unknown fixture sites"):
+            run_benchmark(SITES_DIR, iterations=1, sites=["no-such-site"])
+
+    def test_report_round_trip_and_compare(self, tmp_path):
+        """Test that reports are written as JSON and can be compared."""
+        with patch.object(PlaywrightStyleExtractorTool, "_run", fake_scrape):
+            report = run_benchmark(
+                SITES_DIR, iterations=1, sites=["minimal-meetup"], llm_latency_ms=0
+            )
+
+        path = write_report(report, tmp_path)
+        assert path.name == f"bench-{report.run_id}.json"
+        loaded = load_report(path)
+        assert loaded == report
+
+        comparison = compare_reports(loaded, report)
+        assert comparison["minimal-meetup"]["end_to_end_seconds"]["change_pct"] == 0.0
+
+    def test_summarize_ignores_missing_samples(self):
+        """Test that summaries skip None values."""
+        stats = summarize([1.0, None, 3.0])
+
+        assert stats.count == 2
+        assert stats.median == 2.0
+        assert summarize([None]) is None
+
+
+class TestBenchCommand:
+    """Tests for the bench CLI command."""
+
+    def test_bench_writes_results(self, tmp_path):
+        """Test that bench runs the suite and saves a JSON report."""
+        with patch.object(PlaywrightStyleExtractorTool, "_run", fake_scrape):
+            result = CliRunner().invoke(cli, [
+                "bench",
+                "--sites-dir", str(SITES_DIR),
+                "--output-dir", str(tmp_path),
+                "--site", "tech-summit",
+                "--iterations", "1",
+                "--llm-latency-ms", "0",
+            ])
+
+        assert result.exit_code == 0, result.output
+        assert "Results saved to" in result.output
+        assert len(list(tmp_path.glob("bench-*.json"))) == 1
+
+    def test_bench_reports_unknown_site(self, tmp_path):
+        """Test that bench exits non-zero for unknown sites."""
+        result = CliRunner().invoke(cli, [
+            "bench", "--sites-dir", str(SITES_DIR), "--output-dir", str(tmp_path), "--site", "nope",
+        ])
+
+        assert result.exit_code != 0
+        assert "Unknown fixture sites" in result.output
@@ -36,7 +36,7 @@ class TestCLI:
         assert result.exit_code != 0
         assert "url" in result.output.lower() or "required" in result.output.lower()
 
-    @patch("event_style_scraper.cli.StyleScrapingFlow")
+    @patch("event_style_scraper.flows.style_scraping_flow.StyleScrapingFlow")
     def test_scrape_with_valid_url(self, mock_flow_class):
         """Test scrape command with valid URL."""
         # Create mock config
@@ -75,9 +75,11 @@ class TestCLI:
         assert result.exit_code == 0
         mock_flow_class.assert_called_once_with(url="https://example.com", timeout=60)
         mock_flow.start.assert_called_once()
-        mock_flow.export_config.assert_called_once_with(config)
+        mock_flow.export_config.assert_called_once_with(
+            config, compact=False, bundle=False, css=False
+        )
 
-    @patch("event_style_scraper.cli.StyleScrapingFlow")
+    @patch("event_style_scraper.flows.style_scraping_flow.StyleScrapingFlow")
     def test_scrape_with_custom_timeout(self, mock_flow_class):
         """Test scrape command with custom timeout."""
         config_json = {
@@ -114,7 +116,7 @@ class TestCLI:
         assert result.exit_code == 0
         mock_flow_class.assert_called_once_with(url="https://example.com", timeout=120)
 
-    @patch("event_style_scraper.cli.StyleScrapingFlow")
+    @patch("event_style_scraper.flows.style_scraping_flow.StyleScrapingFlow")
     def test_scrape_handles_invalid_url(self, mock_flow_class):
         """Test scrape command handles invalid URLs gracefully."""
         mock_flow_class.side_effect = ValueError("Invalid URL: not allowed")
@@ -125,7 +127,7 @@ class TestCLI:
         assert result.exit_code != 0
         assert "error" in result.output.lower() or "invalid" in result.output.lower()
 
-    @patch("event_style_scraper.cli.StyleScrapingFlow")
+    @patch("event_style_scraper.flows.style_scraping_flow.StyleScrapingFlow")
     def test_scrape_handles_scraping_error(self, mock_flow_class):
         """Test scrape command handles scraping errors gracefully."""
         mock_flow = Mock()
@@ -138,7 +140,7 @@ class TestCLI:
         assert result.exit_code != 0
         assert "error" in result.output.lower() or "failed" in result.output.lower()
 
-    @patch("event_style_scraper.cli.StyleScrapingFlow")
+    @patch("event_style_scraper.flows.style_scraping_flow.StyleScrapingFlow")
     def test_scrape_displays_success_message(self, mock_flow_class):
         """Test that scrape command displays success message with file path."""
         config_json = {
@@ -0,0 +1,83 @@
+"""Tests for clustering attendees by session choices."""
+
+import pytest
+
+from event_style_scraper.clustering import cluster_attendees
+
+
+def attendee(attendee_id, session_ids, track="AI"):
+    """Build an attendee who attended the given sessions."""
+    return {
+        "id": attendee_id,
+        "sessions": [{"id": s, "title": f"Session {s}", "track": track} for s in session_ids],
+    }
+
+
+class TestClusterAttendees:
+    """Tests for cluster_attendees."""
+
+    def test_near_identical_session_sets_share_a_cluster(self):
+        """Test that small differences cluster together and different agendas do not."""
+        core = [f"s{i}" for i in range(8)]
+        attendees = [
+            attendee("1", core),
+            attendee("2", core),
+            attendee("3", core[:7] + ["s99"]),
+            attendee("4", ["x1", "x2", "x3"], track="Ops"),
+        ]
+
+        clusters = cluster_attendees(attendees)
+
+        assert clusters.labels == [0, 0, 0, 1]
+        assert clusters.clusters[0].size == 3
+        assert clusters.compression_ratio == 2.0
+        assert clusters.clusters[1].tracks == ["Ops"]
+
+    def test_threshold_one_groups_only_identical_sets(self):
+        """Test that a threshold of 1 keeps every distinct session set apart."""
+        core = [f"s{i}" for i in range(8)]
+        attendees = [attendee("1", core), attendee("2", core[:7] + ["s99"]), attendee("3", core)]
+
+        clusters = cluster_attendees(attendees, threshold=1.0)
+
+        assert clusters.labels == [0, 1, 0]
+
+    def test_summary_lists_majority_sessions(self):
+        """Test that a cluster is summarized by sessions most members attended."""
+        attendees = [
+            attendee("1", ["a", "b", "c"]),
+            attendee("2", ["a", "b", "c"]),
+            attendee("3", ["a", "b", "d"]),
+        ]
+
+        summary = cluster_attendees(attendees).clusters[0]
+
+        assert summary.sessions == ["Session a", "Session b", "Session c"]
+        assert summary.key == cluster_attendees(list(reversed(attendees))).clusters[0].key
+
+    def test_attendees_without_sessions(self):
+        """Test that attendees without sessions form their own cluster."""
+        clusters = cluster_attendees(
+            [{"id": "1"}, attendee("2", ["a"]), {"id": "3", "sessions": []}]
+        )
+
+        assert clusters.labels[0] == clusters.labels[2] != clusters.labels[1]
+        assert clusters.clusters[clusters.labels[0]].sessions == []
+
+    def test_empty_event(self):
+        """Test that no attendees give no clusters."""
+        clusters = cluster_attendees([])
+
+        assert clusters.labels == []
+        assert clusters.compression_ratio == 0.0
+
+    @pytest.mark.parametrize("size", [2000])
+    def test_large_event_compresses(self, size):
+        """Test that attendees drawn from a few agendas collapse to those agendas."""
+        agendas = [[f"s{k}-{j}" for j in range(6)] for k in range(5)]
+        attendees = [attendee(str(i), agendas[i % 5][: 5 + i % 2]) for i in range(size)]
+
+        clusters = cluster_attendees(attendees)
+
+        assert len(clusters.clusters) == 5
+        assert clusters.compression_ratio == size / 5
@@ -0,0 +1,183 @@
+"""Tests for CSS color parsing and perceptual color distance."""
+
+import time
+
+import numpy as np
+import pytest
+
+from event_style_scraper.colors import (
+    Color,
+    canonical_color,
+    color_distance,
+    dedupe_colors,
+    delta_e_2000,
+    delta_e_matrix,
+    normalize_color,
+    parse_color,
+    parse_colors,
+    rgb_to_lab,
+)
+
+
+class TestParseColor:
+    """Tests for parse_color."""
+
+    def test_hex_forms(self):
+        """Test short, long and alpha hex colors."""
+        assert parse_color("#ABC") == Color(170, 187, 204)
+        assert parse_color("#1a3c8f") == Color(26, 60, 143)
+        assert parse_color("#1a3c8f80").alpha == pytest.approx(128 / 255)
+        assert parse_color("#0000").alpha == 0
+
+    def test_rgb_forms(self):
+        """Test comma and space syntax, percentages and clamping."""
+        assert parse_color("rgb(26, 60, 143)") == Color(26, 60, 143)
+        assert parse_color("rgba(255,255,255,.5)") == Color(255, 255, 255, 0.5)
+        assert parse_color("rgb(26 60 143 / 50%)") == Color(26, 60, 143, 0.5)
+        assert parse_color("rgb(100%, 0%, 50%)") == Color(255, 0, 128)
+        assert parse_color("rgb(300, -2, 10)") == Color(255, 0, 10)
+
+    def test_hsl_and_named(self):
+        """Test hsl() with hue units and case-insensitive named colors."""
+        assert parse_color("hsl(120, 100%, 25%)") == Color(0, 128, 0)
+        assert parse_color("hsla(0.5turn 50% 50% / 0.25)") == Color(64, 191, 191, 0.25)
+        assert parse_color("RebeccaPurple") == Color(102, 51, 153)
+        assert parse_color("transparent") == Color(0, 0, 0, 0.0)
+
+    def test_invalid(self):
+        """Test that malformed values are rejected."""
+        for value in (
+            None,
+            "",
+            "not-a-color",
+            "#12",
+            "rgb(1, 2)",
+            "hsl(10, 10, 10)",
+            "rgb(a, b, c)",
+        ):
+            assert parse_color(value) is None
+
+
+class TestNormalizeColor:
+    """Tests for CSS color normalization."""
+
+    def test_hex_forms(self):
+        """Test that short, long and alpha hex colors normalize to #rrggbb."""
+        assert normalize_color("#ABC") == "#aabbcc"
+        assert normalize_color("#1A3C8F") == "#1a3c8f"
+        assert normalize_color("#1a3c8fff") == "#1a3c8f"
+
+    def test_rgb_forms(self):
+        """Test that rgb() and opaque rgba() normalize to hex."""
+        assert normalize_color("rgb(26, 60, 143)") == "#1a3c8f"
+        assert normalize_color("rgba(255, 255, 255, 0.5)") == "#ffffff"
+
+    def test_transparent_and_unknown(self):
+        """Test that transparent and unsupported values return None."""
+        assert normalize_color("rgba(0, 0, 0, 0)") is None
+        assert normalize_color("#00000000") is None
+        assert normalize_color("transparent") is None
+        assert normalize_color(None) is None
+
+    def test_canonical_color_keeps_translucency(self):
+        """Test that canonical colors are #rrggbb, or #rrggbbaa when translucent."""
+        assert canonical_color("#ABC") == "#aabbcc"
+        assert canonical_color("rgba(26, 60, 143, 0.5)") == "#1a3c8f80"
+        assert canonical_color("transparent") == "#00000000"
+        assert canonical_color("bogus") is None
+
+
+class TestDeltaE:
+    """Tests for CIELAB conversion and CIEDE2000 distances."""
+
+    def test_lab_reference_values(self):
+        """Test sRGB to CIELAB against known values."""
+        lab = rgb_to_lab(np.array([[255, 255, 255], [0, 0, 0], [255, 0, 0]]))
+
+        np.testing.assert_allclose(lab, [[100, 0, 0], [0, 0, 0], [53.24, 80.09, 67.20]], atol=0.01)
+
+    def test_ciede2000_reference_pairs(self):
+        """Test pairs from Sharma, Wu and Dalal's CIEDE2000 test data."""
+        lab1 = [[50, 2.6772, -79.7751], [50, 2.5, 0], [2.0776, 0.0795, -1.135], [50, 0, 0]]
+        lab2 = [[50, 0, -82.7485], [73, 25, -18], [0.9033, -0.0636, -0.5514], [50, -1, 2]]
+
+        np.testing.assert_allclose(
+            delta_e_2000(lab1, lab2), [2.0425, 27.1492, 0.9082, 2.3669], atol=1e-4
+        )
+
+    def test_matrix_and_distance(self):
+        """Test that the matrix is symmetric with a zero diagonal and matches color_distance."""
+        colors = ["#1a3c8f", "navy", "hsl(0, 100%, 50%)", "#ffffff"]
+
+        matrix = delta_e_matrix(colors)
+
+        assert matrix.shape == (4, 4)
+        np.testing.assert_allclose(matrix, matrix.T, atol=1e-9)
+        np.testing.assert_allclose(np.diag(matrix), 0, atol=1e-9)
+        assert color_distance("#1a3c8f", "navy") == pytest.approx(matrix[0, 1])
+        assert color_distance("#000", "#fff") == pytest.approx(100.0, abs=0.01)
+
+    def test_invalid_colors_rejected(self):
+        """Test that distances to non-colors raise ValueError."""
+        with pytest.raises(ValueError, match="Invalid colors"):
+            delta_e_matrix(["#fff", "bogus"])
+
+    def test_parse_colors_mask(self):
+        """Test that bulk parsing flags values that are not colors."""
+        rgb, valid = parse_colors(["#fff", "nope", "rgb(1, 2, 3)"])
+
+        assert rgb.shape == (3, 3)
+        assert valid.tolist() == [True, False, True]
+
+
+class TestDedupeColors:
+    """Tests for perceptual de-duplication."""
+
+    def test_drops_near_duplicates_in_order(self):
+        """Test that spellings of one color and imperceptible shifts collapse to the first."""
+        colors = [
+            "#fff",
+            "white",
+            "#fefefe",
+            "rgb(0, 0, 0)",
+            "transparent",
+            "#010101",
+            "#1a3c8f",
+            None,
+        ]
+
+        assert dedupe_colors(colors) == ["#ffffff", "#000000", "#1a3c8f"]
+
+    def test_threshold(self):
+        """Test that a larger threshold merges more colors."""
+        colors = ["#1a3c8f", "#2a4a9f", "#ff0000"]
+
+        assert dedupe_colors(colors) == colors
+        assert dedupe_colors(colors, threshold=10) == ["#1a3c8f", "#ff0000"]
+
+    def test_matches_pairwise_greedy(self):
+        """Test that the windowed search keeps the same colors as comparing every pair."""
+        rng = np.random.default_rng(7)
+        colors = [f"#{value:06x}" for value in rng.integers(0, 2 ** 24, 600)]
+
+        matrix = delta_e_matrix(colors)
+        dropped = np.zeros(len(colors), dtype=bool)
+        expected = []
+        for i in range(len(colors)):
+            if not dropped[i]:
+                expected.append(colors[i])
+                dropped[i + 1:] |= matrix[i, i + 1:] < 2.3
+
+        assert dedupe_colors(colors) == expected
+
+    def test_thousands_of_candidates_are_fast(self):
+        """Test that thousands of candidates repeating a few hundred colors take under a second."""
+        rng = np.random.default_rng(0)
+        palette = [f"#{value:06x}" for value in rng.integers(0, 2 ** 24, 300)]
+        candidates = [palette[i] for i in rng.integers(0, len(palette), 5000)]
+
+        start = time.perf_counter()
+        kept = dedupe_colors(candidates)
+
+        assert time.perf_counter() - start < 0.5
+        assert 0 < len(kept) <= len(palette)
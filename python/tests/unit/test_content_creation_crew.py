@@ -4,9 +4,26 @@ import pytest
 from pathlib import Path
 from unittest.mock import Mock, patch
 import json
+from functools import partial
 
-from event_style_scraper.crews.content_creation_crew import ContentCreationCrew
+from event_style_scraper.crews.content_creation_crew import ContentCreationCrew, attendee_inputs
 from event_style_scraper.types import EventStyleConfig, ColorPalette, Typography, BrandVoice
+from unit.factories import make_style_config
+
+make_config = partial(
+    make_style_config,
+    "test",
+    event_name="Test",
+    source_url="https://example.com",
+    primary="#667eea",
+    keywords=["test"],
+)
+
+
+@pytest.fixture
+def style_config():
+    """Minimal style config."""
+    return make_config()
 
 
 class TestContentCreationCrew:
@@ -331,3 +348,219 @@ class TestContentCreationCrew:
         assert hasattr(crew, "config_dir")
         assert isinstance(crew.config_dir, Path)
         assert crew.config_dir.name == "config"
+
+
+class TestContentCreationCrewSharedConfig:
+    """Tests for sharing one YAML parse across crews."""
+
+    def test_yaml_parsed_once_for_many_crews(self, style_config):
+        """Test that building crews for many attendees does not re-read the YAML."""
+        ContentCreationCrew(attendee_data={"id": "0"}, style_config=style_config)
+
+        with patch("yaml.safe_load") as safe_load:
+            for attendee_id in range(3):
+                ContentCreationCrew(
+                    attendee_data={"id": str(attendee_id)}, style_config=style_config
+                ).crew()
+
+        safe_load.assert_not_called()
+
+    def test_crews_do_not_share_mutable_config(self, style_config):
+        """Test that each crew gets its own copy of the parsed configuration."""
+        first = ContentCreationCrew(attendee_data={"id": "1"}, style_config=style_config)
+        second = ContentCreationCrew(attendee_data={"id": "2"}, style_config=style_config)
+
+        assert first.tasks_config.keys() == second.tasks_config.keys()
+        assert first.tasks_config is not second.tasks_config
+
+    def test_verbose_can_be_disabled(self, style_config):
+        """Test that batch runs can silence agent logging."""
+        crew = ContentCreationCrew(
+            attendee_data={"id": "1"}, style_config=style_config, verbose=False
+        ).crew()
+
+        assert crew.verbose is False
+        assert all(agent.verbose is False for agent in crew.agents)
+
+
+class TestContentCreationCrewTemplate:
+    """Tests for attendee-less template crews reused across attendees."""
+
+    @pytest.fixture
+    def style_config(self):
+        """Style config with an energetic, bold brand voice."""
+        return make_config(tone="energetic", style="bold", keywords=["innovation"])
+
+    def test_template_keeps_attendee_placeholders(self, style_config):
+        """Test that analyze_attendee keeps placeholders and brand voice is filled in."""
+        crew = ContentCreationCrew(None, style_config)
+
+        assert "{attendee_name}" in crew.analyze_attendee().description
+        assert "{session_count}" in crew.analyze_attendee().description
+        assert "Tone: energetic" in crew.apply_brand_voice().description
+
+    def test_template_interpolates_attendee_per_run(self, style_config):
+        """Test that kickoff inputs fill in each attendee in turn."""
+        task = ContentCreationCrew(None, style_config).analyze_attendee()
+
+        task.interpolate_inputs_and_add_conversation_history(
+            attendee_inputs({"firstName": "Jane", "lastName": "Doe", "sessions": [{}, {}]})
+        )
+        assert "Attendee: Jane Doe" in task.description
+        assert "Sessions attended: 2" in task.description
+        task.interpolate_inputs_and_add_conversation_history(attendee_inputs({"firstName": "Sam"}))
+        assert "Attendee: Sam" in task.description
+        assert "Jane" not in task.description
+
+    def test_attendee_inputs_match_direct_crew(self, style_config):
+        """Test that template runs see the same prompt as a per-attendee crew."""
+        attendee = {
+            "firstName": "Jane",
+            "lastName": "Doe",
+            "sessions": [{}],
+            "connections": [{}, {}, {}],
+        }
+        direct = ContentCreationCrew(attendee, style_config).analyze_attendee()
+        template = ContentCreationCrew(None, style_config).analyze_attendee()
+
+        template.interpolate_inputs_and_add_conversation_history(attendee_inputs(attendee))
+
+        assert template.description == direct.description
+
+
+class TestContentCreationCrewAnalysis:
+    """Tests for computed versus LLM attendee analysis."""
+
+    def test_default_crew_skips_analysis_task(self, style_config):
+        """Test that the computed profile replaces the analyze_attendee task."""
+        attendee = {
+            "id": "1",
+            "firstName": "Jane",
+            "sessions": [{"track": "AI", "durationMinutes": 30}],
+        }
+        content_crew = ContentCreationCrew(attendee, style_config)
+        crew = content_crew.crew()
+
+        assert [t.name for t in crew.tasks] == [
+            "generate_content",
+            "apply_brand_voice",
+            "quality_check",
+        ]
+        assert "Personalization Specialist" not in [a.role.strip() for a in crew.agents]
+        profile = json.loads(content_crew.analyze_attendee().output.raw)
+        assert profile["session_count"] == 1
+        assert profile["top_tracks"] == ["AI"]
+
+    def test_rich_analysis_keeps_llm_task(self, style_config):
+        """Test that rich analysis runs all four tasks."""
+        crew = ContentCreationCrew({"id": "1"}, style_config, rich_analysis=True).crew()
+
+        assert len(crew.tasks) == 4
+        assert len(crew.agents) == 4
+
+    def test_template_profile_set_per_attendee(self, style_config):
+        """Test that template crews take each attendee's profile as context."""
+        content_crew = ContentCreationCrew(None, style_config)
+        crew = content_crew.crew()
+
+        content_crew.set_attendee_profile('{"name": "Sam"}')
+
+        context = crew.tasks[0].context
+        assert [t.name for t in context] == ["analyze_attendee"]
+        assert context[0].output.raw == '{"name": "Sam"}'
+
+    def test_quality_check_split_into_review_crew(self, style_config):
+        """Test that the quality check can run separately on preset content."""
+        content_crew = ContentCreationCrew(None, style_config, run_quality_check=False)
+        crew = content_crew.crew()
+        review = content_crew.review_crew()
+
+        content_crew.set_task_output("apply_brand_voice", "Hi Sam!")
+
+        assert [t.name for t in crew.tasks] == ["generate_content", "apply_brand_voice"]
+        assert "Quality Editor" not in [a.role.strip() for a in crew.agents]
+        assert [t.name for t in review.tasks] == ["quality_check"]
+        context = {t.name: t.output for t in review.tasks[0].context}
+        assert context["apply_brand_voice"].raw == "Hi Sam!"
+
+
+class TestClusterContentCrew:
+    """Tests for the cluster-then-personalize crew."""
+
+    @pytest.fixture
+    def style_config(self):
+        """Style config with an energetic brand voice."""
+        return make_config(tone="energetic", keywords=["innovation", "community"])
+
+    def test_single_task_crews(self, style_config):
+        """Test that drafting and personalization are one task each."""
+        from event_style_scraper.crews.cluster_content_crew import ClusterContentCrew
+
+        content_crew = ClusterContentCrew(style_config, verbose=False)
+
+        assert [t.name for t in content_crew.highlights_crew().tasks] == ["draft_highlights"]
+        assert [t.name for t in content_crew.personalization_crew().tasks] == [
+            "personalize_content"
+        ]
+
+    def test_inputs_fill_every_placeholder(self, style_config):
+        """Test that kickoff inputs cover the task templates, including brand voice."""
+        from event_style_scraper.clustering import ClusterSummary
+        from event_style_scraper.crews.cluster_content_crew import ClusterContentCrew
+
+        content_crew = ClusterContentCrew(style_config, verbose=False)
+        cluster = ClusterSummary(label=0, size=4, sessions=["Keynote"], tracks=["AI"], key="k")
+
+        highlights = content_crew.draft_highlights()
+        highlights.interpolate_inputs_and_add_conversation_history(
+            content_crew.highlights_inputs(cluster)
+        )
+        personalize = content_crew.personalize_content()
+        personalize.interpolate_inputs_and_add_conversation_history(
+            content_crew.personalization_inputs('{"name": "Sam"}', "Draft text")
+        )
+
+        assert "Keynote" in highlights.description
+        assert "innovation, community" in highlights.description
+        assert '{"name": "Sam"}' in personalize.description
+        assert "{" not in highlights.description
+
+
+class TestSinglePassContentCrew:
+    """Tests for the single-pass content crew."""
+
+    @pytest.fixture
+    def style_config(self):
+        """Style config with an energetic brand voice."""
+        return make_config(tone="energetic", keywords=["innovation", "community"])
+
+    def test_one_structured_task(self, style_config):
+        """Test that the crew is one task with a pydantic output and brand voice in its prompt."""
+        from event_style_scraper.crews.single_pass_content_crew import SinglePassContentCrew
+        from event_style_scraper.types import AttendeeContent
+
+        content_crew = SinglePassContentCrew(style_config, verbose=False)
+        crew = content_crew.crew()
+        task = crew.tasks[0]
+        task.interpolate_inputs_and_add_conversation_history(
+            content_crew.inputs("Sam Lee", '{"name": "Sam Lee"}')
+        )
+
+        assert len(crew.tasks) == 1 and len(crew.agents) == 1
+        assert task.output_pydantic is AttendeeContent
+        assert "Sam Lee" in task.description
+        assert "energetic" in task.description and "innovation, community" in task.description
+        assert "{" not in task.description.replace('{"name": "Sam Lee"}', "")
+
+    def test_content_renders_sections(self):
+        """Test that AttendeeContent renders its non-empty sections as paragraphs."""
+        from event_style_scraper.types import AttendeeContent
+
+        content = AttendeeContent(
+            greeting="Hi Sam.",
+            session_highlights="Great sessions.",
+            achievements=" ",
+            call_to_action="See you.",
+        )
+
+        assert content.to_text() == "Hi Sam.\n\nGreat sessions.\n\nSee you."
@@ -0,0 +1,718 @@
+"""Tests for batch content generation across an event's attendees."""
+
+import json
+from unittest.mock import patch
+
+import pytest
+from click.testing import CliRunner
+from crewai import Crew, Task
+
+from event_style_scraper.benchmarks import StubLLMServer
+from event_style_scraper.benchmarks.metrics import patched_environ
+from event_style_scraper.cli import cli
+from event_style_scraper.content_generation import (
+    content_input_hash,
+    generate_event_content,
+    load_style_config,
+    merge_event_content,
+    stored_input_hash,
+)
+from event_style_scraper.crews.content_creation_crew import ContentCreationCrew
+from event_style_scraper.ingest import Shard
+from event_style_scraper.quality import QualityGates
+from event_style_scraper.types import BrandVoice, ColorPalette, EventStyleConfig, Typography
+
+EVENT_ID = "test-event"
+
+
+@pytest.fixture
+def event_data(tmp_path):
+    """Attendees of two events and a style config for one of them."""
+    attendees_dir = tmp_path / "attendees"
+    attendees_dir.mkdir()
+    for attendee_id, event_id in [
+        ("1", EVENT_ID),
+        ("2", EVENT_ID),
+        ("3", "other-event"),
+        ("4", EVENT_ID),
+    ]:
+        attendee = {
+            "id": attendee_id,
+            "firstName": f"Attendee{attendee_id}",
+            "eventId": event_id,
+            "sessions": [],
+        }
+        (attendees_dir / f"{attendee_id}.json").write_text(json.dumps(attendee))
+
+    style_configs_dir = tmp_path / "style-configs"
+    style_configs_dir.mkdir()
+    config = EventStyleConfig(
+        event_id=EVENT_ID,
+        event_name="Test Event",
+        source_url="https://example.com",
+        colors=ColorPalette(
+            primary="#667eea",
+            secondary="#764ba2",
+            accent="#f093fb",
+            background="#ffffff",
+            text="#1a202c",
+        ),
+        typography=Typography(heading_font="Inter, sans-serif", body_font="system-ui, sans-serif"),
+        brand_voice=BrandVoice(tone="professional", style="modern", keywords=["innovation"]),
+    )
+    (style_configs_dir / f"{EVENT_ID}.json").write_text(config.model_dump_json())
+    return attendees_dir, style_configs_dir
+
+
+@pytest.fixture
+def stub_llm():
+    """Stub LLM that CrewAI is pointed at."""
+    with StubLLMServer() as stub, patched_environ(stub.environment()):
+        yield stub
+
+
+class TestLoading:
+    """Tests for loading style configs."""
+
+    def test_missing_style_config(self, event_data):
+        """Test that a missing style config is reported clearly."""
+        with pytest.raises(FileNotFoundError, match="No style config"):
+            load_style_config(event_data[1], "other-event")
+
+
+class TestGenerateEventContent:
+    """Tests for generate_event_content."""
+
+    def test_generates_content_for_every_attendee(self, event_data, stub_llm, tmp_path):
+        """Test that each attendee's content is written and throughput reported."""
+        attendees_dir, style_configs_dir = event_data
+
+        report = generate_event_content(
+            EVENT_ID, attendees_dir, style_configs_dir, output_dir=tmp_path / "out", concurrency=2
+        )
+
+        assert (report.succeeded, report.failed) == (3, 0)
+        assert report.attendees_per_minute > 0
+        assert report.total_tokens > 0
+        # Writer and brand voice per attendee, plus the editor because the
+        # stub's canned text fails the quality gates; the analysis is computed
+        assert stub_llm.stats()["requests"] == 9
+        written = json.loads((tmp_path / "out" / EVENT_ID / "2.json").read_text())
+        assert written["attendee_id"] == "2"
+        assert written["event_id"] == EVENT_ID
+        assert written["content"]
+
+    def test_failed_attendee_does_not_abort(self, event_data, stub_llm, tmp_path):
+        """Test that one attendee's failure is reported while the rest complete."""
+        original_kickoff = Crew.kickoff
+
+        def kickoff(self, inputs=None, **kwargs):
+            if inputs and inputs["attendee_name"] == "Attendee2":
+                raise RuntimeError("LLM unavailable")
+            return original_kickoff(self, inputs=inputs, **kwargs)
+
+        with patch.object(Crew, "kickoff", kickoff):
+            report = generate_event_content(
+                EVENT_ID, *event_data, output_dir=tmp_path / "out", concurrency=1
+            )
+
+        assert (report.succeeded, report.failed) == (2, 1)
+        failed = [r for r in report.results if not r.success][0]
+        assert (failed.attendee_id, failed.error) == ("2", "LLM unavailable")
+        assert not (tmp_path / "out" / EVENT_ID / "2.json").exists()
+
+    def test_rich_analysis_uses_llm(self, event_data, stub_llm, tmp_path):
+        """Test that --rich-analysis adds the LLM analysis task back."""
+        report = generate_event_content(
+            EVENT_ID, *event_data, output_dir=tmp_path / "out", rich_analysis=True
+        )
+
+        assert report.succeeded == 3
+        assert report.rich_analysis
+        assert stub_llm.stats()["requests"] == 12
+
+    def test_crew_built_once_per_worker(self, event_data, stub_llm, tmp_path):
+        """Test that one worker reuses a single template crew for every attendee."""
+        with patch.object(
+            ContentCreationCrew, "crew", autospec=True, side_effect=ContentCreationCrew.crew
+        ) as build:
+            report = generate_event_content(
+                EVENT_ID, *event_data, output_dir=tmp_path / "out", concurrency=1
+            )
+
+        assert report.succeeded == 3
+        build.assert_called_once()
+        # Per-attendee usage, not the reused crew's running total
+        usages = [r.token_usage for r in report.results]
+        assert max(usages) < 1.5 * min(usages)
+
+    def test_style_config_loaded_once(self, event_data, stub_llm, tmp_path):
+        """Test that every attendee shares one loaded EventStyleConfig."""
+        with patch(
+            "event_style_scraper.content_generation.load_style_config", wraps=load_style_config
+        ) as load:
+            generate_event_content(EVENT_ID, *event_data, output_dir=tmp_path / "out")
+
+        load.assert_called_once()
+
+    def test_streams_attendees_from_export(self, event_data, stub_llm, tmp_path):
+        """Test that a JSONL export feeds generation, skipping invalid records."""
+        attendees_dir, style_configs_dir = event_data
+        export = tmp_path / "export.jsonl"
+        lines = [p.read_text() for p in sorted(attendees_dir.glob("*.json"))] + ['{"id": "9"}']
+        export.write_text("\n".join(json.dumps(json.loads(line)) for line in lines))
+
+        report = generate_event_content(
+            EVENT_ID,
+            attendees_dir,
+            style_configs_dir,
+            output_dir=tmp_path / "out",
+            attendees_file=export,
+        )
+
+        assert [r.attendee_id for r in report.results] == ["1", "2", "4"]
+        assert report.succeeded == 3
+        assert [record.line for record in report.invalid_records] == [5]
+
+    def test_event_without_attendees(self, event_data, tmp_path):
+        """Test that an event with no attendees is an error."""
+        attendees_dir, style_configs_dir = event_data
+        (style_configs_dir / "empty-event.json").write_text(
+            (style_configs_dir / f"{EVENT_ID}.json").read_text()
+        )
+
+        with pytest.raises(ValueError, match="No attendees"):
+            generate_event_content(
+                "empty-event", attendees_dir, style_configs_dir, output_dir=tmp_path
+            )
+
+
+class TestIncrementalRegeneration:
+    """Tests for skipping attendees whose inputs are unchanged."""
+
+    def test_rerun_skips_unchanged_attendees(self, event_data, stub_llm, tmp_path):
+        """Test that only attendees with changed records are regenerated."""
+        attendees_dir, style_configs_dir = event_data
+        generate_event_content(
+            EVENT_ID, attendees_dir, style_configs_dir, output_dir=tmp_path / "out"
+        )
+        requests = stub_llm.stats()["requests"]
+        attendee = json.loads((attendees_dir / "2.json").read_text())
+        attendee["connections"] = [{"name": "Late Connection", "company": "Acme"}]
+        (attendees_dir / "2.json").write_text(json.dumps(attendee))
+
+        report = generate_event_content(
+            EVENT_ID, attendees_dir, style_configs_dir, output_dir=tmp_path / "out"
+        )
+
+        assert (report.regenerated, report.skipped, report.failed) == (1, 2, 0)
+        assert [r.attendee_id for r in report.results if not r.skipped] == ["2"]
+        assert stub_llm.stats()["requests"] == requests + 3
+
+    def test_new_attendee_leaves_others_unchanged(self, event_data, stub_llm, tmp_path):
+        """Test that adding an attendee to the event only generates content for them."""
+        attendees_dir, style_configs_dir = event_data
+        generate_event_content(
+            EVENT_ID, attendees_dir, style_configs_dir, output_dir=tmp_path / "out"
+        )
+        sessions = [{"title": "Keynote", "track": "AI", "durationMinutes": 45}] * 2
+        late = {"id": "5", "firstName": "Attendee5", "eventId": EVENT_ID, "sessions": sessions}
+        (attendees_dir / "5.json").write_text(json.dumps(late))
+
+        report = generate_event_content(
+            EVENT_ID, attendees_dir, style_configs_dir, output_dir=tmp_path / "out"
+        )
+
+        assert (report.regenerated, report.skipped, report.failed) == (1, 3, 0)
+        assert [r.attendee_id for r in report.results if not r.skipped] == ["5"]
+
+    def test_brand_voice_and_model_changes_regenerate(self, event_data, stub_llm, tmp_path):
+        """Test that a new brand voice or model invalidates every attendee."""
+        attendees_dir, style_configs_dir = event_data
+        generate_event_content(
+            EVENT_ID, attendees_dir, style_configs_dir, output_dir=tmp_path / "out"
+        )
+        config_path = style_configs_dir / f"{EVENT_ID}.json"
+        config = json.loads(config_path.read_text())
+        config["brand_voice"]["tone"] = "playful"
+        config_path.write_text(json.dumps(config))
+
+        voice_report = generate_event_content(
+            EVENT_ID, attendees_dir, style_configs_dir, output_dir=tmp_path / "out"
+        )
+        with patched_environ({"MODEL": "gpt-4o"}):
+            model_report = generate_event_content(
+                EVENT_ID, attendees_dir, style_configs_dir, output_dir=tmp_path / "out"
+            )
+
+        assert (voice_report.regenerated, voice_report.skipped) == (3, 0)
+        assert (model_report.regenerated, model_report.skipped) == (3, 0)
+
+    def test_force_regenerates_everything(self, event_data, stub_llm, tmp_path):
+        """Test that force ignores stored input hashes."""
+        generate_event_content(EVENT_ID, *event_data, output_dir=tmp_path / "out")
+
+        report = generate_event_content(
+            EVENT_ID, *event_data, output_dir=tmp_path / "out", force=True
+        )
+
+        assert (report.regenerated, report.skipped) == (3, 0)
+
+    def test_input_hash_ignores_key_order(self, event_data):
+        """Test that the hash depends on values, not on how the record was written."""
+        voice = BrandVoice(tone="professional", style="modern", keywords=["innovation"])
+        first = content_input_hash({"id": "1", "firstName": "A"}, None, voice, "v1", "model")
+        reordered = content_input_hash({"firstName": "A", "id": "1"}, None, voice, "v1", "model")
+        new_prompts = content_input_hash({"id": "1", "firstName": "A"}, None, voice, "v2", "model")
+
+        assert first == reordered
+        assert first != new_prompts
+
+
+class TestShardedGeneration:
+    """Tests for sharded generation and merging."""
+
+    def test_shards_cover_event_and_merge(self, event_data, stub_llm, tmp_path):
+        """Test that three shards generate each attendee once and merge into one file."""
+        out = tmp_path / "out"
+        reports = [
+            generate_event_content(EVENT_ID, *event_data, output_dir=out, shard=Shard(i, 3))
+            for i in (1, 2, 3)
+        ]
+
+        merged = merge_event_content(EVENT_ID, out, expected_ids=["1", "2", "4"])
+
+        assert sorted(r.attendee_id for report in reports for r in report.results) == [
+            "1",
+            "2",
+            "4",
+        ]
+        assert [report.shard for report in reports] == ["1/3", "2/3", "3/3"]
+        assert stub_llm.stats()["requests"] == 9
+        assert merged.complete
+        assert (merged.attendee_count, merged.shard_count) == (3, 3)
+        bundle = json.loads((out / f"{EVENT_ID}.json").read_text())
+        assert [a["attendee_id"] for a in bundle["attendees"]] == ["1", "2", "4"]
+
+    def test_sharding_does_not_change_content_inputs(self, event_data, stub_llm, tmp_path):
+        """Test that shards see event-wide profiles, so unsharded content stays up to date."""
+        out = tmp_path / "out"
+        generate_event_content(EVENT_ID, *event_data, output_dir=out)
+
+        reports = [
+            generate_event_content(EVENT_ID, *event_data, output_dir=out, shard=Shard(i, 3))
+            for i in (1, 2, 3)
+        ]
+
+        assert sum(report.skipped for report in reports) == 3
+
+    def test_merge_reports_incomplete_event(self, event_data, stub_llm, tmp_path):
+        """Test that unfinished shards, unseen attendees and failures block the merge."""
+        out = tmp_path / "out"
+        generate_event_content(EVENT_ID, *event_data, output_dir=out, shard=Shard(3, 3))
+        (out / EVENT_ID / "1.json").unlink()
+
+        merged = merge_event_content(EVENT_ID, out, expected_ids=["1", "2", "4", "5"])
+
+        assert not merged.complete
+        assert merged.missing_shards == ["1/3", "2/3"]
+        assert merged.missing == ["4", "5"]
+        assert merged.failed == ["1"]
+        assert merged.output_path is None
+        assert not (out / f"{EVENT_ID}.json").exists()
+
+    def test_merge_reports_duplicates_and_mixed_counts(self, tmp_path):
+        """Test that attendees claimed twice and stale manifests are detected."""
+        shards_dir = tmp_path / EVENT_ID / "shards"
+        shards_dir.mkdir(parents=True)
+        for index, ids in ((1, ["1", "2"]), (2, ["2"])):
+            manifest = {
+                "event_id": EVENT_ID,
+                "shard": f"{index}/2",
+                "attendee_ids": ids,
+                "results": [],
+            }
+            (shards_dir / f"shard-{index}-of-2.json").write_text(json.dumps(manifest))
+
+        assert merge_event_content(EVENT_ID, tmp_path).duplicated == ["2"]
+
+        (shards_dir / "shard-1-of-1.json").write_text(
+            json.dumps({"event_id": EVENT_ID, "shard": "1/1", "attendee_ids": [], "results": []})
+        )
+        with pytest.raises(ValueError, match="different shard counts"):
+            merge_event_content(EVENT_ID, tmp_path)
+        with pytest.raises(FileNotFoundError, match="No shard manifests"):
+            merge_event_content("other-event", tmp_path)
+
+
+class TestClusteredGeneration:
+    """Tests for cluster-then-personalize generation."""
+
+    def test_one_draft_per_cluster(self, event_data, stub_llm, tmp_path):
+        """Test that similar attendees share a draft and get one call each."""
+        report = generate_event_content(
+            EVENT_ID, *event_data, output_dir=tmp_path / "out", mode="clustered"
+        )
+
+        assert (report.succeeded, report.failed) == (3, 0)
+        # The fixture's attendees attended no sessions, so they form one cluster
+        assert report.cluster_count == 1
+        assert report.compression_ratio == 3.0
+        assert report.drafts_generated == 1
+        assert report.draft_tokens > 0
+        assert stub_llm.stats()["requests"] == 1 + 3
+        assert (tmp_path / "out" / EVENT_ID / "drafts").is_dir()
+
+    def test_sharded_compression_ratio_counts_shard_clusters(self, event_data, stub_llm, tmp_path):
+        """Test that each shard's ratio is over the clusters its own attendees fall in."""
+        attendees_dir = tmp_path / "clustered-attendees"
+        attendees_dir.mkdir()
+        # Attendee 3 is the only one in shard 2/2 and alone in its cluster
+        for attendee_id, session in (
+            ("1", "A"),
+            ("2", "A"),
+            ("3", "B"),
+            ("4", "C"),
+            ("5", "C"),
+            ("6", "C"),
+        ):
+            attendee = {
+                "id": attendee_id,
+                "firstName": f"Attendee{attendee_id}",
+                "eventId": EVENT_ID,
+                "sessions": [
+                    {"id": session, "title": f"Session {session}", "track": f"Track {session}"}
+                ],
+            }
+            (attendees_dir / f"{attendee_id}.json").write_text(json.dumps(attendee))
+
+        first, second = (
+            generate_event_content(
+                EVENT_ID,
+                attendees_dir,
+                event_data[1],
+                output_dir=tmp_path / "out",
+                mode="clustered",
+                shard=Shard(i, 2),
+            )
+            for i in (1, 2)
+        )
+
+        assert (len(first.results), first.cluster_count, first.compression_ratio) == (5, 2, 2.5)
+        assert (len(second.results), second.cluster_count, second.compression_ratio) == (1, 1, 1.0)
+
+    def test_saved_drafts_are_reused(self, event_data, stub_llm, tmp_path):
+        """Test that reruns skip unchanged attendees and reuse saved drafts."""
+        out = tmp_path / "out"
+        generate_event_content(EVENT_ID, *event_data, output_dir=out, mode="clustered")
+
+        unchanged = generate_event_content(EVENT_ID, *event_data, output_dir=out, mode="clustered")
+        requests = stub_llm.stats()["requests"]
+        (out / EVENT_ID / "2.json").unlink()
+        regenerated = generate_event_content(
+            EVENT_ID, *event_data, output_dir=out, mode="clustered"
+        )
+
+        assert unchanged.skipped == 3
+        assert (regenerated.regenerated, regenerated.drafts_generated) == (1, 0)
+        assert stub_llm.stats()["requests"] == requests + 1
+
+    def test_modes_do_not_share_content_hashes(self, event_data, stub_llm, tmp_path):
+        """Test that switching modes regenerates content."""
+        out = tmp_path / "out"
+        generate_event_content(EVENT_ID, *event_data, output_dir=out)
+
+        report = generate_event_content(EVENT_ID, *event_data, output_dir=out, mode="clustered")
+
+        assert report.regenerated == 3
+
+    def test_invalid_mode_options(self, event_data, tmp_path):
+        """Test that unknown modes and rich analysis outside crew mode are rejected."""
+        with pytest.raises(ValueError, match="Unknown content mode"):
+            generate_event_content(EVENT_ID, *event_data, output_dir=tmp_path, mode="bulk")
+        with pytest.raises(ValueError, match="only available in crew mode"):
+            generate_event_content(
+                EVENT_ID, *event_data, output_dir=tmp_path, mode="clustered", rich_analysis=True
+            )
+
+
+class TestQualityGates:
+    """Tests for gating the LLM quality check in crew mode."""
+
+    PASSING_TEXT = (
+        "Hi Sam, thank you for joining us! The sessions you chose on innovation in AI were full of "
+        "practical ideas. You connected with peers from across the industry. Your curiosity was a "
+        "standout part of the week. We can't wait to see you at the next edition."
+    )
+
+    @pytest.fixture
+    def passing_llm(self, event_data):
+        """Stub LLM whose content passes the gates for attendees all named Sam."""
+        attendees_dir, _ = event_data
+        for path in attendees_dir.glob("*.json"):
+            attendee = json.loads(path.read_text())
+            path.write_text(json.dumps({**attendee, "firstName": "Sam"}))
+        with (
+            StubLLMServer(responses={"text": self.PASSING_TEXT}) as stub,
+            patched_environ(stub.environment()),
+        ):
+            yield stub
+
+    def test_passing_content_skips_the_editor(self, event_data, passing_llm, tmp_path):
+        """Test that content passing every gate costs two calls and is marked up to date."""
+        out = tmp_path / "out"
+
+        report = generate_event_content(
+            EVENT_ID, *event_data, output_dir=out, quality_gates=QualityGates(audit_rate=0)
+        )
+        rerun = generate_event_content(EVENT_ID, *event_data, output_dir=out)
+
+        assert passing_llm.stats()["requests"] == 6
+        assert (report.quality.checked, report.quality.passed, report.quality.reviewed) == (3, 3, 0)
+        assert report.quality.llm_calls_avoided == 3
+        written = json.loads((out / EVENT_ID / "1.json").read_text())
+        assert written["quality"] == {"passed": True, "failed_checks": [], "reviewed": False}
+        assert rerun.skipped == 3
+
+    def test_flagged_and_audited_content_is_reviewed(self, event_data, stub_llm, tmp_path):
+        """Test that the editor gets failing content, with the content and profile as context."""
+        contexts = []
+        original_execute = Task.execute_sync
+
+        def execute_sync(self, agent=None, context=None, tools=None):
+            if self.name == "quality_check":
+                contexts.append(context)
+            return original_execute(self, agent=agent, context=context, tools=tools)
+
+        with patch.object(Task, "execute_sync", execute_sync):
+            report = generate_event_content(EVENT_ID, *event_data, output_dir=tmp_path / "out")
+
+        # The stub's canned text never uses the attendee's name
+        assert report.quality.passed == 0
+        assert report.quality.reviewed == 3
+        assert report.quality.pass_rates["facts"] == 0.0
+        assert len(contexts) == 3
+        assert "Thank you for joining us!" in contexts[0] and '"attendee_id"' in contexts[0]
+        written = json.loads((tmp_path / "out" / EVENT_ID / "1.json").read_text())
+        assert written["quality"]["reviewed"] and "facts" in written["quality"]["failed_checks"]
+
+    def test_audit_sample(self, event_data, passing_llm, tmp_path):
+        """Test that passing content is still reviewed at the audit rate."""
+        report = generate_event_content(
+            EVENT_ID,
+            *event_data,
+            output_dir=tmp_path / "out",
+            quality_gates=QualityGates(audit_rate=1.0),
+        )
+
+        assert (report.quality.passed, report.quality.audited, report.quality.reviewed) == (3, 3, 3)
+        assert passing_llm.stats()["requests"] == 9
+
+    def test_failed_review_is_regenerated_next_run(self, event_data, stub_llm, tmp_path):
+        """Test that content whose review failed is reported and not marked up to date."""
+        out = tmp_path / "out"
+        with patch(
+            "event_style_scraper.content_generation._run_review_crew",
+            side_effect=RuntimeError("editor down"),
+        ):
+            report = generate_event_content(EVENT_ID, *event_data, output_dir=out)
+
+        assert report.failed == 3
+        assert report.results[0].error == "Quality review failed: editor down"
+        assert stored_input_hash(out / EVENT_ID, "1") is None
+        assert generate_event_content(EVENT_ID, *event_data, output_dir=out).regenerated == 3
+
+    def test_command_reports_pass_rates(self, event_data, passing_llm, tmp_path):
+        """Test that generate-content reports gate pass rates and avoided editor calls."""
+        attendees_dir, style_configs_dir = event_data
+
+        result = CliRunner().invoke(cli, [
+            "generate-content",
+            "--event", EVENT_ID,
+            "--attendees-dir", str(attendees_dir),
+            "--style-configs-dir", str(style_configs_dir),
+            "--output-dir", str(tmp_path / "out"),
+            "--audit-rate", "0",
+        ])
+
+        assert result.exit_code == 0, result.output
+        assert (
+            "Quality gates: 3/3 passed (100%), 0 sent to the editor (0 audits), 3 LLM calls avoided"
+            in result.output
+        )
+        assert "word_limit 100%" in result.output
+
+    def test_review_all(self, event_data, passing_llm, tmp_path):
+        """Test that review_all runs the quality check inside every crew run."""
+        report = generate_event_content(
+            EVENT_ID, *event_data, output_dir=tmp_path / "out", review_all=True
+        )
+
+        assert report.quality is None
+        assert passing_llm.stats()["requests"] == 9
+
+
+class TestSinglePassGeneration:
+    """Tests for single-pass generation."""
+
+    def test_one_structured_call_per_attendee(self, event_data, stub_llm, tmp_path):
+        """Test that each attendee costs one LLM call and gets the rendered sections."""
+        report = generate_event_content(
+            EVENT_ID, *event_data, output_dir=tmp_path / "out", mode="single-pass"
+        )
+
+        assert (report.succeeded, report.failed) == (3, 0)
+        assert stub_llm.stats()["requests"] == 3
+        content = json.loads((tmp_path / "out" / EVENT_ID / "1.json").read_text())["content"]
+        assert content.startswith("Thank you for joining us!")
+        assert "\n\n" in content and "{" not in content
+
+    def test_rerun_skips_unchanged_attendees(self, event_data, stub_llm, tmp_path):
+        """Test that single-pass content is only regenerated when its inputs change."""
+        out = tmp_path / "out"
+        generate_event_content(EVENT_ID, *event_data, output_dir=out, mode="single-pass")
+
+        rerun = generate_event_content(EVENT_ID, *event_data, output_dir=out, mode="single-pass")
+        switched = generate_event_content(EVENT_ID, *event_data, output_dir=out)
+
+        assert rerun.skipped == 3
+        assert switched.regenerated == 3
+
+
+class TestGenerateContentCommand:
+    """Tests for the generate-content CLI command."""
+
+    def test_generate_content(self, event_data, stub_llm, tmp_path):
+        """Test that the command reports throughput and exits cleanly."""
+        attendees_dir, style_configs_dir = event_data
+
+        result = CliRunner().invoke(cli, [
+            "generate-content",
+            "--event", EVENT_ID,
+            "--attendees-dir", str(attendees_dir),
+            "--style-configs-dir", str(style_configs_dir),
+            "--output-dir", str(tmp_path / "out"),
+        ])
+
+        assert result.exit_code == 0, result.output
+        assert "3/3 attendees succeeded" in result.output
+        assert "attendees/min" in result.output
+        assert "3 regenerated, 0 unchanged" in result.output
+
+    def test_unknown_event(self, event_data):
+        """Test that an event without a style config fails."""
+        result = CliRunner().invoke(cli, [
+            "generate-content",
+            "--event", "missing-event",
+            "--style-configs-dir", str(event_data[1]),
+        ])
+
+        assert result.exit_code == 1
+        assert "No style config" in result.output
+
+    def test_generate_content_with_rate_limits(self, event_data, stub_llm, tmp_path):
+        """Test that rate limit options are accepted and removed after the run."""
+        from crewai.hooks import get_before_llm_call_hooks
+
+        attendees_dir, style_configs_dir = event_data
+        hooks_before = len(get_before_llm_call_hooks())
+
+        result = CliRunner().invoke(cli, [
+            "generate-content",
+            "--event", EVENT_ID,
+            "--attendees-dir", str(attendees_dir),
+            "--style-configs-dir", str(style_configs_dir),
+            "--output-dir", str(tmp_path / "out"),
+            "--requests-per-minute", "6000",
+            "--tokens-per-minute", "1000000",
+            "--rate-limit-dir", str(tmp_path / "limits"),
+        ])
+
+        assert result.exit_code == 0, result.output
+        assert (tmp_path / "limits" / "requests.bucket").exists()
+        assert len(get_before_llm_call_hooks()) == hooks_before
+
+    def test_sharded_generate_and_merge(self, event_data, stub_llm, tmp_path):
+        """Test --shard runs followed by merge-content."""
+        attendees_dir, style_configs_dir = event_data
+        common = ["--attendees-dir", str(attendees_dir), "--output-dir", str(tmp_path / "out")]
+
+        partial = CliRunner().invoke(cli, [
+            "generate-content", "--event", EVENT_ID, "--style-configs-dir", str(style_configs_dir),
+            "--shard", "3/3", *common,
+        ])
+        incomplete = CliRunner().invoke(cli, ["merge-content", "--event", EVENT_ID, *common])
+        for index in (1, 2):
+            CliRunner().invoke(
+                cli,
+                [
+                    "generate-content",
+                    "--event",
+                    EVENT_ID,
+                    "--style-configs-dir",
+                    str(style_configs_dir),
+                    "--shard",
+                    f"{index}/3",
+                    *common,
+                ],
+            )
+        merged = CliRunner().invoke(cli, ["merge-content", "--event", EVENT_ID, *common])
+
+        assert partial.exit_code == 0, partial.output
+        assert "shard 3/3" in partial.output
+        assert incomplete.exit_code == 1
+        assert "Shards not finished (2): 1/3, 2/3" in incomplete.output
+        assert merged.exit_code == 0, merged.output
+        assert "Merged 3 attendees from 3 shards" in merged.output
+
+    def test_invalid_shard(self, event_data):
+        """Test that a malformed --shard is a usage error."""
+        result = CliRunner().invoke(
+            cli, ["generate-content", "--event", EVENT_ID, "--shard", "4/3"]
+        )
+
+        assert result.exit_code == 2
+        assert "Invalid shard" in result.output
+
+    def test_clustered_mode_reports_compression(self, event_data, stub_llm, tmp_path):
+        """Test that --mode clustered reports clusters and the compression ratio."""
+        attendees_dir, style_configs_dir = event_data
+
+        result = CliRunner().invoke(cli, [
+            "generate-content",
+            "--event", EVENT_ID,
+            "--attendees-dir", str(attendees_dir),
+            "--style-configs-dir", str(style_configs_dir),
+            "--output-dir", str(tmp_path / "out"),
+            "--mode", "clustered",
+        ])
+
+        assert result.exit_code == 0, result.output
+        assert "1 clusters, compression ratio 3.0x" in result.output
+
+
+class TestBenchContentCommand:
+    """Tests for the bench-content CLI command."""
+
+    def test_compares_modes(self, event_data, tmp_path):
+        """Test that each mode's calls and tokens are reported and compared with the first."""
+        attendees_dir, style_configs_dir = event_data
+
+        result = CliRunner().invoke(cli, [
+            "bench-content",
+            "--event", EVENT_ID,
+            "--attendees-dir", str(attendees_dir),
+            "--style-configs-dir", str(style_configs_dir),
+            "--output-dir", str(tmp_path / "results"),
+            "--mode", "crew",
+            "--mode", "single-pass",
+            "--llm-latency-ms", "0",
+        ])
+
+        assert result.exit_code == 0, result.output
+        report = json.loads(next((tmp_path / "results").glob("content-*.json")).read_text())
+        crew, single_pass = report["results"]
+        assert (crew["llm_requests"], single_pass["llm_requests"]) == (9, 3)
+        assert single_pass["prompt_tokens"] < crew["prompt_tokens"]
+        assert "single-pass: seconds_per_attendee" in result.output
+        assert "llm_requests_per_attendee -66.7%" in result.output
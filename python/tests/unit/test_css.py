@@ -0,0 +1,67 @@
+"""Tests for precompiled event CSS."""
+
+from event_style_scraper.css import css_filename, generate_event_css, is_css_for, minify_value
+from event_style_scraper.types import LayoutConfig
+from unit.factories import make_style_config
+
+
+def make_config(**fields):
+    """AWS re:Invent style config with quoted font names."""
+    values = dict(
+        event_name="AWS re:Invent 2025",
+        source_url="https://reinvent.awsevents.com/",
+        primary="#232f3e",
+        secondary="#ff9900",
+        accent="#146eb4",
+        text="#16191f",
+        heading_font="'Amazon Ember', 'Helvetica Neue', Arial, sans-serif",
+        body_font="'Amazon Ember', Arial, sans-serif",
+        heading_size="2.5rem",
+        line_height="1.5",
+        layout=LayoutConfig(border_radius="4px"),
+    )
+    values.update(fields)
+    return make_style_config("aws-reinvent-2025", **values)
+
+
+class TestGenerateEventCss:
+    """Tests for compiling configs to CSS."""
+
+    def test_matches_css_generator_properties(self):
+        """Test that the output has cssGenerator.ts's custom properties, in order, minified."""
+        assert generate_event_css(make_config()) == (
+            ":root{"
+            "--color-primary:#232f3e;--color-secondary:#ff9900;--color-accent:#146eb4;"
+            "--color-background:#ffffff;--color-text:#16191f;"
+            "--color-primary-hover:#232f3e;--color-hover:#146eb4;"
+            "--gradient-primary:linear-gradient(135deg,#232f3e 0%,#ff9900 100%);"
+            "--font-heading:'Amazon Ember','Helvetica Neue',Arial,sans-serif;"
+            "--font-body:'Amazon Ember',Arial,sans-serif;"
+            "--font-size-heading:2.5rem;--font-size-body:1rem;--line-height:1.5;"
+            "--spacing-unit:8px;--border-radius:4px;--container-width:1200px"
+            "}\n"
+        )
+
+    def test_minify_keeps_quoted_whitespace(self):
+        """Test that whitespace inside quoted font names survives minification."""
+        assert (
+            minify_value('  "Open  Sans" ,\tArial ,  sans-serif ')
+            == '"Open  Sans",Arial,sans-serif'
+        )
+
+    def test_hash_depends_only_on_styling(self):
+        """Test that metadata changes keep the file name and style changes rename it."""
+        name = css_filename("aws-reinvent-2025", generate_event_css(make_config()))
+        renamed = make_config(event_name="re:Invent", scraped_at="2025-06-01T00:00:00Z")
+        recolored = make_config(primary="#000000")
+
+        assert is_css_for(name, "aws-reinvent-2025")
+        assert not is_css_for(name, "aws-reinvent")
+        assert css_filename("aws-reinvent-2025", generate_event_css(renamed)) == name
+        assert css_filename("aws-reinvent-2025", generate_event_css(recolored)) != name
+
+    def test_missing_layout_uses_defaults(self):
+        """Test that a config with layout null gets the default layout tokens."""
+        css = generate_event_css(make_config(layout=None))
+
+        assert css.endswith("--spacing-unit:8px;--border-radius:8px;--container-width:1200px}\n")
@@ -0,0 +1,181 @@
+"""Tests for style drift reports."""
+
+import json
+from functools import partial
+
+import pytest
+from click.testing import CliRunner
+
+from event_style_scraper.cli import cli
+from event_style_scraper.drift import (
+    FIELD_WEIGHTS,
+    catalog_drift,
+    compare_configs,
+    compare_many,
+    live_drift,
+    normalize_font_stack,
+)
+from event_style_scraper.store import StyleStore
+from unit.factories import make_style_config
+
+make_config = partial(
+    make_style_config,
+    event_name="Tech Summit",
+    scraped_at="2025-06-01T12:00:00+00:00",
+    keywords=["innovation", "ai"],
+)
+
+
+class TestCompareConfigs:
+    """Tests for field-level drift between two configs."""
+
+    def test_identical_configs_do_not_drift(self):
+        """Test that a re-scrape with the same content scores zero."""
+        report = compare_configs(make_config(), make_config(scraped_at="2025-07-01T00:00:00+00:00"))
+
+        assert report.score == 0
+        assert report.fields == []
+        assert not report.drifted()
+
+    def test_imperceptible_color_shift_is_ignored(self):
+        """Test that colors within the just-noticeable difference are not drift."""
+        report = compare_configs(
+            make_config(), make_config(primary="#1b3c8f", background="#fefefe")
+        )
+
+        assert report.fields == []
+
+    def test_rebrand_is_scored_by_field(self):
+        """Test that a new primary color and heading font dominate the report."""
+        report = compare_configs(
+            make_config(), make_config(primary="#e53e3e", heading_font="Poppins, sans-serif")
+        )
+
+        assert [f.field for f in report.fields] == ["colors.primary", "typography.heading_font"]
+        primary = report.fields[0]
+        assert (primary.old, primary.new, primary.score) == ("#1a3c8f", "#e53e3e", 1.0)
+        assert primary.delta_e > 25
+        assert report.score == pytest.approx(
+            FIELD_WEIGHTS["colors.primary"] + FIELD_WEIGHTS["typography.heading_font"]
+        )
+        assert report.drifted()
+
+    def test_font_stacks_are_normalized(self):
+        """Test that quoting and case do not count and fallback changes weigh less."""
+        same = compare_configs(
+            make_config(body_font='"Open Sans", Arial'), make_config(body_font="open sans,arial")
+        )
+        fallback = compare_configs(
+            make_config(body_font="Open Sans, Arial"), make_config(body_font="Open Sans, Helvetica")
+        )
+
+        assert same.fields == []
+        assert fallback.fields[0].score == 0.25
+        assert normalize_font_stack("  'Inter' ,  Inter, SANS-serif;") == ("inter", "sans-serif")
+
+    def test_keywords_use_set_distance(self):
+        """Test that keyword drift is the share of keywords not in both scrapes."""
+        report = compare_configs(make_config(), make_config(keywords=["AI", "cloud"]))
+
+        assert report.fields[0].field == "brand_voice.keywords"
+        assert report.fields[0].score == pytest.approx(2 / 3)
+
+    def test_many_pairs_match_single_comparisons(self):
+        """Test that the vectorized comparison gives the same reports as one pair at a time."""
+        pairs = [
+            (make_config(), make_config(primary="#e53e3e")),
+            (make_config(), make_config(accent="#38a169", tone="playful")),
+            (make_config(), make_config()),
+        ]
+
+        assert compare_many(pairs) == [compare_configs(old, new) for old, new in pairs]
+
+
+class TestCatalogDrift:
+    """Tests for drift across the stored history."""
+
+    @pytest.fixture
+    def store(self, tmp_path):
+        """Store with a rebranded event, a steady event and an event scraped once."""
+        with StyleStore(tmp_path / "history.sqlite") as store:
+            store.record(make_config("rebrand", scraped_at="2025-01-01T00:00:00+00:00"))
+            store.record(
+                make_config("rebrand", primary="#e53e3e", scraped_at="2025-03-01T00:00:00+00:00")
+            )
+            store.record(
+                make_config("rebrand", primary="#e53e3e", scraped_at="2025-05-01T00:00:00+00:00")
+            )
+            store.record(make_config("steady", scraped_at="2025-01-01T00:00:00+00:00"))
+            store.record(make_config("steady", scraped_at="2025-05-01T00:00:00+00:00"))
+            store.record(make_config("new-event", scraped_at="2025-05-01T00:00:00+00:00"))
+            yield store
+
+    def test_against_previous_scrape(self, store):
+        """Test that only events with a previous scrape are compared, with it."""
+        reports = catalog_drift(store)
+
+        assert [r.event_id for r in reports] == ["rebrand", "steady"]
+        assert not any(r.drifted() for r in reports)
+
+    def test_since(self, store):
+        """Test that --since compares with each event's config at that time."""
+        reports = catalog_drift(store, since="2025-02-01T00:00:00+00:00", event_ids=["rebrand"])
+
+        assert [r.event_id for r in reports] == ["rebrand"]
+        assert reports[0].fields[0].field == "colors.primary"
+        assert reports[0].old_scraped_at == "2025-01-01T00:00:00+00:00"
+
+    def test_live_records_fresh_scrapes_and_reports_failures(self, store):
+        """Test comparing live scrapes with the stored configs."""
+        def scrape(url):
+            if "steady" in url:
+                raise ValueError("URL blocked")
+            return make_config(
+                url.split("//")[1].split(".")[0], heading_font="Poppins", scraped_at=None
+            )
+
+        reports = live_drift(store, scrape, record="http")
+
+        assert [r.event_id for r in reports] == ["new-event", "rebrand", "steady"]
+        assert [f.field for f in reports[0].fields] == ["typography.heading_font"]
+        assert reports[2].error == "URL blocked"
+        assert len(store.history("rebrand")) == 4
+
+    def test_live_scrapes_keep_the_stored_event_id(self, store):
+        """Test that a scrape named after its URL is compared and recorded as the stored event."""
+        reports = live_drift(
+            store,
+            lambda url: make_config("rebrand-example-com", heading_font="Poppins", scraped_at=None),
+            event_ids=["rebrand"],
+            record="http",
+        )
+
+        assert "typography.heading_font" in [f.field for f in reports[0].fields]
+        assert store.history("rebrand")[-1].config.typography.heading_font == "Poppins"
+        assert store.latest("rebrand-example-com") is None
+
+
+class TestDiffCommand:
+    """Tests for the diff CLI command."""
+
+    def test_two_files(self, tmp_path):
+        """Test diffing two config files with a JSON report and --fail-on-drift."""
+        (tmp_path / "old.json").write_text(json.dumps(make_config().model_dump()))
+        (tmp_path / "new.json").write_text(json.dumps(make_config(primary="#e53e3e").model_dump()))
+
+        result = CliRunner().invoke(
+            cli,
+            ["diff", str(tmp_path / "old.json"), str(tmp_path / "new.json"),
+             "--json-report", str(tmp_path / "drift.json"), "--fail-on-drift"],
+        )
+
+        assert result.exit_code == 1, result.output
+        assert "colors.primary: #1a3c8f → #e53e3e" in result.output
+        assert json.loads((tmp_path / "drift.json").read_text())[0]["event_id"] == "tech-summit"
+
+    def test_missing_store(self, tmp_path):
+        """Test that a catalog diff without a history store fails clearly."""
+        result = CliRunner().invoke(cli, ["diff", "--store", str(tmp_path / "missing.sqlite")])
+
+        assert result.exit_code == 1
+        assert "No history store" in result.output
@@ -0,0 +1,115 @@
+"""Tests for scraping engine modes and the rule-based config compiler."""
+
+from pathlib import Path
+
+import pytest
+
+from event_style_scraper.benchmarks import FixtureSiteServer
+from event_style_scraper.benchmarks.metrics import patched_environ
+from event_style_scraper.engines import (
+    compile_style_config,
+    event_id_from_url,
+    extract_keywords,
+    pick_palette,
+    run_engine,
+)
+
+SITES_DIR = Path(__file__).parent.parent.parent / "benchmarks" / "sites"
+
+
+class TestCompileStyleConfig:
+    """Tests for compiling scraper output without an LLM."""
+
+    def test_event_id_from_url(self):
+        """Test event_id derivation from hostnames and paths."""
+        assert event_id_from_url("https://www.example.com") == "example-com"
+        assert event_id_from_url("http://127.0.0.1:8000/tech-summit/") == "127-0-0-1-tech-summit"
+        assert event_id_from_url("https://example.com/events/index.html") == "example-com-events"
+
+    def test_css_variables_take_priority(self):
+        """Test that role-named CSS variables choose the palette."""
+        scraped = {
+            "url": "https://summit.example.com",
+            "html": "<html><head><title>Summit 2026 | Home</title></head><body></body></html>",
+            "computed_styles": {
+                "body": {"backgroundColor": "rgb(0, 0, 0)", "color": "rgb(255, 255, 255)"}
+            },
+            "css_variables": {"--brand-primary": "#112233", "--bg": "#fafafa", "--radius": "12px"},
+            "assets": {"logo": "https://summit.example.com/logo.png", "favicon": None},
+        }
+
+        config = compile_style_config(scraped)
+
+        assert config.event_name == "Summit 2026"
+        assert config.colors.primary == "#112233"
+        assert config.colors.background == "#fafafa"
+        assert config.colors.text == "#ffffff"
+        assert config.layout.border_radius == "12px"
+        assert config.logo_url == "https://summit.example.com/logo.png"
+
+    def test_palette_keeps_brand_roles_distinct(self):
+        """Test that secondary and accent skip near-duplicates of chosen brand colors."""
+        scraped = {
+            "css_variables": {
+                "--brand": "hsl(222, 69%, 33%)",
+                "--accent": "#1b3c8f",
+                "--highlight": "teal",
+            },
+            "computed_styles": {
+                "button": {"backgroundColor": "rgb(26, 60, 143)"},
+                "nav": {"backgroundColor": "#223344"},
+                "body": {"backgroundColor": "rgba(0, 0, 0, 0)", "color": "#333"},
+            },
+        }
+
+        palette = pick_palette(scraped)
+
+        assert palette["primary"] == "#1a3d8e"
+        assert palette["secondary"] == "#223344"
+        assert palette["accent"] == "#008080"
+        assert palette["background"] == "#ffffff"
+        assert palette["text"] == "#333333"
+
+    def test_falls_back_to_defaults(self):
+        """Test that missing styles fall back to defaults."""
+        config = compile_style_config({"url": "https://example.com", "html": "<html></html>"})
+
+        assert config.colors.primary == "#1a202c"
+        assert config.typography.body_font == "system-ui, sans-serif"
+        assert config.typography.line_height == "1.6"
+        assert config.event_name == "example.com"
+
+    def test_extract_keywords_skips_stopwords(self):
+        """Test that keywords are frequent non-stopword terms."""
+        keywords = extract_keywords(
+            "Innovation with data. Innovation and data and cloud innovation."
+        )
+
+        assert keywords[:2] == ["innovation", "data"]
+        assert "with" not in keywords
+
+
+class TestRunEngine:
+    """Tests for run_engine mode dispatch."""
+
+    def test_http_engine_against_fixture(self):
+        """Test the HTTP engine end to end on a fixture site."""
+        with FixtureSiteServer(SITES_DIR) as server:
+            with patched_environ({"SCRAPER_ALLOWED_HOSTS": server.host}):
+                config = run_engine(server.site_url("tech-summit"), mode="http", timeout=5)
+
+        assert config.event_name == "Tech Summit 2026"
+        assert config.colors.primary == "#1a3c8f"
+        assert config.colors.accent == "#00b3a4"
+        assert "Inter" in config.typography.body_font
+        assert config.logo_url.endswith("/tech-summit/logo.svg")
+
+    def test_invalid_url_rejected(self):
+        """Test that URLs failing security validation raise ValueError."""
+        with pytest.raises(ValueError, match="Invalid URL"):
+            run_engine("http://localhost/", mode="http")
+
+    def test_unknown_mode_rejected(self):
+        """Test that unknown engine modes raise ValueError."""
+        with pytest.raises(ValueError, match="Unknown engine mode"):
+            run_engine("https://example.com", mode="turbo")
@@ -0,0 +1,151 @@
+"""Tests for atomic, multi-format style config export."""
+
+import json
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from unittest.mock import patch
+
+import pytest
+from click.testing import CliRunner
+
+from event_style_scraper.cli import cli
+from event_style_scraper.export import (
+    BUNDLE_NAME,
+    CSS_DIR,
+    CSS_MANIFEST_NAME,
+    build_bundle,
+    config_paths,
+    export_style_config,
+    write_atomic,
+)
+from event_style_scraper.flows.style_scraping_flow import StyleScrapingFlow
+from unit.factories import make_style_config
+
+make_config = partial(
+    make_style_config, event_name="Tech Summit – Berlin", source_url="https://example.com"
+)
+
+
+class TestWriteAtomic:
+    """Tests for write-and-rename."""
+
+    def test_failed_write_keeps_old_file(self, tmp_path):
+        """Test that a failure before the rename keeps the old file and leaves no temp file."""
+        path = tmp_path / "config.json"
+        path.write_text('{"old": true}')
+
+        with patch("event_style_scraper.export.os.replace", side_effect=OSError("disk full")):
+            with pytest.raises(OSError):
+                write_atomic(path, '{"new": true}')
+
+        assert path.read_text() == '{"old": true}'
+        assert [p.name for p in tmp_path.iterdir()] == ["config.json"]
+
+
+class TestExportStyleConfig:
+    """Tests for exporting configs with compact copies and the bundle."""
+
+    def test_formats(self, tmp_path):
+        """Test that the pretty file is unchanged and the compact copy and bundle match it."""
+        config = make_config()
+
+        path = export_style_config(config, tmp_path, compact=True, bundle=True)
+
+        assert path.read_text(encoding="utf-8") == json.dumps(
+            config.model_dump(), indent=2, ensure_ascii=False
+        )
+        compact = (tmp_path / "tech-summit.min.json").read_text(encoding="utf-8")
+        assert "\n" not in compact and "–" in compact
+        assert json.loads(compact) == config.model_dump()
+        assert json.loads((tmp_path / BUNDLE_NAME).read_text()) == {
+            "tech-summit": config.model_dump()
+        }
+
+    def test_concurrent_exports_keep_every_bundle_entry(self, tmp_path):
+        """Test that parallel workers updating the bundle do not lose each other's configs."""
+        configs = [make_config(f"event-{i}") for i in range(24)]
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(lambda c: export_style_config(c, tmp_path, bundle=True), configs))
+
+        assert sorted(json.loads((tmp_path / BUNDLE_NAME).read_text())) == sorted(
+            c.event_id for c in configs
+        )
+        assert not list(tmp_path.glob("*.tmp"))
+
+    def test_flow_export_options(self, tmp_path):
+        """Test that StyleScrapingFlow.export_config passes the extra formats through."""
+        flow = StyleScrapingFlow(url="https://example.com")
+        flow.output_dir = tmp_path
+
+        flow.export_config(make_config(), compact=True)
+
+        assert (tmp_path / "tech-summit.min.json").exists()
+        assert not (tmp_path / BUNDLE_NAME).exists()
+
+
+class TestBuildBundle:
+    """Tests for rebuilding the bundle from a directory."""
+
+    def test_rebuild_skips_derived_files(self, tmp_path):
+        """Test that only <event_id>.json files are bundled and listed."""
+        export_style_config(make_config("a-conf"), tmp_path, compact=True, bundle=True)
+        export_style_config(make_config("b-expo", primary="#e53e3e"), tmp_path)
+
+        build_bundle(tmp_path)
+
+        assert [p.name for p in config_paths(tmp_path)] == ["a-conf.json", "b-expo.json"]
+        bundle = json.loads((tmp_path / BUNDLE_NAME).read_text())
+        assert list(bundle) == ["a-conf", "b-expo"]
+        assert bundle["b-expo"]["colors"]["primary"] == "#e53e3e"
+
+    def test_bundle_command_rejects_invalid_configs(self, tmp_path):
+        """Test that the bundle command validates every config."""
+        export_style_config(make_config(), tmp_path)
+        (tmp_path / "broken.json").write_text('{"event_id": "broken"}')
+
+        result = CliRunner().invoke(cli, ["bundle", "--output-dir", str(tmp_path)])
+
+        assert result.exit_code == 1
+        assert "Invalid config" in result.output
+        assert not (tmp_path / BUNDLE_NAME).exists()
+
+
+class TestCssExport:
+    """Tests for exporting hashed stylesheets and their manifest."""
+
+    def test_reexport_replaces_only_that_events_stylesheet(self, tmp_path):
+        """Test that a changed config gets a new file name and its old stylesheet is removed."""
+        export_style_config(make_config("tech-summit"), tmp_path, css=True)
+        export_style_config(make_config("tech-summit-eu"), tmp_path, css=True)
+        before = json.loads((tmp_path / CSS_DIR / CSS_MANIFEST_NAME).read_text())
+
+        export_style_config(make_config("tech-summit", primary="#e53e3e"), tmp_path, css=True)
+
+        manifest = json.loads((tmp_path / CSS_DIR / CSS_MANIFEST_NAME).read_text())
+        assert manifest["tech-summit"] != before["tech-summit"]
+        assert manifest["tech-summit-eu"] == before["tech-summit-eu"]
+        assert sorted(p.name for p in (tmp_path / CSS_DIR).glob("*.css")) == sorted(
+            manifest.values()
+        )
+        assert (
+            "--color-primary:#e53e3e" in (tmp_path / CSS_DIR / manifest["tech-summit"]).read_text()
+        )
+        assert [p.name for p in config_paths(tmp_path)] == [
+            "tech-summit-eu.json",
+            "tech-summit.json",
+        ]
+
+    def test_bundle_command_rebuilds_css(self, tmp_path):
+        """Test that bundle --css compiles every config and drops stylesheets of removed events."""
+        export_style_config(make_config("a-conf"), tmp_path)
+        export_style_config(make_config("gone"), tmp_path, css=True)
+        (tmp_path / "gone.json").unlink()
+
+        result = CliRunner().invoke(cli, ["bundle", "--output-dir", str(tmp_path), "--css"])
+
+        assert result.exit_code == 0, result.output
+        assert "Compiled 1 stylesheet(s)" in result.output
+        manifest = json.loads((tmp_path / CSS_DIR / CSS_MANIFEST_NAME).read_text())
+        assert list(manifest) == ["a-conf"]
+        assert [p.name for p in (tmp_path / CSS_DIR).glob("*.css")] == [manifest["a-conf"]]
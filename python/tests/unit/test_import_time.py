@@ -0,0 +1,78 @@
+"""Import-time regression tests for the CLI entry point."""
+
+import os
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+# Budget for all imports done by `python -m event_style_scraper --help`.
+# Override with IMPORT_TIME_BUDGET_MS on slow machines.
+IMPORT_TIME_BUDGET_MS = float(os.getenv("IMPORT_TIME_BUDGET_MS", "500"))
+
+# Heavy dependencies that must only load inside the commands using them
+HEAVY_MODULES = ("crewai", "crewai_tools", "playwright", "pydantic", "bs4", "litellm", "openai")
+
+
+def run_importtime(*args: str) -> List[Tuple[str, int, int]]:
+    """
+    Run Python with -X importtime and parse its report.
+
+    Returns:
+        (module, self_us, cumulative_us) tuples with the module name's
+        indentation kept, so nesting depth can be recovered
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+    assert result.returncode == 0, result.stderr[-2000:]
+
+    timings = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, module = line[len("import time:"):].split("|")
+        timings.append((module.rstrip()[1:], int(self_us), int(cumulative_us)))
+    return timings
+
+
+def total_import_ms(timings: List[Tuple[str, int, int]]) -> float:
+    """Total import time: the sum of cumulative times of top-level imports."""
+    return sum(cumulative for module, _, cumulative in timings if not module.startswith(" ")) / 1000
+
+
+def slowest(timings: List[Tuple[str, int, int]], count: int = 10) -> Dict[str, float]:
+    """The slowest modules by self time, in milliseconds."""
+    ordered = sorted(timings, key=lambda t: t[1], reverse=True)[:count]
+    return {module.strip(): self_us / 1000 for module, self_us, _ in ordered}
+
+
+class TestImportTime:
+    """Tests that CLI startup stays fast."""
+
+    def test_help_skips_heavy_dependencies(self):
+        """Test that --help imports none of the heavy dependencies."""
+        timings = run_importtime("-m", "event_style_scraper", "--help")
+        loaded = {module.strip().split(".")[0] for module, _, _ in timings}
+
+        assert loaded.isdisjoint(HEAVY_MODULES), sorted(loaded & set(HEAVY_MODULES))
+
+    def test_help_within_import_budget(self):
+        """Test that --help imports stay within the import-time budget (best of 3)."""
+        runs = [run_importtime("-m", "event_style_scraper", "--help") for _ in range(3)]
+        best = min(runs, key=total_import_ms)
+
+        assert total_import_ms(best) <= IMPORT_TIME_BUDGET_MS, (
+            f"imports took {total_import_ms(best):.0f}ms (budget {IMPORT_TIME_BUDGET_MS:.0f}ms); "
+            f"slowest: {slowest(best)}"
+        )
+
+    def test_lazy_package_exports_still_resolve(self):
+        """Test that lazily exported names import on first access."""
+        from event_style_scraper import benchmarks, tools
+
+        assert tools.SecurityError.__name__ == "SecurityError"
+        assert benchmarks.FixtureSiteServer.__name__ == "FixtureSiteServer"
+        assert "HttpStyleExtractor" in dir(tools)
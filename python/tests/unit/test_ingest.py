@@ -0,0 +1,148 @@
+"""Tests for streaming attendee export ingest."""
+
+import csv
+import gzip
+import json
+import tracemalloc
+from collections import Counter
+
+import pytest
+
+from event_style_scraper.ingest import (
+    AttendeeExport,
+    Shard,
+    parse_shard,
+    shard_of,
+    split_export,
+)
+
+
+def attendee(attendee_id, event_id="expo", **fields):
+    """Build an exported attendee record."""
+    return {
+        "id": attendee_id,
+        "firstName": f"A{attendee_id}",
+        "eventId": event_id,
+        "sessions": [{"id": "s1", "track": "AI", "durationMinutes": 30}],
+        **fields,
+    }
+
+
+def write_jsonl(path, records):
+    """Write records (dicts or raw lines) as JSONL."""
+    opener = gzip.open if path.suffix == ".gz" else open
+    with opener(path, "wt", encoding="utf-8") as f:
+        for record in records:
+            f.write((record if isinstance(record, str) else json.dumps(record)) + "\n")
+    return path
+
+
+class TestAttendeeExport:
+    """Tests for AttendeeExport."""
+
+    def test_jsonl_stream_skips_invalid_records(self, tmp_path):
+        """Test that valid records stream through and bad ones are reported with line numbers."""
+        path = write_jsonl(tmp_path / "export.jsonl", [
+            attendee("1"),
+            "{not json",
+            {"id": "2", "firstName": "No event"},
+            "",
+            attendee("3", sessions="not a list"),
+            attendee("4", event_id="other"),
+            attendee("5"),
+        ])
+        invalid = []
+
+        export = AttendeeExport(path, on_invalid=invalid.append)
+
+        assert [a["id"] for a in export.iter_attendees("expo")] == ["1", "5"]
+        assert [record.line for record in invalid] == [2, 3, 5]
+        assert "Invalid JSON" in invalid[0].error
+        assert invalid[1].error.startswith("eventId")
+        assert invalid[2].error.startswith("sessions")
+
+    def test_csv_with_json_cells(self, tmp_path):
+        """Test that CSV rows decode nested columns and drop empty cells."""
+        path = tmp_path / "export.csv"
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(
+                f, fieldnames=["id", "firstName", "eventId", "company", "sessions"]
+            )
+            writer.writeheader()
+            writer.writerow({"id": "1", "firstName": "Ann", "eventId": "expo", "company": "",
+                             "sessions": json.dumps([{"id": "s1", "track": "AI"}])})
+            writer.writerow({"id": "2", "firstName": "Ben", "eventId": "expo", "company": "Komo",
+                             "sessions": "[broken"})
+
+        invalid = []
+        attendees = list(AttendeeExport(path, on_invalid=invalid.append))
+
+        assert attendees == [{"id": "1", "firstName": "Ann", "eventId": "expo",
+                              "sessions": [{"id": "s1", "track": "AI"}]}]
+        assert [record.line for record in invalid] == [3]
+
+    def test_gzipped_export(self, tmp_path):
+        """Test that gzipped exports are streamed transparently."""
+        path = write_jsonl(tmp_path / "export.jsonl.gz", [attendee("1"), attendee("2")])
+
+        assert [a["id"] for a in AttendeeExport(path)] == ["1", "2"]
+
+    def test_unsupported_and_missing_files(self, tmp_path):
+        """Test that unknown file types and missing files are rejected."""
+        (tmp_path / "export.xml").write_text("<attendees/>")
+
+        with pytest.raises(ValueError, match="Unsupported"):
+            AttendeeExport(tmp_path / "export.xml")
+        with pytest.raises(FileNotFoundError):
+            AttendeeExport(tmp_path / "missing.jsonl")
+
+    def test_memory_is_constant(self, tmp_path):
+        """Test that streaming a large export does not hold its records."""
+        path = write_jsonl(tmp_path / "export.jsonl", (attendee(str(i)) for i in range(20000)))
+
+        tracemalloc.start()
+        count = sum(1 for _ in AttendeeExport(path))
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+        assert count == 20000
+        assert peak < path.stat().st_size / 10
+
+
+class TestSharding:
+    """Tests for shard assignment and splitting."""
+
+    def test_parse_shard(self):
+        """Test i/N parsing and validation."""
+        assert parse_shard("2/8") == Shard(2, 8)
+        assert str(Shard(2, 8)) == "2/8"
+        for spec in ("0/4", "5/4", "1", "a/b"):
+            with pytest.raises(ValueError, match="Invalid shard"):
+                parse_shard(spec)
+
+    def test_shard_of_is_stable_and_balanced(self):
+        """Test that assignment is deterministic and spreads ids evenly."""
+        counts = Counter(shard_of(str(i), 4) for i in range(4000))
+
+        assert shard_of("2001", 4) == shard_of(2001, 4)
+        assert set(counts) == {1, 2, 3, 4}
+        assert min(counts.values()) > 900
+
+    def test_shards_partition_the_export(self, tmp_path):
+        """Test that every attendee lands in exactly one shard."""
+        path = write_jsonl(tmp_path / "export.jsonl", [attendee(str(i)) for i in range(50)])
+
+        ids = [a["id"] for i in range(1, 4) for a in AttendeeExport(path, shard=Shard(i, 3))]
+
+        assert sorted(ids, key=int) == [str(i) for i in range(50)]
+
+    def test_split_export(self, tmp_path):
+        """Test that splitting writes one JSONL file per shard matching the filter."""
+        path = write_jsonl(tmp_path / "export.jsonl", [attendee(str(i)) for i in range(30)])
+
+        paths = split_export(path, tmp_path / "shards", 3)
+
+        assert [p.name for p in paths] == [f"export.shard-{i}-of-3.jsonl" for i in (1, 2, 3)]
+        for index, shard_path in enumerate(paths, 1):
+            expected = [a["id"] for a in AttendeeExport(path, shard=Shard(index, 3))]
+            assert [a["id"] for a in AttendeeExport(shard_path)] == expected
@@ -0,0 +1,119 @@
+"""Tests for the load-test harness."""
+
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from event_style_scraper.benchmarks import run_load_test
+from event_style_scraper.benchmarks.loadtest import ScrapeSample, aggregate_samples
+from event_style_scraper.benchmarks.metrics import ProcessInfo, count_browsers, percentile
+from event_style_scraper.cli import cli
+
+SITES_DIR = Path(__file__).parent.parent.parent / "benchmarks" / "sites"
+
+
+def sample(pid, latency, error_type=None):
+    """Build a ScrapeSample with fixed resource figures."""
+    return ScrapeSample(
+        pid=pid,
+        url="http://127.0.0.1/site/",
+        latency_seconds=latency,
+        success=error_type is None,
+        error_type=error_type,
+        error_message=f"{error_type} happened" if error_type else None,
+        cpu_seconds=0.5,
+        browser_cpu_seconds=1.0,
+        peak_rss_mb=100.0 + pid,
+    )
+
+
+class TestMetrics:
+    """Tests for percentile and process-tree helpers."""
+
+    def test_percentile_interpolates(self):
+        """Test linear interpolation between ranks."""
+        values = [1.0, 2.0, 3.0, 4.0, 5.0]
+
+        assert percentile(values, 50) == 3.0
+        assert percentile(values, 95) == pytest.approx(4.8)
+        assert percentile([7.0], 99) == 7.0
+
+    def test_count_browsers_ignores_helper_processes(self):
+        """Test that only top-level browser processes are counted."""
+        tree = [
+            ProcessInfo(pid=10, ppid=1, name="python", rss_mb=50),
+            ProcessInfo(pid=11, ppid=10, name="node", rss_mb=30),
+            ProcessInfo(pid=12, ppid=11, name="chrome-headless", rss_mb=80),
+            ProcessInfo(pid=13, ppid=12, name="chrome-headless", rss_mb=40),
+            ProcessInfo(pid=14, ppid=11, name="headless_shell", rss_mb=80),
+        ]
+
+        assert count_browsers(tree) == 2
+
+
+class TestAggregateSamples:
+    """Tests for aggregating worker samples."""
+
+    def test_throughput_latency_and_errors(self):
+        """Test result aggregation across workers."""
+        samples = [
+            sample(1, 0.1),
+            sample(1, 0.3),
+            sample(2, 0.2),
+            sample(2, 0.0, error_type="TimeoutError"),
+        ]
+
+        result = aggregate_samples("http", samples, 2, 2.0, 0, 512.0)
+
+        assert result.successes == 3
+        assert result.failures == 1
+        assert result.throughput_per_second == 1.5
+        assert result.latency.median == pytest.approx(0.2)
+        assert result.errors == {"TimeoutError": 1}
+        assert result.error_examples["TimeoutError"] == "TimeoutError happened"
+        assert [(w.pid, w.scrapes, w.failures) for w in result.workers] == [(1, 2, 0), (2, 2, 1)]
+        assert result.workers[0].cpu_seconds == 1.0
+
+
+class TestRunLoadTest:
+    """Tests for load tests against the fixture server."""
+
+    def test_http_engine_load_test(self):
+        """Test a small concurrent HTTP-engine load test in worker processes."""
+        report = run_load_test(
+            SITES_DIR,
+            engines=["http"],
+            scrapes=4,
+            concurrency=2,
+            sites=["tech-summit", "minimal-meetup"],
+            timeout=5,
+        )
+
+        result = report.results[0]
+        assert result.engine == "http"
+        assert result.successes == 4, result.error_examples
+        assert result.latency.p99 >= result.latency.median
+        assert result.peak_browsers == 0
+        assert sum(w.scrapes for w in result.workers) == 4
+
+    def test_rejects_unknown_engine(self):
+        """Test that unknown engine modes are rejected before starting."""
+        with pytest.raises(ValueError, match="Unknown engine modes"):
+            run_load_test(SITES_DIR, engines=["turbo"])
+
+    def test_loadtest_command_writes_results(self, tmp_path):
+        """Test that the loadtest command prints a summary and saves JSON."""
+        result = CliRunner().invoke(cli, [
+            "loadtest",
+            "--sites-dir", str(SITES_DIR),
+            "--output-dir", str(tmp_path),
+            "--engine", "http",
+            "--site", "minimal-meetup",
+            "--scrapes", "2",
+            "--concurrency", "1",
+        ])
+
+        assert result.exit_code == 0, result.output
+        assert "p95" in result.output
+        assert len(list(tmp_path.glob("loadtest-*.json"))) == 1
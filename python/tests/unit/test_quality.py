@@ -0,0 +1,114 @@
+"""Tests for the local content quality gates."""
+
+import numpy as np
+import pytest
+
+from event_style_scraper.quality import (
+    CHECKS,
+    QualityGates,
+    QualityGateSummary,
+    check_content,
+    select_for_review,
+)
+from event_style_scraper.types import BrandVoice
+
+GOOD = (
+    "Hi Sam, thank you for joining us! The 3 sessions you chose on innovation in AI were full of "
+    "practical ideas. You connected with peers from across the industry. Your curiosity was a "
+    "standout part of the week. We can't wait to see you at the next edition."
+)
+SAM = {
+    "firstName": "Sam",
+    "sessions": [{"id": "s1"}, {"id": "s2"}, {"id": "s3"}],
+    "connections": [],
+}
+BRAND_VOICE = BrandVoice(tone="energetic", style="modern", keywords=["innovation", "community"])
+
+
+class TestCheckContent:
+    """Tests for check_content."""
+
+    def test_good_content_passes(self):
+        """Test that content meeting every gate passes."""
+        [result] = check_content([GOOD], [SAM], BRAND_VOICE)
+
+        assert result.passed
+        assert result.failed_checks == []
+        assert result.keyword_coverage == 0.5
+        assert result.readability > 60
+
+    @pytest.mark.parametrize(
+        "content, check",
+        [
+            (GOOD + " More words here." * 100, "word_limit"),
+            (GOOD.replace("You connected with peers from across the industry. ", ""), "sections"),
+            (GOOD.replace("innovation", "ideas"), "brand_keywords"),
+            (
+                GOOD.replace(
+                    "Your curiosity",
+                    "Multidimensional organizational interoperability necessitates "
+                    "comprehensive institutionalization considerations. " * 4 + "Your curiosity",
+                ),
+                "readability",
+            ),
+            (GOOD + " As an AI, I loved it.", "banned_phrases"),
+            (GOOD.replace("Sam", "{attendee_name}"), "banned_phrases"),
+            (GOOD.replace("Sam", "Alex"), "facts"),
+            (GOOD.replace("3 sessions", "5 sessions"), "facts"),
+        ],
+    )
+    def test_each_gate_fails(self, content, check):
+        """Test that each gate flags the problem it checks for."""
+        [result] = check_content([content], [SAM], BRAND_VOICE)
+
+        assert not result.passed
+        assert check in result.failed_checks
+
+    def test_batch_results_stay_in_order(self):
+        """Test that a batch is checked per content, in input order."""
+        results = check_content(
+            [GOOD, "Thanks.", GOOD], [SAM, SAM, {"firstName": "Alex"}], BRAND_VOICE
+        )
+
+        assert [r.passed for r in results] == [True, False, False]
+        assert "call_to_action" in results[1].missing_sections
+        assert check_content([], [], BRAND_VOICE) == []
+        with pytest.raises(ValueError, match="attendee record"):
+            check_content([GOOD], [], BRAND_VOICE)
+
+    def test_thresholds_are_configurable(self):
+        """Test that gates use the configured thresholds and phrases."""
+        gates = QualityGates(max_words=10, min_keyword_coverage=1.0, banned_phrases=["curiosity"])
+
+        [result] = check_content([GOOD], [SAM], BRAND_VOICE, gates)
+
+        assert result.failed_checks == ["word_limit", "brand_keywords", "banned_phrases"]
+
+
+class TestReviewSelection:
+    """Tests for picking content for the LLM editor."""
+
+    def test_failures_and_audit_sample(self):
+        """Test that every failure is reviewed and passing content only at the audit rate."""
+        results = check_content([GOOD] * 1000 + ["Thanks."] * 10, [SAM] * 1010, BRAND_VOICE)
+
+        review = select_for_review(results, 0.1, np.random.default_rng(0))
+
+        assert all(review[1000:])
+        assert 60 < sum(review[:1000]) < 140
+        assert (
+            select_for_review(results, 0.0, np.random.default_rng(0))
+            == [False] * 1000 + [True] * 10
+        )
+
+    def test_summary(self):
+        """Test pass rates and avoided editor calls."""
+        summary = QualityGateSummary()
+        summary.add(check_content([GOOD, GOOD, GOOD, "Thanks."], [SAM] * 4, BRAND_VOICE))
+        summary.reviewed = 1
+
+        assert summary.pass_rate == 0.75
+        assert summary.pass_rates["word_limit"] == 1.0
+        assert summary.pass_rates["sections"] == 0.75
+        assert list(summary.pass_rates) == list(CHECKS)
+        assert summary.llm_calls_avoided == 3
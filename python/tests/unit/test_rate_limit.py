@@ -0,0 +1,246 @@
+"""Tests for the shared LLM rate limiter and adaptive concurrency."""
+
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+from crewai.events import crewai_event_bus
+
+from event_style_scraper.benchmarks import StubLLMServer
+from event_style_scraper.benchmarks.metrics import patched_environ
+from event_style_scraper.crews.content_creation_crew import ContentCreationCrew
+from event_style_scraper.crews.style_extraction_crew import StyleExtractionCrew
+from event_style_scraper.rate_limit import (
+    AdaptiveConcurrency,
+    RateLimiter,
+    TokenBucket,
+    estimate_tokens,
+    install_llm_limits,
+    is_throttle_error,
+    uninstall_llm_limits,
+)
+from event_style_scraper.tools import PlaywrightStyleExtractorTool
+from event_style_scraper.types import BrandVoice, ColorPalette, EventStyleConfig, Typography
+
+
+@pytest.fixture
+def installed():
+    """Install limits for one test and remove them afterwards."""
+    yield install_llm_limits
+    uninstall_llm_limits()
+
+
+@pytest.fixture
+def style_config():
+    """Minimal style config for content crews."""
+    return EventStyleConfig(
+        event_id="test",
+        event_name="Test",
+        source_url="https://example.com",
+        colors=ColorPalette(
+            primary="#667eea",
+            secondary="#764ba2",
+            accent="#f093fb",
+            background="#ffffff",
+            text="#1a202c",
+        ),
+        typography=Typography(heading_font="Inter, sans-serif", body_font="system-ui, sans-serif"),
+        brand_voice=BrandVoice(tone="professional", style="modern", keywords=["test"]),
+    )
+
+
+class TestTokenBucket:
+    """Tests for TokenBucket."""
+
+    def test_waits_for_refill(self):
+        """Test that an empty bucket blocks until enough tokens refill."""
+        bucket = TokenBucket(per_minute=600, burst=1)
+        assert bucket.acquire() < 0.01
+
+        waited = bucket.acquire()
+
+        # 600/min refills one token every 0.1s
+        assert 0.05 < waited < 0.5
+
+    def test_oversized_request_overdraws(self):
+        """Test that requests above capacity are granted from a full bucket."""
+        bucket = TokenBucket(per_minute=60, burst=10)
+
+        bucket.acquire(25)
+
+        assert bucket.level < -14
+
+    def test_timeout(self):
+        """Test that acquire gives up when the wait would exceed the timeout."""
+        bucket = TokenBucket(per_minute=1, burst=1)
+        bucket.acquire()
+
+        with pytest.raises(TimeoutError):
+            bucket.acquire(timeout=0.1)
+
+    def test_state_file_shared_between_buckets(self, tmp_path):
+        """Test that buckets using the same state file share one budget."""
+        first = TokenBucket(per_minute=60, burst=5, state_path=tmp_path / "requests.bucket")
+        second = TokenBucket(per_minute=60, burst=5, state_path=tmp_path / "requests.bucket")
+
+        first.acquire(4)
+
+        assert second.level == pytest.approx(1, abs=0.1)
+        with pytest.raises(TimeoutError):
+            second.acquire(3, timeout=0.1)
+
+
+class TestRateLimiter:
+    """Tests for RateLimiter."""
+
+    def test_counts_calls_and_tokens(self):
+        """Test that calls take a request and their estimated tokens."""
+        limiter = RateLimiter(requests_per_minute=100, tokens_per_minute=1000)
+
+        limiter.acquire(estimated_tokens=200)
+        limiter.record_tokens(300)
+
+        assert limiter.calls == 1
+        assert limiter.requests.level == pytest.approx(99, abs=0.1)
+        assert limiter.tokens.level == pytest.approx(500, abs=1)
+
+    def test_unlimited(self):
+        """Test that a limiter without budgets never waits."""
+        limiter = RateLimiter()
+
+        assert limiter.acquire(estimated_tokens=10**6) == 0
+        assert limiter.requests is None and limiter.tokens is None
+
+    def test_estimate_tokens(self):
+        """Test the prompt token estimate used before a call."""
+        assert estimate_tokens([{"role": "user", "content": "x" * 400}]) == 100
+        assert estimate_tokens("x" * 40) == 10
+
+
+class TestAdaptiveConcurrency:
+    """Tests for AdaptiveConcurrency."""
+
+    def test_throttle_halves_once_per_cooldown(self):
+        """Test that a burst of throttle signals halves the limit once."""
+        controller = AdaptiveConcurrency(maximum=8, cooldown_seconds=60)
+
+        for _ in range(5):
+            controller.record_throttle()
+
+        assert controller.limit == 4
+
+    def test_successes_grow_limit_back(self):
+        """Test that consecutive successes raise the limit up to the maximum."""
+        controller = AdaptiveConcurrency(maximum=3, initial=1, increase_after=2)
+
+        for _ in range(10):
+            controller.record_success()
+
+        assert controller.limit == 3
+        assert [limit for _, limit in controller.history] == [1, 2, 3]
+
+    def test_never_below_minimum(self):
+        """Test that throttling stops at the minimum."""
+        controller = AdaptiveConcurrency(maximum=4, minimum=2, cooldown_seconds=0)
+
+        for _ in range(5):
+            controller.record_throttle()
+
+        assert controller.limit == 2
+
+    def test_slot_limits_concurrent_work(self):
+        """Test that no more than `limit` blocks run at once."""
+        controller = AdaptiveConcurrency(maximum=2)
+        peak = []
+        lock = threading.Lock()
+        running = [0]
+
+        def work():
+            with controller.slot():
+                with lock:
+                    running[0] += 1
+                    peak.append(running[0])
+                time.sleep(0.05)
+                with lock:
+                    running[0] -= 1
+
+        threads = [threading.Thread(target=work) for _ in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert max(peak) == 2
+        assert controller.active == 0
+
+    def test_slot_records_throttle_errors(self):
+        """Test that 429s raised from a slot lower the limit."""
+        controller = AdaptiveConcurrency(maximum=4)
+
+        with pytest.raises(RuntimeError):
+            with controller.slot():
+                raise RuntimeError("Error code: 429 - rate limit reached")
+
+        assert controller.limit == 2
+
+    def test_is_throttle_error(self):
+        """Test which errors count as throttling."""
+        assert is_throttle_error("Error code: 429")
+        assert is_throttle_error(TimeoutError("Request timed out"))
+        assert not is_throttle_error(ValueError("Invalid URL"))
+
+
+class TestInstallLLMLimits:
+    """Tests for routing crew agents through the shared limits."""
+
+    def test_content_crew_agents_use_limiter(self, installed, style_config):
+        """Test that every ContentCreationCrew LLM call goes through the limiter."""
+        limiter = RateLimiter(requests_per_minute=1000, tokens_per_minute=10**6)
+
+        with StubLLMServer() as stub, patched_environ(stub.environment()):
+            installed(limiter)
+            ContentCreationCrew(
+                {"id": "1", "firstName": "Jane"}, style_config, verbose=False
+            ).crew().kickoff()
+            requests = stub.stats()["requests"]
+
+        assert limiter.calls == requests == 3
+
+    def test_style_crew_agents_use_limiter(self, installed):
+        """Test that every StyleExtractionCrew LLM call goes through the limiter."""
+        limiter = RateLimiter(requests_per_minute=1000)
+        page = {"url": "https://example.com", "html": "<h1>Hi</h1>", "success": True}
+
+        with StubLLMServer() as stub, patched_environ(stub.environment()), \
+                patch.object(PlaywrightStyleExtractorTool, "_run", return_value=page):
+            installed(limiter)
+            StyleExtractionCrew("https://example.com").crew().kickoff()
+            requests = stub.stats()["requests"]
+
+        assert limiter.calls == requests > 0
+
+    def test_provider_429_lowers_concurrency(self, installed, style_config):
+        """Test that rate-limit responses from the provider shrink the controller."""
+        controller = AdaptiveConcurrency(maximum=4)
+
+        with StubLLMServer(requests_per_minute=1) as stub, patched_environ(stub.environment()):
+            installed(controller=controller)
+            with pytest.raises(Exception):
+                ContentCreationCrew({"id": "1"}, style_config, verbose=False).crew().kickoff()
+            # Failure events are handled on the event bus's threads
+            crewai_event_bus.flush()
+
+        assert stub.stats()["rate_limited"] > 0
+        assert controller.limit < 4
+
+    def test_uninstall_removes_hook(self, style_config):
+        """Test that uninstalled limits no longer see LLM calls."""
+        limiter = RateLimiter(requests_per_minute=1000)
+        install_llm_limits(limiter)
+        uninstall_llm_limits()
+
+        with StubLLMServer() as stub, patched_environ(stub.environment()):
+            ContentCreationCrew({"id": "1"}, style_config, verbose=False).crew().kickoff()
+
+        assert limiter.calls == 0
@@ -0,0 +1,177 @@
+"""Tests for the indexed attendee/session repository."""
+
+import json
+import tracemalloc
+from pathlib import Path
+
+import pytest
+
+from event_style_scraper.repository import AttendeeRepository
+
+DATA_DIR = Path(__file__).parent.parent.parent.parent / "data"
+
+
+def make_session(session_id, track, speakers=("Alex Zhang, Lead, Erleah",), title=None):
+    """Build a session record."""
+    return {
+        "id": session_id,
+        "title": title or f"Session {session_id}",
+        "description": f"About {session_id}. " * 20,
+        "speakers": list(speakers),
+        "dateTime": "2025-11-12T10:00:00Z",
+        "durationMinutes": 45,
+        "track": track,
+    }
+
+
+@pytest.fixture
+def data_dir(tmp_path):
+    """Events, a sessions file and attendees embedding copies of sessions."""
+    sessions = [
+        make_session("s1", "AI"),
+        make_session("s2", "AI", speakers=["Sam Lee, CTO, Komo"]),
+        make_session("s3", "Ops", speakers=["Sam Lee, CTO, Komo", "Alex Zhang, Lead, Erleah"]),
+    ]
+    for name in ("events", "sessions", "attendees"):
+        (tmp_path / name).mkdir()
+    (tmp_path / "events" / "expo.json").write_text(json.dumps({"id": "expo", "name": "Expo"}))
+    (tmp_path / "sessions" / "expo-sessions.json").write_text(json.dumps({"sessions": sessions}))
+    attendees = [
+        {
+            "id": "1",
+            "firstName": "Ann",
+            "eventId": "expo",
+            "sessions": [sessions[0], sessions[2]],
+            "connections": [],
+        },
+        {"id": "2", "firstName": "Ben", "eventId": "expo", "sessions": [sessions[1]]},
+        {
+            "id": "3",
+            "firstName": "Cy",
+            "eventId": "other",
+            "sessions": [make_session("s1", "Data")],
+        },
+    ]
+    for attendee in attendees:
+        (tmp_path / "attendees" / f"{attendee['id']}.json").write_text(json.dumps(attendee))
+    return tmp_path
+
+
+class TestAttendeeRepository:
+    """Tests for AttendeeRepository."""
+
+    def test_sessions_are_stored_once(self, data_dir):
+        """Test that embedded session copies are interned to the catalog entries."""
+        repository = AttendeeRepository(data_dir / "attendees")
+
+        # Three catalog sessions plus the other event's s1
+        assert repository.session_count == 4
+        assert len(repository) == 3
+        assert repository.event("expo") == {"id": "expo", "name": "Expo"}
+        assert repository.event_ids() == ["expo", "other"]
+
+    def test_materialized_attendee_matches_file(self, data_dir):
+        """Test that materialization rebuilds the original record as a fresh copy."""
+        repository = AttendeeRepository(data_dir / "attendees")
+        original = json.loads((data_dir / "attendees" / "1.json").read_text())
+
+        attendee = repository.attendee("1")
+        attendee["sessions"][0]["title"] = "Changed"
+
+        assert repository.attendee("1") == original
+        assert list(repository.attendee("1")) == list(original)
+        with pytest.raises(KeyError):
+            repository.attendee("missing")
+
+    def test_session_lookups(self, data_dir):
+        """Test lookups by event, track, speaker and id."""
+        repository = AttendeeRepository(data_dir / "attendees")
+
+        assert [s["id"] for s in repository.sessions(event_id="expo", track="AI")] == ["s1", "s2"]
+        assert [s["id"] for s in repository.sessions(event_id="expo", speaker="Sam Lee")] == [
+            "s2",
+            "s3",
+        ]
+        assert [s["id"] for s in repository.sessions(track="AI", speaker="Alex Zhang")] == ["s1"]
+        assert repository.session("other", "s1")["track"] == "Data"
+        assert repository.session("expo", "missing") is None
+
+    def test_attendee_lookups(self, data_dir):
+        """Test attendee lookups by event, session, track and speaker."""
+        repository = AttendeeRepository(data_dir / "attendees")
+
+        assert repository.attendee_ids("expo") == ["1", "2"]
+        assert repository.attendee_ids("expo", session_id="s3") == ["1"]
+        assert repository.attendee_ids(track="AI") == ["1", "2"]
+        assert repository.attendee_ids(speaker="Alex Zhang") == ["1", "3"]
+        assert repository.attendee_ids("expo", speaker="Alex Zhang") == ["1"]
+        with pytest.raises(ValueError, match="event_id"):
+            repository.attendee_ids(session_id="s1")
+
+    def test_conflicting_session_versions_are_kept(self, data_dir):
+        """Test that an attendee's differing copy of a session survives materialization."""
+        changed = make_session("s1", "AI", title="Corrected title")
+        (data_dir / "attendees" / "4.json").write_text(
+            json.dumps({"id": "4", "eventId": "expo", "sessions": [changed]})
+        )
+
+        repository = AttendeeRepository(data_dir / "attendees")
+
+        assert repository.attendee("4")["sessions"] == [changed]
+        assert repository.session("expo", "s1")["title"] == "Session s1"
+        assert repository.attendee_ids("expo", session_id="s1") == ["1", "4"]
+
+    def test_iter_attendees_by_event(self, data_dir):
+        """Test that attendees are materialized lazily, filtered by event."""
+        repository = AttendeeRepository(data_dir / "attendees")
+
+        attendees = repository.iter_attendees("expo")
+
+        assert next(attendees)["id"] == "1"
+        assert [a["id"] for a in attendees] == ["2"]
+
+    def test_missing_directory(self, tmp_path):
+        """Test that a missing attendees directory is reported."""
+        with pytest.raises(FileNotFoundError, match="Attendees directory"):
+            AttendeeRepository(tmp_path / "nope")
+
+    def test_memory_does_not_grow_with_session_copies(self, tmp_path):
+        """Test that held memory is a fraction of the raw attendee records."""
+        sessions = [make_session(f"s{i}", f"Track {i % 4}") for i in range(30)]
+        attendees_dir = tmp_path / "attendees"
+        attendees_dir.mkdir()
+        raw = []
+        for i in range(500):
+            attendee = {
+                "id": str(i),
+                "firstName": f"A{i}",
+                "eventId": "expo",
+                "sessions": [sessions[(i + k) % 30] for k in range(10)],
+            }
+            raw.append(attendee)
+            (attendees_dir / f"{i}.json").write_text(json.dumps(attendee))
+
+        def held_bytes(load):
+            tracemalloc.start()
+            value = load()
+            size = tracemalloc.get_traced_memory()[0]
+            tracemalloc.stop()
+            del value
+            return size
+
+        raw_bytes = held_bytes(
+            lambda: [json.loads(p.read_text()) for p in attendees_dir.glob("*.json")]
+        )
+        repository_bytes = held_bytes(lambda: AttendeeRepository(attendees_dir))
+
+        assert repository_bytes < raw_bytes / 5
+
+    def test_repository_data(self):
+        """Test that every attendee in the repo's data round-trips."""
+        if not (DATA_DIR / "attendees").is_dir():
+            pytest.skip("No attendee data")
+        repository = AttendeeRepository(DATA_DIR / "attendees")
+
+        for path in (DATA_DIR / "attendees").glob("*.json"):
+            original = json.loads(path.read_text())
+            assert repository.attendee(original["id"]) == original
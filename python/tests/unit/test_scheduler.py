@@ -0,0 +1,224 @@
+"""Tests for staleness-aware re-scrape scheduling."""
+
+import json
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from click.testing import CliRunner
+
+from event_style_scraper.cli import cli
+from event_style_scraper.scheduler import (
+    CatalogEvent,
+    ScheduledEvent,
+    build_schedule,
+    load_catalog,
+    run_schedule,
+    select_events,
+)
+from event_style_scraper.store import StyleStore
+from unit.factories import make_style_config
+
+NOW = datetime(2025, 6, 1, tzinfo=timezone.utc)
+
+
+def make_config(event_id, days_ago, **overrides):
+    """Style config scraped the given number of days before NOW."""
+    return make_style_config(
+        event_id, scraped_at=(NOW - timedelta(days=days_ago)).isoformat(), **overrides
+    )
+
+
+def event(event_id, **fields):
+    """Catalog event for a site named after its id."""
+    return CatalogEvent(id=event_id, website=f"https://{event_id}.example.com/", **fields)
+
+
+def queued(event_id, seconds=10.0, tokens=0):
+    """Due schedule entry with the given cost estimate."""
+    return ScheduledEvent(
+        event_id=event_id,
+        url=f"https://{event_id}.example.com/",
+        timeout=30,
+        priority=1.0,
+        due=True,
+        reason="test",
+        estimated_seconds=seconds,
+        estimated_tokens=tokens,
+    )
+
+
+@pytest.fixture
+def store(tmp_path):
+    """Store in a temporary directory."""
+    with StyleStore(tmp_path / "history.sqlite") as store:
+        yield store
+
+
+class TestBuildSchedule:
+    """Tests for prioritizing the catalog."""
+
+    def test_age_and_event_date_order_the_queue(self, store, tmp_path):
+        """Test that never-scraped and soon-starting events come first and fresh configs wait."""
+        store.record(make_config("stale", days_ago=45))
+        store.record(make_config("upcoming", days_ago=15))
+        store.record(make_config("fresh", days_ago=0.2))
+        catalog = [
+            event("stale"),
+            event("upcoming", start_date=(NOW + timedelta(days=6)).isoformat()),
+            event("fresh"),
+            event("new"),
+            event("disabled", enabled=False),
+        ]
+
+        queue = build_schedule(catalog, tmp_path, store=store, now=NOW)
+
+        assert [(e.event_id, e.due) for e in queue] == [
+            ("new", True),
+            ("stale", True),
+            ("upcoming", True),
+            ("disabled", False),
+            ("fresh", False),
+        ]
+        assert queue[2].priority == pytest.approx(0.5 + 0.9)
+        assert "event in 6 days" in queue[2].reason
+
+    def test_drift_and_past_events(self, store, tmp_path):
+        """Test that frequently changing sites gain priority and long-past events lose it."""
+        for days_ago, primary in ((30, "#1a3c8f"), (20, "#e53e3e"), (10, "#38a169")):
+            store.record(make_config("rebrands", days_ago, primary=primary))
+        store.record(make_config("steady", days_ago=10))
+        store.record(make_config("past", days_ago=10))
+        catalog = [
+            event("steady"),
+            event("rebrands"),
+            event("past", end_date="2025-01-01T00:00:00Z"),
+        ]
+
+        queue = {e.event_id: e for e in build_schedule(catalog, tmp_path, store=store, now=NOW)}
+
+        assert queue["rebrands"].drift_rate == 1.0
+        assert queue["rebrands"].priority > queue["steady"].priority > queue["past"].priority
+
+    def test_failures_back_off(self, store, tmp_path):
+        """Test that a failing event waits before being retried."""
+        store.record_failure("flaky", "https://flaky.example.com/", "timeout")
+        store.record_failure("flaky", "https://flaky.example.com/", "timeout")
+        now = datetime.now(timezone.utc)
+
+        waiting = build_schedule([event("flaky")], tmp_path, store=store, now=now)[0]
+        retried = build_schedule(
+            [event("flaky")], tmp_path, store=store, now=now + timedelta(hours=13)
+        )[0]
+
+        assert not waiting.due
+        assert "backing off after 2 failure(s)" in waiting.reason
+        assert retried.due
+        assert retried.priority == pytest.approx(2.0 / 3, abs=1e-3)
+
+    def test_exported_configs_count_without_history(self, tmp_path):
+        """Test that a config file's scraped_at is used when the store has no record."""
+        (tmp_path / "site-example-com.json").write_text(
+            json.dumps(make_config("x", days_ago=60).model_dump())
+        )
+        catalog = [CatalogEvent(id="site", website="https://site.example.com")]
+
+        assert build_schedule(catalog, tmp_path, now=NOW)[0].age_days == pytest.approx(60)
+
+    def test_load_catalog_fills_dates_from_event_files(self, tmp_path):
+        """Test reading the catalog format with dates from the event files."""
+        (tmp_path / "events").mkdir()
+        (tmp_path / "events" / "conf.json").write_text(
+            json.dumps({"startDate": "2025-12-01T08:00:00Z"})
+        )
+        (tmp_path / "catalog.json").write_text(
+            json.dumps(
+                [
+                    {
+                        "id": "conf",
+                        "name": "Conf",
+                        "website": "https://conf.example.com",
+                        "scraping": {"enabled": True, "timeout": 90},
+                    },
+                    {
+                        "id": "off",
+                        "website": "https://off.example.com",
+                        "scraping": {"enabled": False},
+                    },
+                ]
+            )
+        )
+
+        catalog = load_catalog(tmp_path / "catalog.json", tmp_path / "events")
+
+        assert (catalog[0].timeout, catalog[0].start_date) == (90, "2025-12-01T08:00:00Z")
+        assert not catalog[1].enabled
+
+
+class TestSelectAndRun:
+    """Tests for budgeted selection and scheduled runs."""
+
+    def test_select_fits_budget(self):
+        """Test that the limit and budgets pick the top events that fit, skipping costly ones."""
+        schedule = [
+            queued("a", seconds=30),
+            queued("b", seconds=50, tokens=900),
+            queued("c", seconds=20),
+            queued("d"),
+        ]
+
+        assert [e.event_id for e in select_events(schedule, limit=2)] == ["a", "b"]
+        assert [e.event_id for e in select_events(schedule, max_seconds=60)] == ["a", "c", "d"]
+        assert [e.event_id for e in select_events(schedule, max_tokens=500)] == ["a", "c", "d"]
+        assert [e.event_id for e in select_events(schedule, max_seconds=50, concurrency=2)] == [
+            "a",
+            "b",
+            "c",
+        ]
+
+    def test_run_exports_records_and_defers(self, store, tmp_path):
+        """Test that scrapes use the catalog id, failures are recorded and overruns deferred."""
+        def scrape(url, engine, timeout):
+            if "broken" in url:
+                raise ValueError("URL blocked")
+            return make_config("scraped-id", days_ago=0), 400
+
+        selected = [
+            queued("first", seconds=0.01, tokens=500),
+            queued("broken", seconds=0.01),
+            queued("third", tokens=500),
+        ]
+        report = run_schedule(
+            selected, tmp_path / "out", store=store, engine="crew", max_tokens=800, scrape=scrape
+        )
+
+        assert [r.status for r in report.results] == ["completed", "failed", "deferred"]
+        assert report.tokens == 400
+        assert json.loads((tmp_path / "out" / "first.json").read_text())["event_id"] == "first"
+        assert store.latest("first").tokens == 400
+        assert store.event_stats()["broken"].failure_streak == 1
+
+
+class TestScheduleCommand:
+    """Tests for the schedule CLI command."""
+
+    def test_dry_run(self, tmp_path):
+        """Test that a dry run prints the queue without scraping."""
+        (tmp_path / "catalog.json").write_text(json.dumps([
+            {"id": "conf", "website": "https://conf.example.com"},
+            {"id": "off", "website": "https://off.example.com", "scraping": {"enabled": False}},
+        ]))
+
+        result = CliRunner().invoke(cli, [
+            "schedule",
+            "--catalog", str(tmp_path / "catalog.json"),
+            "--events-dir", str(tmp_path / "events"),
+            "--output-dir", str(tmp_path / "out"),
+            "--store", str(tmp_path / "history.sqlite"),
+            "--engine", "http",
+            "--dry-run",
+        ])
+
+        assert result.exit_code == 0, result.output
+        assert "1 of 2 event(s) due" in result.output
+        assert "conf  priority 2.00  (never scraped)" in result.output
+        assert not (tmp_path / "out").exists()
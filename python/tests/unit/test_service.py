@@ -0,0 +1,245 @@
+"""Tests for the scrape service, its job queue and the local job API."""
+
+import http.client
+import json
+import socket
+import threading
+import time
+import urllib.error
+import urllib.request
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from click.testing import CliRunner
+
+from event_style_scraper.benchmarks import FixtureSiteServer
+from event_style_scraper.benchmarks.metrics import patched_environ
+from event_style_scraper.cli import cli
+from event_style_scraper.service import (
+    JobQueue,
+    QueueFullError,
+    ScrapeJob,
+    ScrapeService,
+    create_server,
+)
+from event_style_scraper.tools import BrowserPool
+
+SITES_DIR = Path(__file__).parent.parent.parent / "benchmarks" / "sites"
+
+
+class UnixHTTPConnection(http.client.HTTPConnection):
+    """HTTPConnection over a Unix domain socket."""
+
+    def __init__(self, path):
+        super().__init__("localhost")
+        self.socket_path = path
+
+    def connect(self):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.connect(str(self.socket_path))
+
+
+def request_json(url, payload=None):
+    """Send a GET (or POST with a JSON payload) and return (status, body)."""
+    data = json.dumps(payload).encode() if payload is not None else None
+    request = urllib.request.Request(url, data=data, headers={"Content-Type": "application/json"})
+    try:
+        with urllib.request.urlopen(request, timeout=10) as response:
+            return response.status, json.loads(response.read())
+    except urllib.error.HTTPError as e:
+        return e.code, json.loads(e.read())
+
+
+def wait_for(service, job_id, timeout=10):
+    """Poll until a job finishes."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        job = service.get_job(job_id)
+        if job.finished:
+            return job
+        time.sleep(0.05)
+    raise AssertionError(f"Job {job_id} did not finish")
+
+
+@pytest.fixture
+def fixtures():
+    """Fixture site server whose host the scraper is allowed to fetch."""
+    with FixtureSiteServer(SITES_DIR) as server:
+        with patched_environ({"SCRAPER_ALLOWED_HOSTS": server.host}):
+            yield server
+
+
+@pytest.fixture
+def service(fixtures, tmp_path):
+    """Started HTTP-engine service exporting to a temporary directory."""
+    with ScrapeService(concurrency=2, engine="http", timeout=5, output_dir=tmp_path) as service:
+        yield service
+
+
+class TestJobQueue:
+    """Tests for the bounded priority queue."""
+
+    def test_priority_then_fifo_order(self):
+        """Test that higher priorities run first and ties keep submit order."""
+        jobs = JobQueue()
+        for url, priority in [("a", 0), ("b", 5), ("c", 0), ("d", 5)]:
+            jobs.put(ScrapeJob(url=f"https://{url}.example.com", priority=priority))
+
+        order = [jobs.get(timeout=0)[0].url[8] for _ in range(4)]
+
+        assert order == ["b", "d", "a", "c"]
+        assert jobs.get(timeout=0) is None
+
+    def test_bounded(self):
+        """Test that a full queue rejects jobs."""
+        jobs = JobQueue(maxsize=1)
+        jobs.put(ScrapeJob(url="https://a.example.com"))
+
+        with pytest.raises(QueueFullError):
+            jobs.put(ScrapeJob(url="https://b.example.com"))
+        assert len(jobs) == 1
+
+
+class TestScrapeService:
+    """Tests for ScrapeService workers."""
+
+    def test_job_completes_and_exports(self, service, fixtures, tmp_path):
+        """Test that a job moves through pending/scraping/completed and is exported."""
+        events = service.subscribe()
+        job = service.submit(fixtures.site_url("tech-summit"))
+
+        finished = wait_for(service, job.id)
+
+        assert finished.status == "completed", finished.error
+        assert Path(finished.output_path).parent == tmp_path
+        assert json.loads(Path(finished.output_path).read_text())["event_id"] == finished.event_id
+        assert finished.work_seconds > 0
+        statuses = []
+        while not events.empty():
+            event = events.get_nowait()
+            if event.id == job.id:
+                statuses.append(event.status)
+        assert statuses == ["pending", "scraping", "completed"]
+
+    def test_failed_job_reports_error(self, service, fixtures):
+        """Test that scrape errors fail the job without stopping the workers."""
+        failed = wait_for(service, service.submit(fixtures.site_url("no-such-site")).id)
+        completed = wait_for(service, service.submit(fixtures.site_url("minimal-meetup")).id)
+
+        assert failed.status == "failed"
+        assert "404" in failed.error
+        assert completed.status == "completed"
+
+    def test_rejects_invalid_url(self, service):
+        """Test that URLs failing security validation are rejected on submit."""
+        with pytest.raises(ValueError, match="Invalid URL"):
+            service.submit("http://localhost/")
+
+    def test_stop_fails_queued_jobs(self, tmp_path):
+        """Test that stop() finishes the running job and fails queued ones."""
+        with FixtureSiteServer(SITES_DIR, latency_ms=300) as slow:
+            with patched_environ({"SCRAPER_ALLOWED_HOSTS": slow.host}):
+                service = ScrapeService(concurrency=1, engine="http", output_dir=tmp_path).start()
+                jobs = [service.submit(slow.site_url("minimal-meetup")) for _ in range(3)]
+                while service.get_job(jobs[0].id).status == "pending":
+                    time.sleep(0.01)
+                service.stop()
+
+        statuses = [service.get_job(job.id).status for job in jobs]
+        assert statuses == ["completed", "failed", "failed"]
+        assert "stopped" in service.get_job(jobs[2].id).error
+        assert not service.running
+
+    def test_rejects_unknown_engine(self):
+        """Test that unknown engine modes are rejected."""
+        with pytest.raises(ValueError, match="Unknown engine mode"):
+            ScrapeService(engine="turbo")
+
+
+class TestJobAPI:
+    """Tests for the HTTP and Unix-socket job API."""
+
+    @pytest.fixture
+    def api(self, service):
+        """TCP job API on a free port."""
+        server = create_server(service, port=0)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+        server.shutdown()
+        server.server_close()
+
+    def test_submit_and_stream_status(self, api, fixtures):
+        """Test submitting a job and streaming its status changes."""
+        status, job = request_json(
+            f"{api}/jobs", {"url": fixtures.site_url("expo-dark"), "priority": 3}
+        )
+        assert status == 202
+        assert job["priority"] == 3
+
+        with urllib.request.urlopen(f"{api}/jobs/{job['id']}/events", timeout=10) as response:
+            events = [json.loads(line) for line in response]
+
+        assert events[-1]["status"] == "completed"
+        assert (
+            request_json(f"{api}/jobs/{job['id']}")[1]["output_path"] == events[-1]["output_path"]
+        )
+
+    def test_errors(self, api, service):
+        """Test bad requests, unknown jobs and a full queue."""
+        assert request_json(f"{api}/jobs", {"nope": 1})[0] == 400
+        assert request_json(f"{api}/jobs", {"url": "http://192.168.1.1/"})[0] == 400
+        assert request_json(f"{api}/jobs/missing")[0] == 404
+
+        with patch.object(service, "submit", side_effect=QueueFullError("Job queue is full")):
+            assert request_json(f"{api}/jobs", {"url": "https://example.com"})[0] == 503
+
+    def test_health(self, api):
+        """Test the health endpoint."""
+        status, health = request_json(f"{api}/health")
+
+        assert status == 200
+        assert health["running"] is True
+        assert health["engine"] == "http"
+
+    def test_unix_socket(self, service, tmp_path):
+        """Test that the API can be served on a Unix socket."""
+        socket_path = tmp_path / "scraper.sock"
+        server = create_server(service, socket_path=socket_path)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        try:
+            connection = UnixHTTPConnection(socket_path)
+            connection.request("GET", "/health")
+            response = connection.getresponse()
+            assert response.status == 200
+            assert json.loads(response.read())["concurrency"] == 2
+        finally:
+            server.shutdown()
+            server.server_close()
+
+
+class TestBrowserPool:
+    """Tests for BrowserPool that need no browser."""
+
+    def test_rejects_empty_pool(self):
+        """Test that the pool needs at least one browser."""
+        with pytest.raises(ValueError):
+            BrowserPool(size=0)
+
+    def test_scrape_requires_start(self):
+        """Test that scraping before start() fails clearly."""
+        with pytest.raises(RuntimeError, match="not started"):
+            BrowserPool().scrape("https://example.com")
+
+
+class TestServeCommand:
+    """Tests for the serve CLI command."""
+
+    def test_serve_help(self):
+        """Test that serve documents the job API."""
+        result = CliRunner().invoke(cli, ["serve", "--help"])
+
+        assert result.exit_code == 0
+        assert "--socket" in result.output
+        assert "--max-queue" in result.output
@@ -0,0 +1,160 @@
+"""Tests for the versioned style config store."""
+
+import json
+from datetime import datetime, timezone
+from functools import partial
+
+import pytest
+from click.testing import CliRunner
+
+from event_style_scraper.cli import cli
+from event_style_scraper.store import StyleStore, config_fingerprint, url_domain
+from unit.factories import make_style_config
+
+make_config = partial(make_style_config, scraped_at="2025-06-01T12:00:00+00:00")
+
+
+@pytest.fixture
+def store(tmp_path):
+    """Store in a temporary directory."""
+    with StyleStore(tmp_path / "history.sqlite") as store:
+        yield store
+
+
+class TestStyleStore:
+    """Tests for StyleStore."""
+
+    def test_record_and_history(self, store):
+        """Test that every scrape is kept, oldest first, with its cost."""
+        store.record(
+            make_config(scraped_at="2025-06-01T12:00:00+00:00"), engine="http", seconds=1.5
+        )
+        store.record(
+            make_config(primary="#ff0000", scraped_at="2025-07-01T12:00:00+00:00"),
+            engine="crew",
+            tokens=900,
+        )
+
+        history = store.history("tech-summit")
+
+        assert len(store) == 2
+        assert [s.config.colors.primary for s in history] == ["#1a3c8f", "#ff0000"]
+        assert (history[0].engine, history[0].seconds, history[1].tokens) == ("http", 1.5, 900)
+        assert history[0].domain == "tech-summit.example.com"
+        assert store.latest("tech-summit").config.colors.primary == "#ff0000"
+        assert store.latest("unknown") is None
+
+    def test_latest_per_event_and_domain(self, store):
+        """Test that each event's most recent snapshot is returned even if recorded out of order."""
+        store.record(make_config("a-conf", scraped_at="2025-07-01T00:00:00+00:00"))
+        store.record(
+            make_config("a-conf", primary="#00ff00", scraped_at="2025-05-01T00:00:00+00:00")
+        )
+        store.record(make_config("b-expo", source_url="https://b.example.org/expo"))
+
+        latest = store.latest_per_event()
+
+        assert [(s.event_id, s.config.colors.primary) for s in latest] == [
+            ("a-conf", "#1a3c8f"),
+            ("b-expo", "#1a3c8f"),
+        ]
+        assert [s.event_id for s in store.latest_per_event(domain="WWW.b.example.org")] == [
+            "b-expo"
+        ]
+
+    def test_timestamps_are_normalized_to_utc(self, store):
+        """Test that offsets and naive times compare correctly."""
+        store.record(make_config(scraped_at="2025-06-01T12:00:00"))
+        store.record(make_config(primary="#ff0000", scraped_at="2025-06-01T10:00:00-05:00"))
+
+        assert store.latest("tech-summit").scraped_at == "2025-06-01T15:00:00+00:00"
+
+    def test_stale(self, store):
+        """Test that only events whose latest scrape is too old are stale."""
+        store.record(make_config("old-conf", scraped_at="2025-01-01T00:00:00+00:00"))
+        store.record(make_config("fresh-conf", scraped_at="2025-01-01T00:00:00+00:00"))
+        store.record(make_config("fresh-conf", scraped_at="2025-06-20T00:00:00+00:00"))
+
+        stale = store.stale(30, now=datetime(2025, 7, 1, tzinfo=timezone.utc))
+
+        assert [s.event_id for s in stale] == ["old-conf"]
+
+    def test_primary_color_changed(self, store):
+        """Test that events are reported once their scrapes disagree on the primary color."""
+        store.record(make_config("steady", scraped_at="2025-01-01T00:00:00+00:00"))
+        store.record(make_config("steady", scraped_at="2025-02-01T00:00:00+00:00"))
+        store.record(make_config("rebrand", scraped_at="2025-01-01T00:00:00+00:00"))
+        store.record(
+            make_config("rebrand", primary="#ff0000", scraped_at="2025-03-01T00:00:00+00:00")
+        )
+
+        assert store.primary_color_changed() == ["rebrand"]
+        assert store.primary_color_changed(since="2025-02-01") == []
+
+    def test_fingerprint_ignores_scrape_time(self):
+        """Test that the fingerprint identifies content, not when it was scraped."""
+        first = make_config(scraped_at="2025-01-01T00:00:00+00:00")
+
+        assert config_fingerprint(first) == config_fingerprint(make_config(scraped_at=None))
+        assert config_fingerprint(first) != config_fingerprint(make_config(primary="#ff0000"))
+        assert url_domain("https://WWW.Example.com:8080/x") == "example.com"
+
+    def test_import_skips_known_and_export_round_trips(self, store, tmp_path):
+        """Test backfilling from config files twice, then re-exporting them unchanged."""
+        configs_dir = tmp_path / "configs"
+        configs_dir.mkdir()
+        for event_id in ("a-conf", "b-expo"):
+            (configs_dir / f"{event_id}.json").write_text(
+                json.dumps(make_config(event_id).model_dump(), indent=2)
+            )
+        files = sorted(configs_dir.glob("*.json"))
+
+        assert store.import_configs(files) == 2
+        assert store.import_configs(files) == 0
+
+        paths = store.export_json(tmp_path / "out", event_ids=["b-expo"])
+
+        assert [p.name for p in paths] == ["b-expo.json"]
+        assert paths[0].read_text() == (configs_dir / "b-expo.json").read_text()
+
+    def test_survives_reopening(self, tmp_path):
+        """Test that snapshots are durable across connections."""
+        path = tmp_path / "history.sqlite"
+        with StyleStore(path) as store:
+            store.record(make_config())
+
+        with StyleStore(path) as store:
+            assert store.latest("tech-summit").config == make_config()
+
+
+class TestHistoryCommand:
+    """Tests for the history CLI commands."""
+
+    def test_import_query_and_export(self, tmp_path):
+        """Test backfilling configs, querying changes and staleness, and re-exporting."""
+        configs_dir = tmp_path / "configs"
+        configs_dir.mkdir()
+        (configs_dir / "tech-summit.json").write_text(json.dumps(make_config().model_dump()))
+        later = make_config(primary="#ff0000", scraped_at="2025-08-01T00:00:00+00:00")
+        (tmp_path / "later.json").write_text(json.dumps(later.model_dump()))
+        store_args = ["history", "--store", str(tmp_path / "history.sqlite")]
+        runner = CliRunner()
+
+        imported = runner.invoke(
+            cli, store_args + ["import", str(configs_dir), str(tmp_path / "later.json")]
+        )
+        changed = runner.invoke(cli, store_args + ["changed"])
+        stale = runner.invoke(cli, store_args + ["stale", "--days", "1"])
+        exported = runner.invoke(
+            cli, store_args + ["export", "--output-dir", str(tmp_path / "out")]
+        )
+
+        assert imported.exit_code == 0, imported.output
+        assert "Imported 2 of 2" in imported.output
+        assert "tech-summit: #1a3c8f → #ff0000" in changed.output
+        assert "1 event(s) last scraped" in stale.output
+        assert exported.exit_code == 0, exported.output
+        assert (
+            json.loads((tmp_path / "out" / "tech-summit.json").read_text())["colors"]["primary"]
+            == "#ff0000"
+        )
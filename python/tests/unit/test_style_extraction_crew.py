@@ -108,3 +108,54 @@ class TestStyleExtractionCrew:
 
         # Verify timeout is correctly converted (30s * 1000 = 30000ms)
         assert agent.tools[0].timeout == 30000
+
+
+class TestStyleExtractionCrewTemplate:
+    """Tests for URL-less template crews reused across runs."""
+
+    def test_template_keeps_url_placeholder(self):
+        """Test that the scrape task keeps {url} for kickoff interpolation."""
+        task = StyleExtractionCrew(timeout=30).scrape_website()
+
+        assert "{url}" in task.description
+        assert "{{" not in task.description
+
+    def test_template_interpolates_url_per_run(self):
+        """Test that kickoff inputs fill in the URL on each run."""
+        task = StyleExtractionCrew().scrape_website()
+
+        task.interpolate_inputs_and_add_conversation_history({"url": "https://a.example.com"})
+        assert "https://a.example.com" in task.description
+        task.interpolate_inputs_and_add_conversation_history({"url": "https://b.example.com"})
+        assert "https://b.example.com" in task.description
+        assert "https://a.example.com" not in task.description
+
+    def test_browser_pool_passed_to_tool(self):
+        """Test that the Playwright tool scrapes with the crew's browser pool."""
+        pool = object()
+        agent = StyleExtractionCrew(browser_pool=pool).web_scraper_agent()
+
+        assert agent.tools[0].browser_pool is pool
+
+
+class TestStyleExtractionCrewResume:
+    """Tests for restoring finished task outputs into a crew."""
+
+    def test_completed_tasks_are_not_rerun(self):
+        """Test that restored tasks are skipped and still provide context."""
+        crew = StyleExtractionCrew(
+            "https://example.com",
+            completed_outputs={"scrape_website": "scraped page", "extract_styles": "styles"},
+        ).crew()
+
+        assert [task.name for task in crew.tasks] == ["analyze_voice", "compile_config"]
+        compile_context = {task.name: task.output for task in crew.tasks[1].context}
+        assert compile_context["scrape_website"].raw == "scraped page"
+        assert compile_context["extract_styles"].raw == "styles"
+
+    def test_task_callback_passed_to_crew(self):
+        """Test that the task callback is attached to the crew."""
+        callback = Mock()
+        crew = StyleExtractionCrew("https://example.com", task_callback=callback).crew()
+
+        assert crew.task_callback is callback
@@ -11,6 +11,7 @@ import shutil
 from event_style_scraper.flows.style_scraping_flow import (
     StyleScrapingFlow,
     StyleScrapingState,
+    extract_token_count,
 )
 from event_style_scraper.types import EventStyleConfig, ColorPalette, Typography, BrandVoice, LayoutConfig
 
@@ -552,3 +553,65 @@ class TestStyleScrapingFlowExport:
             assert data["event_name"] == "Test Version 2"
             assert data["colors"]["primary"] == "#667eea"
             assert data["brand_voice"]["keywords"] == ["new"]
+
+
+class TestExtractTokenCount:
+    """Test suite for crew token usage parsing."""
+
+    def test_integer_usage(self):
+        """Test that integer token_usage is returned as-is."""
+        result = Mock(token_usage=1200)
+        assert extract_token_count(result) == 1200
+
+    def test_usage_metrics_object(self):
+        """Test that UsageMetrics-style objects report total_tokens."""
+        result = Mock(token_usage=Mock(total_tokens=345))
+        assert extract_token_count(result) == 345
+
+    def test_missing_usage(self):
+        """Test that results without usage return None."""
+        assert extract_token_count(Mock(spec=[])) is None
+        assert extract_token_count(Mock(token_usage=None)) is None
+
+    @patch("event_style_scraper.flows.style_scraping_flow.StyleExtractionCrew")
+    def test_start_records_token_usage(self, mock_crew_class):
+        """Test that start() stores reported token usage on the state."""
+        mock_result = Mock(token_usage=Mock(total_tokens=500))
+        mock_result.pydantic = create_test_config()
+        mock_crew_class.return_value.crew.return_value.kickoff.return_value = mock_result
+
+        flow = StyleScrapingFlow(url="https://example.com")
+        flow.start()
+
+        assert flow.get_state().token_usage == 500
+
+
+class TestStyleScrapingFlowReusedCrew:
+    """Tests for running the flow on a pre-built template crew."""
+
+    @patch("event_style_scraper.flows.style_scraping_flow.StyleExtractionCrew")
+    def test_kicks_off_given_crew_with_url(self, mock_crew_class):
+        """Test that a given crew is kicked off with the URL instead of building one."""
+        crew = Mock()
+        crew.calculate_usage_metrics.return_value = Mock(total_tokens=0)
+        crew.kickoff.return_value = Mock(pydantic=create_test_config(), token_usage=None)
+
+        flow = StyleScrapingFlow(url="https://example.com", crew=crew)
+        config = flow.start()
+
+        crew.kickoff.assert_called_once_with(inputs={"url": "https://example.com"})
+        mock_crew_class.assert_not_called()
+        assert config.event_id == "test"
+
+    def test_reports_tokens_of_this_run_only(self):
+        """Test that token usage accumulated by earlier runs is subtracted."""
+        crew = Mock()
+        crew.calculate_usage_metrics.return_value = Mock(total_tokens=1200)
+        crew.kickoff.return_value = Mock(
+            pydantic=create_test_config(), token_usage=Mock(total_tokens=1700)
+        )
+
+        flow = StyleScrapingFlow(url="https://example.com", crew=crew)
+        flow.start()
+
+        assert flow.get_state().token_usage == 500
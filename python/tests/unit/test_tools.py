@@ -1,7 +1,59 @@
 """Tests for security-hardened tool wrappers."""
 
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
 import pytest
-from event_style_scraper.tools import WebScraperTool, SecurityError
+from event_style_scraper.tools import HttpStyleExtractor, WebScraperTool, SecurityError
+from event_style_scraper.tools.http_scraper import parse_rules, resolve_vars, selector_targets
+
+
+@pytest.fixture
+def redirecting_site(monkeypatch):
+    """
+    Local site allowlisted as ``localhost`` whose redirects point back at it.
+
+    Paths: ``/`` and ``/styles.css`` redirect to the same server by its
+    loopback IP (not allowlisted), ``/moved`` redirects to ``/page`` on
+    ``localhost``. Yields the base URL and the list of requested paths.
+    """
+    requested = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            requested.append(self.path)
+            port = self.server.server_address[1]
+            redirects = {
+                "/": f"http://127.0.0.1:{port}/private",
+                "/styles.css": f"http://127.0.0.1:{port}/private.css",
+                "/moved": f"http://localhost:{port}/page",
+            }
+            if self.path in redirects:
+                self.send_response(302)
+                self.send_header("Location", redirects[self.path])
+                self.end_headers()
+                return
+            body = (
+                b'<html><head><link rel="stylesheet" href="/styles.css"></head>'
+                b"<body><h1>Hi</h1></body></html>"
+            )
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    monkeypatch.setenv("SCRAPER_ALLOWED_HOSTS", "localhost")
+    try:
+        yield f"http://localhost:{server.server_address[1]}", requested
+    finally:
+        server.shutdown()
+        server.server_close()
 
 
 class TestWebScraperTool:
@@ -99,3 +151,81 @@ class TestWebScraperTool:
         """Test tool has rate limiting configuration."""
         tool = WebScraperTool(rate_limit_delay=2.0)
         assert tool.rate_limit_delay == 2.0
+
+
+class TestWebScraperToolAllowedHosts:
+    """Tests for the explicit SSRF allowlist."""
+
+    def test_allowed_host_bypasses_localhost_check(self):
+        """Test allowlisted hosts are accepted."""
+        tool = WebScraperTool(allowed_hosts=["127.0.0.1"])
+        tool.validate_url("http://127.0.0.1:8080/site/")
+
+    def test_allowlist_does_not_cover_other_hosts(self):
+        """Test non-allowlisted private hosts are still rejected."""
+        tool = WebScraperTool(allowed_hosts=["127.0.0.1"])
+        with pytest.raises(SecurityError, match="not allowed"):
+            tool.validate_url("http://192.168.1.1")
+
+    def test_allowlist_does_not_cover_schemes(self):
+        """Test allowlisted hosts still require HTTP/HTTPS."""
+        tool = WebScraperTool(allowed_hosts=["127.0.0.1"])
+        with pytest.raises(SecurityError, match="not allowed"):
+            tool.validate_url("ftp://127.0.0.1/")
+
+    def test_allowlist_read_from_environment(self, monkeypatch):
+        """Test allowlist defaults to SCRAPER_ALLOWED_HOSTS."""
+        monkeypatch.setenv("SCRAPER_ALLOWED_HOSTS", "localhost, 127.0.0.1")
+        tool = WebScraperTool()
+        tool.validate_url("http://localhost:8000")
+        tool.validate_url("http://127.0.0.1:8000")
+
+
+class TestHttpStyleExtractor:
+    """Tests for the browserless HTTP style extractor."""
+
+    def test_parse_rules_flattens_and_skips_at_rules(self):
+        """Test that @font-face is skipped and comments are stripped."""
+        css = """
+        @import url(base.css);
+        /* brand */ body { color: red; }
+        @font-face { font-family: X; src: url(x.woff); }
+        h1, .title { font-size: 3rem !important; }
+        """
+
+        rules = parse_rules(css)
+
+        assert rules == [
+            (["body"], {"color": "red"}),
+            (["h1", ".title"], {"font-size": "3rem"}),
+        ]
+
+    def test_resolve_vars_with_fallback(self):
+        """Test var() substitution including nested fallbacks."""
+        variables = {"--brand": "#112233"}
+
+        assert resolve_vars("var(--brand)", variables) == "#112233"
+        assert resolve_vars("var(--missing, #fff)", variables) == "#fff"
+        assert resolve_vars("1px solid var(--brand)", variables) == "1px solid #112233"
+
+    def test_selector_targets_subject_element(self):
+        """Test that only the selector subject is matched."""
+        assert selector_targets("nav a:hover", "a")
+        assert selector_targets("header > h1.title", "h1")
+        assert not selector_targets("a span", "a")
+
+    def test_extract_validates_url(self):
+        """Test that blocked URLs are rejected before fetching."""
+        with pytest.raises(SecurityError):
+            HttpStyleExtractor().extract("http://127.0.0.1/")
+
+    def test_redirects_are_validated(self, redirecting_site):
+        """Test that page and stylesheet redirects to blocked addresses are not followed."""
+        base_url, requested = redirecting_site
+
+        with pytest.raises(SecurityError):
+            HttpStyleExtractor().extract(f"{base_url}/")
+        result = HttpStyleExtractor().extract(f"{base_url}/moved")
+
+        assert "h1" in result["computed_styles"]
+        assert requested == ["/", "/moved", "/page", "/styles.css"]
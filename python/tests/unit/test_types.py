@@ -1,5 +1,7 @@
 """Tests for Pydantic data models."""
 
+import json
+
 import pytest
 from pydantic import ValidationError
 
@@ -9,6 +11,8 @@ from event_style_scraper.types import (
     BrandVoice,
     LayoutConfig,
     EventStyleConfig,
+    validate_configs,
+    validate_configs_json,
 )
 
 
@@ -31,7 +35,7 @@ class TestColorPalette:
         assert palette.text == "#1a202c"
 
     def test_color_palette_rgb_format(self):
-        """Test ColorPalette accepts RGB format."""
+        """Test ColorPalette accepts RGB format and normalizes it to hex."""
         palette = ColorPalette(
             primary="rgb(102, 126, 234)",
             secondary="rgb(118, 75, 162)",
@@ -39,7 +43,23 @@ class TestColorPalette:
             background="rgb(255, 255, 255)",
             text="rgb(26, 32, 44)",
         )
-        assert "rgb" in palette.primary
+        assert palette.primary == "#667eea"
+        assert palette.background == "#ffffff"
+
+    def test_color_palette_canonical_form(self):
+        """Test that every spelling of a color is stored as lowercase hex."""
+        palette = ColorPalette(
+            primary="#667EEA",
+            secondary="hsl(270, 37%, 46%)",
+            accent="#F9F",
+            background="White",
+            text="rgba(26, 32, 44, 0.5)",
+        )
+        assert palette.primary == "#667eea"
+        assert palette.secondary == "#754aa1"
+        assert palette.accent == "#ff99ff"
+        assert palette.background == "#ffffff"
+        assert palette.text == "#1a202c80"
 
     def test_color_palette_invalid_format(self):
         """Test ColorPalette rejects invalid color format."""
@@ -230,3 +250,49 @@ class TestEventStyleConfig:
         config = EventStyleConfig(**json_data)
         assert config.event_id == "event-2025"
         assert config.colors.primary == "#667eea"
+
+
+class TestBulkValidation:
+    """Tests for validating many configs at once."""
+
+    def config_data(self, event_id, primary="#667eea"):
+        """Build a minimal config dict."""
+        return {
+            "event_id": event_id,
+            "event_name": event_id.title(),
+            "source_url": f"https://{event_id}.example.com",
+            "colors": {
+                "primary": primary,
+                "secondary": "#764ba2",
+                "accent": "#f093fb",
+                "background": "#ffffff",
+                "text": "#1a202c",
+            },
+            "typography": {"heading_font": "Inter", "body_font": "Roboto"},
+            "brand_voice": {"tone": "professional", "style": "modern"},
+        }
+
+    def test_validate_configs(self):
+        """Test that a list of dicts validates in order with colors normalized."""
+        configs = validate_configs(
+            [self.config_data("a"), self.config_data("b", primary="RGB(1, 2, 3)")]
+        )
+
+        assert [c.event_id for c in configs] == ["a", "b"]
+        assert configs[1].colors.primary == "#010203"
+
+    def test_validate_configs_json(self):
+        """Test that a JSON array validates in one call."""
+        data = json.dumps([self.config_data("a"), self.config_data("b")])
+
+        configs = validate_configs_json(data)
+
+        assert all(isinstance(c, EventStyleConfig) for c in configs)
+        assert configs[0].colors.primary == "#667eea"
+
+    def test_errors_located_by_index(self):
+        """Test that an invalid config is reported with its list position."""
+        with pytest.raises(ValidationError) as excinfo:
+            validate_configs([self.config_data("a"), self.config_data("b", primary="not-a-color")])
+
+        assert excinfo.value.errors()[0]["loc"][:3] == (1, "colors", "primary")
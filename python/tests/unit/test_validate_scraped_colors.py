@@ -0,0 +1,302 @@
+"""Tests for the batch mode of scripts/validate_scraped_colors.py."""
+
+import importlib.util
+import json
+import sys
+import xml.etree.ElementTree as ET
+from argparse import Namespace
+from pathlib import Path
+
+import pytest
+
+from unit.factories import make_style_config
+
+SCRIPT = Path(__file__).resolve().parents[2] / "scripts" / "validate_scraped_colors.py"
+
+
+@pytest.fixture(scope="module")
+def script():
+    """The validation script loaded as a module."""
+    spec = importlib.util.spec_from_file_location("validate_scraped_colors", SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    try:
+        spec.loader.exec_module(module)
+        yield module
+    finally:
+        del sys.modules[spec.name]
+
+
+@pytest.fixture
+def manifest(tmp_path):
+    """Write a manifest and its configs; returns a function taking the manifest dict."""
+    config = make_style_config("summit", source_url="https://summit.example.com/")
+    (tmp_path / "configs").mkdir()
+    (tmp_path / "configs" / "summit.json").write_text(config.model_dump_json())
+
+    def write(data):
+        path = tmp_path / "validation.json"
+        path.write_text(json.dumps(data))
+        return path
+
+    return write
+
+
+def site_entry(**fields):
+    """Manifest site for the summit config."""
+    return {"config": "configs/summit.json", **fields}
+
+
+class TestLoadManifest:
+    """Tests for reading batch manifests."""
+
+    def test_shared_checks_merge_with_site_checks(self, script, manifest):
+        """Test that top-level checks run first on every site, followed by the site's own."""
+        path = manifest(
+            {
+                "checks": [
+                    {
+                        "field": "colors.background",
+                        "selector": "body",
+                        "property": "backgroundColor",
+                    }
+                ],
+                "sites": [
+                    site_entry(
+                        checks=[
+                            {
+                                "field": "colors.primary",
+                                "selector": "header",
+                                "property": "backgroundColor",
+                                "expected": "#1a3c8f",
+                                "tolerance": 5,
+                            }
+                        ]
+                    ),
+                    site_entry(url="https://mirror.example.com/"),
+                ],
+            }
+        )
+
+        first, second = script.load_manifest(path)
+
+        assert [(c.field, c.selector) for c in first.checks] == [
+            ("colors.background", "body"),
+            ("colors.primary", "header"),
+        ]
+        assert (first.checks[1].expected, first.checks[1].tolerance) == ("#1a3c8f", 5)
+        assert [c.field for c in second.checks] == ["colors.background"]
+        assert first.config_path == str(path.parent / "configs" / "summit.json")
+        assert first.config["colors"]["primary"] == "#1a3c8f"
+
+    def test_url_falls_back_to_source_url(self, script, manifest):
+        """Test that a site without url uses the config's source_url and an explicit url wins."""
+        check = {"field": "colors.text", "selector": "body", "property": "color"}
+        path = manifest(
+            {
+                "checks": [check],
+                "sites": [site_entry(), site_entry(url="https://mirror.example.com/")],
+            }
+        )
+
+        assert [site.url for site in script.load_manifest(path)] == [
+            "https://summit.example.com/", "https://mirror.example.com/"
+        ]
+
+    @pytest.mark.parametrize("data", [
+        {"sites": []},
+        {"sites": [site_entry()]},
+        {"sites": [site_entry(config="configs/missing.json", checks=[{"field": "colors.text"}])]},
+    ])
+    def test_invalid_manifests(self, script, manifest, data):
+        """Test that empty manifests, sites without checks and missing configs are rejected."""
+        with pytest.raises((ValueError, OSError)):
+            script.load_manifest(manifest(data))
+
+
+class TestEvaluateCheck:
+    """Tests for comparing computed values with the config."""
+
+    @pytest.fixture
+    def config(self):
+        """Summit config as a plain dict."""
+        return make_style_config("summit").model_dump(mode="json")
+
+    def test_rgba_value_matches_hex(self, script, config):
+        """Test that a translucent computed color compares on its RGB channels."""
+        check = script.ColorCheck("colors.primary", "header", "backgroundColor", expected="#1a3c8f")
+
+        result = script.evaluate_check(
+            check, config, {"value": "rgba(26, 60, 143, 0.5)"}, tolerance=2
+        )
+
+        assert (result.status, result.diff, result.expected_diff, result.delta_e) == (
+            "pass",
+            0,
+            0,
+            0.0,
+        )
+        assert (result.scraped, result.actual) == ("#1a3c8f", "rgba(26, 60, 143, 0.5)")
+
+    def test_difference_beyond_tolerance_fails(self, script, config):
+        """Test that a check fails past the tolerance and passes with a per-check tolerance."""
+        check = script.ColorCheck("colors.primary", "header", "backgroundColor")
+        computed = {"value": "rgb(30, 60, 143)"}
+
+        failed = script.evaluate_check(check, config, computed, tolerance=2)
+        check.tolerance = 4
+
+        assert (failed.status, failed.diff) == ("fail", 4)
+        assert failed.message.startswith("Δ=4 RGB units (max 2 allowed)")
+        assert script.evaluate_check(check, config, computed, tolerance=2).status == "pass"
+
+    def test_unknown_field_is_an_error(self, script, config):
+        """Test that a field missing from the config is reported as an error."""
+        check = script.ColorCheck("colors.highlight", "a", "color")
+
+        result = script.evaluate_check(check, config, {"value": "rgb(0, 0, 0)"}, tolerance=2)
+
+        assert (result.status, result.message) == (
+            "error",
+            "Field not found in config: colors.highlight",
+        )
+
+    def test_missing_element_is_an_error(self, script, config):
+        """Test that an in-page lookup error is carried into the result."""
+        check = script.ColorCheck("colors.primary", "header", "backgroundColor")
+
+        result = script.evaluate_check(
+            check, config, {"error": "Element not found: header"}, tolerance=2
+        )
+
+        assert (result.status, result.message, result.actual) == (
+            "error",
+            "Element not found: header",
+            None,
+        )
+
+
+def site_result(script, statuses):
+    """Site result with one check per status."""
+    checks = [
+        script.CheckResult(field=f"colors.{name}", selector="body", property="color", status=status,
+                           scraped="#1a3c8f", actual="rgb(0, 0, 0)", message=f"{status} message")
+        for name, status in zip(("primary", "secondary", "accent"), statuses)
+    ]
+    return script.SiteResult("https://summit.example.com/", "configs/summit.json", 1.25, checks)
+
+
+class TestWriteJunitReport:
+    """Tests for the JUnit XML report."""
+
+    def test_failures_and_errors(self, script, tmp_path):
+        """Test that failed and errored checks get failure and error elements and counts add up."""
+        path = tmp_path / "results.xml"
+
+        script.write_junit_report([site_result(script, ("pass", "fail", "error"))], path, 2.0)
+
+        root = ET.parse(path).getroot()
+        suite = root.find("testsuite")
+        cases = suite.findall("testcase")
+        assert (root.get("tests"), root.get("failures"), root.get("errors"), root.get("time")) == (
+            "3",
+            "1",
+            "1",
+            "2.000",
+        )
+        assert (suite.get("name"), suite.get("time")) == ("https://summit.example.com/", "1.250")
+        assert [c.get("name") for c in cases] == [
+            "colors.primary body.color", "colors.secondary body.color", "colors.accent body.color"
+        ]
+        assert {c.get("classname") for c in cases} == {"summit"}
+        assert list(cases[0]) == []
+        assert (cases[1][0].tag, cases[1][0].get("message")) == ("failure", "fail message")
+        assert (cases[2][0].tag, cases[2][0].get("message")) == ("error", "error message")
+        assert cases[1][0].text == "scraped #1a3c8f, actual rgb(0, 0, 0), expected None"
+
+
+class TestRunBatch:
+    """Tests for batch exit codes and reports."""
+
+    @pytest.fixture
+    def run(self, script, manifest, monkeypatch, tmp_path):
+        """Run the batch against canned computed values keyed by selector; returns the exit code."""
+
+        def run(computed, data=None):
+            async def validate_sites(sites, concurrency, tolerance, timeout, max_delta_e=None):
+                return [
+                    script.SiteResult(
+                        site.url,
+                        site.config_path,
+                        0.5,
+                        [
+                            script.evaluate_check(
+                                c, site.config, computed[c.selector], tolerance, max_delta_e
+                            )
+                            for c in site.checks
+                        ],
+                    )
+                    for site in sites
+                ]
+
+            monkeypatch.setattr(script, "validate_sites", validate_sites)
+            path = manifest(
+                data
+                or {
+                    "checks": [
+                        {
+                            "field": "colors.primary",
+                            "selector": "header",
+                            "property": "backgroundColor",
+                        },
+                        {"field": "colors.text", "selector": "body", "property": "color"},
+                    ],
+                    "sites": [site_entry()],
+                }
+            )
+            args = Namespace(
+                manifest=str(path),
+                concurrency=2,
+                tolerance=2,
+                timeout=30,
+                max_delta_e=None,
+                json_report=str(tmp_path / "results.json"),
+                junit_report=str(tmp_path / "results.xml"),
+            )
+            return script.run_batch(args)
+
+        return run
+
+    def test_all_pass_exits_zero(self, run, tmp_path):
+        """Test that matching colors exit 0 and write both reports."""
+        code = run(
+            {"header": {"value": "rgb(26, 60, 143)"}, "body": {"value": "rgba(26, 32, 44, 1)"}}
+        )
+
+        report = json.loads((tmp_path / "results.json").read_text())
+        assert code == 0
+        assert report["summary"] == {"sites": 1, "checks": 2, "passed": 2, "failed": 0, "errors": 0}
+        assert ET.parse(tmp_path / "results.xml").getroot().get("failures") == "0"
+
+    def test_mismatch_exits_one(self, run):
+        """Test that a color beyond tolerance exits 1."""
+        assert (
+            run({"header": {"value": "rgb(200, 60, 143)"}, "body": {"value": "rgb(26, 32, 44)"}})
+            == 1
+        )
+
+    def test_errors_exit_two(self, run):
+        """Test that a check error exits 2 even when another check fails."""
+        assert (
+            run(
+                {
+                    "header": {"value": "rgb(200, 60, 143)"},
+                    "body": {"error": "Element not found: body"},
+                }
+            )
+            == 2
+        )
+
+    def test_invalid_manifest_exits_two(self, run):
+        """Test that a manifest without sites exits 2 before any page is opened."""
+        assert run({}, data={"checks": [], "sites": []}) == 2